@@ -29,6 +29,9 @@ from src.services.config import get_agent_params
 from src.services.llm import complete as llm_complete
 from src.services.llm import get_llm_config, get_token_limit_kwargs, supports_response_format
 from src.services.llm import stream as llm_stream
+from src.services.llm.prompt_cache import assemble_messages
+from src.services.llm.scheduler import priority_for_module
+from src.services.llm.usage import TokenUsage, capture_usage
 from src.services.prompt import get_prompt_manager
 
 
@@ -293,6 +296,7 @@ class BaseAgent(ABC):
         user_prompt: str,
         response: str,
         stage: str | None = None,
+        usage: TokenUsage | None = None,
     ):
         """
         Track token usage using available tracker.
@@ -301,14 +305,24 @@ class BaseAgent(ABC):
         1. External TokenTracker (if self.token_tracker is set)
         2. Shared LLMStats (always available)
 
+        Token counts reported by the provider are used when available;
+        otherwise they are estimated from the prompt and response text.
+
         Args:
             model: Model name
             system_prompt: System prompt
             user_prompt: User prompt
             response: LLM response
             stage: Stage name (optional)
+            usage: Provider-reported usage of the call (optional)
         """
         stage_label = stage or self.agent_name
+        reported = usage is not None and usage.reported
+        token_counts = (
+            {"prompt_tokens": usage.prompt_tokens, "completion_tokens": usage.completion_tokens}
+            if reported
+            else None
+        )
 
         # 1. Use external TokenTracker if provided
         if self.token_tracker:
@@ -317,6 +331,7 @@ class BaseAgent(ABC):
                     agent_name=self.agent_name,
                     stage=stage_label,
                     model=model,
+                    token_counts=token_counts,
                     system_prompt=system_prompt,
                     user_prompt=user_prompt,
                     response_text=response,
@@ -326,12 +341,20 @@ class BaseAgent(ABC):
 
         # 2. Always use shared LLMStats
         stats = self.get_stats(self.module_name)
-        stats.add_call(
-            model=model,
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            response=response,
-        )
+        if reported:
+            stats.add_call(
+                model=model,
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+                cached_tokens=usage.cached_tokens,
+            )
+        else:
+            stats.add_call(
+                model=model,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                response=response,
+            )
 
     # -------------------------------------------------------------------------
     # LLM Call Interface
@@ -342,6 +365,7 @@ class BaseAgent(ABC):
         user_prompt: str,
         system_prompt: str,
         messages: list[dict[str, str]] | None = None,
+        context: str | list[str] | None = None,
         response_format: dict[str, str] | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
@@ -353,12 +377,16 @@ class BaseAgent(ABC):
         Unified interface for calling LLM (non-streaming).
 
         Uses the LLM factory to route calls to the appropriate provider
-        (cloud or local) based on configuration.
+        (cloud or local) based on configuration. Messages are assembled as a
+        stable prefix (system prompt, then ``context``) followed by the volatile
+        user prompt, so providers can reuse the cached prefix across calls.
 
         Args:
             user_prompt: User prompt (ignored if messages provided)
             system_prompt: System prompt (ignored if messages provided)
             messages: Pre-built messages array (optional, overrides prompt/system_prompt)
+            context: Stable reference material reused across calls (e.g. knowledge
+                chains, outlines, citation tables), placed after the system prompt
             response_format: Response format (e.g., {"type": "json_object"})
             temperature: Temperature parameter (optional, uses config by default)
             max_tokens: Maximum tokens (optional, uses config by default)
@@ -399,8 +427,22 @@ class BaseAgent(ABC):
             else:
                 self.logger.debug(f"response_format not supported for {binding}/{model}, skipping")
 
-        if messages:
-            kwargs["messages"] = messages
+        # Stable prefix first: system prompt, shared context, earlier turns
+        if messages or context:
+            kwargs["messages"] = assemble_messages(
+                system_prompt, user_prompt, context=context, messages=messages
+            )
+
+        # Admission class of this module (interactive work is admitted before batch work)
+        kwargs["priority"] = priority_for_module(self.module_name)
+
+        # Completion cache policy of this module (agents.yaml), if any
+        if self._agent_params.get("cache"):
+            kwargs["cache"] = self._agent_params["cache"]
+
+        # Hedge policy of this module (agents.yaml), if any
+        if self._agent_params.get("hedge"):
+            kwargs["hedge"] = self._agent_params["hedge"]
 
         # Log input
         stage_label = stage or self.agent_name
@@ -416,16 +458,17 @@ class BaseAgent(ABC):
         # Call LLM via factory (routes to cloud or local provider)
         response = None
         try:
-            response = await llm_complete(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-                model=model,
-                api_key=self.api_key,
-                base_url=self.base_url,
-                api_version=self.api_version,
-                max_retries=max_retries,
-                **kwargs,
-            )
+            with capture_usage() as usage:
+                response = await llm_complete(
+                    prompt=user_prompt,
+                    system_prompt=system_prompt,
+                    model=model,
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                    api_version=self.api_version,
+                    max_retries=max_retries,
+                    **kwargs,
+                )
         except Exception as e:
             self.logger.error(f"LLM call failed: {e}")
             raise
@@ -440,6 +483,7 @@ class BaseAgent(ABC):
             user_prompt=user_prompt,
             response=response,
             stage=stage_label,
+            usage=usage,
         )
 
         # Log output
@@ -492,12 +536,17 @@ class BaseAgent(ABC):
         # Build kwargs
         kwargs = {
             "temperature": temperature,
+            "priority": priority_for_module(self.module_name),
         }
 
         # Handle token limit for newer OpenAI models
         if max_tokens:
             kwargs.update(get_token_limit_kwargs(model, max_tokens))
 
+        # Hedge policy of this module (agents.yaml), if any
+        if self._agent_params.get("hedge"):
+            kwargs["hedge"] = self._agent_params["hedge"]
+
         # Log input
         stage_label = stage or self.agent_name
         if hasattr(self.logger, "log_llm_input"):
@@ -515,7 +564,7 @@ class BaseAgent(ABC):
 
         try:
             # Stream via factory (routes to cloud or local provider)
-            async for chunk in llm_stream(
+            chunks = llm_stream(
                 prompt=user_prompt,
                 system_prompt=system_prompt,
                 model=model,
@@ -524,9 +573,20 @@ class BaseAgent(ABC):
                 api_version=self.api_version,
                 messages=messages,
                 **kwargs,
-            ):
-                full_response += chunk
-                yield chunk
+            )
+            # Usage is captured per step: the caller's own LLM calls between
+            # chunks must not be counted as this stream's
+            usage = TokenUsage()
+            try:
+                while True:
+                    with capture_usage(usage):
+                        chunk = await anext(chunks, None)
+                    if chunk is None:
+                        break
+                    full_response += chunk
+                    yield chunk
+            finally:
+                await chunks.aclose()
 
             # Track token usage after streaming completes
             self._track_tokens(
@@ -535,6 +595,7 @@ class BaseAgent(ABC):
                 user_prompt=user_prompt,
                 response=full_response,
                 stage=stage_label,
+                usage=usage,
             )
 
             # Log output
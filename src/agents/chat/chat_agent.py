@@ -21,7 +21,7 @@ if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 from src.agents.base_agent import BaseAgent
-from src.tools import rag_search, web_search
+from src.tools import aweb_search, rag_search
 
 
 class ChatAgent(BaseAgent):
@@ -210,7 +210,7 @@ class ChatAgent(BaseAgent):
         if enable_web_search:
             try:
                 self.logger.info(f"Web search: {message[:50]}...")
-                web_result = web_search(query=message, verbose=False)
+                web_result = await aweb_search(query=message, verbose=False)
                 web_answer = web_result.get("answer", "")
                 web_citations = web_result.get("citations", [])
 
@@ -250,19 +250,19 @@ class ChatAgent(BaseAgent):
         system_prompt = self.get_prompt("system", "You are a helpful AI assistant.")
         messages.append({"role": "system", "content": system_prompt})
 
-        # Add context if available
-        if context:
-            context_template = self.get_prompt("context_template", "Reference context:\n{context}")
-            context_msg = context_template.format(context=context)
-            messages.append({"role": "system", "content": context_msg})
-
-        # Add conversation history
+        # Add conversation history (system prompt + history form the prefix reused across turns)
         for msg in history:
             role = msg.get("role", "user")
             content = msg.get("content", "")
             if role in ("user", "assistant"):
                 messages.append({"role": role, "content": content})
 
+        # Add context if available (retrieved per turn, so it follows the reusable prefix)
+        if context:
+            context_template = self.get_prompt("context_template", "Reference context:\n{context}")
+            context_msg = context_template.format(context=context)
+            messages.append({"role": "system", "content": context_msg})
+
         # Add current message
         messages.append({"role": "user", "content": message})
 
@@ -335,31 +335,14 @@ class ChatAgent(BaseAgent):
                 break
 
         # Use BaseAgent's call_llm which routes through the factory
-        # Note: call_llm expects simple prompt/system_prompt, but for multi-turn
-        # we need to use the factory directly with messages
-        from src.services.llm import complete as llm_complete
-
-        response = await llm_complete(
-            prompt=user_prompt,
+        # (tracks token usage and applies the module's admission/hedge policy)
+        return await self.call_llm(
+            user_prompt=user_prompt,
             system_prompt=system_prompt,
-            model=self.get_model(),
-            api_key=self.api_key,
-            base_url=self.base_url,
             messages=messages,
-            temperature=self.get_temperature(),
-        )
-
-        # Track token usage
-        self._track_tokens(
-            model=self.get_model(),
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            response=response,
             stage="chat",
         )
 
-        return response
-
     async def process(
         self,
         message: str,
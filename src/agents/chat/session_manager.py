@@ -10,18 +10,20 @@ This module handles:
 - Deleting sessions
 """
 
-import json
 from pathlib import Path
 import time
 from typing import Any
 import uuid
 
+from src.services.session import SessionStore
+
 
 class SessionManager:
     """
     Manages persistent storage of chat sessions.
 
-    Sessions are stored in a JSON file at data/user/chat_sessions.json.
+    Sessions are stored in a SQLite database at data/user/chat_sessions.sqlite3
+    (see src/services/session); an existing chat_sessions.json is migrated on startup.
     Each session contains:
     - session_id: Unique identifier
     - title: Session title (usually first user message)
@@ -50,41 +52,11 @@ class SessionManager:
         self.base_dir = base_dir_path
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
-        self.sessions_file = self.base_dir / "chat_sessions.json"
-        self._ensure_file()
-
-    def _ensure_file(self):
-        """Ensure the sessions file exists with correct format."""
-        if not self.sessions_file.exists():
-            initial_data = {
-                "version": "1.0",
-                "sessions": [],
-            }
-            self._save_data(initial_data)
-
-    def _load_data(self) -> dict[str, Any]:
-        """Load sessions data from file."""
-        try:
-            with open(self.sessions_file, encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {"version": "1.0", "sessions": []}
-
-    def _save_data(self, data: dict[str, Any]):
-        """Save sessions data to file."""
-        with open(self.sessions_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-    def _get_sessions(self) -> list[dict[str, Any]]:
-        """Get list of all sessions."""
-        data = self._load_data()
-        return data.get("sessions", [])
-
-    def _save_sessions(self, sessions: list[dict[str, Any]]):
-        """Save sessions list."""
-        data = self._load_data()
-        data["sessions"] = sessions
-        self._save_data(data)
+        # SQLite store; the old JSON file is imported once on first start
+        self.sessions_file = self.base_dir / "chat_sessions.sqlite3"
+        self.store = SessionStore(
+            self.sessions_file, legacy_json=self.base_dir / "chat_sessions.json", max_sessions=100
+        )
 
     def create_session(
         self,
@@ -113,15 +85,8 @@ class SessionManager:
             "updated_at": now,
         }
 
-        sessions = self._get_sessions()
-        sessions.insert(0, session)  # Add to front (newest first)
-
-        # Limit total sessions to prevent file bloat
-        max_sessions = 100
-        if len(sessions) > max_sessions:
-            sessions = sessions[:max_sessions]
-
-        self._save_sessions(sessions)
+        # Sessions beyond the newest 100 are dropped to bound storage
+        self.store.insert(session)
 
         return session
 
@@ -135,11 +100,7 @@ class SessionManager:
         Returns:
             Session dict or None if not found
         """
-        sessions = self._get_sessions()
-        for session in sessions:
-            if session.get("session_id") == session_id:
-                return session
-        return None
+        return self.store.get(session_id)
 
     def update_session(
         self,
@@ -158,29 +119,15 @@ class SessionManager:
             settings: New settings (optional)
 
         Returns:
-            Updated session or None if not found
+            Updated session (messages are included only if they were replaced)
+            or None if not found
         """
-        sessions = self._get_sessions()
-
-        for i, session in enumerate(sessions):
-            if session.get("session_id") == session_id:
-                if messages is not None:
-                    session["messages"] = messages
-                if title is not None:
-                    session["title"] = title[:100]
-                if settings is not None:
-                    session["settings"] = settings
-
-                session["updated_at"] = time.time()
-
-                # Move to front (most recently updated)
-                sessions.pop(i)
-                sessions.insert(0, session)
-
-                self._save_sessions(sessions)
-                return session
-
-        return None
+        fields: dict[str, Any] = {}
+        if title is not None:
+            fields["title"] = title[:100]
+        if settings is not None:
+            fields["settings"] = settings
+        return self.store.update(session_id, fields, messages=messages)
 
     def add_message(
         self,
@@ -199,12 +146,8 @@ class SessionManager:
             sources: Optional sources dict (for assistant messages)
 
         Returns:
-            Updated session or None if not found
+            Session summary (without the message history) or None if not found
         """
-        session = self.get_session(session_id)
-        if not session:
-            return None
-
         message = {
             "role": role,
             "content": content,
@@ -213,15 +156,12 @@ class SessionManager:
         if sources:
             message["sources"] = sources
 
-        messages = session.get("messages", [])
-        messages.append(message)
-
         # Update title from first user message if still default
-        if session.get("title") == "New Chat" and role == "user":
-            new_title = content[:50] + ("..." if len(content) > 50 else "")
-            return self.update_session(session_id, messages=messages, title=new_title)
+        retitle = None
+        if role == "user":
+            retitle = ("New Chat", content[:50] + ("..." if len(content) > 50 else ""))
 
-        return self.update_session(session_id, messages=messages)
+        return self.store.append_message(session_id, message, retitle=retitle)
 
     def list_sessions(
         self,
@@ -238,29 +178,24 @@ class SessionManager:
         Returns:
             List of session dicts (newest first)
         """
-        sessions = self._get_sessions()[:limit]
-
-        if not include_messages:
-            # Return summary only (without full messages)
-            return [
-                {
-                    "session_id": s.get("session_id"),
-                    "title": s.get("title"),
-                    "message_count": len(s.get("messages", [])),
-                    "settings": s.get("settings"),
-                    "created_at": s.get("created_at"),
-                    "updated_at": s.get("updated_at"),
-                    # Include preview of last message
-                    "last_message": (
-                        s.get("messages", [])[-1].get("content", "")[:100]
-                        if s.get("messages")
-                        else ""
-                    ),
-                }
-                for s in sessions
-            ]
-
-        return sessions
+        if include_messages:
+            return self.store.list_sessions(limit)
+
+        # Summary rows only; messages are not loaded
+        sessions = self.store.list_summaries(limit)
+        return [
+            {
+                "session_id": s.get("session_id"),
+                "title": s.get("title"),
+                "message_count": s.get("message_count", 0),
+                "settings": s.get("settings"),
+                "created_at": s.get("created_at"),
+                "updated_at": s.get("updated_at"),
+                # Include preview of last message
+                "last_message": s.get("last_message", ""),
+            }
+            for s in sessions
+        ]
 
     def delete_session(self, session_id: str) -> bool:
         """
@@ -272,16 +207,7 @@ class SessionManager:
         Returns:
             True if deleted, False if not found
         """
-        sessions = self._get_sessions()
-        original_count = len(sessions)
-
-        sessions = [s for s in sessions if s.get("session_id") != session_id]
-
-        if len(sessions) < original_count:
-            self._save_sessions(sessions)
-            return True
-
-        return False
+        return self.store.delete(session_id)
 
     def clear_all_sessions(self) -> int:
         """
@@ -290,10 +216,7 @@ class SessionManager:
         Returns:
             Number of sessions deleted
         """
-        sessions = self._get_sessions()
-        count = len(sessions)
-        self._save_sessions([])
-        return count
+        return self.store.clear()
 
 
 # Singleton instance for convenience
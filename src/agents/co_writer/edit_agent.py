@@ -11,7 +11,7 @@ import uuid
 
 from src.agents.base_agent import BaseAgent
 from src.tools.rag_tool import rag_search
-from src.tools.web_search import web_search
+from src.tools.web_search import aweb_search
 
 USER_DIR = Path(__file__).parent.parent.parent.parent / "data" / "user" / "co-writer"
 HISTORY_FILE = USER_DIR / "history.json"
@@ -128,7 +128,7 @@ class EditAgent(BaseAgent):
         elif source == "web":
             self.logger.info(f"Searching Web for: {instruction}")
             try:
-                search_result = web_search(instruction)
+                search_result = await aweb_search(instruction)
                 context = search_result.get("answer", "")
                 self.logger.info(f"Web context found: {len(context)} chars")
 
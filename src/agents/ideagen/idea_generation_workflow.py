@@ -32,6 +32,7 @@ class IdeaGenerationWorkflow(BaseAgent):
         progress_callback: Callable[[str, Any], None | Awaitable[None]] | None = None,
         output_dir: Path | None = None,
         language: str = "en",
+        max_concurrency: int = 4,
     ):
         """
         Initialize workflow
@@ -44,6 +45,7 @@ class IdeaGenerationWorkflow(BaseAgent):
             progress_callback: Progress callback function for streaming output
             output_dir: Output directory for saving intermediate results
             language: Language for prompts ("en" or "zh")
+            max_concurrency: Knowledge points processed concurrently
         """
         super().__init__(
             module_name="ideagen",
@@ -56,6 +58,7 @@ class IdeaGenerationWorkflow(BaseAgent):
         )
         self.progress_callback = progress_callback
         self.output_dir = output_dir
+        self.max_concurrency = max(1, int(max_concurrency))
         self._prompts = get_prompt_manager().load_prompts(
             module_name="ideagen",
             agent_name="idea_generation",
@@ -345,6 +348,89 @@ class IdeaGenerationWorkflow(BaseAgent):
 
         return response
 
+    async def process_point(
+        self,
+        index: int,
+        total: int,
+        point: dict[str, Any],
+        emit: Callable[[str, Any], Awaitable[None]] | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Explore, strictly filter and state ideas for one knowledge point
+
+        Args:
+            index: 0-based position of the point among the filtered points
+            total: Number of filtered points
+            point: Knowledge point
+            emit: Progress emitter (defaults to the workflow's progress callback)
+
+        Returns:
+            {"index", "knowledge_point", "research_ideas", "statement"}, or None if
+            no idea survived
+        """
+        emit = emit or self._emit_progress
+        name = point.get("knowledge_point", f"Point {index + 1}")
+        base = {"index": index + 1, "total": total, "knowledge_point": name}
+
+        await emit("explore", {"status": "processing", **base})
+
+        # 3.2 Explore knowledge points
+        research_ideas = await self.explore_ideas(point)
+        await emit("explore", {"status": "complete", **base, "ideas_count": len(research_ideas)})
+
+        if not research_ideas:
+            return None
+
+        # 3.3 Strict filtering
+        await emit("filter", {"status": "processing", **base, "ideas_count": len(research_ideas)})
+        kept_ideas = await self.strict_filter(point, research_ideas)
+        await emit("filter", {"status": "complete", **base, "kept": len(kept_ideas)})
+
+        if not kept_ideas:
+            return None
+
+        # 3.4 Generate statement
+        await emit("statement", {"status": "processing", **base, "kept_ideas": len(kept_ideas)})
+        statement = await self.generate_statement(point, kept_ideas)
+        result = {
+            "index": index,
+            "knowledge_point": point,
+            "research_ideas": kept_ideas,
+            "statement": statement,
+        }
+        await emit("statement", {"status": "complete", **base, "result": result})
+        return result
+
+    async def process_points(
+        self,
+        points: list[dict[str, Any]],
+        emit: Callable[[str, Any], Awaitable[None]] | None = None,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Run process_point over all points, up to max_concurrency at a time
+
+        Progress events carry each point's own index/total, so they stay correct
+        while points interleave. A failing point cancels the remaining ones.
+
+        Returns:
+            process_point results in the order of points
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        total = len(points)
+
+        async def run(index: int, point: dict[str, Any]) -> dict[str, Any] | None:
+            async with semaphore:
+                return await self.process_point(index, total, point, emit)
+
+        tasks = [asyncio.create_task(run(index, point)) for index, point in enumerate(points)]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def process(self, knowledge_points: list[dict[str, Any]]) -> str:
         """
         Execute complete workflow
@@ -361,36 +447,9 @@ class IdeaGenerationWorkflow(BaseAgent):
         if not filtered_points:
             return "# Research Ideas Generation Result\n\nNo suitable knowledge points found."
 
-        # 3.2 and 3.3 Process each knowledge point
-        final_statements = []
-
-        for idx, point in enumerate(filtered_points):
-            await self._emit_progress(
-                "explore", {"status": "processing", "index": idx + 1, "total": len(filtered_points)}
-            )
-
-            # 3.2 Explore knowledge points
-            research_ideas = await self.explore_ideas(point)
-            await self._emit_progress(
-                "explore",
-                {"status": "complete", "index": idx + 1, "ideas_count": len(research_ideas)},
-            )
-
-            if not research_ideas:
-                continue
-
-            # 3.3 Strict filtering
-            kept_ideas = await self.strict_filter(point, research_ideas)
-            await self._emit_progress(
-                "filter", {"status": "complete", "index": idx + 1, "kept": len(kept_ideas)}
-            )
-
-            if not kept_ideas:
-                continue
-
-            # 3.4 Generate statement
-            statement = await self.generate_statement(point, kept_ideas)
-            final_statements.append(statement)
+        # 3.2 - 3.4 Process knowledge points concurrently, assembled in input order
+        results = [r for r in await self.process_points(filtered_points) if r]
+        final_statements = [r["statement"] for r in results]
 
         # Join all statements
         final_markdown = "# Research Ideas Generation Result\n\n"
@@ -404,18 +463,11 @@ class IdeaGenerationWorkflow(BaseAgent):
                 "filtered_knowledge_points_count": len(filtered_points),
                 "processed_points": [
                     {
-                        "knowledge_point": point["knowledge_point"],
-                        "description": point["description"],
-                        "statement": statement,
+                        "knowledge_point": r["knowledge_point"]["knowledge_point"],
+                        "description": r["knowledge_point"]["description"],
+                        "statement": r["statement"],
                     }
-                    for point, statement in zip(
-                        [
-                            p
-                            for p in filtered_points
-                            if any(p["knowledge_point"] in s for s in final_statements)
-                        ],
-                        final_statements,
-                    )
+                    for r in results
                 ],
                 "final_statements_count": len(final_statements),
                 "timestamp": datetime.now().isoformat(),
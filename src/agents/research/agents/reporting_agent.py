@@ -10,11 +10,13 @@ ReportingAgent - Report generation Agent (DR-in-KG 2.0)
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 import re
 from string import Template
 import sys
+import time
 from typing import Any
 
 project_root = Path(__file__).parent.parent.parent.parent
@@ -83,6 +85,9 @@ class ReportingAgent(BaseAgent):
         self.enable_citation_list = self.reporting_config.get("enable_citation_list", False)
         self.enable_inline_citations = self.reporting_config.get("enable_inline_citations", False)
 
+        # Per-part drafting latency of the last report, in outline order
+        self.section_latencies: list[dict[str, Any]] = []
+
     def set_citation_manager(self, citation_manager):
         """Set citation manager"""
         self.citation_manager = citation_manager
@@ -139,7 +144,9 @@ class ReportingAgent(BaseAgent):
         print("\n✍️  Step 3: Writing report...")
         report_markdown = await self._write_report(topic, cleaned_blocks, outline)
         print("✓ Report writing completed")
-        self._notify_progress(progress_callback, "writing_completed")
+        self._notify_progress(
+            progress_callback, "writing_completed", section_latencies=self.section_latencies
+        )
 
         word_count = len(report_markdown)
         sections = len(cleaned_blocks)
@@ -162,6 +169,7 @@ class ReportingAgent(BaseAgent):
             "word_count": word_count,
             "sections": sections,
             "citations": citations,
+            "section_latencies": getattr(self, "section_latencies", []),
         }
 
         # If outline has been generated, add it to result
@@ -427,6 +435,18 @@ class ReportingAgent(BaseAgent):
                 f"Unable to parse LLM returned introduction content: {e!s}. Report generation failed."
             )
 
+    def _section_framework(self, citation_output_hint: str) -> str | None:
+        """
+        Writing framework shared by every section call.
+
+        It is sent as stable context ahead of the per-section prompt, so providers
+        can reuse the cached prefix across the sections of a report.
+        """
+        framework = self.get_prompt("process", "section_writing_framework", "")
+        if not framework:
+            return None
+        return self._safe_format(framework, citation_output_hint=citation_output_hint)
+
     async def _write_section_body(
         self, topic: str, block: TopicBlock, section_outline: dict[str, Any]
     ) -> str:
@@ -475,7 +495,13 @@ class ReportingAgent(BaseAgent):
             citation_output_hint=citation_output_hint,
         )
 
-        resp = await self.call_llm(filled, system_prompt, stage="write_section_body", verbose=False)
+        resp = await self.call_llm(
+            filled,
+            system_prompt,
+            context=self._section_framework(citation_output_hint),
+            stage="write_section_body",
+            verbose=False,
+        )
         data = extract_json_from_text(resp)
 
         try:
@@ -1108,26 +1134,49 @@ class ReportingAgent(BaseAgent):
             title = f"# {title}"
         parts.append(f"{title}\n\n")
 
-        # 2. Write introduction
-        print("  📝 Writing introduction...")
-        self._notify_progress(
-            getattr(self, "_progress_callback", None),
-            "writing_section",
-            current_section="Introduction",
-            section_index=0,
-            total_sections=len(outline.get("sections", [])) + 2,  # +2 for intro and conclusion
-        )
-        introduction = await self._write_introduction(topic, blocks, outline)
-        # Get introduction title from outline, or use default if not available
-        intro_title = outline.get("introduction", "## Introduction")
-        if not intro_title.startswith("##"):
-            intro_title = f"## {intro_title}"
-        parts.append(f"{intro_title}\n\n")
-        parts.append(introduction)
-        parts.append("\n\n")
-
-        # 3. Write each section with subsection support
+        # 2-4. Draft introduction, sections and conclusion. Each part only depends
+        # on the outline and topic blocks, so in parallel mode they are drafted
+        # concurrently and assembled in outline order.
         sections = outline.get("sections", [])
+        total_sections = len(sections) + 2  # +2 for intro and conclusion
+
+        async def write_introduction() -> str:
+            introduction = await self._write_introduction(topic, blocks, outline)
+            # Get introduction title from outline, or use default if not available
+            intro_title = outline.get("introduction", "## Introduction")
+            if not intro_title.startswith("##"):
+                intro_title = f"## {intro_title}"
+            return f"{intro_title}\n\n{introduction}\n\n"
+
+        async def write_conclusion() -> str:
+            conclusion = await self._write_conclusion(topic, blocks, outline)
+            # Get conclusion title from outline, or use default if not available
+            conclusion_title = outline.get("conclusion", "## Conclusion")
+            if not conclusion_title.startswith("##"):
+                conclusion_title = f"## {conclusion_title}"
+            return f"{conclusion_title}\n\n{conclusion}\n\n"
+
+        def section_writer(block: TopicBlock, section: dict[str, Any]):
+            async def write_section() -> str:
+                # Check if section has subsections defined in outline
+                subsections = section.get("subsections", [])
+
+                if subsections:
+                    # Write section with explicit subsection structure
+                    section_content = await self._write_section_with_subsections(
+                        topic, block, section, subsections
+                    )
+                else:
+                    # Write section normally (LLM will generate its own subsection structure)
+                    section_content = await self._write_section_body(topic, block, section)
+
+                # Section content already includes ## level title, append directly
+                return f"{section_content}\n\n"
+
+            return write_section
+
+        # (section_index, display title, writer)
+        drafts = [(0, "Introduction", write_introduction)]
         for i, section in enumerate(sections, 1):
             block_id = section.get("block_id")
             block = next((b for b in blocks if b.block_id == block_id), None)
@@ -1140,49 +1189,10 @@ class ReportingAgent(BaseAgent):
             section_title = section.get("title", block.sub_topic)
             # Clean section title for display (remove markdown markers)
             display_title = section_title.replace("##", "").strip()
-            print(f"  📝 Writing section {i}/{len(sections)}: {section_title}...")
-            self._notify_progress(
-                getattr(self, "_progress_callback", None),
-                "writing_section",
-                current_section=display_title,
-                section_index=i,  # 1-based, after introduction
-                total_sections=len(sections) + 2,  # +2 for intro and conclusion
-            )
-
-            # Check if section has subsections defined in outline
-            subsections = section.get("subsections", [])
-
-            if subsections:
-                # Write section with explicit subsection structure
-                section_content = await self._write_section_with_subsections(
-                    topic, block, section, subsections
-                )
-            else:
-                # Write section normally (LLM will generate its own subsection structure)
-                section_content = await self._write_section_body(topic, block, section)
+            drafts.append((i, display_title, section_writer(block, section)))
+        drafts.append((total_sections - 1, "Conclusion", write_conclusion))
 
-            # Section content already includes ## level title, append directly
-            parts.append(section_content)
-            parts.append("\n\n")
-
-        # 4. Write conclusion
-        print("  📝 Writing conclusion...")
-        total_sections = len(sections) + 2
-        self._notify_progress(
-            getattr(self, "_progress_callback", None),
-            "writing_section",
-            current_section="Conclusion",
-            section_index=total_sections - 1,  # Last section
-            total_sections=total_sections,
-        )
-        conclusion = await self._write_conclusion(topic, blocks, outline)
-        # Get conclusion title from outline, or use default if not available
-        conclusion_title = outline.get("conclusion", "## Conclusion")
-        if not conclusion_title.startswith("##"):
-            conclusion_title = f"## {conclusion_title}"
-        parts.append(f"{conclusion_title}\n\n")
-        parts.append(conclusion)
-        parts.append("\n\n")
+        parts.extend(await self._draft_parts(drafts, total_sections))
 
         # 5. Generate References based on configuration
         if self.enable_citation_list:
@@ -1213,6 +1223,68 @@ class ReportingAgent(BaseAgent):
 
         return report
 
+    async def _draft_parts(
+        self,
+        drafts: list[tuple[int, str, Callable[[], Awaitable[str]]]],
+        total_sections: int,
+    ) -> list[str]:
+        """Run report part writers and return their text in draft order
+
+        In ``parallel`` execution mode up to ``max_parallel_sections`` parts are
+        drafted at once; in ``series`` mode one at a time. Each part is reported
+        through the progress callback as soon as it is finished, with its
+        latency. The first failure cancels the remaining drafts.
+        """
+        execution_mode = self.reporting_config.get("execution_mode", "series")
+        max_parallel = 1
+        if execution_mode == "parallel":
+            max_parallel = max(1, int(self.reporting_config.get("max_parallel_sections", 4)))
+            print(f"  🚀 Drafting {len(drafts)} parts with up to {max_parallel} in parallel")
+
+        semaphore = asyncio.Semaphore(max_parallel)
+        callback = getattr(self, "_progress_callback", None)
+        self.section_latencies = []
+
+        async def draft(section_index: int, display_title: str, write) -> str:
+            async with semaphore:
+                print(f"  📝 Writing {display_title} ({section_index + 1}/{total_sections})...")
+                self._notify_progress(
+                    callback,
+                    "writing_section",
+                    current_section=display_title,
+                    section_index=section_index,
+                    total_sections=total_sections,
+                )
+                started = time.perf_counter()
+                text = await write()
+                latency = round(time.perf_counter() - started, 3)
+
+            self.section_latencies.append(
+                {"section_index": section_index, "title": display_title, "latency_s": latency}
+            )
+            print(f"  ✓ {display_title} written in {latency:.1f}s")
+            self._notify_progress(
+                callback,
+                "section_completed",
+                current_section=display_title,
+                section_index=section_index,
+                total_sections=total_sections,
+                latency_s=latency,
+                content=text,
+            )
+            return text
+
+        tasks = [asyncio.create_task(draft(*item)) for item in drafts]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            self.section_latencies.sort(key=lambda item: item["section_index"])
+
     async def _write_section_with_subsections(
         self,
         topic: str,
@@ -1300,6 +1372,7 @@ class ReportingAgent(BaseAgent):
         resp = await self.call_llm(
             filled,
             system_prompt,
+            context=self._section_framework(citation_output_hint),
             stage="write_section_with_subsections",
             verbose=False,
         )
@@ -55,12 +55,13 @@ from src.agents.research.agents import (
 )
 from src.agents.research.data_structures import DynamicTopicQueue
 from src.agents.research.utils.citation_manager import CitationManager
+from src.agents.research.utils.progress_log import ProgressEventLog
 from src.logging import get_logger
 from src.tools.code_executor import run_code
 from src.tools.paper_search_tool import PaperSearchTool
 from src.tools.query_item_tool import query_numbered_item
 from src.tools.rag_tool import rag_search
-from src.tools.web_search import web_search
+from src.tools.web_search import aweb_search
 
 
 class ResearchPipeline:
@@ -117,13 +118,9 @@ class ResearchPipeline:
         # Create directories
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.reports_dir.mkdir(parents=True, exist_ok=True)
-        self.plan_progress_file = self.cache_dir / "planning_progress.json"
-        self.report_progress_file = self.cache_dir / "reporting_progress.json"
         self.queue_progress_file = self.cache_dir / "queue_progress.json"
-        self._stage_events: dict[str, list[dict[str, Any]]] = {
-            "planning": [],
-            "reporting": [],
-        }
+        # Stage events go to {stage}_progress.jsonl with periodic JSON snapshots
+        self.progress_log = ProgressEventLog(self.cache_dir, self._progress_context)
 
         # Initialize queue
         queue_cfg = config.get("queue", {})
@@ -146,11 +143,6 @@ class ResearchPipeline:
         # Citation manager
         self.citation_manager = CitationManager(self.research_id, self.cache_dir)
 
-        # Lock for thread-safe progress file writing in parallel mode
-        import threading
-
-        self._progress_file_lock = threading.Lock()
-
     def _init_logger(self):
         """Initialize unified logging system"""
         # Get log_dir from config paths (user_log_dir from main.yaml)
@@ -322,7 +314,7 @@ class ResearchPipeline:
 
             if tool_type == "web_search":
                 res = await self._call_tool_with_retry(
-                    web_search,
+                    aweb_search,
                     query=query,
                     output_dir=str(self.cache_dir),
                     max_retries=max_retries,
@@ -502,6 +494,8 @@ class ResearchPipeline:
 
             self.logger.error(traceback.format_exc())
             raise
+        finally:
+            self.progress_log.close()
 
     async def _phase1_planning(self, topic: str) -> str:
         """
@@ -1105,23 +1099,7 @@ class ResearchPipeline:
         event = {"status": status, "timestamp": datetime.now().isoformat()}
         event.update({k: v for k, v in payload.items() if v is not None})
 
-        # Use lock to prevent concurrent file writes in parallel mode
-        with self._progress_file_lock:
-            if "researching" not in self._stage_events:
-                self._stage_events["researching"] = []
-            self._stage_events["researching"].append(event)
-
-            # Save to file
-            research_progress_file = self.cache_dir / "researching_progress.json"
-            context = {
-                "research_id": self.research_id,
-                "stage": "researching",
-                "input_topic": self.input_topic,
-                "optimized_topic": self.optimized_topic,
-                "events": self._stage_events["researching"],
-            }
-            with open(research_progress_file, "w", encoding="utf-8") as f:
-                json.dump(context, f, ensure_ascii=False, indent=2)
+        self.progress_log.record("researching", event)
 
         # Send progress via callback
         if self.progress_callback:
@@ -1203,23 +1181,22 @@ class ResearchPipeline:
 
         return report_result
 
-    def _log_progress(self, stage: str, status: str, **payload: Any) -> None:
-        """Record stage progress to JSON file and send progress via callback"""
-        if stage not in self._stage_events:
-            return
-        event = {"status": status, "timestamp": datetime.now().isoformat()}
-        event.update({k: v for k, v in payload.items() if v is not None})
-        self._stage_events[stage].append(event)
-        file_path = self.plan_progress_file if stage == "planning" else self.report_progress_file
-        context = {
+    def _progress_context(self, stage: str) -> dict[str, Any]:
+        """Header of a stage's progress snapshot"""
+        return {
             "research_id": self.research_id,
             "stage": stage,
             "input_topic": self.input_topic,
             "optimized_topic": self.optimized_topic,
-            "events": self._stage_events[stage],
         }
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(context, f, ensure_ascii=False, indent=2)
+
+    def _log_progress(self, stage: str, status: str, **payload: Any) -> None:
+        """Record stage progress to the event log and send progress via callback"""
+        if stage not in ("planning", "reporting"):
+            return
+        event = {"status": status, "timestamp": datetime.now().isoformat()}
+        event.update({k: v for k, v in payload.items() if v is not None})
+        self.progress_log.record(stage, event)
 
         # Send progress via callback (if callback function is set)
         if self.progress_callback:
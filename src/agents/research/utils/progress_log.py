@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ProgressEventLog - Append-only progress events with periodic snapshots
+
+Each stage's events are appended to ``{stage}_progress.jsonl`` (one JSON object
+per line) by a background writer thread, so recording an event never touches
+the disk on the caller's path. ``{stage}_progress.json`` keeps the previous
+schema ({research_id, stage, input_topic, optimized_topic, events}) and is
+rewritten at most once per snapshot interval and on close, instead of after
+every event.
+"""
+
+from collections.abc import Callable
+import json
+import os
+from pathlib import Path
+import queue
+import threading
+import time
+from typing import Any
+
+# Seconds between snapshot rewrites of a stage that received new events
+DEFAULT_SNAPSHOT_INTERVAL = 2.0
+
+_STOP = object()
+
+
+class ProgressEventLog:
+    """Per-stage progress events, written off the caller's thread"""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        context: Callable[[str], dict[str, Any]],
+        snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+    ):
+        """
+        Initialize the event log
+
+        Args:
+            cache_dir: Directory of the research run
+            context: Returns the snapshot header for a stage (research_id, topics, ...)
+            snapshot_interval: Minimum seconds between snapshot rewrites per stage
+        """
+        self.cache_dir = Path(cache_dir)
+        self.context = context
+        self.snapshot_interval = snapshot_interval
+        self._events: dict[str, list[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._closed = False
+
+    def events(self, stage: str) -> list[dict[str, Any]]:
+        """Events recorded so far for a stage"""
+        with self._lock:
+            return list(self._events.get(stage, []))
+
+    def record(self, stage: str, event: dict[str, Any]) -> None:
+        """
+        Record one event; the write happens on the background writer
+
+        Args:
+            stage: Stage name (planning, researching, reporting)
+            event: JSON-serializable event
+        """
+        with self._lock:
+            self._events.setdefault(stage, []).append(event)
+            if self._closed:
+                return
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run, name="research-progress-writer", daemon=True
+                )
+                self._writer.start()
+            # Enqueue under the lock so the stream keeps the in-memory order
+            self._queue.put((stage, event))
+
+    def close(self) -> None:
+        """Flush pending events and write final snapshots"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            writer = self._writer
+        if writer is not None:
+            self._queue.put(_STOP)
+            writer.join()
+        for stage in self._stages():
+            self._write_snapshot(stage)
+
+    def _stages(self) -> list[str]:
+        with self._lock:
+            return list(self._events)
+
+    def _run(self) -> None:
+        last_snapshot: dict[str, float] = {}
+        dirty: set[str] = set()
+        stop = False
+        while not stop:
+            try:
+                items = [self._queue.get(timeout=self.snapshot_interval)]
+            except queue.Empty:
+                items = []
+            # Drain whatever else is queued so a burst becomes one write per stage
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines: dict[str, list[str]] = {}
+            for item in items:
+                if item is _STOP:
+                    stop = True
+                    continue
+                stage, event = item
+                lines.setdefault(stage, []).append(json.dumps(event, ensure_ascii=False))
+            for stage, stage_lines in lines.items():
+                self._append(stage, stage_lines)
+                dirty.add(stage)
+
+            now = time.monotonic()
+            for stage in list(dirty):
+                if stop:
+                    # close() writes the final snapshots
+                    break
+                if now - last_snapshot.get(stage, 0.0) >= self.snapshot_interval:
+                    self._write_snapshot(stage)
+                    last_snapshot[stage] = now
+                    dirty.discard(stage)
+
+    def _append(self, stage: str, lines: list[str]) -> None:
+        try:
+            path = self.cache_dir / f"{stage}_progress.jsonl"
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError:
+            pass
+
+    def _write_snapshot(self, stage: str) -> None:
+        snapshot = {**self.context(stage), "events": self.events(stage)}
+        path = self.cache_dir / f"{stage}_progress.json"
+        tmp = path.with_suffix(".json.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+
+__all__ = ["ProgressEventLog"]
@@ -4,6 +4,7 @@ InvestigateAgent - Investigator
 Generates query actions and calls tools based on current memory and reflections.
 """
 
+import asyncio
 from pathlib import Path
 import sys
 from typing import Any
@@ -15,10 +16,11 @@ sys.path.insert(0, str(project_root))
 import json
 
 from src.agents.base_agent import BaseAgent
-from src.tools import query_numbered_item, rag_search, web_search
+from src.tools import aweb_search, query_numbered_item, rag_search
 
 from ..memory import CitationMemory, InvestigateMemory, KnowledgeItem
 from ..utils.json_utils import extract_json_from_text
+from ..utils.tool_scheduler import ToolScheduler
 
 
 class InvestigateAgent(BaseAgent):
@@ -51,6 +53,9 @@ class InvestigateAgent(BaseAgent):
         self.max_actions_per_round = agent_config.get("max_actions_per_round", 1)
         self.max_iterations = agent_config.get("max_iterations", 3)
 
+        # Tool calls of one round run per solve.tool_execution (series or bounded parallel)
+        self.tool_scheduler = ToolScheduler.from_config(config)
+
     async def process(
         self,
         question: str,
@@ -152,24 +157,29 @@ class InvestigateAgent(BaseAgent):
         # Limit number of actions per round based on config
         tool_plans_to_execute = tool_plans[: self.max_actions_per_round]
 
+        actions = []
         for plan in tool_plans_to_execute:
             tool_type = plan.get("tool")
-            if not tool_type:
-                continue
-
-            query = plan.get("query", "")
-            identifier = plan.get("identifier")
-
-            if tool_type == "none":
+            if not tool_type or tool_type == "none":
                 continue
+            actions.append((tool_type, plan.get("query", ""), plan.get("identifier")))
+
+        # Tool calls are independent I/O and run concurrently (bounded per tool
+        # type); citations are registered afterwards in plan order so cite_ids
+        # stay deterministic
+        outcomes = await self.tool_scheduler.run(
+            actions,
+            lambda action: action[0],
+            lambda action: self._run_tool(*action, kb_name=kb_name, output_dir=output_dir),
+        )
 
-            knowledge_item = await self._execute_single_action(
-                tool_selection=tool_type,
-                query=query,
-                identifier=identifier,
-                kb_name=kb_name,
-                output_dir=output_dir,
-                citation_memory=citation_memory,
+        for (tool_type, query, identifier), outcome in zip(actions, outcomes):
+            knowledge_item = (
+                self._register_knowledge(
+                    outcome, tool_type, query, identifier, kb_name, citation_memory
+                )
+                if outcome
+                else None
             )
 
             executed_actions.append(
@@ -185,6 +195,9 @@ class InvestigateAgent(BaseAgent):
                 memory.add_knowledge(knowledge_item)
                 knowledge_ids.append(knowledge_item.cite_id)
 
+        if knowledge_ids:
+            citation_memory.save()
+
         if knowledge_ids and output_dir:
             memory.save()
 
@@ -290,16 +303,15 @@ class InvestigateAgent(BaseAgent):
             )
         return template.format(**context)
 
-    async def _execute_single_action(
+    async def _run_tool(
         self,
         tool_selection: str,
         query: str,
         identifier: str | None,
         kb_name: str,
         output_dir: str | None,
-        citation_memory: CitationMemory,
-    ) -> KnowledgeItem | None:
-        """Execute a single tool call"""
+    ) -> dict[str, Any] | None:
+        """Call a tool; returns its result, or None if the call was rejected or failed"""
         import time
 
         start_time = time.time()
@@ -344,38 +356,11 @@ class InvestigateAgent(BaseAgent):
                 self.logger.warning(f"Unknown tool type: {tool_selection}")
                 return None
 
-            elapsed_ms = (time.time() - start_time) * 1000
-
-            # Create and register citation
-            cite_id = citation_memory.add_citation(
-                tool_type=tool_selection,
-                query=query,
-                raw_result=raw_result,
-                stage="analysis",
-                metadata={"identifier": identifier},
-            )
-            citation_memory.save()
-
-            # Log tool call
-            self.logger.log_tool_call(
-                tool_name=tool_selection,
-                tool_input=tool_input,
-                tool_output=result,
-                status="success",
-                elapsed_ms=elapsed_ms,
-                citation_id=cite_id,
-            )
-
-            # Create knowledge item
-            knowledge_item = KnowledgeItem(
-                cite_id=cite_id,
-                tool_type=tool_selection,
-                query=query,
-                raw_result=raw_result,
-                summary="",  # Generated by NoteAgent
-            )
-
-            return knowledge_item
+            return {
+                "result": result,
+                "raw_result": raw_result,
+                "elapsed_ms": (time.time() - start_time) * 1000,
+            }
 
         except Exception as e:
             elapsed_ms = (time.time() - start_time) * 1000
@@ -393,6 +378,46 @@ class InvestigateAgent(BaseAgent):
             self.logger.warning(f"Tool call failed ({tool_selection}): {e}")
             return None
 
+    def _register_knowledge(
+        self,
+        outcome: dict[str, Any],
+        tool_selection: str,
+        query: str,
+        identifier: str | None,
+        kb_name: str,
+        citation_memory: CitationMemory,
+    ) -> KnowledgeItem:
+        """Register a tool result as a citation (caller saves citation memory)"""
+        raw_result = outcome["raw_result"]
+
+        # Create and register citation
+        cite_id = citation_memory.add_citation(
+            tool_type=tool_selection,
+            query=query,
+            raw_result=raw_result,
+            stage="analysis",
+            metadata={"identifier": identifier},
+        )
+
+        # Log tool call
+        self.logger.log_tool_call(
+            tool_name=tool_selection,
+            tool_input={"query": query, "identifier": identifier, "kb_name": kb_name},
+            tool_output=outcome["result"],
+            status="success",
+            elapsed_ms=outcome["elapsed_ms"],
+            citation_id=cite_id,
+        )
+
+        # Create knowledge item
+        return KnowledgeItem(
+            cite_id=cite_id,
+            tool_type=tool_selection,
+            query=query,
+            raw_result=raw_result,
+            summary="",  # Generated by NoteAgent
+        )
+
     async def _call_rag_naive(
         self, query: str, kb_name: str, output_dir: str | None
     ) -> dict[str, Any]:
@@ -407,8 +432,8 @@ class InvestigateAgent(BaseAgent):
 
     async def _call_web_search(self, query: str, output_dir: str | None) -> dict[str, Any]:
         """Call Web Search"""
-        return web_search(query=query, output_dir=output_dir or "./cache", verbose=False)
+        return await aweb_search(query=query, output_dir=output_dir or "./cache", verbose=False)
 
     async def _call_query_item(self, identifier: str, kb_name: str) -> dict[str, Any]:
-        """Call Query Item"""
-        return query_numbered_item(identifier=identifier, kb_name=kb_name)
+        """Call Query Item (blocking, so run in a worker thread)"""
+        return await asyncio.to_thread(query_numbered_item, identifier=identifier, kb_name=kb_name)
@@ -68,11 +68,15 @@ class ResponseAgent(BaseAgent):
             accumulated_response=accumulated_response,
         )
 
-        system_prompt = self._build_system_prompt(context["image_materials"])
+        system_prompt = self._build_system_prompt()
         user_prompt = self._build_user_prompt(context)
 
+        # The question and the steps written so far open every step's prompt
         response = await self.call_llm(
-            user_prompt=user_prompt, system_prompt=system_prompt, verbose=verbose
+            user_prompt=user_prompt,
+            system_prompt=system_prompt,
+            context=self._build_stable_context(context),
+            verbose=verbose,
         )
 
         # Directly use LLM's raw output as step_response, no parsing
@@ -119,7 +123,7 @@ class ResponseAgent(BaseAgent):
             or "(No previous content, this is the first step)",
         }
 
-    def _build_system_prompt(self, image_materials: list[str]) -> str:
+    def _build_system_prompt(self) -> str:
         base_prompt = self.get_prompt("system") if self.has_prompts() else None
         if not base_prompt:
             raise ValueError(
@@ -135,17 +139,16 @@ class ResponseAgent(BaseAgent):
             else:
                 citation_instruction = "\n\n**Important: Citation Feature Disabled**\n"
 
-        if image_materials:
-            image_list = "\n".join([f"  - {img}" for img in image_materials])
-            image_instruction_template = self.get_prompt("image_instruction")
-            if image_instruction_template:
-                image_instruction = image_instruction_template.format(image_list=image_list)
-            else:
-                image_instruction = f"\n\n**Image files to insert**:\n{image_list}\n"
-            return base_prompt + citation_instruction + image_instruction
-
         return base_prompt + citation_instruction
 
+    def _build_stable_context(self, context: dict[str, Any]) -> str:
+        template = self.get_prompt("context_template") if self.has_prompts() else None
+        if not template:
+            raise ValueError(
+                "ResponseAgent missing context_template, please configure context_template in prompts/{lang}/solve_loop/response_agent.yaml"
+            )
+        return template.format(**context)
+
     def _build_user_prompt(self, context: dict[str, Any]) -> str:
         template = self.get_prompt("user_template") if self.has_prompts() else None
         if not template:
@@ -153,6 +156,17 @@ class ResponseAgent(BaseAgent):
                 "ResponseAgent missing user_template, please configure user_template in prompts/{lang}/solve_loop/response_agent.yaml"
             )
 
+        # The image instruction changes with every step, so it ends the user
+        # prompt instead of the shared system prompt
+        image_instruction = ""
+        if context.get("image_materials"):
+            image_list = "\n".join([f"  - {img}" for img in context["image_materials"]])
+            image_instruction_template = self.get_prompt("image_instruction")
+            if image_instruction_template:
+                image_instruction = image_instruction_template.format(image_list=image_list)
+            else:
+                image_instruction = f"\n\n**Image files to insert**:\n{image_list}\n"
+
         # Format image_materials as clear text list
         image_materials = context.get("image_materials", [])
         if image_materials:
@@ -164,7 +178,7 @@ class ResponseAgent(BaseAgent):
         formatted_context = context.copy()
         formatted_context["image_materials"] = image_text
 
-        return template.format(**formatted_context)
+        return template.format(**formatted_context) + image_instruction
 
     # ------------------------------------------------------------------ #
     # Material Organization
@@ -76,9 +76,12 @@ class SolveAgent(BaseAgent):
         system_prompt = self._build_system_prompt()
         user_prompt = self._build_user_prompt(context)
 
+        # Question, step target and background stay the same across the
+        # iterations of a step, so they go into the cacheable prefix
         response = await self.call_llm(
             user_prompt=user_prompt,
             system_prompt=system_prompt,
+            context=self._build_stable_context(context),
             verbose=verbose,
             response_format={"type": "json_object"},  # Force JSON
         )
@@ -200,6 +203,14 @@ class SolveAgent(BaseAgent):
             )
         return prompt
 
+    def _build_stable_context(self, context: dict[str, Any]) -> str:
+        template = self.get_prompt("context_template") if self.has_prompts() else None
+        if not template:
+            raise ValueError(
+                "SolveAgent missing context_template prompt, please configure context_template in prompts/zh/solve_loop/solve_agent.yaml."
+            )
+        return template.format(**context)
+
     def _build_user_prompt(self, context: dict[str, Any]) -> str:
         template = self.get_prompt("user_template") if self.has_prompts() else None
         if not template:
@@ -18,10 +18,11 @@ if str(project_root) not in sys.path:
 from src.agents.base_agent import BaseAgent
 from src.tools.code_executor import run_code
 from src.tools.rag_tool import rag_search
-from src.tools.web_search import web_search
+from src.tools.web_search import aweb_search
 
 from ..memory import CitationMemory, SolveChainStep, SolveMemory
 from ..memory.solve_memory import ToolCallRecord
+from ..utils.tool_scheduler import ToolScheduler
 
 
 class ToolAgent(BaseAgent):
@@ -46,6 +47,7 @@ class ToolAgent(BaseAgent):
             config=config,
             token_tracker=token_tracker,
         )
+        self.tool_scheduler = ToolScheduler.from_config(config)
 
     async def _generate_code_from_intent(self, intent: str) -> str:
         system_prompt = """
@@ -104,7 +106,7 @@ Rules:
             "Tool", "start", f"step={step.step_id}, pending_calls={len(pending)}"
         )
 
-        for record in pending:
+        async def run_call(record: ToolCallRecord) -> dict[str, Any]:
             call_label = f"{record.tool_type} | cite={record.cite_id or '-'}"
             self.logger.log_stage_progress(
                 "Tool", "running", f"step={step.step_id}, call={call_label}"
@@ -130,35 +132,58 @@ Rules:
                 summary = await self._summarize_tool_result(
                     tool_type=record.tool_type, query=record.query, raw_answer=raw_answer
                 )
+                return {
+                    "raw_answer": raw_answer,
+                    "metadata": metadata,
+                    "summary": summary,
+                    # Set correct status based on execution result
+                    "status": "failed" if is_failed else "success",
+                    "elapsed_ms": (time.time() - start_ts) * 1000,
+                }
+            except Exception as e:
+                error_msg = str(e)
+                self.logger.log_stage_progress(
+                    "Tool", "warning", f"step={step.step_id}, call={call_label}, error={error_msg}"
+                )
+                return {
+                    "error": error_msg,
+                    "elapsed_ms": (time.time() - start_ts) * 1000,
+                }
+
+        # Independent calls run concurrently (bounded per tool type); results are
+        # written to memory afterwards in call order
+        outcomes = await self.tool_scheduler.run(pending, lambda r: r.tool_type, run_call)
 
-                # Set correct status based on execution result
-                status = "failed" if is_failed else "success"
+        for record, outcome in zip(pending, outcomes):
+            tool_input = {
+                "step_id": step.step_id,
+                "call_id": record.call_id,
+                "query": record.query,
+            }
+            if "error" not in outcome:
+                raw_answer = outcome["raw_answer"]
+                summary = outcome["summary"]
                 solve_memory.update_tool_call_result(
                     step_id=step.step_id,
                     call_id=record.call_id,
                     raw_answer=raw_answer,
                     summary=summary,
-                    status=status,
-                    metadata=metadata,  # Pass metadata to ensure artifacts are saved
+                    status=outcome["status"],
+                    metadata=outcome["metadata"],  # Pass metadata to ensure artifacts are saved
                 )
                 citation_memory.update_citation(
                     cite_id=record.cite_id,
                     raw_result=raw_answer,
                     content=summary,
-                    metadata=metadata,
+                    metadata=outcome["metadata"],
                     step_id=step.step_id,
                 )
-                elapsed_ms = (time.time() - start_ts) * 1000
                 self.logger.log_tool_call(
                     tool_name=record.tool_type,
-                    tool_input={
-                        "step_id": step.step_id,
-                        "call_id": record.call_id,
-                        "query": record.query,
-                    },
+                    tool_input=tool_input,
                     tool_output=raw_answer,
                     status="success",
-                    elapsed_ms=elapsed_ms,
+                    elapsed_ms=outcome["elapsed_ms"],
                     step_id=step.step_id,
                     cite_id=record.cite_id,
                 )
@@ -171,9 +196,8 @@ Rules:
                         "summary": summary,
                     }
                 )
-            except Exception as e:
-                error_msg = str(e)
-                elapsed_ms = (time.time() - start_ts) * 1000
+            else:
+                error_msg = outcome["error"]
                 solve_memory.update_tool_call_result(
                     step_id=step.step_id,
                     call_id=record.call_id,
@@ -191,20 +215,13 @@ Rules:
                 )
                 self.logger.log_tool_call(
                     tool_name=record.tool_type,
-                    tool_input={
-                        "step_id": step.step_id,
-                        "call_id": record.call_id,
-                        "query": record.query,
-                    },
+                    tool_input=tool_input,
                     tool_output=error_msg,
                     status="failed",
-                    elapsed_ms=elapsed_ms,
+                    elapsed_ms=outcome["elapsed_ms"],
                     step_id=step.step_id,
                     cite_id=record.cite_id,
                 )
-                self.logger.log_stage_progress(
-                    "Tool", "warning", f"step={step.step_id}, call={call_label}, error={error_msg}"
-                )
                 logs.append(
                     {
                         "call_id": record.call_id,
@@ -250,7 +267,7 @@ Rules:
             return answer, metadata
 
         if tool_type == "web_search":
-            result = web_search(query=query, output_dir=output_dir, verbose=verbose)
+            result = await aweb_search(query=query, output_dir=output_dir, verbose=verbose)
             answer = result.get("answer") or result.get("summary") or ""
             used_citation_ids = self._extract_answer_citations(answer)
             filtered_citations = self._select_web_citations(used_citation_ids, result)
@@ -37,6 +37,9 @@ from .performance_monitor import PerformanceMonitor
 # Token tracker
 from .token_tracker import TokenTracker, calculate_cost, get_model_pricing
 
+# Tool scheduling
+from .tool_scheduler import ToolScheduler
+
 __all__ = [
     # Logging system
     "Logger",
@@ -52,6 +55,8 @@ __all__ = [
     "TokenTracker",
     "calculate_cost",
     "get_model_pricing",
+    # Tool scheduling
+    "ToolScheduler",
     # Error handling
     "ParseError",
     "retry_on_parse_error",
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Tool Scheduler - Bounded-parallel execution of a round of tool calls
+Runs independent tool calls (RAG, web search, query_item, ...) concurrently with
+a global cap and per-tool-type caps; results come back in input order
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Code execution snapshots the shared artifacts directory to find new images,
+# so two runs at once would pick up each other's files
+DEFAULT_PER_TOOL_LIMITS = {"code_execution": 1}
+
+
+class ToolScheduler:
+    """Run tool calls in series or bounded parallel"""
+
+    def __init__(
+        self,
+        mode: str = "series",
+        max_concurrency: int = 4,
+        per_tool_limits: dict[str, int] | None = None,
+    ):
+        self.mode = mode
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.per_tool_limits = {**DEFAULT_PER_TOOL_LIMITS, **(per_tool_limits or {})}
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "ToolScheduler":
+        """Build from the ``solve.tool_execution`` section of the main config"""
+        settings = config.get("solve", {}).get("tool_execution", {}) or {}
+        return cls(
+            mode=settings.get("mode", "series"),
+            max_concurrency=settings.get("max_concurrency", 4),
+            per_tool_limits=settings.get("per_tool_limits"),
+        )
+
+    @property
+    def parallel(self) -> bool:
+        return self.mode == "parallel" and self.max_concurrency > 1
+
+    async def run(
+        self,
+        items: list[T],
+        tool_type: Callable[[T], str],
+        worker: Callable[[T], Awaitable[R]],
+    ) -> list[R]:
+        """
+        Run worker on every item
+
+        Args:
+            items: Tool calls of one round
+            tool_type: Returns the tool type of an item (selects its per-type cap)
+            worker: Executes one item; should handle its own errors
+
+        Returns:
+            Worker results in the order of items
+        """
+        if not self.parallel or len(items) <= 1:
+            return [await worker(item) for item in items]
+
+        overall = asyncio.Semaphore(self.max_concurrency)
+        per_type = {
+            name: asyncio.Semaphore(max(1, int(limit)))
+            for name, limit in self.per_tool_limits.items()
+        }
+
+        async def run_one(item: T) -> R:
+            limit = per_type.get(tool_type(item))
+            if limit is None:
+                async with overall:
+                    return await worker(item)
+            # Take the per-type slot first so waiting calls do not hold a global slot
+            async with limit, overall:
+                return await worker(item)
+
+        return list(await asyncio.gather(*(run_one(item) for item in items)))
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -119,6 +120,26 @@ def validate_tool_consistency():
         raise
 
 
+async def warmup_default_kb():
+    """
+    Preload the default knowledge base's index in the background.
+
+    Failures are logged and never block startup.
+    """
+    try:
+        from src.knowledge.manager import KnowledgeBaseManager
+        from src.services.rag.service import RAGService
+
+        kb_base_dir = Path(__file__).parent.parent.parent / "data" / "knowledge_bases"
+        default_kb = KnowledgeBaseManager(base_dir=str(kb_base_dir)).get_default()
+        if not default_kb:
+            return
+
+        await RAGService(kb_base_dir=str(kb_base_dir)).warmup(default_kb)
+    except Exception as e:
+        logger.warning(f"Failed to warm up default knowledge base: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -142,8 +163,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to initialize LLM client at startup: {e}")
 
+    # Preload the default KB index without delaying startup
+    warmup_task = asyncio.create_task(warmup_default_kb())
+
     yield
     # Execute on shutdown
+    if not warmup_task.done():
+        warmup_task.cancel()
+
+    # Close pooled provider connections
+    try:
+        from src.services.llm.http_pool import close_session_pool
+
+        await close_session_pool()
+    except Exception as e:
+        logger.warning(f"Failed to close LLM HTTP sessions: {e}")
+
     logger.info("Application shutdown")
 
 
@@ -6,6 +6,7 @@ WebSocket endpoint for lightweight chat with session management.
 REST endpoints for session operations.
 """
 
+import asyncio
 from pathlib import Path
 import sys
 
@@ -17,6 +18,7 @@ sys.path.insert(0, str(_project_root))
 from src.agents.chat import ChatAgent, SessionManager
 from src.logging import get_logger
 from src.services.config import load_config_with_main
+from src.services.llm import set_llm_session
 from src.services.llm.config import get_llm_config
 from src.services.settings.interface_settings import get_ui_language
 
@@ -48,7 +50,9 @@ async def list_sessions(limit: int = 20):
     Returns:
         List of session summaries
     """
-    return session_manager.list_sessions(limit=limit, include_messages=False)
+    return await asyncio.to_thread(
+        session_manager.list_sessions, limit=limit, include_messages=False
+    )
 
 
 @router.get("/chat/sessions/{session_id}")
@@ -62,7 +66,7 @@ async def get_session(session_id: str):
     Returns:
         Complete session data including messages
     """
-    session = session_manager.get_session(session_id)
+    session = await asyncio.to_thread(session_manager.get_session, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     return session
@@ -79,7 +83,7 @@ async def delete_session(session_id: str):
     Returns:
         Success message
     """
-    if session_manager.delete_session(session_id):
+    if await asyncio.to_thread(session_manager.delete_session, session_id):
         return {"status": "deleted", "session_id": session_id}
     raise HTTPException(status_code=404, detail="Session not found")
 
@@ -139,10 +143,11 @@ async def websocket_chat(websocket: WebSocket):
             try:
                 # Get or create session
                 if session_id:
-                    session = session_manager.get_session(session_id)
+                    session = await asyncio.to_thread(session_manager.get_session, session_id)
                     if not session:
                         # Session not found, create new one
-                        session = session_manager.create_session(
+                        session = await asyncio.to_thread(
+                            session_manager.create_session,
                             title=message[:50] + ("..." if len(message) > 50 else ""),
                             settings={
                                 "kb_name": kb_name,
@@ -153,7 +158,8 @@ async def websocket_chat(websocket: WebSocket):
                         session_id = session["session_id"]
                 else:
                     # Create new session
-                    session = session_manager.create_session(
+                    session = await asyncio.to_thread(
+                        session_manager.create_session,
                         title=message[:50] + ("..." if len(message) > 50 else ""),
                         settings={
                             "kb_name": kb_name,
@@ -163,6 +169,9 @@ async def websocket_chat(websocket: WebSocket):
                     )
                     session_id = session["session_id"]
 
+                # Queue this conversation's LLM calls as one fair-share session
+                set_llm_session(f"chat:{session_id}")
+
                 # Send session ID to frontend
                 await websocket.send_json(
                     {
@@ -182,7 +191,8 @@ async def websocket_chat(websocket: WebSocket):
                     ]
 
                 # Add user message to session
-                session_manager.add_message(
+                await asyncio.to_thread(
+                    session_manager.add_message,
                     session_id=session_id,
                     role="user",
                     content=message,
@@ -273,7 +283,8 @@ async def websocket_chat(websocket: WebSocket):
                 )
 
                 # Save assistant message to session
-                session_manager.add_message(
+                await asyncio.to_thread(
+                    session_manager.add_message,
                     session_id=session_id,
                     role="assistant",
                     content=full_response,
@@ -376,7 +376,8 @@ async def list_knowledge_bases():
 
         for name in kb_names:
             try:
-                info = manager.get_info(name)
+                # Directory scans and config reads are blocking file I/O
+                info = await asyncio.to_thread(manager.get_info, name)
                 logger.debug(f"Successfully got info for KB '{name}': {info.get('statistics', {})}")
                 result.append(
                     KnowledgeBaseInfo(
@@ -433,7 +434,7 @@ async def get_knowledge_base_details(kb_name: str):
     """Get detailed info for a specific KB."""
     try:
         manager = get_kb_manager()
-        return manager.get_info(kb_name)
+        return await asyncio.to_thread(manager.get_info, kb_name)
     except ValueError:
         raise HTTPException(status_code=404, detail=f"Knowledge base '{kb_name}' not found")
     except Exception as e:
@@ -14,7 +14,7 @@ from src.api.utils.history import ActivityType, history_manager
 from src.api.utils.task_id_manager import TaskIDManager
 from src.logging import get_logger
 from src.services.config import load_config_with_main
-from src.services.llm import get_llm_config
+from src.services.llm import get_llm_config, set_llm_session
 from src.services.settings.interface_settings import get_ui_language
 
 # Force stdout to use utf-8 to prevent encoding errors with emojis on Windows
@@ -111,6 +111,9 @@ async def websocket_research_run(websocket: WebSocket):
         task_key = f"research_{kb_name}_{hash(str(topic))}"
         task_id = task_manager.generate_task_id("research", task_key)
 
+        # Queue this job's LLM calls as one fair-share session
+        set_llm_session(f"research:{task_id}")
+
         # Send task ID to frontend
         await websocket.send_json({"type": "task_id", "task_id": task_id})
 
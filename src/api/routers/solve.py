@@ -22,7 +22,7 @@ _project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(_project_root))
 from src.logging import get_logger
 from src.services.config import load_config_with_main
-from src.services.llm import get_llm_config
+from src.services.llm import get_llm_config, set_llm_session
 from src.services.settings.interface_settings import get_ui_language
 
 # Initialize logger with config
@@ -53,7 +53,9 @@ async def list_solver_sessions(limit: int = 20):
     Returns:
         List of session summaries
     """
-    return solver_session_manager.list_sessions(limit=limit, include_messages=False)
+    return await asyncio.to_thread(
+        solver_session_manager.list_sessions, limit=limit, include_messages=False
+    )
 
 
 @router.get("/solve/sessions/{session_id}")
@@ -67,7 +69,7 @@ async def get_solver_session(session_id: str):
     Returns:
         Complete session data including messages
     """
-    session = solver_session_manager.get_session(session_id)
+    session = await asyncio.to_thread(solver_session_manager.get_session, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     return session
@@ -84,7 +86,7 @@ async def delete_solver_session(session_id: str):
     Returns:
         Success message
     """
-    if solver_session_manager.delete_session(session_id):
+    if await asyncio.to_thread(solver_session_manager.delete_session, session_id):
         return {"status": "deleted", "session_id": session_id}
     raise HTTPException(status_code=404, detail="Session not found")
 
@@ -157,27 +159,33 @@ async def websocket_solve(websocket: WebSocket):
 
         # Get or create session
         if session_id:
-            session = solver_session_manager.get_session(session_id)
+            session = await asyncio.to_thread(solver_session_manager.get_session, session_id)
             if not session:
                 # Session not found, create new one
-                session = solver_session_manager.create_session(
+                session = await asyncio.to_thread(
+                    solver_session_manager.create_session,
                     title=question[:50] + ("..." if len(question) > 50 else ""),
                     kb_name=kb_name,
                 )
                 session_id = session["session_id"]
         else:
             # Create new session
-            session = solver_session_manager.create_session(
+            session = await asyncio.to_thread(
+                solver_session_manager.create_session,
                 title=question[:50] + ("..." if len(question) > 50 else ""),
                 kb_name=kb_name,
             )
             session_id = session["session_id"]
 
+        # Queue this solve's LLM calls as one fair-share session
+        set_llm_session(f"solve:{session_id}")
+
         # Send session ID to frontend
         await websocket.send_json({"type": "session", "session_id": session_id})
 
         # Add user message to session
-        solver_session_manager.add_message(
+        await asyncio.to_thread(
+            solver_session_manager.add_message,
             session_id=session_id,
             role="user",
             content=question,
@@ -359,7 +367,8 @@ async def websocket_solve(websocket: WebSocket):
 
             # Save assistant message to session
             if session_id:
-                solver_session_manager.add_message(
+                await asyncio.to_thread(
+                    solver_session_manager.add_message,
                     session_id=session_id,
                     role="assistant",
                     content=final_answer,
@@ -367,7 +376,8 @@ async def websocket_solve(websocket: WebSocket):
                 )
                 # Update token stats in session
                 if display_manager:
-                    solver_session_manager.update_token_stats(
+                    await asyncio.to_thread(
+                        solver_session_manager.update_token_stats,
                         session_id=session_id,
                         token_stats=display_manager.stats.copy(),
                     )
@@ -82,6 +82,19 @@ async def get_system_status():
     return result
 
 
+@router.get("/pools")
+async def get_pool_stats():
+    """
+    Get connection pool statistics for outbound provider calls
+
+    Returns:
+        Dictionary containing pooled LLM HTTP session stats
+    """
+    from src.services.llm.http_pool import get_session_pool
+
+    return {"llm": get_session_pool().get_stats()}
+
+
 @router.post("/test/llm", response_model=TestResponse)
 async def test_llm_connection():
     """
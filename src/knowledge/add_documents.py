@@ -28,6 +28,7 @@ from typing import Any, Dict, List
 from dotenv import load_dotenv
 
 from src.knowledge.extract_numbered_items import process_content_list
+from src.knowledge.stats import refresh_kb_stats
 from src.logging import LightRAGLogContext, get_logger
 from src.services.llm import get_llm_config
 
@@ -789,6 +790,11 @@ class DocumentAdder:
         except Exception as e:
             logger.warning(f"Metadata update failed: {e}")
 
+        try:
+            refresh_kb_stats(self.kb_dir)
+        except Exception as e:
+            logger.warning(f"KB stats refresh failed: {e}")
+
 
 async def main():
     parser = argparse.ArgumentParser(
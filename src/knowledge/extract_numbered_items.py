@@ -9,7 +9,6 @@ Use LLM to identify these contents and store the mapping between numbers and ori
 
 import argparse
 import asyncio
-import inspect
 import json
 import os
 from pathlib import Path
@@ -20,7 +19,9 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from dotenv import load_dotenv
 
-from src.services.llm import get_llm_client, get_llm_config
+from src.services.config import get_agent_params
+from src.services.llm import complete as llm_complete
+from src.services.llm import get_llm_config, get_token_limit_kwargs
 
 load_dotenv(dotenv_path=".env", override=False)
 
@@ -61,26 +62,29 @@ async def _call_llm_async(
     temperature: float = 0.1,
     model: str = None,
 ) -> str:
-    """Asynchronously call LLM using unified LLM service"""
-    # Get unified LLM client (handles all provider differences and env var setup)
-    llm_client = get_llm_client()
-    llm_model_func = llm_client.get_model_func()
+    """
+    Asynchronously call LLM using unified LLM service
 
-    # If model not specified, use configured model
-    if model is None:
-        model = llm_client.config.model
+    Re-extracting the same content issues the same prompts, so calls go through
+    the completion cache when agents.yaml enables it for the knowledge module.
+    """
+    llm_cfg = get_llm_config()
+    model = model or llm_cfg.model
 
-    result = llm_model_func(
-        prompt,
+    return await llm_complete(
+        prompt=prompt,
         system_prompt=system_prompt,
-        max_tokens=max_tokens,
+        model=model,
+        api_key=api_key or llm_cfg.api_key,
+        base_url=base_url or llm_cfg.base_url,
+        api_version=llm_cfg.api_version,
+        binding=llm_cfg.binding,
         temperature=temperature,
+        cache=get_agent_params("knowledge").get("cache"),
+        priority="batch",
+        **get_token_limit_kwargs(model, max_tokens),
     )
 
-    if inspect.isawaitable(result):
-        return await result
-    return str(result)
-
 
 def _extract_json_block(text: str) -> str:
     """Extract JSON block from text"""
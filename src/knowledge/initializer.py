@@ -490,12 +490,12 @@ class KnowledgeBaseInitializer:
                     logger.info(f"Text chunks: {len(chunks)}")
 
             if vector_store_dir.exists():
-                metadata_file = vector_store_dir / "metadata.json"
-                if metadata_file.exists():
-                    with open(metadata_file, encoding="utf-8") as f:
-                        metadata = json.load(f)
-                        logger.info(f"Vector embeddings: {metadata.get('num_embeddings', 0)}")
-                        logger.info(f"Embedding dimension: {metadata.get('dimension', 0)}")
+                info_file = vector_store_dir / "info.json"
+                if info_file.exists():
+                    with open(info_file, encoding="utf-8") as f:
+                        info = json.load(f)
+                        logger.info(f"Vector embeddings: {info.get('num_chunks', 0)}")
+                        logger.info(f"Embedding dimension: {info.get('embedding_dim', 0)}")
         except Exception as e:
             logger.warning(f"Could not retrieve statistics: {e!s}")
 
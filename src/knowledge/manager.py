@@ -15,7 +15,9 @@ from pathlib import Path
 import shutil
 import sys
 
+from src.knowledge.stats import forget_kb_stats, get_kb_stats
 from src.services.rag.components.routing import FileTypeRouter
+from src.services.rag.service import evict_pipelines
 
 
 # Cross-platform file locking
@@ -356,39 +358,9 @@ class KnowledgeBaseManager:
                     print(f"Warning: Failed to read metadata.json for KB '{kb_name}': {e}")
                     info["metadata"] = {}
 
-        # Count files - handle errors gracefully
-        raw_dir = kb_dir / "raw" if dir_exists else None
-        images_dir = kb_dir / "images" if dir_exists else None
-        content_list_dir = kb_dir / "content_list" if dir_exists else None
+        # File and RAG counts come from the cached stats sidecar (see stats.py)
         rag_storage_dir = kb_dir / "rag_storage" if dir_exists else None
-
-        raw_count = 0
-        images_count = 0
-        content_lists_count = 0
-
-        if dir_exists:
-            try:
-                raw_count = (
-                    len([f for f in raw_dir.iterdir() if f.is_file()]) if raw_dir.exists() else 0
-                )
-            except Exception:
-                pass
-
-            try:
-                images_count = (
-                    len([f for f in images_dir.iterdir() if f.is_file()])
-                    if images_dir.exists()
-                    else 0
-                )
-            except Exception:
-                pass
-
-            try:
-                content_lists_count = (
-                    len(list(content_list_dir.glob("*.json"))) if content_list_dir.exists() else 0
-                )
-            except Exception:
-                pass
+        counts = get_kb_stats(kb_dir) if dir_exists else {}
 
         metadata = info["metadata"]
         rag_provider = metadata.get("rag_provider") if isinstance(metadata, dict) else None
@@ -401,9 +373,9 @@ class KnowledgeBaseManager:
         )
 
         info["statistics"] = {
-            "raw_documents": raw_count,
-            "images": images_count,
-            "content_lists": content_lists_count,
+            "raw_documents": counts.get("raw_documents", 0),
+            "images": counts.get("images", 0),
+            "content_lists": counts.get("content_lists", 0),
             "rag_initialized": rag_initialized,
             "rag_provider": rag_provider,
             # Include status and progress in statistics for backward compatibility
@@ -411,52 +383,9 @@ class KnowledgeBaseManager:
             "progress": progress,
         }
 
-        # Try to get RAG statistics
-        if rag_initialized:
-            try:
-                entities_file = rag_storage_dir / "kv_store_full_entities.json"
-                relations_file = rag_storage_dir / "kv_store_full_relations.json"
-                chunks_file = rag_storage_dir / "kv_store_text_chunks.json"
-
-                rag_stats = {}
-                if entities_file.exists():
-                    try:
-                        with open(entities_file, encoding="utf-8") as f:
-                            entities_data = json.load(f)
-                            rag_stats["entities"] = (
-                                len(entities_data) if isinstance(entities_data, (list, dict)) else 0
-                            )
-                    except Exception:
-                        pass
-
-                if relations_file.exists():
-                    try:
-                        with open(relations_file, encoding="utf-8") as f:
-                            relations_data = json.load(f)
-                            rag_stats["relations"] = (
-                                len(relations_data)
-                                if isinstance(relations_data, (list, dict))
-                                else 0
-                            )
-                    except Exception:
-                        pass
-
-                if chunks_file.exists():
-                    try:
-                        with open(chunks_file, encoding="utf-8") as f:
-                            chunks_data = json.load(f)
-                            rag_stats["chunks"] = (
-                                len(chunks_data) if isinstance(chunks_data, (list, dict)) else 0
-                            )
-                    except Exception:
-                        pass
-
-                if rag_stats:
-                    statistics = info["statistics"]
-                    if isinstance(statistics, dict):
-                        statistics["rag"] = rag_stats
-            except Exception:
-                pass
+        rag_stats = counts.get("rag")
+        if rag_initialized and rag_stats:
+            info["statistics"]["rag"] = dict(rag_stats)
 
         return info
 
@@ -487,6 +416,9 @@ class KnowledgeBaseManager:
 
         # Delete the directory
         shutil.rmtree(kb_dir)
+        forget_kb_stats(kb_dir)
+        # Shared pipelines may hold RAG instances opened on the deleted storage
+        evict_pipelines(kb_base_dir=str(self.base_dir))
 
         # Remove from config
         if name in self.config.get("knowledge_bases", {}):
@@ -530,6 +462,7 @@ class KnowledgeBaseManager:
         # Delete RAG storage
         shutil.rmtree(rag_storage_dir)
         rag_storage_dir.mkdir(parents=True, exist_ok=True)
+        evict_pipelines(kb_base_dir=str(self.base_dir))
 
         print(f"✓ RAG storage cleaned for '{kb_name}'")
         return True
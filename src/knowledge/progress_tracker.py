@@ -140,6 +140,15 @@ class ProgressTracker:
         except Exception as e:
             print(f"[ProgressTracker] Failed to save progress to kb_config.json: {e}")
 
+        # Indexing finished: refresh the stats sidecar so listings stay cheap
+        if progress.get("stage") == "completed":
+            try:
+                from src.knowledge.stats import refresh_kb_stats
+
+                refresh_kb_stats(self.kb_dir)
+            except Exception as e:
+                print(f"[ProgressTracker] Failed to refresh KB stats: {e}")
+
         # Also save to local .progress.json file (for backward compatibility)
         try:
             self.kb_dir.mkdir(parents=True, exist_ok=True)
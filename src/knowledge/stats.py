@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Knowledge Base Statistics
+
+Cheap per-KB statistics (document, image, content list and RAG entity/relation/
+chunk counts) for listing knowledge bases.
+
+Entry counts of the LightRAG key-value stores are the expensive part: they are
+stored in a small ``kb_stats.json`` sidecar next to the KB's data, together with
+the mtime/size of every store they were computed from. Indexing refreshes the
+sidecar when it finishes; a reader whose stores no longer match recounts,
+streaming through them instead of loading them, and rewrites it. Results are
+also kept in memory per KB. Directory file counts are a single scandir each and
+are always taken live.
+"""
+
+import json
+import os
+from pathlib import Path
+import re
+import threading
+from typing import Any
+
+STATS_FILE = "kb_stats.json"
+
+# LightRAG key-value stores whose top-level entry counts are reported
+RAG_STORES = {
+    "entities": "kv_store_full_entities.json",
+    "relations": "kv_store_full_relations.json",
+    "chunks": "kv_store_text_chunks.json",
+}
+
+_READ_CHUNK = 1024 * 1024
+_STRUCTURAL = re.compile(r'["\\{}\[\],]')
+
+_cache: dict[str, tuple[dict, dict]] = {}
+_cache_lock = threading.Lock()
+
+
+def count_json_entries(path: Path) -> int:
+    """
+    Count the top-level entries of a JSON object or array without parsing it.
+
+    Only structural characters are visited, so memory stays at one read chunk
+    and string contents are skipped by the regex engine.
+
+    Args:
+        path: JSON file whose root is an object or array
+
+    Returns:
+        Number of keys (object) or elements (array); 0 for any other root
+    """
+    depth = 0
+    in_string = False
+    skip_first = False  # Previous chunk ended with a backslash inside a string
+    commas = 0
+    state = "root"  # root -> first (check for empty container) -> body
+
+    with open(path, encoding="utf-8") as f:
+        while True:
+            chunk = f.read(_READ_CHUNK)
+            if not chunk:
+                break
+            offset = 0
+            if state != "body":
+                stripped = chunk.lstrip()
+                if not stripped:
+                    continue
+                offset = len(chunk) - len(stripped)
+                if state == "root":
+                    if stripped[0] not in "{[":
+                        return 0
+                    state = "first"
+                    depth = 1
+                    offset += 1
+                    stripped = stripped[1:].lstrip()
+                    if not stripped:
+                        continue
+                    offset = len(chunk) - len(stripped)
+                if stripped[0] in "]}":
+                    return 0
+                state = "body"
+
+            escaped_at = 0 if skip_first else -1
+            skip_first = False
+            for match in _STRUCTURAL.finditer(chunk, offset):
+                pos = match.start()
+                if pos == escaped_at:
+                    continue
+                ch = chunk[pos]
+                if in_string:
+                    if ch == "\\":
+                        escaped_at = pos + 1
+                        if escaped_at == len(chunk):
+                            skip_first = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = True
+                elif ch in "{[":
+                    depth += 1
+                elif ch in "]}":
+                    depth -= 1
+                    if depth == 0:
+                        return commas + 1
+                elif depth == 1:
+                    commas += 1
+    return commas + 1 if state == "body" else 0
+
+
+def _signature(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _sources(kb_dir: Path) -> dict[str, list[int] | None]:
+    """Stat every key-value store the RAG counts depend on."""
+    rag_storage = kb_dir / "rag_storage"
+    return {filename: _signature(rag_storage / filename) for filename in RAG_STORES.values()}
+
+
+def _count_files(directory: Path, pattern: str | None = None) -> int:
+    try:
+        if not directory.is_dir():
+            return 0
+        if pattern:
+            return sum(1 for _ in directory.glob(pattern))
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.is_file())
+    except OSError:
+        return 0
+
+
+def count_kb_files(kb_dir: Path) -> dict[str, int]:
+    """Count raw documents, images and content lists of a knowledge base."""
+    return {
+        "raw_documents": _count_files(kb_dir / "raw"),
+        "images": _count_files(kb_dir / "images"),
+        "content_lists": _count_files(kb_dir / "content_list", "*.json"),
+    }
+
+
+def compute_rag_stats(kb_dir: Path) -> dict[str, int]:
+    """
+    Count the entries of each RAG key-value store by streaming through it.
+
+    Args:
+        kb_dir: Knowledge base directory
+
+    Returns:
+        dict mapping entities/relations/chunks to counts (missing stores omitted)
+    """
+    rag_stats = {}
+    for key, filename in RAG_STORES.items():
+        store = kb_dir / "rag_storage" / filename
+        if store.exists():
+            try:
+                rag_stats[key] = count_json_entries(store)
+            except Exception:
+                pass
+    return rag_stats
+
+
+def _write_sidecar(kb_dir: Path, sources: dict, stats: dict) -> None:
+    sidecar = kb_dir / STATS_FILE
+    tmp = sidecar.with_suffix(".json.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"sources": sources, "stats": stats}, f, indent=2)
+        os.replace(tmp, sidecar)
+    except OSError:
+        # Read-only or concurrently deleted KB; stats still come from memory
+        pass
+
+
+def refresh_kb_stats(kb_dir: str | Path) -> dict[str, int]:
+    """
+    Recount the RAG stores of a knowledge base and rewrite its stats sidecar.
+
+    Called by indexing when it finishes so the next listing is a cheap read.
+
+    Args:
+        kb_dir: Knowledge base directory
+
+    Returns:
+        The fresh RAG counts
+    """
+    kb_dir = Path(kb_dir)
+    sources = _sources(kb_dir)
+    rag_stats = compute_rag_stats(kb_dir)
+    _write_sidecar(kb_dir, sources, rag_stats)
+    with _cache_lock:
+        _cache[str(kb_dir)] = (sources, rag_stats)
+    return rag_stats
+
+
+def _get_rag_stats(kb_dir: Path) -> dict[str, int]:
+    """RAG counts from memory, then the sidecar, then a recount; each only if current."""
+    sources = _sources(kb_dir)
+
+    with _cache_lock:
+        cached = _cache.get(str(kb_dir))
+    if cached is not None and cached[0] == sources:
+        return dict(cached[1])
+
+    sidecar = kb_dir / STATS_FILE
+    if sidecar.exists():
+        try:
+            with open(sidecar, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("sources") == sources and isinstance(data.get("stats"), dict):
+                with _cache_lock:
+                    _cache[str(kb_dir)] = (sources, data["stats"])
+                return dict(data["stats"])
+        except Exception:
+            pass
+
+    return dict(refresh_kb_stats(kb_dir))
+
+
+def get_kb_stats(kb_dir: str | Path) -> dict[str, Any]:
+    """
+    Get the statistics of a knowledge base, recounting RAG stores only when they changed.
+
+    Args:
+        kb_dir: Knowledge base directory
+
+    Returns:
+        dict with raw_documents, images, content_lists and rag (counts per store)
+    """
+    kb_dir = Path(kb_dir)
+    stats: dict[str, Any] = count_kb_files(kb_dir)
+    stats["rag"] = _get_rag_stats(kb_dir)
+    return stats
+
+
+def forget_kb_stats(kb_dir: str | Path) -> None:
+    """Drop the in-memory statistics of a knowledge base (e.g. after deleting it)."""
+    with _cache_lock:
+        _cache.pop(str(Path(kb_dir)), None)
+
+
+__all__ = [
+    "STATS_FILE",
+    "compute_rag_stats",
+    "count_json_entries",
+    "count_kb_files",
+    "forget_kb_stats",
+    "get_kb_stats",
+    "refresh_kb_stats",
+]
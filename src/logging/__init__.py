@@ -50,6 +50,7 @@ from .handlers import (
     FileHandler,
     JSONFileHandler,
     LogInterceptor,
+    QueuedFileHandler,
     RotatingFileHandler,
     WebSocketLogHandler,
 )
@@ -85,6 +86,7 @@ __all__ = [
     "ConsoleHandler",
     "FileHandler",
     "JSONFileHandler",
+    "QueuedFileHandler",
     "RotatingFileHandler",
     "WebSocketLogHandler",
     "LogInterceptor",
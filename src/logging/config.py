@@ -33,6 +33,11 @@ class LoggingConfig:
     max_bytes: int = 10 * 1024 * 1024  # 10MB
     backup_count: int = 5
 
+    # Background file writer settings
+    file_queue_size: int = 10000  # Records buffered before new ones are dropped
+    file_flush_interval: float = 1.0  # Seconds a record may wait before being written
+    file_flush_bytes: int = 64 * 1024  # Pending size that triggers a write
+
 
 def get_default_log_dir() -> Path:
     """Get the default log directory."""
@@ -78,6 +83,17 @@ def load_logging_config() -> LoggingConfig:
             file_output=logging_config.get("save_to_file", True),
             log_dir=get_path_from_config(config, "user_log_dir"),
             rag_logger_names=logging_config.get("rag_logger_names"),
+            max_bytes=int(logging_config.get("max_bytes", LoggingConfig.max_bytes)),
+            backup_count=int(logging_config.get("backup_count", LoggingConfig.backup_count)),
+            file_queue_size=int(
+                logging_config.get("file_queue_size", LoggingConfig.file_queue_size)
+            ),
+            file_flush_interval=float(
+                logging_config.get("file_flush_interval", LoggingConfig.file_flush_interval)
+            ),
+            file_flush_bytes=int(
+                logging_config.get("file_flush_bytes", LoggingConfig.file_flush_bytes)
+            ),
         )
     except Exception:
         return LoggingConfig()
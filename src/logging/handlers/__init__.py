@@ -7,13 +7,26 @@ Custom logging handlers for various output destinations.
 """
 
 from .console import ConsoleHandler
-from .file import FileHandler, JSONFileHandler, RotatingFileHandler, create_task_logger
+from .file import (
+    BufferedLogSink,
+    FileHandler,
+    JSONFileHandler,
+    QueuedFileHandler,
+    RotatingFileHandler,
+    create_task_logger,
+    get_file_sink,
+    shutdown_file_sinks,
+)
 from .websocket import LogInterceptor, WebSocketLogHandler
 
 __all__ = [
     "ConsoleHandler",
     "FileHandler",
     "JSONFileHandler",
+    "QueuedFileHandler",
+    "BufferedLogSink",
+    "get_file_sink",
+    "shutdown_file_sinks",
     "RotatingFileHandler",
     "WebSocketLogHandler",
     "LogInterceptor",
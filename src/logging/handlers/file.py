@@ -4,15 +4,27 @@ File Log Handlers
 =================
 
 File-based logging with rotation support.
+
+QueuedFileHandler is the default file sink of get_logger(): records are
+formatted on the caller's thread and handed to a bounded queue; one writer
+thread per log file keeps the file open, writes in batches (by size, by time,
+or immediately for ERROR and above) and rotates it by size. When the queue is
+full, records are dropped and counted instead of blocking the event loop, and
+the writer notes the drop count in the file.
 """
 
 import asyncio
+import atexit
 from datetime import datetime
 import json
 import logging
 from logging.handlers import RotatingFileHandler as BaseRotatingFileHandler
+import os
 from pathlib import Path
-from typing import Optional
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, TextIO
 
 # Import FileFormatter from the main logger module to avoid duplication
 from ..logger import FileFormatter
@@ -81,7 +93,343 @@ class RotatingFileHandler(BaseRotatingFileHandler):
         self.setFormatter(FileFormatter())
 
 
-class JSONFileHandler(logging.Handler):
+_STOP = object()
+
+
+class BufferedLogSink:
+    """
+    Background writer of one log file, shared by every handler writing to it.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        encoding: str = "utf-8",
+        max_queue: int = 10000,
+        flush_interval: float = 1.0,
+        flush_bytes: int = 64 * 1024,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+    ):
+        """
+        Initialize the sink (the writer thread starts with the first line).
+
+        Args:
+            filename: Path to log file
+            encoding: File encoding
+            max_queue: Lines buffered before new ones are dropped
+            flush_interval: Maximum seconds a line waits before being written
+            flush_bytes: Pending size that triggers a write
+            max_bytes: File size that triggers rotation (0 disables rotation)
+            backup_count: Number of rotated files to keep
+        """
+        self.path = Path(filename)
+        self.encoding = encoding
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.dropped = 0
+        self.written = 0
+        self._reported_drops = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_queue))
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stream: Optional[TextIO] = None
+        self._closed = False
+        self._refs = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def acquire(self) -> None:
+        """Register a handler using this sink."""
+        with self._lock:
+            self._refs += 1
+
+    def release(self) -> bool:
+        """
+        Unregister a handler; the last one closes the sink.
+
+        Returns:
+            True if the sink was closed
+        """
+        with self._lock:
+            self._refs -= 1
+            last = self._refs <= 0
+        if last:
+            self.close()
+        return last
+
+    def put(self, line: str, urgent: bool = False) -> bool:
+        """
+        Queue one line without blocking.
+
+        Args:
+            line: Text to write (including the trailing newline)
+            urgent: Write the pending batch right away (e.g. for errors)
+
+        Returns:
+            False if the line was dropped because the queue is full or closed
+        """
+        with self._lock:
+            if self._closed:
+                self.dropped += 1
+                return False
+            self._ensure_writer()
+        try:
+            self._queue.put_nowait((line, urgent))
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait until every line queued so far is written."""
+        with self._lock:
+            if self._closed or self._thread is None:
+                return
+            self._ensure_writer()
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return
+        done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write pending lines, stop the writer and close the file."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                pass
+            thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return written/dropped counters and the current queue depth."""
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "written": self.written,
+                "dropped": self.dropped,
+                "queued": self._queue.qsize(),
+            }
+
+    def _ensure_writer(self) -> None:
+        """Start the writer thread, or restart it if it died (caller holds the lock)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run, name=f"log-writer-{self.path.name}", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        pending: List[str] = []
+        pending_bytes = 0
+        last_write = time.monotonic()
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(self.flush_interval - (time.monotonic() - last_write), 0)
+            try:
+                items = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                items = []
+            # Drain whatever else is queued so a burst becomes one write
+            while len(items) < 1000:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            force = False
+            waiters = []
+            for item in items:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    line, urgent = item
+                    pending.append(line)
+                    pending_bytes += len(line)
+                    force = force or urgent
+
+            now = time.monotonic()
+            if (
+                stop
+                or force
+                or waiters
+                or pending_bytes >= self.flush_bytes
+                or (pending and now - last_write >= self.flush_interval)
+            ):
+                self._write(pending)
+                pending = []
+                pending_bytes = 0
+                last_write = now
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                if self._stream is not None:
+                    self._stream.close()
+                    self._stream = None
+                return
+
+    def _write(self, lines: List[str]) -> None:
+        with self._lock:
+            dropped = self.dropped - self._reported_drops
+            self._reported_drops = self.dropped
+        if dropped:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            lines = [*lines, f"{timestamp} [WARNING ] [LogSink] Dropped {dropped} log records\n"]
+        if not lines:
+            return
+        data = "".join(lines)
+        try:
+            if self._stream is None:
+                self._stream = open(
+                    self.path, "a", encoding=self.encoding, errors="backslashreplace"
+                )
+            if (
+                self.max_bytes
+                and self._stream.tell()
+                and (self._stream.tell() + len(data) > self.max_bytes)
+            ):
+                self._rotate()
+            self._stream.write(data)
+            self._stream.flush()
+            with self._lock:
+                self.written += len(lines)
+        except Exception:
+            # The log file must never take the application (or the writer thread) down
+            pass
+
+    def _rotate(self) -> None:
+        """Rename file -> file.1 -> ... -> file.N (dropping the oldest) and reopen."""
+        self._stream.close()
+        self._stream = None
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                src = self.path.with_name(f"{self.path.name}.{i}")
+                if src.exists():
+                    os.replace(src, self.path.with_name(f"{self.path.name}.{i + 1}"))
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink(missing_ok=True)
+        self._stream = open(self.path, "a", encoding=self.encoding, errors="backslashreplace")
+
+
+# One sink per log file, shared by all handlers of the process
+_sinks: Dict[str, BufferedLogSink] = {}
+_sinks_lock = threading.Lock()
+
+
+def get_file_sink(filename: str, encoding: str = "utf-8") -> BufferedLogSink:
+    """
+    Get the shared sink of a log file, creating it with the logging settings
+    of config/main.yaml (logging.file_queue_size, file_flush_interval,
+    file_flush_bytes, max_bytes, backup_count).
+
+    Args:
+        filename: Path to log file
+        encoding: File encoding (used when the sink is created)
+
+    Returns:
+        BufferedLogSink for the file
+    """
+    key = str(Path(filename).resolve())
+    with _sinks_lock:
+        sink = _sinks.get(key)
+        if sink is not None and not sink._closed:
+            return sink
+
+    # Loaded outside the lock: reading the config may import modules that
+    # create loggers (and so sinks) themselves
+    from ..config import load_logging_config
+
+    config = load_logging_config()
+    with _sinks_lock:
+        sink = _sinks.get(key)
+        if sink is None or sink._closed:
+            sink = _sinks[key] = BufferedLogSink(
+                filename,
+                encoding=encoding,
+                max_queue=config.file_queue_size,
+                flush_interval=config.file_flush_interval,
+                flush_bytes=config.file_flush_bytes,
+                max_bytes=config.max_bytes,
+                backup_count=config.backup_count,
+            )
+        return sink
+
+
+def shutdown_file_sinks() -> None:
+    """Flush and close every log file sink (registered to run at exit)."""
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+        _sinks.clear()
+    for sink in sinks:
+        sink.close()
+
+
+atexit.register(shutdown_file_sinks)
+
+
+class QueuedFileHandler(logging.Handler):
+    """
+    File handler that queues formatted records for a background writer.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        level: int = logging.DEBUG,
+        encoding: str = "utf-8",
+    ):
+        """
+        Initialize queued file handler.
+
+        Args:
+            filename: Path to log file
+            level: Minimum log level
+            encoding: File encoding
+        """
+        super().__init__(level)
+        self.sink = get_file_sink(filename, encoding=encoding)
+        self.sink.acquire()
+        self._released = False
+
+    def format_line(self, record: logging.LogRecord) -> str:
+        """Render a record as one line of the file."""
+        return self.format(record) + "\n"
+
+    def emit(self, record: logging.LogRecord):
+        """Queue a log record; never blocks on the file."""
+        try:
+            self.sink.put(self.format_line(record), urgent=record.levelno >= logging.ERROR)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """Wait until records queued so far are written."""
+        self.sink.flush()
+
+    def close(self):
+        """Release the shared sink (closed with its last handler)."""
+        if not self._released:
+            self._released = True
+            self.sink.release()
+        super().close()
+
+
+class JSONFileHandler(QueuedFileHandler):
     """
     A logging handler that writes structured JSON logs to a file.
     Each line is a valid JSON object (JSONL format).
@@ -106,38 +454,28 @@ class JSONFileHandler(logging.Handler):
             level: Minimum log level
             encoding: File encoding
         """
-        super().__init__()
-
-        # Ensure directory exists
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(filepath, level=level, encoding=encoding)
 
         self.filepath = filepath
         self.encoding = encoding
-        self.setLevel(level)
         self.setFormatter(logging.Formatter("%(message)s"))
 
-    def emit(self, record: logging.LogRecord):
-        """Emit a log record as JSON."""
-        try:
-            # Build JSON entry
-            entry = {
-                "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-                "level": record.levelname,
-                "module": getattr(record, "module_name", record.name),
-                "message": self.format(record),
-            }
-
-            # Add extra fields if present
-            for key in ["display_level", "tool_name", "elapsed_ms", "tokens"]:
-                if hasattr(record, key):
-                    entry[key] = getattr(record, key)
-
-            # Write to file
-            with open(self.filepath, "a", encoding=self.encoding) as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-
-        except Exception:
-            self.handleError(record)
+    def format_line(self, record: logging.LogRecord) -> str:
+        """Render a log record as one JSON line."""
+        # Build JSON entry
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "module": getattr(record, "module_name", record.name),
+            "message": self.format(record),
+        }
+
+        # Add extra fields if present
+        for key in ["display_level", "tool_name", "elapsed_ms", "tokens"]:
+            if hasattr(record, key):
+                entry[key] = getattr(record, key)
+
+        return json.dumps(entry, ensure_ascii=False) + "\n"
 
 
 def create_task_logger(
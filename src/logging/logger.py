@@ -194,12 +194,14 @@ class Logger:
             console_handler.setFormatter(ConsoleFormatter(service_prefix=service_prefix))
             self.logger.addHandler(console_handler)
 
-        # File handler
+        # File handler (queued: the shared background writer owns the file)
         if file_output:
+            from .handlers.file import QueuedFileHandler
+
             timestamp = datetime.now().strftime("%Y%m%d")
             log_file = log_dir_path / f"deeptutor_{timestamp}.log"
 
-            file_handler = logging.FileHandler(log_file, encoding="utf-8")
+            file_handler = QueuedFileHandler(str(log_file), encoding="utf-8")
             file_handler.setLevel(logging.DEBUG)  # Log everything to file
             file_handler.setFormatter(FileFormatter())
             self.logger.addHandler(file_handler)
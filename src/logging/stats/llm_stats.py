@@ -15,7 +15,8 @@ Usage:
     stats.add_call(
         model="gpt-4o-mini",
         prompt_tokens=100,
-        completion_tokens=50
+        completion_tokens=50,
+        cached_tokens=80,  # prompt tokens served from the provider's prompt cache
     )
 
     # At the end:
@@ -65,6 +66,7 @@ class LLMCall:
     prompt_tokens: int
     completion_tokens: int
     cost: float
+    cached_tokens: int = 0
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
@@ -85,6 +87,7 @@ class LLMStats:
         self.calls: list[LLMCall] = []
         self.total_prompt_tokens = 0
         self.total_completion_tokens = 0
+        self.total_cached_tokens = 0
         self.total_cost = 0.0
         self.model_used: Optional[str] = None
 
@@ -93,6 +96,7 @@ class LLMStats:
         model: str,
         prompt_tokens: Optional[int] = None,
         completion_tokens: Optional[int] = None,
+        cached_tokens: Optional[int] = None,
         # Alternative: estimate from text
         system_prompt: Optional[str] = None,
         user_prompt: Optional[str] = None,
@@ -105,6 +109,7 @@ class LLMStats:
             model: Model name
             prompt_tokens: Number of prompt tokens (if known)
             completion_tokens: Number of completion tokens (if known)
+            cached_tokens: Prompt tokens read from the provider's prompt cache (if reported)
             system_prompt: System prompt text (for estimation)
             user_prompt: User prompt text (for estimation)
             response: Response text (for estimation)
@@ -119,6 +124,7 @@ class LLMStats:
 
         prompt_tokens = prompt_tokens or 0
         completion_tokens = completion_tokens or 0
+        cached_tokens = cached_tokens or 0
 
         # Calculate cost
         pricing = get_pricing(model)
@@ -128,13 +134,18 @@ class LLMStats:
 
         # Record call
         call = LLMCall(
-            model=model, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, cost=cost
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cost=cost,
+            cached_tokens=cached_tokens,
         )
         self.calls.append(call)
 
         # Update totals
         self.total_prompt_tokens += prompt_tokens
         self.total_completion_tokens += completion_tokens
+        self.total_cached_tokens += cached_tokens
         self.total_cost += cost
 
         # Track primary model
@@ -150,6 +161,7 @@ class LLMStats:
             "prompt_tokens": self.total_prompt_tokens,
             "completion_tokens": self.total_completion_tokens,
             "total_tokens": self.total_prompt_tokens + self.total_completion_tokens,
+            "cached_tokens": self.total_cached_tokens,
             "cost_usd": self.total_cost,
         }
 
@@ -179,6 +191,9 @@ class LLMStats:
         logger.info(
             f"Tokens      : {total_tokens:,} (Input: {self.total_prompt_tokens:,}, Output: {self.total_completion_tokens:,})"
         )
+        if self.total_cached_tokens:
+            cached_share = self.total_cached_tokens / max(self.total_prompt_tokens, 1)
+            logger.info(f"Cached      : {self.total_cached_tokens:,} ({cached_share:.0%} of input)")
         logger.info(f"Cost        : ${self.total_cost:.6f} USD")
         logger.info("=" * 60)
 
@@ -195,5 +210,6 @@ class LLMStats:
         self.calls.clear()
         self.total_prompt_tokens = 0
         self.total_completion_tokens = 0
+        self.total_cached_tokens = 0
         self.total_cost = 0.0
         self.model_used = None
@@ -6,7 +6,8 @@ Configuration Service
 Provides three types of configuration:
 
 1. **YAML Configuration (loader.py)** - For application settings from config/*.yaml
-   - PROJECT_ROOT, load_config_with_main, get_path_from_config, parse_language, get_agent_params
+   - PROJECT_ROOT, load_config_with_main, get_path_from_config, parse_language, get_agent_params,
+     get_llm_cache_settings
 
 2. **Unified Config Service (unified_config.py)** - For service configurations (LLM, Embedding, TTS, Search)
    - ConfigType, UnifiedConfigManager, get_config_manager
@@ -25,6 +26,7 @@ from .knowledge_base_config import (
 from .loader import (
     PROJECT_ROOT,
     get_agent_params,
+    get_llm_cache_settings,
     get_path_from_config,
     load_config_with_main,
     parse_language,
@@ -48,6 +50,7 @@ __all__ = [
     "get_path_from_config",
     "parse_language",
     "get_agent_params",
+    "get_llm_cache_settings",
     # From unified_config.py
     "ConfigType",
     "UnifiedConfigManager",
@@ -197,6 +197,15 @@ def parse_language(language: Any) -> str:
     return "zh"  # Default Chinese
 
 
+def _load_agents_config() -> dict[str, Any]:
+    """Load config/agents.yaml (empty dict if missing)."""
+    config_path = PROJECT_ROOT / "config" / "agents.yaml"
+    if not config_path.exists():
+        return {}
+    with open(config_path, encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
 def get_agent_params(module_name: str) -> dict:
     """
     Get agent parameters (temperature, max_tokens) for a specific module.
@@ -218,6 +227,10 @@ def get_agent_params(module_name: str) -> dict:
         dict: Dictionary containing:
             - temperature: float, default 0.5
             - max_tokens: int, default 4096
+            - cache: completion cache policy ({enabled, allow_sampling}),
+              only present when the module configures one
+            - hedge: hedged request policy ({enabled, delay, ttft, config_id}),
+              only present when the module configures one
 
     Example:
         >>> params = get_agent_params("guide")
@@ -232,29 +245,44 @@ def get_agent_params(module_name: str) -> dict:
 
     # Try to load from agents.yaml
     try:
-        config_path = PROJECT_ROOT / "config" / "agents.yaml"
-
-        if config_path.exists():
-            with open(config_path, encoding="utf-8") as f:
-                agents_config = yaml.safe_load(f) or {}
-
-            if module_name in agents_config:
-                module_config = agents_config[module_name]
-                return {
-                    "temperature": module_config.get("temperature", defaults["temperature"]),
-                    "max_tokens": module_config.get("max_tokens", defaults["max_tokens"]),
-                }
+        agents_config = _load_agents_config()
+
+        if module_name in agents_config:
+            module_config = agents_config[module_name]
+            params = {
+                "temperature": module_config.get("temperature", defaults["temperature"]),
+                "max_tokens": module_config.get("max_tokens", defaults["max_tokens"]),
+            }
+            for key in ("cache", "hedge"):
+                if module_config.get(key) is not None:
+                    params[key] = module_config[key]
+            return params
     except Exception as e:
         print(f"⚠️ Failed to load agents.yaml: {e}, using defaults")
 
     return defaults
 
 
+def get_llm_cache_settings() -> dict[str, Any]:
+    """
+    Get the completion cache store settings (``llm_cache`` in config/agents.yaml).
+
+    Returns:
+        dict with optional max_entries, ttl_seconds, persist, path (empty if unset)
+    """
+    try:
+        return dict(_load_agents_config().get("llm_cache") or {})
+    except Exception as e:
+        print(f"⚠️ Failed to load agents.yaml: {e}, using defaults")
+        return {}
+
+
 __all__ = [
     "PROJECT_ROOT",
     "load_config_with_main",
     "get_path_from_config",
     "parse_language",
     "get_agent_params",
+    "get_llm_cache_settings",
     "_deep_merge",
 ]
@@ -471,6 +471,22 @@ class UnifiedConfigManager:
         # Fallback to default if active config not found
         return self._get_default_config_resolved(config_type)
 
+    def get_resolved_config(
+        self, config_type: ConfigType, config_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a specific configuration by ID with all values resolved.
+        Unlike get_config(), the default config carries its real API key.
+        """
+        if config_id == "default":
+            return self._get_default_config_resolved(config_type)
+
+        data = self._load_configs(config_type)
+        for cfg in data.get("configs", []):
+            if cfg.get("id") == config_id:
+                return self._resolve_config(cfg, config_type)
+        return None
+
     def add_config(self, config_type: ConfigType, config: Dict[str, Any]) -> Dict[str, Any]:
         """Add a new configuration."""
         data = self._load_configs(config_type)
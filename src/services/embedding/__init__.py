@@ -25,6 +25,7 @@ from .adapters import (
     OllamaEmbeddingAdapter,
     OpenAICompatibleEmbeddingAdapter,
 )
+from .cache import EmbeddingCache, get_embedding_cache, reset_embedding_cache
 from .client import EmbeddingClient, get_embedding_client, reset_embedding_client
 from .config import EmbeddingConfig, get_embedding_config
 from .provider import get_embedding_provider_manager, reset_embedding_provider_manager
@@ -35,6 +36,9 @@ __all__ = [
     "get_embedding_client",
     "get_embedding_config",
     "reset_embedding_client",
+    "EmbeddingCache",
+    "get_embedding_cache",
+    "reset_embedding_cache",
     "get_embedding_provider_manager",
     "reset_embedding_provider_manager",
     "BaseEmbeddingAdapter",
@@ -8,8 +8,62 @@ Defines the contract that all embedding providers must implement.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import asyncio
+from dataclasses import dataclass, replace
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Default cap on in-flight batch requests per adapter
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Conservative token estimate used for batch budgeting.
+
+    UTF-8 bytes / 3 slightly over-counts English and roughly matches CJK,
+    without the cost of running a real tokenizer over every chunk.
+    """
+    return len(text.encode("utf-8")) // 3 + 1
+
+
+def split_batches(
+    texts: List[str], max_items: int, max_tokens: Optional[int] = None
+) -> List[Tuple[int, List[str]]]:
+    """
+    Split texts into request-sized batches, preserving order.
+
+    Args:
+        texts: Texts to embed
+        max_items: Maximum number of texts per batch
+        max_tokens: Maximum estimated tokens per batch (None = unlimited).
+            A single text above the budget still gets its own batch.
+
+    Returns:
+        List of (start_offset, batch_texts)
+    """
+    batches: List[Tuple[int, List[str]]] = []
+    start = 0
+    current: List[str] = []
+    current_tokens = 0
+
+    for i, text in enumerate(texts):
+        tokens = estimate_tokens(text) if max_tokens else 0
+        if current and (
+            len(current) >= max_items or (max_tokens and current_tokens + tokens > max_tokens)
+        ):
+            batches.append((start, current))
+            start, current, current_tokens = i, [], 0
+        current.append(text)
+        current_tokens += tokens
+
+    if current:
+        batches.append((start, current))
+    return batches
 
 
 @dataclass
@@ -59,8 +113,18 @@ class BaseEmbeddingAdapter(ABC):
 
     Each adapter implements the specific API interface for a provider
     (OpenAI, Cohere, Ollama, etc.) while exposing a unified interface.
+
+    ``embed()`` splits oversized inputs into provider-sized batches
+    (MAX_BATCH_SIZE items / MAX_BATCH_TOKENS estimated tokens), sends them
+    concurrently under a per-adapter semaphore over a pooled HTTP client,
+    and reassembles the vectors in input order. Subclasses implement
+    ``_embed_batch()`` for a single request.
     """
 
+    # Provider request limits (override in subclasses)
+    MAX_BATCH_SIZE: int = 256
+    MAX_BATCH_TOKENS: Optional[int] = None
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the adapter with configuration.
@@ -72,6 +136,7 @@ class BaseEmbeddingAdapter(ABC):
                 - model: Model name to use
                 - dimensions: Embedding vector dimensions
                 - request_timeout: Request timeout in seconds
+                - max_concurrency: Max batch requests in flight (optional)
         """
         self.api_key = config.get("api_key")
         self.base_url = config.get("base_url")
@@ -79,14 +144,107 @@ class BaseEmbeddingAdapter(ABC):
         self.model = config.get("model")
         self.dimensions = config.get("dimensions")
         self.request_timeout = config.get("request_timeout", 30)
+        self.max_concurrency = max(1, config.get("max_concurrency") or DEFAULT_MAX_CONCURRENCY)
 
-    @abstractmethod
-    async def embed(self, request: EmbeddingRequest) -> EmbeddingResponse:
+        # Pooled client and semaphore per event loop (both are loop-bound)
+        self._loop_state: Dict[int, Tuple[asyncio.AbstractEventLoop, Any, Any]] = {}
+
+    def _get_loop_state(self) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """Return the pooled client and concurrency semaphore for the running loop."""
+        loop = asyncio.get_running_loop()
+        state = self._loop_state.get(id(loop))
+        if state is None or state[0] is not loop or state[1].is_closed:
+            # Forget state belonging to loops that no longer exist
+            for key in [k for k, v in self._loop_state.items() if v[0].is_closed()]:
+                del self._loop_state[key]
+
+            client = httpx.AsyncClient(
+                timeout=self.request_timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency * 2,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+            state = (loop, client, asyncio.Semaphore(self.max_concurrency))
+            self._loop_state[id(loop)] = state
+        return state[1], state[2]
+
+    def get_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client for the running event loop.
+
+        Returns:
+            Shared httpx.AsyncClient
+        """
+        return self._get_loop_state()[0]
+
+    async def aclose(self) -> None:
+        """Close the pooled client owned by the running event loop."""
+        loop = asyncio.get_running_loop()
+        state = self._loop_state.pop(id(loop), None)
+        if state is not None and not state[1].is_closed:
+            await state[1].aclose()
+
+    async def embed(
+        self, request: EmbeddingRequest, batch_size: Optional[int] = None
+    ) -> EmbeddingResponse:
         """
         Generate embeddings for a list of texts.
 
+        Inputs larger than the provider limits are split into batches that
+        run concurrently; results are returned in input order.
+
         Args:
             request: EmbeddingRequest with texts and parameters
+            batch_size: Optional per-request item cap (never above MAX_BATCH_SIZE)
+
+        Returns:
+            EmbeddingResponse with embeddings and metadata
+
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        max_items = min(batch_size or self.MAX_BATCH_SIZE, self.MAX_BATCH_SIZE)
+        batches = split_batches(request.texts, max_items, self.MAX_BATCH_TOKENS)
+        _, semaphore = self._get_loop_state()
+
+        if len(batches) <= 1:
+            async with semaphore:
+                return await self._embed_batch(request)
+
+        logger.debug(
+            f"Splitting {len(request.texts)} texts into {len(batches)} batches "
+            f"(max {max_items} items, concurrency {self.max_concurrency})"
+        )
+
+        async def run_batch(texts: List[str]) -> EmbeddingResponse:
+            async with semaphore:
+                return await self._embed_batch(replace(request, texts=texts))
+
+        responses = await asyncio.gather(*[run_batch(texts) for _, texts in batches])
+
+        embeddings: List[List[float]] = []
+        usage: Dict[str, Any] = {}
+        for response in responses:
+            embeddings.extend(response.embeddings)
+            for key, value in (response.usage or {}).items():
+                if isinstance(value, (int, float)):
+                    usage[key] = usage.get(key, 0) + value
+
+        return EmbeddingResponse(
+            embeddings=embeddings,
+            model=responses[0].model,
+            dimensions=responses[0].dimensions,
+            usage=usage,
+        )
+
+    @abstractmethod
+    async def _embed_batch(self, request: EmbeddingRequest) -> EmbeddingResponse:
+        """
+        Send a single embedding request to the provider.
+
+        Args:
+            request: EmbeddingRequest whose texts fit in one provider call
 
         Returns:
             EmbeddingResponse with embeddings and metadata
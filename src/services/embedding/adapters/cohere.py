@@ -4,8 +4,6 @@
 import logging
 from typing import Any, Dict
 
-import httpx
-
 from .base import BaseEmbeddingAdapter, EmbeddingRequest, EmbeddingResponse
 
 logger = logging.getLogger(__name__)
@@ -14,6 +12,9 @@ logger = logging.getLogger(__name__)
 class CohereEmbeddingAdapter(BaseEmbeddingAdapter):
     """Adapter for Cohere Embed API (v1 and v2)."""
 
+    # Cohere rejects requests with more than 96 texts
+    MAX_BATCH_SIZE = 96
+
     MODELS_INFO = {
         "embed-v4.0": {
             "dimensions": [256, 512, 1024, 1536],
@@ -42,7 +43,7 @@ class CohereEmbeddingAdapter(BaseEmbeddingAdapter):
         },
     }
 
-    async def embed(self, request: EmbeddingRequest) -> EmbeddingResponse:
+    async def _embed_batch(self, request: EmbeddingRequest) -> EmbeddingResponse:
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -83,14 +84,14 @@ class CohereEmbeddingAdapter(BaseEmbeddingAdapter):
 
         logger.debug(f"Sending embedding request to {url} with {len(request.texts)} texts")
 
-        async with httpx.AsyncClient(timeout=self.request_timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        client = self.get_client()
+        response = await client.post(url, json=payload, headers=headers)
 
-            if response.status_code >= 400:
-                logger.error(f"HTTP {response.status_code} response body: {response.text}")
+        if response.status_code >= 400:
+            logger.error(f"HTTP {response.status_code} response body: {response.text}")
 
-            response.raise_for_status()
-            data = response.json()
+        response.raise_for_status()
+        data = response.json()
 
         if api_version == "v1":
             embeddings = data["embeddings"]
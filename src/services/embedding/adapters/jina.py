@@ -4,14 +4,14 @@
 import logging
 from typing import Any, Dict
 
-import httpx
-
 from .base import BaseEmbeddingAdapter, EmbeddingRequest, EmbeddingResponse
 
 logger = logging.getLogger(__name__)
 
 
 class JinaEmbeddingAdapter(BaseEmbeddingAdapter):
+    MAX_BATCH_SIZE = 512
+
     MODELS_INFO = {
         "jina-embeddings-v3": {"default": 1024, "dimensions": [32, 64, 128, 256, 512, 768, 1024]},
         "jina-embeddings-v4": {"default": 1024, "dimensions": [32, 64, 128, 256, 512, 768, 1024]},
@@ -25,7 +25,7 @@ class JinaEmbeddingAdapter(BaseEmbeddingAdapter):
         "text-matching": "text-matching",
     }
 
-    async def embed(self, request: EmbeddingRequest) -> EmbeddingResponse:
+    async def _embed_batch(self, request: EmbeddingRequest) -> EmbeddingResponse:
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -56,14 +56,14 @@ class JinaEmbeddingAdapter(BaseEmbeddingAdapter):
 
         logger.debug(f"Sending embedding request to {url} with {len(request.texts)} texts")
 
-        async with httpx.AsyncClient(timeout=self.request_timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        client = self.get_client()
+        response = await client.post(url, json=payload, headers=headers)
 
-            if response.status_code >= 400:
-                logger.error(f"HTTP {response.status_code} response body: {response.text}")
+        if response.status_code >= 400:
+            logger.error(f"HTTP {response.status_code} response body: {response.text}")
 
-            response.raise_for_status()
-            data = response.json()
+        response.raise_for_status()
+        data = response.json()
 
         embeddings = [item["embedding"] for item in data["data"]]
         actual_dims = len(embeddings[0]) if embeddings else 0
@@ -12,6 +12,9 @@ logger = logging.getLogger(__name__)
 
 
 class OllamaEmbeddingAdapter(BaseEmbeddingAdapter):
+    # Local server: keep batches small so one request does not monopolize it
+    MAX_BATCH_SIZE = 64
+
     MODELS_INFO = {
         "all-minilm": 384,
         "all-mpnet-base-v2": 768,
@@ -20,7 +23,7 @@ class OllamaEmbeddingAdapter(BaseEmbeddingAdapter):
         "snowflake-arctic-embed": 1024,
     }
 
-    async def embed(self, request: EmbeddingRequest) -> EmbeddingResponse:
+    async def _embed_batch(self, request: EmbeddingRequest) -> EmbeddingResponse:
         payload = {
             "model": request.model or self.model,
             "input": request.texts,
@@ -39,31 +42,31 @@ class OllamaEmbeddingAdapter(BaseEmbeddingAdapter):
         logger.debug(f"Sending embedding request to {url} with {len(request.texts)} texts")
 
         try:
-            async with httpx.AsyncClient(timeout=self.request_timeout) as client:
-                response = await client.post(url, json=payload)
-
-                if response.status_code == 404:
-                    try:
-                        health_check = await client.get(f"{self.base_url}/api/tags")
-                        if health_check.status_code == 200:
-                            available_models = [
-                                m.get("name", "") for m in health_check.json().get("models", [])
-                            ]
-                            raise ValueError(
-                                f"Model '{payload['model']}' not found in Ollama. "
-                                f"Available models: {', '.join(available_models[:10])}. "
-                                f"Download it with: ollama pull {payload['model']}"
-                            )
-                    except httpx.HTTPError:
-                        pass
-
-                    raise ValueError(
-                        f"Model '{payload['model']}' not found. "
-                        f"Download it with: ollama pull {payload['model']}"
-                    )
-
-                response.raise_for_status()
-                data = response.json()
+            client = self.get_client()
+            response = await client.post(url, json=payload)
+
+            if response.status_code == 404:
+                try:
+                    health_check = await client.get(f"{self.base_url}/api/tags")
+                    if health_check.status_code == 200:
+                        available_models = [
+                            m.get("name", "") for m in health_check.json().get("models", [])
+                        ]
+                        raise ValueError(
+                            f"Model '{payload['model']}' not found in Ollama. "
+                            f"Available models: {', '.join(available_models[:10])}. "
+                            f"Download it with: ollama pull {payload['model']}"
+                        )
+                except httpx.HTTPError:
+                    pass
+
+                raise ValueError(
+                    f"Model '{payload['model']}' not found. "
+                    f"Download it with: ollama pull {payload['model']}"
+                )
+
+            response.raise_for_status()
+            data = response.json()
 
         except httpx.ConnectError as e:
             raise ConnectionError(
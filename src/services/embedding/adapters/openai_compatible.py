@@ -4,21 +4,23 @@
 import logging
 from typing import Any, Dict
 
-import httpx
-
 from .base import BaseEmbeddingAdapter, EmbeddingRequest, EmbeddingResponse
 
 logger = logging.getLogger(__name__)
 
 
 class OpenAICompatibleEmbeddingAdapter(BaseEmbeddingAdapter):
+    # OpenAI accepts up to 2048 inputs / ~300k tokens; stay below for compatible servers
+    MAX_BATCH_SIZE = 512
+    MAX_BATCH_TOKENS = 250_000
+
     MODELS_INFO = {
         "text-embedding-3-large": {"default": 3072, "dimensions": [256, 512, 1024, 3072]},
         "text-embedding-3-small": {"default": 1536, "dimensions": [512, 1536]},
         "text-embedding-ada-002": 1536,
     }
 
-    async def embed(self, request: EmbeddingRequest) -> EmbeddingResponse:
+    async def _embed_batch(self, request: EmbeddingRequest) -> EmbeddingResponse:
         headers = {
             "Content-Type": "application/json",
         }
@@ -45,14 +47,14 @@ class OpenAICompatibleEmbeddingAdapter(BaseEmbeddingAdapter):
 
         logger.debug(f"Sending embedding request to {url} with {len(request.texts)} texts")
 
-        async with httpx.AsyncClient(timeout=self.request_timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        client = self.get_client()
+        response = await client.post(url, json=payload, headers=headers)
 
-            if response.status_code >= 400:
-                logger.error(f"HTTP {response.status_code} response body: {response.text}")
+        if response.status_code >= 400:
+            logger.error(f"HTTP {response.status_code} response body: {response.text}")
 
-            response.raise_for_status()
-            data = response.json()
+        response.raise_for_status()
+        data = response.json()
 
         embeddings = [item["embedding"] for item in data["data"]]
 
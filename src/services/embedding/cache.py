@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+Embedding Cache
+===============
+
+Persistent, content-addressed cache for embedding vectors.
+
+Vectors are stored as float32 blobs in a SQLite database keyed by
+sha256(model, dimensions, input_type, text), so identical chunks are embedded
+once no matter which pipeline (LlamaIndex, LightRAG, RAG-Anything, plain
+vector indexer) or which re-index run asks for them. The database is bounded
+by a byte budget and evicts least recently used vectors first.
+
+Environment Variables:
+    EMBEDDING_CACHE_ENABLED: Set to false to bypass the cache (default: true)
+    EMBEDDING_CACHE_PATH: SQLite file (default: data/user/cache/embeddings.sqlite3)
+    EMBEDDING_CACHE_MAX_BYTES: Vector byte budget (default: 1 GiB)
+
+Usage:
+    from src.services.embedding.cache import get_embedding_cache
+
+    cache = get_embedding_cache()
+    keys = [cache.make_key(model, dim, input_type, t) for t in texts]
+    found = cache.get_many(keys)
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .config import PROJECT_ROOT, _strip_value, _to_bool, _to_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = PROJECT_ROOT / "data" / "user" / "cache" / "embeddings.sqlite3"
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Fraction of the budget kept after an eviction pass, so inserts near the cap
+# do not trigger an eviction on every write
+EVICTION_TARGET = 0.9
+
+# SQLite limits the number of bound parameters per statement
+_SQL_CHUNK = 500
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed LRU cache of embedding vectors.
+
+    Thread-safe: the client calls it from worker threads so that disk I/O
+    never blocks the event loop.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (created on first use)
+            max_bytes: Approximate budget for stored vector bytes
+        """
+        self.path = Path(path or DEFAULT_CACHE_PATH)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        model: str, dimensions: Optional[int], input_type: Optional[str], text: str
+    ) -> str:
+        """
+        Build the content address of one text for a given embedding model.
+
+        Args:
+            model: Embedding model name
+            dimensions: Requested vector dimensions
+            input_type: Task-aware input type, if any
+            text: Text to embed
+
+        Returns:
+            Hex sha256 digest
+        """
+        h = hashlib.sha256()
+        h.update(f"{model}\x00{dimensions or ''}\x00{input_type or ''}\x00".encode("utf-8"))
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key TEXT PRIMARY KEY,"
+                " dim INTEGER NOT NULL,"
+                " vector BLOB NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)"
+            )
+            conn.commit()
+            row = conn.execute("SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings").fetchone()
+            self._total_bytes = int(row[0])
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """
+        Look up vectors by key and refresh their recency.
+
+        Args:
+            keys: Content keys from make_key()
+
+        Returns:
+            Mapping of found keys to vectors (missing keys are absent)
+        """
+        unique = list(dict.fromkeys(keys))
+        found: Dict[str, List[float]] = {}
+        if not unique:
+            return found
+
+        with self._lock:
+            conn = self._connect()
+            for start in range(0, len(unique), _SQL_CHUNK):
+                chunk = unique[start : start + _SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                conn.commit()
+
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, items: Sequence[Tuple[str, Sequence[float]]]) -> None:
+        """
+        Store vectors, evicting least recently used ones beyond the budget.
+
+        Args:
+            items: (key, vector) pairs
+        """
+        if not items:
+            return
+
+        now = time.time()
+        rows = []
+        for key, vector in items:
+            blob = np.asarray(vector, dtype=np.float32).tobytes()
+            rows.append((key, len(blob) // 4, blob, now))
+
+        with self._lock:
+            conn = self._connect()
+            added = 0
+            for start in range(0, len(rows), _SQL_CHUNK):
+                chunk = rows[start : start + _SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                existing = conn.execute(
+                    f"SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings "
+                    f"WHERE key IN ({placeholders})",
+                    [row[0] for row in chunk],
+                ).fetchone()[0]
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, dim, vector, last_used) "
+                    "VALUES (?, ?, ?, ?)",
+                    chunk,
+                )
+                added += sum(len(row[2]) for row in chunk) - int(existing)
+            self._total_bytes += added
+            self.writes += len(rows)
+
+            if self._total_bytes > self.max_bytes:
+                self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used vectors until under the target size."""
+        target = int(self.max_bytes * EVICTION_TARGET)
+        removed_bytes = 0
+        removed_keys: List[str] = []
+        cursor = conn.execute("SELECT key, LENGTH(vector) FROM embeddings ORDER BY last_used ASC")
+        for key, size in cursor:
+            if self._total_bytes - removed_bytes <= target:
+                break
+            removed_keys.append(key)
+            removed_bytes += int(size)
+
+        for start in range(0, len(removed_keys), _SQL_CHUNK):
+            chunk = removed_keys[start : start + _SQL_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            conn.execute(f"DELETE FROM embeddings WHERE key IN ({placeholders})", chunk)
+
+        self._total_bytes -= removed_bytes
+        self.evictions += len(removed_keys)
+        if removed_keys:
+            logger.debug(f"Evicted {len(removed_keys)} cached embeddings")
+
+    def clear(self) -> None:
+        """Remove every cached vector."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM embeddings")
+            conn.commit()
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache counters."""
+        with self._lock:
+            conn = self._connect()
+            entries = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "path": str(self.path),
+                "entries": int(entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+            }
+
+
+# Singleton instance
+_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Get or create the process-wide embedding cache.
+
+    Returns:
+        EmbeddingCache, or None when disabled via EMBEDDING_CACHE_ENABLED=false
+    """
+    global _cache
+    if not _to_bool(_strip_value(os.getenv("EMBEDDING_CACHE_ENABLED")), True):
+        return None
+    if _cache is None:
+        path = _strip_value(os.getenv("EMBEDDING_CACHE_PATH"))
+        max_bytes = _to_int(_strip_value(os.getenv("EMBEDDING_CACHE_MAX_BYTES")), DEFAULT_MAX_BYTES)
+        _cache = EmbeddingCache(path=Path(path) if path else None, max_bytes=max_bytes)
+    return _cache
+
+
+def reset_embedding_cache():
+    """Close and reset the singleton cache."""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+    _cache = None
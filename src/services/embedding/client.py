@@ -7,11 +7,13 @@ Unified embedding client for all DeepTutor services.
 Now supports multiple providers through adapters.
 """
 
+import asyncio
 from typing import List, Optional
 
 from src.logging import get_logger
 
 from .adapters.base import EmbeddingRequest
+from .cache import EmbeddingCache, get_embedding_cache
 from .config import EmbeddingConfig, get_embedding_config
 from .provider import EmbeddingProviderManager, get_embedding_provider_manager
 
@@ -34,6 +36,7 @@ class EmbeddingClient:
         self.config = config or get_embedding_config()
         self.logger = get_logger("EmbeddingClient")
         self.manager: EmbeddingProviderManager = get_embedding_provider_manager()
+        self.cache: Optional[EmbeddingCache] = get_embedding_cache()
 
         # Initialize adapter based on binding configuration
         try:
@@ -46,6 +49,7 @@ class EmbeddingClient:
                     "model": self.config.model,
                     "dimensions": self.config.dim,
                     "request_timeout": self.config.request_timeout,
+                    "max_concurrency": self.config.max_concurrency,
                 },
             )
             self.manager.set_adapter(adapter)
@@ -58,16 +62,61 @@ class EmbeddingClient:
             self.logger.error(f"Failed to initialize embedding adapter: {e}")
             raise
 
-    async def embed(self, texts: List[str]) -> List[List[float]]:
+    async def embed(self, texts: List[str], batch_size: Optional[int] = None) -> List[List[float]]:
         """
         Get embeddings for texts using the configured adapter.
 
+        Texts already embedded with the same model, dimensions and input type
+        are served from the persistent embedding cache; only the remaining
+        (deduplicated) texts are sent to the provider. The adapter splits them
+        into provider-sized batches, sends them concurrently over a pooled
+        connection and returns vectors in input order.
+
         Args:
             texts: List of texts to embed
+            batch_size: Optional cap on texts per provider request
 
         Returns:
             List of embedding vectors
         """
+        if not texts:
+            return []
+        if self.cache is None:
+            return await self._embed_uncached(texts, batch_size)
+
+        keys = [
+            self.cache.make_key(self.config.model, self.config.dim, self.config.input_type, text)
+            for text in texts
+        ]
+        try:
+            found = await asyncio.to_thread(self.cache.get_many, keys)
+        except Exception as e:
+            self.logger.warning(f"Embedding cache lookup failed: {e}")
+            return await self._embed_uncached(texts, batch_size)
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+
+        if missing:
+            vectors = await self._embed_uncached(list(missing.values()), batch_size)
+            fresh = dict(zip(missing.keys(), vectors))
+            found.update(fresh)
+            try:
+                await asyncio.to_thread(self.cache.put_many, list(fresh.items()))
+            except Exception as e:
+                self.logger.warning(f"Embedding cache write failed: {e}")
+
+        self.logger.debug(
+            f"Embedding cache: {len(texts) - len(missing)}/{len(texts)} texts served from cache"
+        )
+        return [found[key] for key in keys]
+
+    async def _embed_uncached(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> List[List[float]]:
+        """Send texts to the active adapter, bypassing the cache."""
         adapter = self.manager.get_active_adapter()
 
         request = EmbeddingRequest(
@@ -78,7 +127,7 @@ class EmbeddingClient:
         )
 
         try:
-            response = await adapter.embed(request)
+            response = await adapter.embed(request, batch_size=batch_size)
 
             self.logger.debug(
                 f"Generated {len(response.embeddings)} embeddings using {self.config.binding}"
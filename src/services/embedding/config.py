@@ -36,6 +36,7 @@ class EmbeddingConfig:
     max_tokens: int = 8192
     request_timeout: int = 30
     input_type: Optional[str] = None  # For task-aware embeddings (Cohere, Jina)
+    max_concurrency: int = 4  # Max batch requests in flight per adapter
 
     # Optional provider-specific settings
     encoding_format: str = "float"
@@ -93,6 +94,7 @@ def get_embedding_config() -> EmbeddingConfig:
                 base_url=config.get("base_url"),
                 api_version=config.get("api_version"),
                 dim=config.get("dimensions", 3072),
+                max_concurrency=_to_int(_strip_value(os.getenv("EMBEDDING_MAX_CONCURRENCY")), 4),
             )
     except ImportError:
         # Unified config service not yet available, fall back to env
@@ -133,6 +135,7 @@ def get_embedding_config() -> EmbeddingConfig:
     max_tokens = _to_int(_strip_value(os.getenv("EMBEDDING_MAX_TOKENS")), 8192)
     request_timeout = _to_int(_strip_value(os.getenv("EMBEDDING_REQUEST_TIMEOUT")), 30)
     input_type = _strip_value(os.getenv("EMBEDDING_INPUT_TYPE"))  # Optional
+    max_concurrency = _to_int(_strip_value(os.getenv("EMBEDDING_MAX_CONCURRENCY")), 4)
 
     # Provider-specific optional settings
     encoding_format = _strip_value(os.getenv("EMBEDDING_ENCODING_FORMAT")) or "float"
@@ -150,6 +153,7 @@ def get_embedding_config() -> EmbeddingConfig:
         max_tokens=max_tokens,
         request_timeout=request_timeout,
         input_type=input_type,
+        max_concurrency=max_concurrency,
         encoding_format=encoding_format,
         normalized=normalized,
         truncate=truncate,
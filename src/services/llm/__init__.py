@@ -50,6 +50,12 @@ Usage:
 
 # Note: cloud_provider and local_provider are lazy-loaded via __getattr__
 # to avoid importing lightrag at module load time
+from .cache import (
+    CompletionCache,
+    get_completion_cache,
+    reset_completion_cache,
+    set_completion_cache,
+)
 from .capabilities import (
     DEFAULT_CAPABILITIES,
     MODEL_OVERRIDES,
@@ -90,6 +96,16 @@ from .factory import (
     get_provider_presets,
     stream,
 )
+from .hedge import get_hedge_stats, reset_hedge_stats
+from .prompt_cache import assemble_messages
+from .rate_limit import RateLimiter, get_rate_limiter, reset_rate_limiter
+from .scheduler import (
+    LLMScheduler,
+    get_llm_scheduler,
+    reset_llm_scheduler,
+    set_llm_session,
+)
+from .usage import TokenUsage, capture_usage
 from .utils import (
     build_auth_headers,
     build_chat_url,
@@ -129,6 +145,27 @@ __all__ = [
     "LLMRateLimitError",
     "LLMAuthenticationError",
     "LLMModelNotFoundError",
+    # Completion cache
+    "CompletionCache",
+    "get_completion_cache",
+    "set_completion_cache",
+    "reset_completion_cache",
+    # Hedged requests
+    "get_hedge_stats",
+    "reset_hedge_stats",
+    # Prompt prefix caching and usage
+    "assemble_messages",
+    "TokenUsage",
+    "capture_usage",
+    # Header-driven rate limiting
+    "RateLimiter",
+    "get_rate_limiter",
+    "reset_rate_limiter",
+    # Admission scheduler
+    "LLMScheduler",
+    "get_llm_scheduler",
+    "reset_llm_scheduler",
+    "set_llm_session",
     # Factory (main API)
     "complete",
     "stream",
@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+LLM Completion Cache
+====================
+
+Size-bounded cache of non-streaming completions.
+
+Entries are keyed by sha256(model, base_url, messages, temperature,
+response_format, max_tokens and any other request options), so an agent that
+re-issues an identical prompt (question planning, idea filters, numbered-item
+extraction re-runs) is answered locally. Results live in an in-memory LRU; with
+persistence enabled they are also written to SQLite and survive restarts.
+
+Caching is opt-in per module (config/agents.yaml, ``<module>.cache``):
+    enabled: Look up and store completions (default: false)
+    allow_sampling: Also cache calls with temperature > 0 (default: false)
+
+Store settings (config/agents.yaml, ``llm_cache``):
+    max_entries: Entries kept in memory and on disk (default: 1024)
+    ttl_seconds: Lifetime of an entry, 0 for no expiry (default: 0)
+    persist: Also store completions on disk (default: false)
+    path: SQLite file (default: data/user/cache/llm_completions.sqlite3)
+
+Usage:
+    from src.services.llm.cache import get_completion_cache, should_cache
+
+    if should_cache(policy, temperature):
+        cache = get_completion_cache()
+        key = cache.make_key(model, messages, temperature=temperature)
+        response = cache.get(key)
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.services.config import PROJECT_ROOT, get_llm_cache_settings
+
+DEFAULT_CACHE_PATH = PROJECT_ROOT / "data" / "user" / "cache" / "llm_completions.sqlite3"
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 0
+
+
+def should_cache(policy: Union[bool, Dict[str, Any], None], temperature: Optional[float]) -> bool:
+    """
+    Decide whether a completion may be served from / stored in the cache.
+
+    Args:
+        policy: Module cache policy (``{"enabled", "allow_sampling"}``) or a bool
+        temperature: Sampling temperature of the call (None means provider default)
+
+    Returns:
+        True if the cache applies; sampled calls need allow_sampling
+    """
+    if isinstance(policy, bool):
+        policy = {"enabled": policy}
+    if not policy or not policy.get("enabled", False):
+        return False
+    deterministic = temperature is not None and temperature <= 0
+    return deterministic or bool(policy.get("allow_sampling", False))
+
+
+class CompletionCache:
+    """
+    LRU cache of completion texts with optional SQLite persistence.
+
+    Subclass and install with set_completion_cache() to plug in another
+    backend; the factory only uses make_key(), get(), put() and record_bypass().
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        path: Optional[Path] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            ttl_seconds: Lifetime of an entry (0 keeps entries until evicted)
+            path: SQLite file for persistence (None keeps completions in memory only)
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = ttl_seconds
+        self.path = Path(path) if path else None
+        # key -> (expires_at or None, response, latency of the original call)
+        self._entries: OrderedDict[str, Tuple[Optional[float], str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Rows in the table, counted once on connect and then kept up to date
+        self._disk_count = 0
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.saved_seconds = 0.0
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: Optional[float] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None,
+        base_url: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Build the cache key of one completion request.
+
+        Args:
+            model: Model name
+            messages: Full message list sent to the model
+            temperature: Sampling temperature
+            response_format: Response format (e.g. {"type": "json_object"})
+            max_tokens: Output token limit
+            base_url: Endpoint, so equally named models of different servers differ
+            options: Any other request options that change the response
+
+        Returns:
+            Hex sha256 digest
+        """
+        payload = {
+            "model": model,
+            "base_url": base_url,
+            "messages": messages,
+            "temperature": temperature,
+            "response_format": response_format,
+            "max_tokens": max_tokens,
+            "options": options or {},
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self.path is None:
+            return None
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS completions ("
+                " key TEXT PRIMARY KEY,"
+                " response TEXT NOT NULL,"
+                " latency REAL NOT NULL,"
+                " expires_at REAL,"
+                " created_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "DELETE FROM completions WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            conn.commit()
+            (self._disk_count,) = conn.execute("SELECT COUNT(*) FROM completions").fetchone()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached completion.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            The cached response, or None when missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._load(key)
+            if entry is not None and entry[0] is not None and entry[0] <= now:
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._trim()
+            self.hits += 1
+            self.saved_seconds += entry[2]
+            return entry[1]
+
+    def put(self, key: str, response: str, latency: float = 0.0) -> None:
+        """
+        Store a completion, evicting least recently used entries beyond max_entries.
+
+        Args:
+            key: Key from make_key()
+            response: Completion text
+            latency: Seconds the original call took (credited on every hit)
+        """
+        now = time.time()
+        expires_at = now + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._entries[key] = (expires_at, response, latency)
+            self._entries.move_to_end(key)
+            conn = self._connect()
+            if conn is not None:
+                inserted = conn.execute(
+                    "INSERT OR IGNORE INTO completions "
+                    "(key, response, latency, expires_at, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, response, latency, expires_at, now),
+                ).rowcount
+                if inserted:
+                    self._disk_count += 1
+                else:
+                    conn.execute(
+                        "UPDATE completions SET response = ?, latency = ?, expires_at = ?,"
+                        " created_at = ? WHERE key = ?",
+                        (response, latency, expires_at, now, key),
+                    )
+                conn.commit()
+            self._trim()
+
+    def record_bypass(self) -> None:
+        """Count a call that skipped the cache (e.g. sampled without allow_sampling)."""
+        with self._lock:
+            self.bypassed += 1
+
+    def _load(self, key: str) -> Optional[Tuple[Optional[float], str, float]]:
+        conn = self._connect()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT expires_at, response, latency FROM completions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], float(row[2])
+
+    def _drop(self, key: str) -> None:
+        self._entries.pop(key, None)
+        conn = self._connect()
+        if conn is not None:
+            self._disk_count -= conn.execute(
+                "DELETE FROM completions WHERE key = ?", (key,)
+            ).rowcount
+            conn.commit()
+
+    def _trim(self) -> None:
+        """Evict least recently used entries beyond max_entries."""
+        evicted = []
+        while len(self._entries) > self.max_entries:
+            key, _ = self._entries.popitem(last=False)
+            evicted.append(key)
+        conn = self._connect()
+        if conn is None:
+            return
+        if evicted:
+            self._disk_count -= conn.executemany(
+                "DELETE FROM completions WHERE key = ?", [(k,) for k in evicted]
+            ).rowcount
+        # The disk table also holds entries never loaded into memory this run
+        if self._disk_count > self.max_entries:
+            self._disk_count -= conn.execute(
+                "DELETE FROM completions WHERE key IN ("
+                " SELECT key FROM completions ORDER BY created_at ASC LIMIT ?)",
+                (self._disk_count - self.max_entries,),
+            ).rowcount
+        if conn.in_transaction:
+            conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached completion."""
+        with self._lock:
+            self._entries.clear()
+            conn = self._connect()
+            if conn is not None:
+                conn.execute("DELETE FROM completions")
+                conn.commit()
+                self._disk_count = 0
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache counters, including the call latency saved by hits."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "path": str(self.path) if self.path else None,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "saved_seconds": round(self.saved_seconds, 3),
+            }
+
+
+# Singleton instance
+_cache: Optional[CompletionCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_completion_cache() -> CompletionCache:
+    """
+    Get or create the process-wide completion cache (settings from agents.yaml llm_cache).
+
+    Returns:
+        CompletionCache instance
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            settings = get_llm_cache_settings()
+            path = None
+            if settings.get("persist", False):
+                path = Path(settings.get("path") or DEFAULT_CACHE_PATH)
+                if not path.is_absolute():
+                    path = PROJECT_ROOT / path
+            _cache = CompletionCache(
+                max_entries=int(settings.get("max_entries", DEFAULT_MAX_ENTRIES)),
+                ttl_seconds=float(settings.get("ttl_seconds", DEFAULT_TTL_SECONDS)),
+                path=path,
+            )
+        return _cache
+
+
+def set_completion_cache(cache: Optional[CompletionCache]) -> None:
+    """
+    Install a completion cache (e.g. a custom backend); None resets to the default.
+
+    Args:
+        cache: Cache instance to use for all subsequent completions
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is not None and _cache is not cache:
+            _cache.close()
+        _cache = cache
+
+
+def reset_completion_cache() -> None:
+    """Close and reset the singleton cache."""
+    set_completion_cache(None)
+
+
+__all__ = [
+    "CompletionCache",
+    "get_completion_cache",
+    "reset_completion_cache",
+    "set_completion_cache",
+    "should_cache",
+]
@@ -4,37 +4,27 @@ Cloud LLM Provider
 ==================
 
 Handles all cloud API LLM calls (OpenAI, DeepSeek, Anthropic, etc.)
-Provides both complete() and stream() methods.
+Provides both complete() and stream() methods. Requests go directly to the
+provider's HTTP API, so every response feeds the rate limiter.
 """
 
-import logging
 import os
 from typing import AsyncGenerator, Dict, List, Optional
 
 import aiohttp
 
-# Get loggers for suppression during fallback scenarios
-# (lightrag logs errors internally before raising exceptions)
-_lightrag_logger = logging.getLogger("lightrag")
-_openai_logger = logging.getLogger("openai")
-
-# Lazy import for lightrag to avoid import errors when not installed
-_openai_complete_if_cache = None
-
-
-def _get_openai_complete_if_cache():
-    """Lazy load openai_complete_if_cache from lightrag."""
-    global _openai_complete_if_cache
-    if _openai_complete_if_cache is None:
-        from lightrag.llm.openai import openai_complete_if_cache
-
-        _openai_complete_if_cache = openai_complete_if_cache
-    return _openai_complete_if_cache
-
-
 from .capabilities import get_effective_temperature, supports_response_format
 from .config import get_token_limit_kwargs
-from .exceptions import LLMAPIError, LLMAuthenticationError, LLMConfigError
+from .exceptions import (
+    LLMAPIError,
+    LLMAuthenticationError,
+    LLMConfigError,
+    LLMRateLimitError,
+)
+from .http_pool import get_session_pool
+from .prompt_cache import to_anthropic
+from .rate_limit import get_rate_limiter
+from .usage import report_usage
 from .utils import (
     build_auth_headers,
     build_chat_url,
@@ -161,6 +151,7 @@ async def _openai_complete(
     base_url: Optional[str],
     api_version: Optional[str] = None,
     binding: str = "openai",
+    messages: Optional[List[Dict[str, str]]] = None,
     **kwargs,
 ) -> str:
     """OpenAI-compatible completion."""
@@ -173,80 +164,58 @@ async def _openai_complete(
     if not supports_response_format(binding, model):
         kwargs.pop("response_format", None)
 
-    content = None
-    try:
-        # Try using lightrag's openai_complete_if_cache first (has caching)
-        # Only pass api_version if it's set (for Azure OpenAI)
-        # Standard OpenAI SDK doesn't accept api_version parameter
-        lightrag_kwargs = {
-            "system_prompt": system_prompt,
-            "history_messages": [],  # Required by lightrag to build messages array
-            "api_key": api_key,
-            "base_url": base_url,
-            **kwargs,
-        }
-        if api_version:
-            lightrag_kwargs["api_version"] = api_version
-
-        # Suppress lightrag's and openai's internal error logging during the call
-        # (errors are handled by our fallback mechanism)
-        original_lightrag_level = _lightrag_logger.level
-        original_openai_level = _openai_logger.level
-        _lightrag_logger.setLevel(logging.CRITICAL)
-        _openai_logger.setLevel(logging.CRITICAL)
-        try:
-            # model and prompt must be positional arguments
-            openai_complete_if_cache = _get_openai_complete_if_cache()
-            content = await openai_complete_if_cache(model, prompt, **lightrag_kwargs)
-        finally:
-            _lightrag_logger.setLevel(original_lightrag_level)
-            _openai_logger.setLevel(original_openai_level)
-    except Exception:
-        pass  # Fall through to direct call
-
-    # Fallback: Direct aiohttp call
-    if not content and base_url:
-        # Build URL using unified utility (use binding for Azure detection)
-        url = build_chat_url(base_url, api_version, binding)
-
-        # Build headers using unified utility
-        headers = build_auth_headers(api_key, binding)
-
-        data = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": get_effective_temperature(
-                binding, model, kwargs.get("temperature", 0.7)
-            ),
-        }
-
-        # Handle max_tokens / max_completion_tokens based on model
-        max_tokens = kwargs.get("max_tokens") or kwargs.get("max_completion_tokens") or 4096
-        data.update(get_token_limit_kwargs(model, max_tokens))
+    # Direct request, so the rate-limit headers and usage of every response are observed
+    effective_base = base_url or "https://api.openai.com/v1"
 
-        # Include response_format if present in kwargs
-        if "response_format" in kwargs:
-            data["response_format"] = kwargs["response_format"]
+    # Build URL using unified utility (use binding for Azure detection)
+    url = build_chat_url(effective_base, api_version, binding)
 
-        timeout = aiohttp.ClientTimeout(total=120)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(url, headers=headers, json=data) as resp:
-                if resp.status == 200:
-                    result = await resp.json()
-                    if "choices" in result and result["choices"]:
-                        msg = result["choices"][0].get("message", {})
-                        # Use unified response extraction
-                        content = extract_response_content(msg)
-                else:
-                    error_text = await resp.text()
-                    raise LLMAPIError(
-                        f"OpenAI API error: {error_text}",
-                        status_code=resp.status,
-                        provider=binding or "openai",
-                    )
+    # Build headers using unified utility
+    headers = build_auth_headers(api_key, binding)
+
+    data = {
+        "model": model,
+        "messages": messages
+        or [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ],
+        "temperature": get_effective_temperature(binding, model, kwargs.get("temperature", 0.7)),
+    }
+
+    # Handle max_tokens / max_completion_tokens based on model
+    max_tokens = kwargs.get("max_tokens") or kwargs.get("max_completion_tokens") or 4096
+    data.update(get_token_limit_kwargs(model, max_tokens))
+
+    # Include response_format if present in kwargs
+    if "response_format" in kwargs:
+        data["response_format"] = kwargs["response_format"]
+
+    timeout = aiohttp.ClientTimeout(total=120)
+    session = get_session_pool().get_session(url)
+    content = None
+    async with session.post(url, headers=headers, json=data, timeout=timeout) as resp:
+        limits = get_rate_limiter().observe(effective_base, model, resp.headers)
+        if resp.status == 200:
+            result = await resp.json()
+            report_usage(result.get("usage"))
+            if "choices" in result and result["choices"]:
+                msg = result["choices"][0].get("message", {})
+                # Use unified response extraction
+                content = extract_response_content(msg)
+        else:
+            error_text = await resp.text()
+            if resp.status == 429:
+                raise LLMRateLimitError(
+                    f"OpenAI API error: {error_text}",
+                    retry_after=limits.retry_after,
+                    provider=binding or "openai",
+                )
+            raise LLMAPIError(
+                f"OpenAI API error: {error_text}",
+                status_code=resp.status,
+                provider=binding or "openai",
+            )
 
     if content is not None:
         # Clean thinking tags from response using unified utility
@@ -310,54 +279,63 @@ async def _openai_stream(
         data["response_format"] = kwargs["response_format"]
 
     timeout = aiohttp.ClientTimeout(total=300)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(url, headers=headers, json=data) as resp:
-            if resp.status != 200:
-                error_text = await resp.text()
-                raise LLMAPIError(
+    session = get_session_pool().get_session(url)
+    async with session.post(url, headers=headers, json=data, timeout=timeout) as resp:
+        limits = get_rate_limiter().observe(base_url or effective_base, model, resp.headers)
+        if resp.status != 200:
+            error_text = await resp.text()
+            if resp.status == 429:
+                raise LLMRateLimitError(
                     f"OpenAI stream error: {error_text}",
-                    status_code=resp.status,
+                    retry_after=limits.retry_after,
                     provider=binding or "openai",
                 )
-
-            # Track thinking block state for streaming
-            in_thinking_block = False
-            thinking_buffer = ""
-
-            async for line in resp.content:
-                line_str = line.decode("utf-8").strip()
-                if not line_str or not line_str.startswith("data:"):
-                    continue
-
-                data_str = line_str[5:].strip()
-                if data_str == "[DONE]":
-                    break
-
-                try:
-                    chunk_data = json.loads(data_str)
-                    if "choices" in chunk_data and chunk_data["choices"]:
-                        delta = chunk_data["choices"][0].get("delta", {})
-                        content = delta.get("content")
-                        if content:
-                            # Handle thinking tags in streaming
-                            if "<think>" in content:
-                                in_thinking_block = True
-                                thinking_buffer = content
-                                continue
-                            elif in_thinking_block:
-                                thinking_buffer += content
-                                if "</think>" in thinking_buffer:
-                                    # End of thinking block, clean and yield
-                                    cleaned = clean_thinking_tags(thinking_buffer, binding, model)
-                                    if cleaned:
-                                        yield cleaned
-                                    in_thinking_block = False
-                                    thinking_buffer = ""
-                                continue
-                            else:
-                                yield content
-                except json.JSONDecodeError:
-                    continue
+            raise LLMAPIError(
+                f"OpenAI stream error: {error_text}",
+                status_code=resp.status,
+                provider=binding or "openai",
+            )
+
+        # Track thinking block state for streaming
+        in_thinking_block = False
+        thinking_buffer = ""
+
+        async for line in resp.content:
+            line_str = line.decode("utf-8").strip()
+            if not line_str or not line_str.startswith("data:"):
+                continue
+
+            data_str = line_str[5:].strip()
+            if data_str == "[DONE]":
+                break
+
+            try:
+                chunk_data = json.loads(data_str)
+                # Servers that include usage send it with the last chunk
+                report_usage(chunk_data.get("usage"))
+                if "choices" in chunk_data and chunk_data["choices"]:
+                    delta = chunk_data["choices"][0].get("delta", {})
+                    content = delta.get("content")
+                    if content:
+                        # Handle thinking tags in streaming
+                        if "<think>" in content:
+                            in_thinking_block = True
+                            thinking_buffer = content
+                            continue
+                        elif in_thinking_block:
+                            thinking_buffer += content
+                            if "</think>" in thinking_buffer:
+                                # End of thinking block, clean and yield
+                                cleaned = clean_thinking_tags(thinking_buffer, binding, model)
+                                if cleaned:
+                                    yield cleaned
+                                in_thinking_block = False
+                                thinking_buffer = ""
+                            continue
+                        else:
+                            yield content
+            except json.JSONDecodeError:
+                continue
 
 
 async def _anthropic_complete(
@@ -381,39 +359,39 @@ async def _anthropic_complete(
     # Build headers using unified utility
     headers = build_auth_headers(api_key, binding="anthropic")
 
-    # Build messages - handle pre-built messages array
-    if messages:
-        # Filter out system messages for Anthropic (system is a separate parameter)
-        msg_list = [m for m in messages if m.get("role") != "system"]
-        system_content = next(
-            (m["content"] for m in messages if m.get("role") == "system"),
-            system_prompt,
-        )
-    else:
-        msg_list = [{"role": "user", "content": prompt}]
-        system_content = system_prompt
+    # System is a separate parameter; the stable prefix carries cache breakpoints
+    system_content, msg_list = to_anthropic(messages, system_prompt, prompt)
 
     data = {
         "model": model,
-        "system": system_content,
         "messages": msg_list,
         "max_tokens": kwargs.get("max_tokens", 4096),
         "temperature": kwargs.get("temperature", 0.7),
     }
+    if system_content:
+        data["system"] = system_content
 
     timeout = aiohttp.ClientTimeout(total=120)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(url, headers=headers, json=data) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise LLMAPIError(
+    session = get_session_pool().get_session(url)
+    async with session.post(url, headers=headers, json=data, timeout=timeout) as response:
+        limits = get_rate_limiter().observe(effective_base, model, response.headers)
+        if response.status != 200:
+            error_text = await response.text()
+            if response.status == 429:
+                raise LLMRateLimitError(
                     f"Anthropic API error: {error_text}",
-                    status_code=response.status,
+                    retry_after=limits.retry_after,
                     provider="anthropic",
                 )
+            raise LLMAPIError(
+                f"Anthropic API error: {error_text}",
+                status_code=response.status,
+                provider="anthropic",
+            )
 
-            result = await response.json()
-            return result["content"][0]["text"]
+        result = await response.json()
+        report_usage(result.get("usage"))
+        return result["content"][0]["text"]
 
 
 async def _anthropic_stream(
@@ -439,57 +417,63 @@ async def _anthropic_stream(
     # Build headers using unified utility
     headers = build_auth_headers(api_key, binding="anthropic")
 
-    # Build messages
-    if messages:
-        # Filter out system messages for Anthropic
-        msg_list = [m for m in messages if m.get("role") != "system"]
-        system_content = next(
-            (m["content"] for m in messages if m.get("role") == "system"),
-            system_prompt,
-        )
-    else:
-        msg_list = [{"role": "user", "content": prompt}]
-        system_content = system_prompt
+    # System is a separate parameter; the stable prefix carries cache breakpoints
+    system_content, msg_list = to_anthropic(messages, system_prompt, prompt)
 
     data = {
         "model": model,
-        "system": system_content,
         "messages": msg_list,
         "max_tokens": kwargs.get("max_tokens", 4096),
         "temperature": kwargs.get("temperature", 0.7),
         "stream": True,
     }
+    if system_content:
+        data["system"] = system_content
 
     timeout = aiohttp.ClientTimeout(total=300)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(url, headers=headers, json=data) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise LLMAPIError(
+    session = get_session_pool().get_session(url)
+    async with session.post(url, headers=headers, json=data, timeout=timeout) as response:
+        limits = get_rate_limiter().observe(effective_base, model, response.headers)
+        if response.status != 200:
+            error_text = await response.text()
+            if response.status == 429:
+                raise LLMRateLimitError(
                     f"Anthropic stream error: {error_text}",
-                    status_code=response.status,
+                    retry_after=limits.retry_after,
                     provider="anthropic",
                 )
-
-            async for line in response.content:
-                line_str = line.decode("utf-8").strip()
-                if not line_str or not line_str.startswith("data:"):
-                    continue
-
-                data_str = line_str[5:].strip()
-                if not data_str:
-                    continue
-
-                try:
-                    chunk_data = json.loads(data_str)
-                    event_type = chunk_data.get("type")
-                    if event_type == "content_block_delta":
-                        delta = chunk_data.get("delta", {})
-                        text = delta.get("text")
-                        if text:
-                            yield text
-                except json.JSONDecodeError:
-                    continue
+            raise LLMAPIError(
+                f"Anthropic stream error: {error_text}",
+                status_code=response.status,
+                provider="anthropic",
+            )
+
+        # Input and cache usage arrive with message_start, output usage with message_delta
+        usage: Dict[str, int] = {}
+        async for line in response.content:
+            line_str = line.decode("utf-8").strip()
+            if not line_str or not line_str.startswith("data:"):
+                continue
+
+            data_str = line_str[5:].strip()
+            if not data_str:
+                continue
+
+            try:
+                chunk_data = json.loads(data_str)
+                event_type = chunk_data.get("type")
+                if event_type == "content_block_delta":
+                    delta = chunk_data.get("delta", {})
+                    text = delta.get("text")
+                    if text:
+                        yield text
+                elif event_type == "message_start":
+                    usage.update(chunk_data.get("message", {}).get("usage") or {})
+                elif event_type == "message_delta":
+                    usage.update(chunk_data.get("usage") or {})
+            except json.JSONDecodeError:
+                continue
+        report_usage(usage)
 
 
 async def fetch_models(
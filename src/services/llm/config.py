@@ -173,6 +173,34 @@ async def get_llm_config_async() -> LLMConfig:
     return _get_llm_config_from_env()
 
 
+def get_llm_config_by_id(config_id: str) -> Optional[LLMConfig]:
+    """
+    Load a specific LLM configuration of the unified config service (not just the active one).
+
+    Args:
+        config_id: Configuration ID ("default" for the .env configuration)
+
+    Returns:
+        LLMConfig, or None if no configuration with that ID exists
+    """
+    try:
+        from src.services.config import ConfigType, get_config_manager
+
+        config = get_config_manager().get_resolved_config(ConfigType.LLM, config_id)
+    except Exception as e:
+        logger.warning(f"Failed to load LLM config {config_id!r}: {e}")
+        return None
+    if not config or not config.get("model"):
+        return None
+    return LLMConfig(
+        binding=config.get("provider", "openai"),
+        model=config["model"],
+        api_key=config.get("api_key", ""),
+        base_url=config.get("base_url"),
+        api_version=config.get("api_version"),
+    )
+
+
 def uses_max_completion_tokens(model: str) -> bool:
     """
     Check if the model uses max_completion_tokens instead of max_tokens.
@@ -226,6 +254,7 @@ __all__ = [
     "LLMConfig",
     "get_llm_config",
     "get_llm_config_async",
+    "get_llm_config_by_id",
     "uses_max_completion_tokens",
     "get_token_limit_kwargs",
 ]
@@ -17,6 +17,7 @@ from .exceptions import (
     LLMRateLimitError,
     ProviderContextWindowError,
 )
+from .rate_limit import parse_rate_limit_headers
 
 try:
     import openai  # type: ignore
@@ -70,7 +71,9 @@ if _HAS_OPENAI:
         ),
         MappingRule(
             classifier=_instance_of(openai.RateLimitError),
-            factory=lambda exc, provider: LLMRateLimitError(str(exc), provider=provider),
+            factory=lambda exc, provider: LLMRateLimitError(
+                str(exc), retry_after=_retry_after(exc), provider=provider
+            ),
         ),
     ]
 
@@ -88,14 +91,27 @@ except ImportError:
     pass
 
 
+def _retry_after(exc: Exception) -> Optional[float]:
+    """Retry-after seconds from the HTTP response attached to an SDK exception, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    try:
+        return parse_rate_limit_headers(headers).retry_after
+    except Exception:
+        return None
+
+
 def map_error(exc: Exception, provider: Optional[str] = None) -> LLMError:
     """Map provider-specific errors to unified internal exceptions."""
+    if isinstance(exc, LLMRateLimitError):
+        # Already unified; keep the provider's retry_after
+        return exc
+
     # Heuristic check for status codes before rules
     status_code = getattr(exc, "status_code", None)
     if status_code == 401:
         return LLMAuthenticationError(str(exc), provider=provider)
     if status_code == 429:
-        return LLMRateLimitError(str(exc), provider=provider)
+        return LLMRateLimitError(str(exc), retry_after=_retry_after(exc), provider=provider)
 
     for rule in _GLOBAL_RULES:
         if rule.classifier(exc):
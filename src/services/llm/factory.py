@@ -29,9 +29,24 @@ Retry Mechanism:
 - Automatic retry with exponential backoff for transient errors
 - Configurable max_retries, retry_delay, and exponential_backoff
 - Only retries on retriable errors (timeout, rate limit, server errors)
+
+Completion Cache:
+- complete() takes a cache policy (see cache.py); identical requests are then
+  answered from the completion cache instead of the provider
+
+Admission:
+- Every provider attempt waits for a slot of the process-wide scheduler
+  (see scheduler.py), by priority class and fairly across sessions
+- Once admitted, an attempt is paced by the rate-limit headers its provider
+  reported (see rate_limit.py); a 429 retries after the provider's retry-after
+
+Hedging:
+- complete() and stream() take a hedge policy (see hedge.py); a slow call is
+  duplicated to the same or a secondary model and the first result wins
 """
 
 import asyncio
+import time
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
 import tenacity
@@ -39,6 +54,7 @@ import tenacity
 from src.logging.logger import get_logger
 
 from . import cloud_provider, local_provider
+from .cache import get_completion_cache, should_cache
 from .config import get_llm_config
 from .exceptions import (
     LLMAPIError,
@@ -46,6 +62,9 @@ from .exceptions import (
     LLMRateLimitError,
     LLMTimeoutError,
 )
+from .hedge import apply_target, hedge_policy, hedge_target, hedged_call, hedged_stream
+from .rate_limit import get_rate_limiter
+from .scheduler import get_llm_scheduler
 from .utils import is_local_llm_server
 
 # Initialize logger
@@ -100,6 +119,61 @@ def _is_retriable_error(error: Exception) -> bool:
     return True
 
 
+async def _run_on_cache(method, *args):
+    """Call a completion cache method; SQLite-backed caches run in a worker thread."""
+    if getattr(get_completion_cache(), "path", None) is not None:
+        return await asyncio.to_thread(method, *args)
+    return method(*args)
+
+
+def _cache_key(
+    model: str,
+    base_url: Optional[str],
+    prompt: str,
+    system_prompt: str,
+    messages: Optional[List[Dict[str, Any]]],
+    kwargs: Dict[str, Any],
+) -> str:
+    """Completion cache key of a request, over the messages the provider will see."""
+    options = dict(kwargs)
+    temperature = options.pop("temperature", None)
+    response_format = options.pop("response_format", None)
+    max_tokens = options.pop("max_tokens", None) or options.pop("max_completion_tokens", None)
+    options.pop("max_completion_tokens", None)
+    if not messages:
+        history = options.pop("history_messages", None) or []
+        messages = [
+            {"role": "system", "content": system_prompt},
+            *history,
+            {"role": "user", "content": prompt},
+        ]
+    return get_completion_cache().make_key(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        response_format=response_format,
+        max_tokens=max_tokens,
+        base_url=base_url,
+        options=options,
+    )
+
+
+def _estimate_request_tokens(
+    prompt: str,
+    system_prompt: str,
+    messages: Optional[List[Dict[str, Any]]],
+    kwargs: Dict[str, Any],
+) -> int:
+    """Rough token cost of a request for admission budgets (~4 chars per token + output limit)."""
+    if messages:
+        chars = sum(len(str(m.get("content", ""))) for m in messages)
+    else:
+        chars = len(prompt or "") + len(system_prompt or "")
+        chars += sum(len(str(m.get("content", ""))) for m in kwargs.get("history_messages") or [])
+    max_tokens = kwargs.get("max_tokens") or kwargs.get("max_completion_tokens") or 0
+    return chars // 4 + int(max_tokens)
+
+
 def _should_use_local(base_url: Optional[str]) -> bool:
     """
     Determine if we should use the local provider based on URL.
@@ -125,6 +199,9 @@ async def complete(
     max_retries: int = DEFAULT_MAX_RETRIES,
     retry_delay: float = DEFAULT_RETRY_DELAY,
     exponential_backoff: bool = DEFAULT_EXPONENTIAL_BACKOFF,
+    cache: Optional[Dict[str, Any]] = None,
+    priority: Optional[str] = None,
+    hedge: Optional[Dict[str, Any]] = None,
     **kwargs,
 ) -> str:
     """
@@ -132,6 +209,7 @@ async def complete(
 
     Routes to cloud_provider or local_provider based on configuration.
     Includes automatic retry with exponential backoff for transient errors.
+    With a cache policy, identical requests are served from the completion cache.
 
     Args:
         prompt: The user prompt
@@ -145,6 +223,9 @@ async def complete(
         max_retries: Maximum number of retry attempts (default: 5)
         retry_delay: Initial delay between retries in seconds (default: 2.0)
         exponential_backoff: Whether to use exponential backoff (default: True)
+        cache: Completion cache policy {"enabled", "allow_sampling"} (default: no caching)
+        priority: Admission class: "interactive", "normal" or "batch" (default: normal)
+        hedge: Hedge policy {"enabled", "delay", "ttft", "config_id"} (default: no hedging)
         **kwargs: Additional parameters (temperature, max_tokens, etc.)
 
     Returns:
@@ -159,6 +240,17 @@ async def complete(
         api_version = api_version or config.api_version
         binding = binding or config.binding or "openai"
 
+    cache_key = None
+    if cache:
+        if should_cache(cache, kwargs.get("temperature")):
+            cache_key = _cache_key(model, base_url, prompt, system_prompt, messages, kwargs)
+            cached = await _run_on_cache(get_completion_cache().get, cache_key)
+            if cached is not None:
+                logger.debug(f"Completion cache hit for {model}")
+                return cached
+        else:
+            get_completion_cache().record_bypass()
+
     # Determine which provider to use
     use_local = _should_use_local(base_url)
 
@@ -192,6 +284,15 @@ async def complete(
 
     # Calculate total attempts for logging (1 initial + max_retries)
     total_attempts = max_retries + 1
+    request_tokens = _estimate_request_tokens(prompt, system_prompt, messages, kwargs)
+    backoff = tenacity.wait_exponential(multiplier=retry_delay, min=retry_delay, max=120)
+
+    def _retry_wait(retry_state: tenacity.RetryCallState) -> float:
+        # The provider's retry-after replaces the exponential backoff
+        error = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(error, LLMRateLimitError) and error.retry_after:
+            return min(error.retry_after, 120)
+        return backoff(retry_state)
 
     # Define the actual completion function with tenacity retry
     @tenacity.retry(
@@ -200,7 +301,7 @@ async def complete(
             | tenacity.retry_if_exception_type(LLMTimeoutError)
             | tenacity.retry_if_exception(_is_retriable_llm_api_error)
         ),
-        wait=tenacity.wait_exponential(multiplier=retry_delay, min=retry_delay, max=120),
+        wait=_retry_wait,
         stop=tenacity.stop_after_attempt(total_attempts),
         before_sleep=lambda retry_state: logger.warning(
             f"LLM call failed (attempt {retry_state.attempt_number}/{total_attempts}), "
@@ -209,10 +310,15 @@ async def complete(
     )
     async def _do_complete(**call_kwargs):
         try:
-            if use_local:
-                return await local_provider.complete(**call_kwargs)
-            else:
-                return await cloud_provider.complete(**call_kwargs)
+            # Each attempt queues separately, so retries back off without holding a slot
+            async with get_llm_scheduler().admit(
+                base_url, priority=priority, tokens=request_tokens
+            ):
+                await get_rate_limiter().acquire(base_url, model, tokens=request_tokens)
+                if use_local:
+                    return await local_provider.complete(**call_kwargs)
+                else:
+                    return await cloud_provider.complete(**call_kwargs)
         except Exception as e:
             # Map raw SDK exceptions to unified exceptions for retry logic
             from .error_mapping import map_error
@@ -236,8 +342,35 @@ async def complete(
         call_kwargs["api_version"] = api_version
         call_kwargs["binding"] = binding or "openai"
 
-    # Execute with retry (handled by tenacity decorator)
-    return await _do_complete(**call_kwargs)
+    start_time = time.monotonic()
+    policy = hedge_policy(hedge)
+    if policy:
+        # Each side is a complete call of its own, with its own retries
+        call_args = {
+            **call_kwargs,
+            "api_version": api_version,
+            "binding": binding,
+            "max_retries": max_retries,
+            "retry_delay": retry_delay,
+            "exponential_backoff": exponential_backoff,
+            "priority": priority,
+        }
+        target = hedge_target(policy, kwargs)
+        response = await hedged_call(
+            lambda: complete(**call_args),
+            lambda: complete(**apply_target(call_args, target)),
+            delay=policy["delay"],
+            fallback=target is not None,
+        )
+    else:
+        # Execute with retry (handled by tenacity decorator)
+        response = await _do_complete(**call_kwargs)
+
+    if cache_key is not None and isinstance(response, str):
+        await _run_on_cache(
+            get_completion_cache().put, cache_key, response, time.monotonic() - start_time
+        )
+    return response
 
 
 async def stream(
@@ -252,6 +385,8 @@ async def stream(
     max_retries: int = DEFAULT_MAX_RETRIES,
     retry_delay: float = DEFAULT_RETRY_DELAY,
     exponential_backoff: bool = DEFAULT_EXPONENTIAL_BACKOFF,
+    priority: Optional[str] = None,
+    hedge: Optional[Dict[str, Any]] = None,
     **kwargs,
 ) -> AsyncGenerator[str, None]:
     """
@@ -275,6 +410,8 @@ async def stream(
         max_retries: Maximum number of retry attempts (default: 5)
         retry_delay: Initial delay between retries in seconds (default: 2.0)
         exponential_backoff: Whether to use exponential backoff (default: True)
+        priority: Admission class: "interactive", "normal" or "batch" (default: normal)
+        hedge: Hedge policy {"enabled", "delay", "ttft", "config_id"} (default: no hedging)
         **kwargs: Additional parameters (temperature, max_tokens, etc.)
 
     Yields:
@@ -289,6 +426,34 @@ async def stream(
         api_version = api_version or config.api_version
         binding = binding or config.binding or "openai"
 
+    policy = hedge_policy(hedge)
+    if policy:
+        # Each side is a stream call of its own, with its own retries
+        call_args = {
+            "prompt": prompt,
+            "system_prompt": system_prompt,
+            "model": model,
+            "api_key": api_key,
+            "base_url": base_url,
+            "api_version": api_version,
+            "binding": binding,
+            "messages": messages,
+            "max_retries": max_retries,
+            "retry_delay": retry_delay,
+            "exponential_backoff": exponential_backoff,
+            "priority": priority,
+            **kwargs,
+        }
+        target = hedge_target(policy, kwargs)
+        async for chunk in hedged_stream(
+            lambda: stream(**call_args),
+            lambda: stream(**apply_target(call_args, target)),
+            ttft=policy["ttft"],
+            fallback=target is not None,
+        ):
+            yield chunk
+        return
+
     # Determine which provider to use
     use_local = _should_use_local(base_url)
 
@@ -312,18 +477,24 @@ async def stream(
     # Total attempts = 1 initial + max_retries
     total_attempts = max_retries + 1
     last_exception = None
+    request_tokens = _estimate_request_tokens(prompt, system_prompt, messages, kwargs)
     delay = retry_delay
     max_delay = 120  # Cap maximum delay at 120 seconds (consistent with complete())
 
     for attempt in range(total_attempts):
         try:
-            # Route to appropriate provider
-            if use_local:
-                async for chunk in local_provider.stream(**call_kwargs):
-                    yield chunk
-            else:
-                async for chunk in cloud_provider.stream(**call_kwargs):
-                    yield chunk
+            # The admission slot is held until the stream ends
+            async with get_llm_scheduler().admit(
+                base_url, priority=priority, tokens=request_tokens
+            ):
+                await get_rate_limiter().acquire(base_url, model, tokens=request_tokens)
+                # Route to appropriate provider
+                if use_local:
+                    async for chunk in local_provider.stream(**call_kwargs):
+                        yield chunk
+                else:
+                    async for chunk in cloud_provider.stream(**call_kwargs):
+                        yield chunk
             # If we get here, streaming completed successfully
             return
         except Exception as e:
@@ -339,9 +510,9 @@ async def stream(
             else:
                 current_delay = delay
 
-            # Special handling for rate limit errors with retry_after
+            # The provider's retry-after replaces the exponential backoff
             if isinstance(e, LLMRateLimitError) and e.retry_after:
-                current_delay = max(current_delay, e.retry_after)
+                current_delay = min(e.retry_after, max_delay)
 
             # Log retry attempt (consistent with complete() function)
             logger.warning(
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""
+LLM Request Hedging
+===================
+
+Opt-in hedged and fallback requests against tail latency.
+
+A hedged complete() starts the primary request. If it has not finished after
+``delay`` seconds, a duplicate goes to the same model or to a secondary
+configured model. The first response wins and the other request is
+cancelled. A hedged stream() hedges when no first token has arrived within
+``ttft`` seconds, then continues with whichever stream produced a token first.
+With a secondary model configured, a primary that fails before the hedge is
+issued falls back to the secondary right away.
+
+Hedging is opt-in per module (config/agents.yaml, ``<module>.hedge``):
+    enabled: Hedge this module's calls (default: false)
+    delay: Seconds before a non-streaming call is hedged (default: 2.0)
+    ttft: Seconds without a first token before a stream is hedged (default: delay)
+    config_id: LLM configuration (Settings) to hedge to; empty hedges to the same model
+
+Usage:
+    from src.services.llm.hedge import get_hedge_stats
+
+    get_hedge_stats().get_stats()  # hedge rate, wins and latency saved per call kind
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, TypeVar, Union
+
+from .config import get_llm_config_by_id, get_token_limit_kwargs
+
+DEFAULT_HEDGE_DELAY = 2.0
+
+# Marks the end of a buffered stream
+_END = object()
+
+T = TypeVar("T")
+
+
+def hedge_policy(policy: Union[bool, Dict[str, Any], None]) -> Optional[Dict[str, Any]]:
+    """
+    Normalize a module hedge policy.
+
+    Args:
+        policy: Module hedge policy ({"enabled", "delay", "ttft", "config_id"}) or a bool
+
+    Returns:
+        Policy with delay/ttft filled in, or None when hedging is off
+    """
+    if isinstance(policy, bool):
+        policy = {"enabled": policy}
+    if not policy or not policy.get("enabled", False):
+        return None
+    delay = float(policy.get("delay", DEFAULT_HEDGE_DELAY))
+    return {
+        "delay": delay,
+        "ttft": float(policy.get("ttft", delay)),
+        "config_id": policy.get("config_id") or None,
+    }
+
+
+def hedge_target(policy: Dict[str, Any], kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Connection arguments of the secondary model, if the policy names one.
+
+    Args:
+        policy: Normalized policy from hedge_policy()
+        kwargs: Request options (the token limit is re-keyed for the secondary model)
+
+    Returns:
+        Arguments overriding model/base_url/api_key/api_version/binding, or None to
+        hedge to the primary model
+    """
+    if not policy.get("config_id"):
+        return None
+    config = get_llm_config_by_id(policy["config_id"])
+    if config is None:
+        return None
+    target = {
+        "model": config.model,
+        "api_key": config.api_key,
+        "base_url": config.base_url,
+        "api_version": config.api_version,
+        "binding": config.binding,
+    }
+    max_tokens = kwargs.get("max_tokens") or kwargs.get("max_completion_tokens")
+    if max_tokens:
+        target.update(get_token_limit_kwargs(config.model, max_tokens))
+    return target
+
+
+def apply_target(call_args: Dict[str, Any], target: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Arguments of the duplicate request: the primary's, redirected to ``target``."""
+    if target is None:
+        return dict(call_args)
+    token_keys = ("max_tokens", "max_completion_tokens")
+    args = {k: v for k, v in call_args.items() if k not in token_keys}
+    args.update(target)
+    return args
+
+
+class HedgeStats:
+    """
+    Hedging counters per call kind ("complete" or "stream").
+
+    Latency is time to the full response for complete() and to the first token
+    for stream(). The latency saved by a hedge win is estimated against the
+    mean latency of hedged calls the primary still won, since the cancelled
+    primary's own finish time is never observed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._kinds: Dict[str, Dict[str, float]] = {}
+
+    def _counters(self, kind: str) -> Dict[str, float]:
+        counters = self._kinds.get(kind)
+        if counters is None:
+            counters = self._kinds[kind] = {
+                "calls": 0,
+                "hedged": 0,
+                "hedge_wins": 0,
+                "primary_wins": 0,
+                "fallbacks": 0,
+                "saved_seconds": 0.0,
+                "slow_primary_seconds": 0.0,
+            }
+        return counters
+
+    def record(
+        self, kind: str, hedged: bool, winner: str, latency: float, fallback: bool = False
+    ) -> None:
+        """
+        Record one hedge-enabled call.
+
+        Args:
+            kind: "complete" or "stream"
+            hedged: Whether a duplicate was issued
+            winner: "primary" or "hedge"
+            latency: Seconds until the winning result
+            fallback: The duplicate was issued because the primary failed
+        """
+        with self._lock:
+            counters = self._counters(kind)
+            counters["calls"] += 1
+            if not hedged:
+                return
+            counters["hedged"] += 1
+            counters["fallbacks"] += int(fallback)
+            if winner == "primary":
+                counters["primary_wins"] += 1
+                counters["slow_primary_seconds"] += latency
+            else:
+                counters["hedge_wins"] += 1
+                if counters["primary_wins"] and not fallback:
+                    slow = counters["slow_primary_seconds"] / counters["primary_wins"]
+                    counters["saved_seconds"] += max(0.0, slow - latency)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hedge rate, wins and estimated latency saved per call kind."""
+        with self._lock:
+            stats = {}
+            for kind, counters in self._kinds.items():
+                stats[kind] = {
+                    "calls": int(counters["calls"]),
+                    "hedged": int(counters["hedged"]),
+                    "hedge_rate": counters["hedged"] / counters["calls"]
+                    if counters["calls"]
+                    else 0.0,
+                    "hedge_wins": int(counters["hedge_wins"]),
+                    "primary_wins": int(counters["primary_wins"]),
+                    "fallbacks": int(counters["fallbacks"]),
+                    "saved_seconds": round(counters["saved_seconds"], 3),
+                }
+            return stats
+
+
+async def hedged_call(
+    primary: Callable[[], Awaitable[T]],
+    hedge: Callable[[], Awaitable[T]],
+    delay: float,
+    fallback: bool = False,
+    stats: Optional[HedgeStats] = None,
+) -> T:
+    """
+    Run ``primary`` and, if it is still running after ``delay``, also ``hedge``.
+
+    Args:
+        primary: Starts the primary request
+        hedge: Starts the duplicate request
+        delay: Seconds before the duplicate is issued
+        fallback: Also issue the duplicate when the primary fails before ``delay``
+        stats: Counters to update (default: get_hedge_stats())
+
+    Returns:
+        The first successful result; the other request is cancelled
+    """
+    stats = stats or get_hedge_stats()
+    start = time.monotonic()
+    names: Dict[asyncio.Future, str] = {asyncio.ensure_future(primary()): "primary"}
+    pending = set(names)
+    errors: Dict[str, BaseException] = {}
+    fell_back = False
+    try:
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        for task in done:
+            if task.exception() is None:
+                stats.record("complete", False, "primary", time.monotonic() - start)
+                return task.result()
+            errors["primary"] = task.exception()
+        if errors and not fallback:
+            raise errors["primary"]
+
+        fell_back = bool(errors)
+        second = asyncio.ensure_future(hedge())
+        names[second] = "hedge"
+        pending.add(second)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    stats.record("complete", True, names[task], time.monotonic() - start, fell_back)
+                    return task.result()
+                errors[names[task]] = task.exception()
+        raise errors.get("primary") or errors["hedge"]
+    finally:
+        for task in names:
+            if not task.done():
+                task.cancel()
+
+
+class _Contender:
+    """Runs one stream in its own task and buffers its chunks."""
+
+    def __init__(self, factory: Callable[[], AsyncIterator[str]]):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task = asyncio.ensure_future(self._pump(factory))
+
+    async def _pump(self, factory: Callable[[], AsyncIterator[str]]) -> None:
+        try:
+            async for chunk in factory():
+                self.queue.put_nowait((chunk, None))
+        except Exception as e:
+            self.queue.put_nowait((_END, e))
+        else:
+            self.queue.put_nowait((_END, None))
+
+
+async def hedged_stream(
+    primary: Callable[[], AsyncIterator[str]],
+    hedge: Callable[[], AsyncIterator[str]],
+    ttft: float,
+    fallback: bool = False,
+    stats: Optional[HedgeStats] = None,
+) -> AsyncIterator[str]:
+    """
+    Stream from ``primary``, racing ``hedge`` when no first chunk arrives within ``ttft``.
+
+    Args:
+        primary: Starts the primary stream
+        hedge: Starts the duplicate stream
+        ttft: Seconds without a first chunk before the duplicate is issued
+        fallback: Also issue the duplicate when the primary fails before its first chunk
+        stats: Counters to update (default: get_hedge_stats())
+
+    Yields:
+        Chunks of whichever stream produced a chunk first; the other is cancelled
+    """
+    stats = stats or get_hedge_stats()
+    start = time.monotonic()
+    contenders: Dict[str, _Contender] = {}
+    heads: Dict[asyncio.Future, str] = {}
+
+    def launch(name: str, factory: Callable[[], AsyncIterator[str]]) -> asyncio.Future:
+        contenders[name] = _Contender(factory)
+        head = asyncio.ensure_future(contenders[name].queue.get())
+        heads[head] = name
+        return head
+
+    pending = {launch("primary", primary)}
+    errors: Dict[str, BaseException] = {}
+    winner: Optional[str] = None
+    first: Any = _END
+    fell_back = False
+    try:
+        while winner is None:
+            hedged = "hedge" in contenders
+            timeout = None if hedged else max(0.0, start + ttft - time.monotonic())
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                pending.add(launch("hedge", hedge))
+                continue
+            for head in done:
+                item, error = head.result()
+                if error is None:
+                    winner, first = heads[head], item
+                    break
+                errors[heads[head]] = error
+            if winner is None and not pending:
+                if hedged or not fallback:
+                    raise errors.get("primary") or errors["hedge"]
+                fell_back = True
+                pending.add(launch("hedge", hedge))
+    finally:
+        for head in pending:
+            head.cancel()
+        for name, contender in contenders.items():
+            if name != winner:
+                contender.task.cancel()
+
+    stats.record("stream", "hedge" in contenders, winner, time.monotonic() - start, fell_back)
+    contender = contenders[winner]
+    try:
+        item = first
+        while item is not _END:
+            yield item
+            item, error = await contender.queue.get()
+            if error is not None:
+                raise error
+    finally:
+        contender.task.cancel()
+
+
+# Singleton instance
+_stats: Optional[HedgeStats] = None
+
+
+def get_hedge_stats() -> HedgeStats:
+    """Get or create the process-wide hedging counters."""
+    global _stats
+    if _stats is None:
+        _stats = HedgeStats()
+    return _stats
+
+
+def reset_hedge_stats() -> None:
+    """Reset the hedging counters."""
+    global _stats
+    _stats = None
+
+
+__all__ = [
+    "DEFAULT_HEDGE_DELAY",
+    "HedgeStats",
+    "apply_target",
+    "get_hedge_stats",
+    "hedge_policy",
+    "hedge_target",
+    "hedged_call",
+    "hedged_stream",
+    "reset_hedge_stats",
+]
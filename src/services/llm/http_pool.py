@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+LLM HTTP Session Pool
+=====================
+
+Shared, long-lived aiohttp sessions for LLM provider calls.
+
+One ClientSession (and its TCPConnector) is kept per (endpoint origin, event loop),
+so consecutive requests to the same provider reuse keep-alive connections instead
+of paying a fresh TCP/TLS handshake each time.
+
+Environment Variables:
+    LLM_POOL_LIMIT: Max open connections per session (default: 100)
+    LLM_POOL_LIMIT_PER_HOST: Max open connections per host (default: 20)
+    LLM_POOL_KEEPALIVE: Seconds an idle connection is kept alive (default: 60)
+
+Usage:
+    from src.services.llm.http_pool import get_session_pool
+
+    session = get_session_pool().get_session(url)
+    async with session.post(url, json=data, timeout=timeout) as resp:
+        ...
+"""
+
+import asyncio
+from dataclasses import dataclass
+import os
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from src.logging.logger import get_logger
+
+logger = get_logger("LLMHttpPool")
+
+DEFAULT_POOL_LIMIT = 100
+DEFAULT_POOL_LIMIT_PER_HOST = 20
+DEFAULT_KEEPALIVE_TIMEOUT = 60.0
+
+
+def _env_number(name: str, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass
+class PoolConfig:
+    """Connection limits applied to every pooled session."""
+
+    limit: int = DEFAULT_POOL_LIMIT
+    limit_per_host: int = DEFAULT_POOL_LIMIT_PER_HOST
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        return cls(
+            limit=_env_number("LLM_POOL_LIMIT", DEFAULT_POOL_LIMIT),
+            limit_per_host=_env_number("LLM_POOL_LIMIT_PER_HOST", DEFAULT_POOL_LIMIT_PER_HOST),
+            keepalive_timeout=_env_number(
+                "LLM_POOL_KEEPALIVE", DEFAULT_KEEPALIVE_TIMEOUT, cast=float
+            ),
+        )
+
+
+def _origin(url: str) -> str:
+    """Reduce a URL to scheme://host[:port] so all paths of one endpoint share a pool."""
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return url
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class SessionPool:
+    """
+    Registry of pooled aiohttp sessions keyed by (origin, event loop).
+
+    aiohttp sessions are bound to the loop they were created on, so callers
+    running their own loops (worker threads, asyncio.run in sync wrappers)
+    transparently get their own session.
+    """
+
+    def __init__(self, config: Optional[PoolConfig] = None):
+        self.config = config or PoolConfig.from_env()
+        self._sessions: Dict[Tuple[str, int], Tuple[asyncio.AbstractEventLoop, Any]] = {}
+        self._requests: Dict[str, int] = {}
+        self.sessions_created = 0
+
+    def get_session(self, url: str) -> aiohttp.ClientSession:
+        """
+        Get the pooled session for a URL on the running event loop.
+
+        Must be called from within a coroutine.
+
+        Args:
+            url: Request URL (only its origin is used as pool key)
+
+        Returns:
+            Shared aiohttp.ClientSession
+        """
+        loop = asyncio.get_running_loop()
+        origin = _origin(url)
+        key = (origin, id(loop))
+
+        entry = self._sessions.get(key)
+        if entry is None or entry[0] is not loop or entry[1].closed:
+            self._prune_closed_loops()
+            connector = aiohttp.TCPConnector(
+                limit=self.config.limit,
+                limit_per_host=self.config.limit_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            # Per-request timeouts are passed by callers; no session-wide total timeout
+            session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=None)
+            )
+            self._sessions[key] = (loop, session)
+            self.sessions_created += 1
+            logger.debug(f"Created pooled HTTP session for {origin}")
+            entry = self._sessions[key]
+
+        self._requests[origin] = self._requests.get(origin, 0) + 1
+        return entry[1]
+
+    def _prune_closed_loops(self) -> None:
+        """Forget sessions whose event loop has already been closed."""
+        stale = [key for key, (loop, _) in self._sessions.items() if loop.is_closed()]
+        for key in stale:
+            self._sessions.pop(key, None)
+
+    async def close(self) -> None:
+        """
+        Close every session owned by the running event loop.
+
+        Sessions created on other loops are dropped (they can only be closed
+        from their own loop).
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        sessions = list(self._sessions.items())
+        self._sessions.clear()
+        for (origin, _), (session_loop, session) in sessions:
+            if session_loop is loop and not session.closed:
+                try:
+                    await session.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close HTTP session for {origin}: {e}")
+        if sessions:
+            logger.info(f"Closed {len(sessions)} pooled LLM HTTP session(s)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return pool statistics.
+
+        Returns:
+            Dictionary with limits, totals and per-endpoint connection counts
+        """
+        endpoints: List[Dict[str, Any]] = []
+        for (origin, _), (loop, session) in self._sessions.items():
+            connector = session.connector
+            acquired = len(getattr(connector, "_acquired", ()) or ())
+            idle = sum(len(v) for v in (getattr(connector, "_conns", {}) or {}).values())
+            endpoints.append(
+                {
+                    "origin": origin,
+                    "closed": session.closed or loop.is_closed(),
+                    "active_connections": acquired,
+                    "idle_connections": idle,
+                    "requests": self._requests.get(origin, 0),
+                }
+            )
+
+        return {
+            "limit": self.config.limit,
+            "limit_per_host": self.config.limit_per_host,
+            "keepalive_timeout": self.config.keepalive_timeout,
+            "sessions": len(self._sessions),
+            "sessions_created": self.sessions_created,
+            "total_requests": sum(self._requests.values()),
+            "endpoints": endpoints,
+        }
+
+
+# Singleton instance
+_pool: Optional[SessionPool] = None
+
+
+def get_session_pool() -> SessionPool:
+    """Get or create the process-wide LLM session pool."""
+    global _pool
+    if _pool is None:
+        _pool = SessionPool()
+    return _pool
+
+
+async def close_session_pool() -> None:
+    """Close pooled sessions (call on application shutdown)."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+__all__ = [
+    "PoolConfig",
+    "SessionPool",
+    "get_session_pool",
+    "close_session_pool",
+]
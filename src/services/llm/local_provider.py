@@ -17,7 +17,10 @@ from typing import AsyncGenerator, Dict, List, Optional
 
 import aiohttp
 
-from .exceptions import LLMAPIError, LLMConfigError
+from .exceptions import LLMAPIError, LLMConfigError, LLMRateLimitError
+from .http_pool import get_session_pool
+from .rate_limit import get_rate_limiter
+from .usage import report_usage
 from .utils import (
     build_auth_headers,
     build_chat_url,
@@ -89,27 +92,35 @@ async def complete(
 
     timeout = aiohttp.ClientTimeout(total=kwargs.get("timeout", DEFAULT_TIMEOUT))
 
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        async with session.post(url, json=data, headers=headers) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                raise LLMAPIError(
+    session = get_session_pool().get_session(url)
+    async with session.post(url, json=data, headers=headers, timeout=timeout) as response:
+        limits = get_rate_limiter().observe(base_url, model, response.headers)
+        if response.status != 200:
+            error_text = await response.text()
+            if response.status == 429:
+                raise LLMRateLimitError(
                     f"Local LLM error: {error_text}",
-                    status_code=response.status,
+                    retry_after=limits.retry_after,
                     provider="local",
                 )
+            raise LLMAPIError(
+                f"Local LLM error: {error_text}",
+                status_code=response.status,
+                provider="local",
+            )
 
-            result = await response.json()
+        result = await response.json()
+        report_usage(result.get("usage"))
 
-            if "choices" in result and result["choices"]:
-                msg = result["choices"][0].get("message", {})
-                # Use unified response extraction
-                content = extract_response_content(msg)
-                # Clean thinking tags using unified utility
-                content = clean_thinking_tags(content)
-                return content
+        if "choices" in result and result["choices"]:
+            msg = result["choices"][0].get("message", {})
+            # Use unified response extraction
+            content = extract_response_content(msg)
+            # Clean thinking tags using unified utility
+            content = clean_thinking_tags(content)
+            return content
 
-            return ""
+        return ""
 
 
 async def stream(
@@ -172,75 +183,83 @@ async def stream(
     timeout = aiohttp.ClientTimeout(total=kwargs.get("timeout", DEFAULT_TIMEOUT))
 
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(url, json=data, headers=headers) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise LLMAPIError(
+        session = get_session_pool().get_session(url)
+        async with session.post(url, json=data, headers=headers, timeout=timeout) as response:
+            limits = get_rate_limiter().observe(base_url, model, response.headers)
+            if response.status != 200:
+                error_text = await response.text()
+                if response.status == 429:
+                    raise LLMRateLimitError(
                         f"Local LLM stream error: {error_text}",
-                        status_code=response.status,
+                        retry_after=limits.retry_after,
                         provider="local",
                     )
+                raise LLMAPIError(
+                    f"Local LLM stream error: {error_text}",
+                    status_code=response.status,
+                    provider="local",
+                )
 
-                # Track if we're inside a thinking block
-                in_thinking_block = False
-                thinking_buffer = ""
-
-                async for line in response.content:
-                    line_str = line.decode("utf-8").strip()
-
-                    # Skip empty lines
-                    if not line_str:
-                        continue
-
-                    # Handle SSE format
-                    if line_str.startswith("data:"):
-                        data_str = line_str[5:].strip()
-
-                        if data_str == "[DONE]":
-                            break
-
-                        try:
-                            chunk_data = json.loads(data_str)
-                            if "choices" in chunk_data and chunk_data["choices"]:
-                                delta = chunk_data["choices"][0].get("delta", {})
-                                content = delta.get("content")
-
-                                if content:
-                                    # Handle thinking tags in streaming
-                                    if "<think>" in content:
-                                        in_thinking_block = True
-                                        thinking_buffer = content
-                                        continue
-                                    elif in_thinking_block:
-                                        thinking_buffer += content
-                                        if "</think>" in thinking_buffer:
-                                            # End of thinking block, clean and yield
-                                            cleaned = clean_thinking_tags(thinking_buffer)
-                                            if cleaned:
-                                                yield cleaned
-                                            in_thinking_block = False
-                                            thinking_buffer = ""
-                                        continue
-                                    else:
-                                        yield content
-
-                        except json.JSONDecodeError:
-                            # Non-JSON response, might be raw text
-                            if data_str and not data_str.startswith("{"):
-                                yield data_str
-
-                    # Some servers don't use SSE format
-                    elif line_str.startswith("{"):
-                        try:
-                            chunk_data = json.loads(line_str)
-                            if "choices" in chunk_data and chunk_data["choices"]:
-                                delta = chunk_data["choices"][0].get("delta", {})
-                                content = delta.get("content")
-                                if content:
+            # Track if we're inside a thinking block
+            in_thinking_block = False
+            thinking_buffer = ""
+
+            async for line in response.content:
+                line_str = line.decode("utf-8").strip()
+
+                # Skip empty lines
+                if not line_str:
+                    continue
+
+                # Handle SSE format
+                if line_str.startswith("data:"):
+                    data_str = line_str[5:].strip()
+
+                    if data_str == "[DONE]":
+                        break
+
+                    try:
+                        chunk_data = json.loads(data_str)
+                        report_usage(chunk_data.get("usage"))
+                        if "choices" in chunk_data and chunk_data["choices"]:
+                            delta = chunk_data["choices"][0].get("delta", {})
+                            content = delta.get("content")
+
+                            if content:
+                                # Handle thinking tags in streaming
+                                if "<think>" in content:
+                                    in_thinking_block = True
+                                    thinking_buffer = content
+                                    continue
+                                elif in_thinking_block:
+                                    thinking_buffer += content
+                                    if "</think>" in thinking_buffer:
+                                        # End of thinking block, clean and yield
+                                        cleaned = clean_thinking_tags(thinking_buffer)
+                                        if cleaned:
+                                            yield cleaned
+                                        in_thinking_block = False
+                                        thinking_buffer = ""
+                                    continue
+                                else:
                                     yield content
-                        except json.JSONDecodeError:
-                            pass
+
+                    except json.JSONDecodeError:
+                        # Non-JSON response, might be raw text
+                        if data_str and not data_str.startswith("{"):
+                            yield data_str
+
+                # Some servers don't use SSE format
+                elif line_str.startswith("{"):
+                    try:
+                        chunk_data = json.loads(line_str)
+                        if "choices" in chunk_data and chunk_data["choices"]:
+                            delta = chunk_data["choices"][0].get("delta", {})
+                            content = delta.get("content")
+                            if content:
+                                yield content
+                    except json.JSONDecodeError:
+                        pass
 
     except LLMAPIError:
         raise  # Re-raise LLM errors as-is
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Prompt Prefix Caching
+=====================
+
+Message assembly that keeps the reusable part of a prompt in front.
+
+Providers cache the longest prompt prefix they have seen recently: OpenAI,
+DeepSeek and most OpenAI-compatible servers do so automatically, Anthropic
+for prefixes ending at a ``cache_control`` breakpoint. Agents re-send the same
+system prompt, knowledge chains, outlines and citation tables on every call,
+so messages are assembled as a stable prefix followed by a volatile suffix:
+
+    [system prompt] [stable context] [earlier turns] | [volatile context] [user turn]
+
+Everything before the final user turn and the system messages directly in
+front of it is the prefix. For Anthropic, the system messages that open the
+conversation become the ``system`` blocks, later system messages are folded
+into the user turn that follows them, and breakpoints are set at the end of
+the system prompt, at the end of the system blocks and at the end of the
+prefix.
+
+Environment Variables:
+    LLM_PROMPT_CACHE_ENABLED: Set to "false" to stop sending cache breakpoints (default: true)
+
+Usage:
+    from src.services.llm.prompt_cache import assemble_messages
+
+    messages = assemble_messages(system_prompt, user_prompt, context=outline_json)
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def prompt_cache_enabled() -> bool:
+    """Whether cache breakpoints are sent to providers that support them."""
+    return os.getenv("LLM_PROMPT_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+
+
+def assemble_messages(
+    system_prompt: str,
+    user_prompt: str,
+    context: Union[str, Sequence[str], None] = None,
+    messages: Optional[List[Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Build a messages array ordered as stable prefix + volatile suffix.
+
+    Args:
+        system_prompt: System prompt (ignored if messages provided)
+        user_prompt: User prompt (ignored if messages provided)
+        context: Stable reference material shared by many calls (knowledge chains,
+            outlines, citation tables); sent as system messages after the system prompt
+        messages: Pre-built messages array, already ordered by the caller
+
+    Returns:
+        Messages array
+    """
+    if isinstance(context, str):
+        context = [context]
+    context_messages = [{"role": "system", "content": c} for c in context or [] if c]
+
+    if not messages:
+        system = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        return system + context_messages + [{"role": "user", "content": user_prompt}]
+
+    # Stable context goes right after the system messages that open the conversation
+    lead = _leading_system_count(messages)
+    return list(messages[:lead]) + context_messages + list(messages[lead:])
+
+
+def _leading_system_count(messages: Sequence[Dict[str, Any]]) -> int:
+    count = 0
+    for message in messages:
+        if message.get("role") != "system":
+            break
+        count += 1
+    return count
+
+
+def _text_blocks(content: Any) -> List[Dict[str, Any]]:
+    if isinstance(content, list):
+        return [dict(block) for block in content]
+    return [{"type": "text", "text": str(content or "")}] if content else []
+
+
+def _mark(blocks: List[Dict[str, Any]]) -> bool:
+    """Set a cache breakpoint on the last non-empty text block."""
+    for block in reversed(blocks):
+        if block.get("type") != "text" or block.get("text"):
+            block["cache_control"] = dict(CACHE_CONTROL)
+            return True
+    return False
+
+
+def to_anthropic(
+    messages: Optional[List[Dict[str, Any]]],
+    system_prompt: str,
+    prompt: str,
+    cache: Optional[bool] = None,
+) -> Tuple[Union[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """
+    Convert a request into Anthropic's ``system`` and ``messages`` fields.
+
+    Args:
+        messages: Messages array (optional; otherwise system_prompt + prompt)
+        system_prompt: System prompt used when messages has no system message
+        prompt: User prompt used when messages is not provided
+        cache: Set cache breakpoints (default: prompt_cache_enabled())
+
+    Returns:
+        (system, messages) for the request body
+    """
+    cache = prompt_cache_enabled() if cache is None else cache
+    if not messages:
+        messages = [{"role": "user", "content": prompt}]
+    lead = _leading_system_count(messages)
+
+    system: List[Dict[str, Any]] = []
+    for message in messages[:lead] or [{"content": system_prompt}]:
+        system.extend(_text_blocks(message.get("content")))
+
+    # Later system messages (volatile context) are folded into the next user turn
+    msg_list: List[Dict[str, Any]] = []
+    pending: List[Dict[str, Any]] = []
+    for message in messages[lead:]:
+        role = message.get("role")
+        if role == "system":
+            pending.extend(_text_blocks(message.get("content")))
+            continue
+        if role == "user" and pending:
+            msg_list.append({"role": "user", "content": pending + _text_blocks(message["content"])})
+            pending = []
+            continue
+        msg_list.append(dict(message))
+    if pending:
+        msg_list.append({"role": "user", "content": pending})
+
+    if not cache:
+        if len(system) == 1 and "cache_control" not in system[0]:
+            return system[0]["text"], msg_list
+        return system, msg_list
+
+    # Breakpoints: end of the system prompt, end of all system blocks, end of the prefix
+    if lead > 1 and system:
+        first = _text_blocks(messages[0].get("content"))
+        _mark(system[: len(first)] if first else system[:1])
+    _mark(system)
+    if len(msg_list) > 1:
+        prefix_end = msg_list[-2]
+        blocks = _text_blocks(prefix_end.get("content"))
+        if _mark(blocks):
+            prefix_end["content"] = blocks
+    return system, msg_list
+
+
+__all__ = [
+    "CACHE_CONTROL",
+    "assemble_messages",
+    "prompt_cache_enabled",
+    "to_anthropic",
+]
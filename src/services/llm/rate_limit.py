@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+"""
+LLM Rate Limiter
+================
+
+Pre-emptive request pacing driven by provider rate-limit headers.
+
+Providers report their remaining quota on every response: OpenAI-compatible
+APIs send ``x-ratelimit-{limit,remaining,reset}-{requests,tokens}``, Anthropic
+sends ``anthropic-ratelimit-{requests,tokens}-{limit,remaining,reset}``, and
+throttled responses carry ``retry-after``. The providers feed these headers
+into one token bucket per (endpoint, model). Before each attempt the factory
+reserves a request and the estimated tokens from the bucket and sleeps until
+they are available. Parallel callers are therefore spread out at the rate the
+provider sustains, instead of bursting into 429s and backing off.
+
+A bucket paces nothing until its provider has reported limits, so endpoints
+without rate-limit headers (most local servers) are unaffected.
+
+Environment Variables:
+    LLM_RATE_LIMIT_ENABLED: Set to "false" to disable header-driven pacing (default: true)
+
+Usage:
+    from src.services.llm.rate_limit import get_rate_limiter
+
+    await get_rate_limiter().acquire(base_url, model, tokens=1200)
+    async with session.post(url, json=data) as resp:
+        get_rate_limiter().observe(base_url, model, resp.headers)
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Refill window assumed when a provider reports a limit but no reset time
+DEFAULT_WINDOW_SECONDS = 60.0
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def _origin(url: Optional[str]) -> str:
+    """Reduce an endpoint URL to scheme://host[:port]; all paths share one bucket."""
+    if not url:
+        return "default"
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return url.lower()
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def _parse_seconds(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a reset / retry-after value into seconds from now.
+
+    Accepts plain seconds ("1.5"), Go-style durations ("6m0s", "20ms"),
+    RFC 3339 timestamps (Anthropic) and HTTP dates (retry-after).
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+        return sum(float(n) * scale[u] for n, u in parts)
+
+    now = time.time() if now is None else now
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, moment.timestamp() - now)
+
+
+@dataclass
+class RateLimitInfo:
+    """Quota reported by one provider response (None where a header was missing)."""
+
+    limit_requests: Optional[int] = None
+    remaining_requests: Optional[int] = None
+    reset_requests: Optional[float] = None
+    limit_tokens: Optional[int] = None
+    remaining_tokens: Optional[int] = None
+    reset_tokens: Optional[float] = None
+    retry_after: Optional[float] = None
+
+    def is_empty(self) -> bool:
+        return (
+            self.remaining_requests is None
+            and self.remaining_tokens is None
+            and self.retry_after is None
+        )
+
+
+def parse_rate_limit_headers(headers: Optional[Mapping[str, str]]) -> RateLimitInfo:
+    """
+    Extract rate-limit information from response headers.
+
+    Args:
+        headers: Response headers (any mapping; names are matched case-insensitively)
+
+    Returns:
+        RateLimitInfo with the fields the provider reported
+    """
+    if not headers:
+        return RateLimitInfo()
+    lowered = {str(k).lower(): v for k, v in headers.items()}
+
+    def pick(*names: str) -> Optional[str]:
+        for name in names:
+            if name in lowered:
+                return lowered[name]
+        return None
+
+    info = RateLimitInfo()
+    for kind in ("requests", "tokens"):
+        limit = pick(f"x-ratelimit-limit-{kind}", f"anthropic-ratelimit-{kind}-limit")
+        remaining = pick(f"x-ratelimit-remaining-{kind}", f"anthropic-ratelimit-{kind}-remaining")
+        reset = pick(f"x-ratelimit-reset-{kind}", f"anthropic-ratelimit-{kind}-reset")
+        setattr(info, f"limit_{kind}", _parse_int(limit))
+        setattr(info, f"remaining_{kind}", _parse_int(remaining))
+        setattr(info, f"reset_{kind}", _parse_seconds(reset))
+
+    retry_after_ms = pick("retry-after-ms")
+    if retry_after_ms is not None:
+        seconds = _parse_seconds(retry_after_ms)
+        info.retry_after = seconds / 1000.0 if seconds is not None else None
+    if info.retry_after is None:
+        info.retry_after = _parse_seconds(pick("retry-after"))
+    return info
+
+
+class _Bucket:
+    """One dimension (requests or tokens) of a provider quota."""
+
+    def __init__(self):
+        # None until the provider has reported this dimension
+        self.capacity: Optional[float] = None
+        self.level = 0.0
+        self.rate = 0.0
+        self.updated = 0.0
+        # Reserved by callers still sleeping in acquire(), i.e. not yet sent
+        self.pending = 0.0
+
+    def refill(self, now: float) -> None:
+        if self.capacity is None:
+            return
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def observe(
+        self,
+        limit: Optional[int],
+        remaining: Optional[int],
+        reset: Optional[float],
+        now: float,
+    ) -> None:
+        if remaining is None:
+            return
+        capacity = float(limit) if limit else max(self.capacity or 0.0, float(remaining), 1.0)
+        self.capacity = capacity
+        if reset and reset > 0:
+            # The quota is back to full after ``reset`` seconds
+            self.rate = max(capacity - remaining, 1.0) / reset
+        elif not self.rate:
+            self.rate = capacity / DEFAULT_WINDOW_SECONDS
+        # The provider has counted everything already sent, but not our pending reservations
+        self.level = min(capacity, float(remaining)) - self.pending
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` and return the seconds until it is covered (0 if available)."""
+        if self.capacity is None or amount <= 0:
+            return 0.0
+        self.refill(now)
+        # A request larger than the whole quota waits for a full bucket at most
+        amount = min(amount, self.capacity)
+        self.level -= amount
+        if self.level >= 0 or self.rate <= 0:
+            return 0.0
+        return -self.level / self.rate
+
+
+class _ProviderLimits:
+    """Request and token buckets of one (endpoint, model)."""
+
+    def __init__(self):
+        self.requests = _Bucket()
+        self.tokens = _Bucket()
+        self.blocked_until = 0.0
+        self.observed = 0
+        self.throttled = 0
+        self.paced = 0
+        self.paced_seconds = 0.0
+
+
+class RateLimiter:
+    """
+    Header-driven token buckets keyed by (endpoint origin, model).
+
+    Thread-safe; the buckets are shared by every event loop in the process.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the limiter.
+
+        Args:
+            enabled: Never pace when False (headers are still recorded)
+        """
+        self.enabled = enabled
+        self._limits: Dict[Tuple[str, str], _ProviderLimits] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        return cls(
+            enabled=os.getenv("LLM_RATE_LIMIT_ENABLED", "true").lower() not in ("0", "false", "no")
+        )
+
+    def _get(self, base_url: Optional[str], model: Optional[str]) -> _ProviderLimits:
+        key = (_origin(base_url), model or "")
+        limits = self._limits.get(key)
+        if limits is None:
+            limits = self._limits[key] = _ProviderLimits()
+        return limits
+
+    def observe(
+        self,
+        base_url: Optional[str],
+        model: Optional[str],
+        headers: Optional[Mapping[str, str]],
+    ) -> RateLimitInfo:
+        """
+        Update the buckets of an endpoint/model from a provider response.
+
+        Args:
+            base_url: Endpoint the request was sent to
+            model: Model of the request
+            headers: Response headers
+
+        Returns:
+            The parsed RateLimitInfo (e.g. for retry_after on a 429)
+        """
+        info = parse_rate_limit_headers(headers)
+        if info.is_empty():
+            return info
+        now = time.monotonic()
+        with self._lock:
+            limits = self._get(base_url, model)
+            limits.observed += 1
+            limits.requests.observe(
+                info.limit_requests, info.remaining_requests, info.reset_requests, now
+            )
+            limits.tokens.observe(info.limit_tokens, info.remaining_tokens, info.reset_tokens, now)
+            if info.retry_after:
+                limits.throttled += 1
+                limits.blocked_until = max(limits.blocked_until, now + info.retry_after)
+        return info
+
+    async def acquire(
+        self, base_url: Optional[str], model: Optional[str], tokens: int = 0
+    ) -> float:
+        """
+        Reserve one request and ``tokens`` tokens, sleeping until the quota covers them.
+
+        Args:
+            base_url: Endpoint the request will be sent to
+            model: Model of the request
+            tokens: Estimated tokens of the request (prompt + output limit)
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+        now = time.monotonic()
+        with self._lock:
+            limits = self._get(base_url, model)
+            delay = max(
+                limits.blocked_until - now,
+                limits.requests.reserve(1, now),
+                limits.tokens.reserve(tokens, now),
+            )
+            if delay <= 0:
+                return 0.0
+            limits.requests.pending += 1
+            limits.tokens.pending += tokens
+            limits.paced += 1
+            limits.paced_seconds += delay
+
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            with self._lock:
+                limits.requests.pending -= 1
+                limits.tokens.pending -= tokens
+        return delay
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the known quota, pacing counters and throttles per endpoint/model."""
+        now = time.monotonic()
+        with self._lock:
+            providers = {}
+            for (origin, model), limits in self._limits.items():
+                for bucket in (limits.requests, limits.tokens):
+                    bucket.refill(now)
+                providers[f"{origin}|{model}"] = {
+                    "requests_limit": limits.requests.capacity,
+                    "requests_available": round(limits.requests.level, 2),
+                    "tokens_limit": limits.tokens.capacity,
+                    "tokens_available": round(limits.tokens.level, 2),
+                    "blocked_seconds": round(max(0.0, limits.blocked_until - now), 3),
+                    "observed": limits.observed,
+                    "throttled": limits.throttled,
+                    "paced": limits.paced,
+                    "paced_seconds": round(limits.paced_seconds, 3),
+                }
+            return {"enabled": self.enabled, "providers": providers}
+
+
+# Singleton instance
+_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get or create the process-wide rate limiter (configured from environment)."""
+    global _limiter
+    if _limiter is None:
+        _limiter = RateLimiter.from_env()
+    return _limiter
+
+
+def reset_rate_limiter() -> None:
+    """Reset the singleton rate limiter."""
+    global _limiter
+    _limiter = None
+
+
+__all__ = [
+    "RateLimitInfo",
+    "RateLimiter",
+    "get_rate_limiter",
+    "parse_rate_limit_headers",
+    "reset_rate_limiter",
+]
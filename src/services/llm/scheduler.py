@@ -0,0 +1,445 @@
+# -*- coding: utf-8 -*-
+"""
+LLM Admission Scheduler
+=======================
+
+Process-wide admission control for LLM calls.
+
+Every call made through the factory waits for a slot of its provider endpoint
+(one lane per origin, e.g. https://api.openai.com). A lane admits at most
+``max_concurrency`` calls at a time and, when ``tokens_per_minute`` is set, no
+more estimated tokens per sliding minute than the budget. Waiting calls are
+admitted by priority class first (interactive > normal > batch), and within a
+class round-robin across sessions, so one research job with many parallel
+topics cannot starve a chat session or another research job.
+
+Sessions are taken from a context variable; request handlers call
+``set_llm_session()`` once and every LLM call made from that task (and tasks
+it spawns) is queued under that session.
+
+Environment Variables:
+    LLM_SCHEDULER_ENABLED: Set to "false" to disable admission control (default: true)
+    LLM_MAX_CONCURRENCY: Concurrent calls per endpoint (default: 16)
+    LLM_TOKENS_PER_MINUTE: Estimated tokens per endpoint per minute, 0 = unlimited (default: 0)
+
+Usage:
+    from src.services.llm.scheduler import get_llm_scheduler
+
+    async with get_llm_scheduler().admit(base_url, priority="interactive", tokens=1200):
+        response = await provider_call()
+"""
+
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+import os
+import threading
+import time
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_TOKENS_PER_MINUTE = 0
+
+# Priority classes, highest first
+PRIORITIES = ("interactive", "normal", "batch")
+DEFAULT_PRIORITY = "normal"
+
+# Priority class of each agent module; modules not listed run as "normal"
+MODULE_PRIORITIES = {
+    "chat": "interactive",
+    "solve": "interactive",
+    "guide": "interactive",
+    "co_writer": "interactive",
+    "narrator": "interactive",
+    "research": "batch",
+    "knowledge": "batch",
+}
+
+_WINDOW_SECONDS = 60.0
+
+_session: ContextVar[Optional[str]] = ContextVar("llm_session", default=None)
+
+
+def set_llm_session(session_id: Optional[str]) -> Token:
+    """
+    Queue LLM calls of the current task (and tasks it spawns) under a session.
+
+    Args:
+        session_id: Session identifier (e.g. "chat:<id>", "research:<task_id>")
+
+    Returns:
+        Token for ContextVar.reset
+    """
+    return _session.set(session_id)
+
+
+def current_llm_session() -> Optional[str]:
+    """Session the current task's LLM calls are queued under."""
+    return _session.get()
+
+
+def priority_for_module(module_name: Optional[str]) -> str:
+    """Priority class of an agent module (see MODULE_PRIORITIES)."""
+    return MODULE_PRIORITIES.get(module_name or "", DEFAULT_PRIORITY)
+
+
+def _env_number(name: str, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _origin(url: Optional[str]) -> str:
+    """Reduce an endpoint URL to scheme://host[:port]; all paths share one lane."""
+    if not url:
+        return "default"
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return url.lower()
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+@dataclass
+class LaneLimits:
+    """Admission limits of one provider endpoint."""
+
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE
+
+
+class _Waiter:
+    __slots__ = (
+        "lane",
+        "loop",
+        "future",
+        "priority",
+        "session",
+        "tokens",
+        "enqueued_at",
+        "granted",
+    )
+
+    def __init__(self, lane: "_Lane", loop, priority: str, session: str, tokens: int):
+        self.lane = lane
+        self.loop = loop
+        self.future = loop.create_future()
+        self.priority = priority
+        self.session = session
+        self.tokens = tokens
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+
+
+class _Lane:
+    """Admission state of one endpoint; guarded by the scheduler lock."""
+
+    def __init__(self, limits: LaneLimits):
+        self.limits = limits
+        self.active = 0
+        # priority -> session -> waiters; session order is the round-robin order
+        self.queues: Dict[str, "OrderedDict[str, Deque[_Waiter]]"] = {
+            priority: OrderedDict() for priority in PRIORITIES
+        }
+        self.waiting = 0
+        self.usage: Deque[Tuple[float, int]] = deque()
+        self.used_tokens = 0
+        self.retry_scheduled = False
+        self.max_waiting = 0
+        self.admitted = {priority: 0 for priority in PRIORITIES}
+        self.wait_total = {priority: 0.0 for priority in PRIORITIES}
+        self.wait_max = {priority: 0.0 for priority in PRIORITIES}
+
+    def head(self) -> Optional[_Waiter]:
+        """Next waiter to admit: highest priority, then the next session in turn."""
+        for priority in PRIORITIES:
+            sessions = self.queues[priority]
+            if sessions:
+                return next(iter(sessions.values()))[0]
+        return None
+
+    def pop(self, waiter: _Waiter) -> None:
+        sessions = self.queues[waiter.priority]
+        waiters = sessions[waiter.session]
+        waiters.popleft()
+        if waiters:
+            # The session goes to the back of its class
+            sessions.move_to_end(waiter.session)
+        else:
+            del sessions[waiter.session]
+        self.waiting -= 1
+
+    def remove(self, waiter: _Waiter) -> None:
+        sessions = self.queues[waiter.priority]
+        waiters = sessions.get(waiter.session)
+        if waiters is None or waiter not in waiters:
+            return
+        waiters.remove(waiter)
+        if not waiters:
+            del sessions[waiter.session]
+        self.waiting -= 1
+
+    def budget_wait(self, tokens: int, now: float) -> float:
+        """Seconds until ``tokens`` fit the per-minute budget (0 if they fit now)."""
+        budget = self.limits.tokens_per_minute
+        while self.usage and self.usage[0][0] <= now - _WINDOW_SECONDS:
+            self.used_tokens -= self.usage.popleft()[1]
+        if not budget or not self.usage or self.used_tokens + tokens <= budget:
+            # An oversized request is admitted alone once the window is empty
+            return 0.0
+        freed = 0
+        for stamp, used in self.usage:
+            freed += used
+            if self.used_tokens - freed + tokens <= budget:
+                return stamp + _WINDOW_SECONDS - now
+        return self.usage[-1][0] + _WINDOW_SECONDS - now
+
+
+class LLMScheduler:
+    """
+    Admission control with per-endpoint concurrency and token budgets.
+
+    Thread-safe; calls from different event loops share the same budgets.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE,
+        enabled: bool = True,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Default concurrent calls per endpoint
+            tokens_per_minute: Default token budget per endpoint (0 = unlimited)
+            enabled: Admit every call immediately when False
+        """
+        self.defaults = LaneLimits(max(1, max_concurrency), max(0, tokens_per_minute))
+        self.enabled = enabled
+        self._lanes: Dict[str, _Lane] = {}
+        self._limits: Dict[str, LaneLimits] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "LLMScheduler":
+        return cls(
+            max_concurrency=_env_number("LLM_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY),
+            tokens_per_minute=_env_number("LLM_TOKENS_PER_MINUTE", DEFAULT_TOKENS_PER_MINUTE),
+            enabled=os.getenv("LLM_SCHEDULER_ENABLED", "true").lower() not in ("0", "false", "no"),
+        )
+
+    def set_limits(
+        self,
+        endpoint: str,
+        max_concurrency: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ) -> None:
+        """
+        Override the limits of one endpoint.
+
+        Args:
+            endpoint: Base URL of the provider
+            max_concurrency: Concurrent calls (None keeps the current value)
+            tokens_per_minute: Token budget, 0 = unlimited (None keeps the current value)
+        """
+        key = _origin(endpoint)
+        with self._lock:
+            current = self._limits.get(key) or self.defaults
+            limits = LaneLimits(
+                max(1, max_concurrency) if max_concurrency is not None else current.max_concurrency,
+                max(0, tokens_per_minute)
+                if tokens_per_minute is not None
+                else current.tokens_per_minute,
+            )
+            self._limits[key] = limits
+            lane = self._lanes.get(key)
+            if lane is not None:
+                lane.limits = limits
+                granted = self._dispatch(lane)
+            else:
+                granted = []
+        self._wake(granted)
+
+    def _lane(self, key: str) -> _Lane:
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = _Lane(self._limits.get(key) or self.defaults)
+        return lane
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        endpoint: Optional[str],
+        priority: Optional[str] = None,
+        tokens: int = 0,
+        session: Optional[str] = None,
+    ) -> AsyncIterator[None]:
+        """
+        Hold an admission slot of an endpoint for the duration of the block.
+
+        Args:
+            endpoint: Base URL of the provider
+            priority: "interactive", "normal" or "batch" (default: normal)
+            tokens: Estimated tokens of the request (prompt + output limit)
+            session: Fair-queuing session (default: current_llm_session())
+        """
+        if not self.enabled:
+            yield
+            return
+
+        key = _origin(endpoint)
+        if priority not in PRIORITIES:
+            priority = DEFAULT_PRIORITY
+        with self._lock:
+            lane = self._lane(key)
+            waiter = _Waiter(
+                lane,
+                asyncio.get_running_loop(),
+                priority,
+                session or current_llm_session() or "",
+                max(0, int(tokens)),
+            )
+            lane.queues[priority].setdefault(waiter.session, deque()).append(waiter)
+            lane.waiting += 1
+            lane.max_waiting = max(lane.max_waiting, lane.waiting)
+            granted = self._dispatch(lane)
+        self._wake(granted)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    lane.active -= 1
+                else:
+                    lane.remove(waiter)
+                granted = self._dispatch(lane)
+            self._wake(granted)
+            raise
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                lane.active -= 1
+                granted = self._dispatch(lane)
+            self._wake(granted)
+
+    def _dispatch(self, lane: _Lane) -> List[_Waiter]:
+        """Admit waiters while the lane has capacity (call with the lock held)."""
+        granted = []
+        now = time.monotonic()
+        while lane.active < lane.limits.max_concurrency:
+            waiter = lane.head()
+            if waiter is None:
+                break
+            delay = lane.budget_wait(waiter.tokens, now)
+            if delay > 0:
+                self._schedule_retry(lane, waiter.loop, delay)
+                break
+            lane.pop(waiter)
+            lane.active += 1
+            waiter.granted = True
+            if waiter.tokens:
+                lane.usage.append((now, waiter.tokens))
+                lane.used_tokens += waiter.tokens
+            waited = now - waiter.enqueued_at
+            lane.admitted[waiter.priority] += 1
+            lane.wait_total[waiter.priority] += waited
+            lane.wait_max[waiter.priority] = max(lane.wait_max[waiter.priority], waited)
+            granted.append(waiter)
+        return granted
+
+    def _schedule_retry(self, lane: _Lane, loop, delay: float) -> None:
+        if lane.retry_scheduled:
+            return
+        lane.retry_scheduled = True
+
+        def retry():
+            with self._lock:
+                lane.retry_scheduled = False
+                granted = self._dispatch(lane)
+            self._wake(granted)
+
+        try:
+            loop.call_soon_threadsafe(loop.call_later, delay, retry)
+        except RuntimeError:
+            # The waiter's loop is closed; the next admission or release retries
+            lane.retry_scheduled = False
+
+    def _wake(self, granted: List[_Waiter]) -> None:
+        for waiter in granted:
+            try:
+                waiter.loop.call_soon_threadsafe(_resolve, waiter.future)
+            except RuntimeError:
+                # Loop closed before the waiter could run; give the slot back
+                with self._lock:
+                    waiter.lane.active -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return queue depth, admissions and wait times per endpoint and priority."""
+        with self._lock:
+            lanes = {}
+            for key, lane in self._lanes.items():
+                lanes[key] = {
+                    "max_concurrency": lane.limits.max_concurrency,
+                    "tokens_per_minute": lane.limits.tokens_per_minute,
+                    "active": lane.active,
+                    "queued": {
+                        priority: sum(len(w) for w in lane.queues[priority].values())
+                        for priority in PRIORITIES
+                    },
+                    "max_queued": lane.max_waiting,
+                    "tokens_in_window": lane.used_tokens,
+                    "admitted": dict(lane.admitted),
+                    "avg_wait_seconds": {
+                        priority: round(lane.wait_total[priority] / lane.admitted[priority], 4)
+                        if lane.admitted[priority]
+                        else 0.0
+                        for priority in PRIORITIES
+                    },
+                    "max_wait_seconds": {p: round(w, 4) for p, w in lane.wait_max.items()},
+                }
+            return {"enabled": self.enabled, "lanes": lanes}
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+# Singleton instance
+_scheduler: Optional[LLMScheduler] = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Get or create the process-wide scheduler (configured from environment)."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = LLMScheduler.from_env()
+    return _scheduler
+
+
+def reset_llm_scheduler() -> None:
+    """Reset the singleton scheduler (waiting calls keep their current lanes)."""
+    global _scheduler
+    _scheduler = None
+
+
+__all__ = [
+    "DEFAULT_PRIORITY",
+    "LLMScheduler",
+    "LaneLimits",
+    "MODULE_PRIORITIES",
+    "PRIORITIES",
+    "current_llm_session",
+    "get_llm_scheduler",
+    "priority_for_module",
+    "reset_llm_scheduler",
+    "set_llm_session",
+]
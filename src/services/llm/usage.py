@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+LLM Token Usage
+===============
+
+Provider-reported token usage, including prompt-cache hits.
+
+Providers return the text of a completion, so the usage block of each
+response is handed back through a side channel: a caller opens
+``capture_usage()`` around a factory call and the providers ``report_usage()``
+the raw usage they received. Both OpenAI-style usage (``prompt_tokens``,
+``prompt_tokens_details.cached_tokens``, DeepSeek's ``prompt_cache_hit_tokens``)
+and Anthropic usage (``input_tokens``, ``cache_read_input_tokens``,
+``cache_creation_input_tokens``) are understood.
+
+Usage:
+    from src.services.llm.usage import capture_usage
+
+    with capture_usage() as usage:
+        response = await complete(prompt, system_prompt=system_prompt)
+    if usage.reported:
+        print(usage.prompt_tokens, usage.cached_tokens)
+
+    # Streams capture each step into one TokenUsage, never across a yield
+    usage = TokenUsage()
+    with capture_usage(usage):
+        chunk = await anext(chunks, None)
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Mapping, Optional
+
+
+@dataclass
+class TokenUsage:
+    """Token counts of one or more provider responses."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # Prompt tokens served from the provider's prompt cache (included in prompt_tokens)
+    cached_tokens: int = 0
+    # Prompt tokens written to the provider's prompt cache (included in prompt_tokens)
+    cache_write_tokens: int = 0
+    reported: bool = False
+
+    def add(self, other: "TokenUsage") -> None:
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.cached_tokens += other.cached_tokens
+        self.cache_write_tokens += other.cache_write_tokens
+        self.reported = self.reported or other.reported
+
+
+def _count(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def parse_usage(usage: Optional[Mapping[str, Any]]) -> Optional[TokenUsage]:
+    """
+    Normalize a provider usage block.
+
+    Args:
+        usage: ``usage`` object of an OpenAI-compatible or Anthropic response
+
+    Returns:
+        TokenUsage (prompt_tokens includes cached and cache-write tokens), or None
+        if the block carries no token counts
+    """
+    if not usage or not isinstance(usage, Mapping):
+        return None
+
+    if "input_tokens" in usage or "output_tokens" in usage:
+        # Anthropic: input_tokens excludes the tokens read from / written to the cache
+        cached = _count(usage.get("cache_read_input_tokens"))
+        written = _count(usage.get("cache_creation_input_tokens"))
+        return TokenUsage(
+            prompt_tokens=_count(usage.get("input_tokens")) + cached + written,
+            completion_tokens=_count(usage.get("output_tokens")),
+            cached_tokens=cached,
+            cache_write_tokens=written,
+            reported=True,
+        )
+
+    if "prompt_tokens" in usage or "completion_tokens" in usage:
+        details = usage.get("prompt_tokens_details") or {}
+        cached = _count(details.get("cached_tokens") if isinstance(details, Mapping) else 0)
+        cached = cached or _count(usage.get("prompt_cache_hit_tokens"))
+        return TokenUsage(
+            prompt_tokens=_count(usage.get("prompt_tokens")),
+            completion_tokens=_count(usage.get("completion_tokens")),
+            cached_tokens=cached,
+            reported=True,
+        )
+
+    return None
+
+
+_collector: ContextVar[Optional[TokenUsage]] = ContextVar("llm_usage_collector", default=None)
+
+
+@contextmanager
+def capture_usage(usage: Optional[TokenUsage] = None) -> Iterator[TokenUsage]:
+    """
+    Collect the usage providers report while the block runs.
+
+    The block must not span a ``yield``: a generator runs in its consumer's
+    context, so the consumer's own calls between items would be counted too.
+    Streams capture each step instead, into one shared TokenUsage.
+
+    Args:
+        usage: TokenUsage to add to (default: a new one)
+
+    Yields:
+        TokenUsage summed over every response received in the block (and in
+        tasks started from it, e.g. hedged duplicates)
+    """
+    usage = usage if usage is not None else TokenUsage()
+    token = _collector.set(usage)
+    try:
+        yield usage
+    finally:
+        _collector.reset(token)
+
+
+def report_usage(usage: Optional[Mapping[str, Any]]) -> None:
+    """
+    Record a provider usage block with the active capture_usage() block, if any.
+
+    Args:
+        usage: ``usage`` object of the response
+    """
+    collector = _collector.get()
+    if collector is None:
+        return
+    parsed = parse_usage(usage)
+    if parsed is not None:
+        collector.add(parsed)
+
+
+__all__ = [
+    "TokenUsage",
+    "capture_usage",
+    "parse_usage",
+    "report_usage",
+]
@@ -40,7 +40,7 @@ Usage:
 
 from .factory import get_pipeline, has_pipeline, list_pipelines, register_pipeline
 from .pipeline import RAGPipeline
-from .service import RAGService
+from .service import RAGService, evict_pipelines, get_shared_pipeline, list_shared_pipelines
 from .types import Chunk, Document, SearchResult
 
 
@@ -70,6 +70,9 @@ def __getattr__(name: str):
 __all__ = [
     # Service (recommended entry point)
     "RAGService",
+    "get_shared_pipeline",
+    "evict_pipelines",
+    "list_shared_pipelines",
     # Types
     "Document",
     "Chunk",
@@ -14,6 +14,7 @@ Components follow a simple protocol:
 from . import chunkers, embedders, indexers, parsers, retrievers
 from .base import BaseComponent, Component
 from .routing import DocumentType, FileClassification, FileTypeRouter
+from .vector_store import VectorStore
 
 __all__ = [
     "Component",
@@ -27,4 +28,6 @@ __all__ = [
     "FileTypeRouter",
     "FileClassification",
     "DocumentType",
+    # Vector store layout
+    "VectorStore",
 ]
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+ANN Index Types
+===============
+
+FAISS index construction and search tuning for the vector store.
+
+Supported index types (all use inner product on normalized vectors, i.e.
+cosine similarity, and are labelled with chunk ids):
+
+- ``flat``: exact brute-force search (IndexFlatIP)
+- ``ivf_flat``: inverted lists over full vectors; tune recall with ``nprobe``
+- ``hnsw``: graph search; tune recall with ``ef_search``. HNSW cannot remove
+  vectors, so every write rebuilds it from the stored vectors
+- ``ivf_pq``: inverted lists over product-quantized codes; ~16-32x smaller
+  than float32 vectors at some recall cost
+- ``auto``: picks one of the above from the corpus size
+
+Environment Variables:
+    RAG_VECTOR_INDEX_TYPE: Default index type for VectorIndexer (default: auto)
+"""
+
+import math
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from src.logging import get_logger
+
+logger = get_logger("ANNIndex")
+
+INDEX_TYPES = ("flat", "ivf_flat", "hnsw", "ivf_pq")
+
+# Corpus sizes at which index_type="auto" switches to an approximate index.
+# IVF is preferred over HNSW because it supports in-place deletes.
+AUTO_IVF_MIN_VECTORS = 50_000
+AUTO_PQ_MIN_VECTORS = 1_000_000
+
+# IVF training: FAISS wants ~39+ points per list; cap the sample for speed
+MIN_POINTS_PER_LIST = 39
+MAX_TRAIN_SAMPLE = 200_000
+
+# PQ uses 8-bit codes, so training needs at least 256 points
+PQ_NBITS = 8
+MIN_PQ_TRAIN = 1 << PQ_NBITS
+
+# IVF indexes are retrained once the corpus outgrows the training set by this factor
+RETRAIN_GROWTH = 4
+
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+DEFAULT_EF_SEARCH = 64
+
+
+def select_index_type(index_type: str, num_vectors: int) -> str:
+    """
+    Resolve the index type to build for a corpus.
+
+    Args:
+        index_type: Requested type (one of INDEX_TYPES or "auto")
+        num_vectors: Number of vectors to index
+
+    Returns:
+        Concrete index type; falls back to simpler types when the corpus is
+        too small to train the requested one
+    """
+    if index_type == "auto":
+        if num_vectors >= AUTO_PQ_MIN_VECTORS:
+            index_type = "ivf_pq"
+        elif num_vectors >= AUTO_IVF_MIN_VECTORS:
+            index_type = "ivf_flat"
+        else:
+            index_type = "flat"
+
+    if index_type not in INDEX_TYPES:
+        logger.warning(f"Unknown vector index type '{index_type}', using flat")
+        return "flat"
+    if index_type == "ivf_pq" and num_vectors < MIN_PQ_TRAIN * MIN_POINTS_PER_LIST:
+        index_type = "ivf_flat"
+    if index_type == "ivf_flat" and num_vectors < MIN_POINTS_PER_LIST * 4:
+        index_type = "flat"
+    return index_type
+
+
+def ivf_nlist(num_vectors: int) -> int:
+    """Number of inverted lists for a corpus (~4*sqrt(n), enough points per list)."""
+    nlist = int(4 * math.sqrt(max(num_vectors, 1)))
+    return max(1, min(nlist, num_vectors // MIN_POINTS_PER_LIST))
+
+
+def pq_subquantizers(dim: int) -> int:
+    """Largest PQ sub-quantizer count <= 64 that divides dim with >= 4 dims each."""
+    for m in (64, 48, 32, 24, 16, 12, 8, 4, 2, 1):
+        if dim % m == 0 and dim // m >= 4:
+            return m
+    return 1
+
+
+def default_nprobe(nlist: int) -> int:
+    """Inverted lists probed per query when the caller does not set nprobe."""
+    return max(1, min(nlist, max(8, nlist // 16)))
+
+
+def build_index(
+    faiss: Any, index_type: str, vectors: np.ndarray, ids: np.ndarray, seed: int = 0
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Build and fill a FAISS index of the given type.
+
+    Args:
+        faiss: FAISS module
+        index_type: Concrete index type (see select_index_type)
+        vectors: Normalized float32 vectors
+        ids: Chunk id of each row
+        seed: Seed for the training sample
+
+    Returns:
+        (index, params) where params are recorded in info.json
+    """
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    ids = np.ascontiguousarray(ids, dtype=np.int64)
+    n, dim = vectors.shape
+    params: Dict[str, Any] = {"index_type": index_type}
+
+    if index_type == "hnsw":
+        inner = faiss.IndexHNSWFlat(dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        inner.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        index = faiss.IndexIDMap2(inner)
+        params["hnsw_m"] = HNSW_M
+    elif index_type in ("ivf_flat", "ivf_pq"):
+        nlist = ivf_nlist(n)
+        quantizer = faiss.IndexFlatIP(dim)
+        if index_type == "ivf_pq":
+            m = pq_subquantizers(dim)
+            index = faiss.IndexIVFPQ(quantizer, dim, nlist, m, PQ_NBITS, faiss.METRIC_INNER_PRODUCT)
+            params["pq_m"] = m
+        else:
+            index = faiss.IndexIVFFlat(quantizer, dim, nlist, faiss.METRIC_INNER_PRODUCT)
+        sample = vectors
+        if n > MAX_TRAIN_SAMPLE:
+            rng = np.random.default_rng(seed)
+            sample = vectors[np.sort(rng.choice(n, MAX_TRAIN_SAMPLE, replace=False))]
+        index.train(sample)
+        params.update({"nlist": nlist, "trained_on": int(n)})
+    else:
+        index = faiss.IndexIDMap2(faiss.IndexFlatIP(dim))
+
+    if n:
+        index.add_with_ids(vectors, ids)
+    logger.info(f"Built {index_type} index with {index.ntotal} vectors")
+    return index, params
+
+
+def can_update_in_place(index_type: str, info: Dict[str, Any], num_vectors: int) -> bool:
+    """
+    Whether the previous generation's index can be updated with remove/add.
+
+    HNSW cannot remove vectors; IVF indexes are rebuilt when the corpus has
+    grown well past the sample they were trained on.
+    """
+    if info.get("index_type", "flat") != index_type or index_type == "hnsw":
+        return False
+    if index_type in ("ivf_flat", "ivf_pq"):
+        trained_on = int(info.get("trained_on", 0))
+        return trained_on > 0 and num_vectors <= trained_on * RETRAIN_GROWTH
+    return True
+
+
+def configure_search(
+    faiss: Any,
+    index: Any,
+    k: int,
+    nprobe: Optional[int] = None,
+    ef_search: Optional[int] = None,
+) -> None:
+    """
+    Apply per-query recall/speed knobs to an index.
+
+    Args:
+        faiss: FAISS module
+        index: Index loaded from the store
+        k: Number of results requested
+        nprobe: Inverted lists to probe (IVF indexes)
+        ef_search: Candidate list size (HNSW indexes, at least k)
+    """
+    try:
+        ivf = faiss.extract_index_ivf(index)
+    except Exception:
+        ivf = None
+    if ivf is not None:
+        ivf.nprobe = int(nprobe) if nprobe else default_nprobe(ivf.nlist)
+        return
+
+    inner = faiss.downcast_index(index.index) if hasattr(index, "index") else index
+    if hasattr(inner, "hnsw"):
+        inner.hnsw.efSearch = max(int(ef_search or DEFAULT_EF_SEARCH), k)
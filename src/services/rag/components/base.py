@@ -42,6 +42,7 @@ class BaseComponent:
     Provides:
     - Logger initialization
     - Default name from class name
+    - Pickling support (for process-pool execution)
     """
 
     name: str = "base"
@@ -51,6 +52,19 @@ class BaseComponent:
 
         self.logger = get_logger(self.__class__.__name__)
 
+    def __getstate__(self):
+        # Loggers hold locks/handlers; drop them so components can be sent to
+        # worker processes and recreate them on arrival
+        state = self.__dict__.copy()
+        state.pop("logger", None)
+        return state
+
+    def __setstate__(self, state):
+        from src.logging import get_logger
+
+        self.__dict__.update(state)
+        self.logger = get_logger(self.__class__.__name__)
+
     async def process(self, data: Any, **kwargs) -> Any:
         """
         Process input data.
@@ -20,6 +20,7 @@ class FixedSizeChunker(BaseComponent):
     """
 
     name = "fixed_size_chunker"
+    cpu_bound = True  # Pure Python splitting; may run in a process pool
 
     def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 100):
         """
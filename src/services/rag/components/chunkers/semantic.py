@@ -21,6 +21,7 @@ class SemanticChunker(BaseComponent):
     """
 
     name = "semantic_chunker"
+    cpu_bound = True  # Pure Python splitting; may run in a process pool
 
     def __init__(
         self,
@@ -15,6 +15,8 @@ class OpenAIEmbedder(BaseComponent):
     OpenAI-compatible embedder.
 
     Uses the embedding service to generate vectors for document chunks.
+    All chunk texts go to EmbeddingClient in one call; the adapter splits
+    them into batches of at most ``batch_size`` and sends them concurrently.
     """
 
     name = "openai_embedder"
@@ -24,7 +26,7 @@ class OpenAIEmbedder(BaseComponent):
         Initialize OpenAI embedder.
 
         Args:
-            batch_size: Number of texts to embed per API call
+            batch_size: Maximum number of texts per API request
         """
         super().__init__()
         self.batch_size = batch_size
@@ -50,15 +52,12 @@ class OpenAIEmbedder(BaseComponent):
 
         client = get_embedding_client()
 
-        # Batch embed
-        for i in range(0, len(doc.chunks), self.batch_size):
-            batch = doc.chunks[i : i + self.batch_size]
-            texts = [chunk.content for chunk in batch]
+        # Batch embed (batches are split and parallelized by the adapter)
+        texts = [chunk.content for chunk in doc.chunks]
+        embeddings = await client.embed(texts, batch_size=self.batch_size)
 
-            embeddings = await client.embed(texts)
-
-            for chunk, embedding in zip(batch, embeddings):
-                chunk.embedding = embedding
+        for chunk, embedding in zip(doc.chunks, embeddings):
+            chunk.embedding = embedding
 
         self.logger.info("Embedding complete")
         return doc
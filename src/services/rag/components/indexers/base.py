@@ -17,9 +17,14 @@ class BaseIndexer(BaseComponent):
     Base class for document indexers.
 
     Indexers build searchable indexes from documents.
+
+    Set ``incremental = True`` when process() adds to an existing index
+    rather than rebuilding it; RAGPipeline then streams documents to the
+    indexer in batches instead of passing the whole corpus at once.
     """
 
     name = "base_indexer"
+    incremental = False
 
     async def process(self, kb_name: str, documents: List[Document], **kwargs) -> bool:
         """
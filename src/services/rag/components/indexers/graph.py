@@ -22,6 +22,7 @@ class GraphIndexer(BaseComponent):
     """
 
     name = "graph_indexer"
+    incremental = True  # Inserts documents one by one; safe to call per batch
     _instances: Dict[str, any] = {}  # Cache RAG instances
 
     def __init__(self, kb_base_dir: Optional[str] = None):
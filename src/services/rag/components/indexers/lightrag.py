@@ -23,6 +23,7 @@ class LightRAGIndexer(BaseComponent):
     """
 
     name = "lightrag_indexer"
+    incremental = True  # Inserts documents one by one; safe to call per batch
     _instances: Dict[str, any] = {}  # Cache LightRAG instances
 
     def __init__(self, kb_base_dir: Optional[str] = None):
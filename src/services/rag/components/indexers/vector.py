@@ -7,15 +7,15 @@ Vector-based indexer using dense embeddings with FAISS.
 Provides fast similarity search for RAG retrieval.
 """
 
-import json
+import asyncio
+import os
 from pathlib import Path
-import pickle
 from typing import List, Optional
 
-import numpy as np
-
 from ...types import Document
 from ..base import BaseComponent
+from ..retrievers.index_cache import get_vector_index_cache
+from ..vector_store import DEFAULT_VECTOR_DTYPE, VectorStore
 
 
 class VectorIndexer(BaseComponent):
@@ -24,18 +24,30 @@ class VectorIndexer(BaseComponent):
 
     Creates and stores vector embeddings for efficient retrieval.
     Falls back to simple vector storage if FAISS is not available.
+
+    Documents are upserted into a generational VectorStore, so indexing
+    and deleting documents only touches their own chunks.
     """
 
     name = "vector_indexer"
+    # Upserts, but every call publishes a full index generation; the pipeline
+    # should hand over all documents at once rather than batch by batch
+    incremental = False
 
-    def __init__(self, kb_base_dir: Optional[str] = None):
+    def __init__(self, kb_base_dir: Optional[str] = None, index_type: Optional[str] = None):
         """
         Initialize vector indexer.
 
         Args:
             kb_base_dir: Base directory for knowledge bases
+            index_type: FAISS index type ("flat", "ivf_flat", "hnsw", "ivf_pq")
+                or "auto" to choose by corpus size. Defaults to the
+                RAG_VECTOR_INDEX_TYPE env var, then "auto".
         """
         super().__init__()
+        self.index_type = (index_type or os.getenv("RAG_VECTOR_INDEX_TYPE") or "auto").lower()
+        # On-disk dtype of the memory-mapped vectors used without FAISS
+        self.vector_dtype = (os.getenv("RAG_VECTOR_DTYPE") or DEFAULT_VECTOR_DTYPE).lower()
         self.kb_base_dir = kb_base_dir or str(
             Path(__file__).resolve().parent.parent.parent.parent.parent.parent
             / "data"
@@ -57,8 +69,10 @@ class VectorIndexer(BaseComponent):
         """
         Index documents using vector embeddings.
 
-        Creates FAISS index for fast similarity search or falls back to
-        simple JSON storage if FAISS is unavailable.
+        Adds the documents to the knowledge base's vector store. A document
+        that is already indexed (same file name) has its chunks replaced;
+        every other document in the store is left untouched, so adding one
+        file does not re-embed or renumber the rest of the knowledge base.
 
         Args:
             kb_name: Knowledge base name
@@ -70,78 +84,62 @@ class VectorIndexer(BaseComponent):
         """
         self.logger.info(f"Indexing {len(documents)} documents into vector store for {kb_name}")
 
-        # Collect all chunks with embeddings
-        all_chunks = []
-        for doc in documents:
-            for chunk in doc.chunks:
-                # Check if embedding exists (handles numpy arrays and lists)
-                if chunk.embedding is not None and len(chunk.embedding) > 0:
-                    all_chunks.append(chunk)
-
-        if not all_chunks:
+        num_chunks = sum(
+            1
+            for doc in documents
+            for chunk in doc.chunks
+            # Check if embedding exists (handles numpy arrays and lists)
+            if chunk.embedding is not None and len(chunk.embedding) > 0
+        )
+        if not num_chunks:
             self.logger.warning("No chunks with embeddings to index")
             return False
 
-        self.logger.info(f"Indexing {len(all_chunks)} chunks")
+        self.logger.info(f"Indexing {num_chunks} chunks")
+        info = await asyncio.to_thread(self._apply, kb_name, documents, ())
+        self.logger.info(
+            f"Vector index for {kb_name} now has {info['num_chunks']} chunks "
+            f"(generation {info['generation']})"
+        )
+        return True
+
+    async def delete_documents(self, kb_name: str, doc_ids: List[str]) -> bool:
+        """
+        Remove documents from the vector store.
 
-        # Create vector store directory
+        Args:
+            kb_name: Knowledge base name
+            doc_ids: Document ids (file names) to remove
+
+        Returns:
+            True if the store exists and a new generation was published
+        """
         kb_dir = Path(self.kb_base_dir) / kb_name / "vector_store"
-        kb_dir.mkdir(parents=True, exist_ok=True)
-
-        # Convert embeddings to numpy array
-        embeddings = np.array(
-            [
-                chunk.embedding if isinstance(chunk.embedding, list) else chunk.embedding.tolist()
-                for chunk in all_chunks
-            ],
-            dtype=np.float32,
+        if not VectorStore(kb_dir).exists():
+            self.logger.warning(f"No vector store found at {kb_dir}")
+            return False
+
+        info = await asyncio.to_thread(self._apply, kb_name, (), list(doc_ids))
+        self.logger.info(
+            f"Removed {len(doc_ids)} document(s) from {kb_name} "
+            f"({info['num_chunks']} chunks left, generation {info['generation']})"
         )
+        return True
 
-        # Store metadata separately
-        metadata = []
-        for i, chunk in enumerate(all_chunks):
-            metadata.append(
-                {
-                    "id": i,
-                    "content": chunk.content,
-                    "type": chunk.chunk_type,
-                    "metadata": chunk.metadata,
-                }
+    def _apply(self, kb_name: str, documents, delete_doc_ids) -> dict:
+        kb_dir = Path(self.kb_base_dir) / kb_name / "vector_store"
+        store = VectorStore(kb_dir)
+        try:
+            info = store.apply(
+                documents,
+                delete_doc_ids,
+                faiss=self.faiss if self.use_faiss else None,
+                index_type=self.index_type,
+                vector_dtype=self.vector_dtype,
             )
+        finally:
+            store.close()
 
-        # Save metadata
-        with open(kb_dir / "metadata.json", "w", encoding="utf-8") as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
-
-        if self.use_faiss:
-            # Create FAISS index for inner product (cosine similarity with normalized vectors)
-            dimension = embeddings.shape[1]
-            index = self.faiss.IndexFlatIP(dimension)  # Inner product for cosine similarity
-
-            # Normalize vectors for cosine similarity (inner product of normalized vectors = cosine similarity)
-            self.faiss.normalize_L2(embeddings)
-
-            # Add vectors to index
-            index.add(embeddings)
-
-            # Save FAISS index
-            self.faiss.write_index(index, str(kb_dir / "index.faiss"))
-            self.logger.info(f"FAISS index saved with {index.ntotal} vectors")
-        else:
-            # Simple storage: save embeddings as pickle
-            with open(kb_dir / "embeddings.pkl", "wb") as f:
-                pickle.dump(embeddings, f)
-            self.logger.info(f"Embeddings saved for {len(all_chunks)} chunks")
-
-        # Save index info
-        info = {
-            "num_chunks": len(all_chunks),
-            "num_documents": len(documents),
-            "embedding_dim": embeddings.shape[1],
-            "use_faiss": self.use_faiss,
-        }
-        with open(kb_dir / "info.json", "w", encoding="utf-8") as f:
-            json.dump(info, f, indent=2)
-
-        self.logger.info(f"Vector index saved to {kb_dir}")
-        return True
+        # Drop any resident copy held by retrievers in this process
+        get_vector_index_cache().invalidate(kb_dir)
+        return info
@@ -9,6 +9,7 @@ Retrievers for searching indexed documents.
 from .base import BaseRetriever
 from .dense import DenseRetriever
 from .hybrid import HybridRetriever
+from .index_cache import VectorIndexCache, get_vector_index_cache, reset_vector_index_cache
 from .lightrag import LightRAGRetriever
 
 __all__ = [
@@ -16,4 +17,7 @@ __all__ = [
     "DenseRetriever",
     "HybridRetriever",
     "LightRAGRetriever",
+    "VectorIndexCache",
+    "get_vector_index_cache",
+    "reset_vector_index_cache",
 ]
@@ -6,14 +6,59 @@ Dense Retriever
 Dense vector-based retriever using FAISS or cosine similarity.
 """
 
+import asyncio
 import json
 from pathlib import Path
 import pickle
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from ..ann import configure_search
 from ..base import BaseComponent
+from ..vector_store import FAISS_FILE, VectorStore, normalize_rows
+from .index_cache import CachedVectorIndex, get_store_signature, get_vector_index_cache
+
+# Rows upcast per block when scoring float16 vectors
+SCAN_BLOCK_ROWS = 65536
+
+
+def scan_scores(doc_vecs: np.ndarray, query_vec: np.ndarray) -> np.ndarray:
+    """
+    Dot products of every row with the query.
+
+    float32 matrices are multiplied directly; other dtypes (float16 stores)
+    are upcast block by block so a query never materializes a float32 copy
+    of the whole matrix.
+
+    Args:
+        doc_vecs: (n, d) matrix
+        query_vec: (d,) query, or (d, m) matrix of m queries
+
+    Returns:
+        (n,) or (n, m) scores
+    """
+    query_vec = query_vec.astype(np.float32, copy=False)
+    if doc_vecs.dtype == np.float32:
+        return np.dot(doc_vecs, query_vec)
+
+    scores = np.empty((len(doc_vecs),) + query_vec.shape[1:], dtype=np.float32)
+    for start in range(0, len(doc_vecs), SCAN_BLOCK_ROWS):
+        block = doc_vecs[start : start + SCAN_BLOCK_ROWS]
+        scores[start : start + len(block)] = block.astype(np.float32) @ query_vec
+    return scores
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first.
+
+    Uses argpartition (O(n)) and only sorts the k selected scores.
+    """
+    if k >= len(scores):
+        return np.argsort(-scores)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
 
 
 class DenseRetriever(BaseComponent):
@@ -21,18 +66,28 @@ class DenseRetriever(BaseComponent):
     Dense vector retriever.
 
     Uses FAISS for fast similarity search or falls back to
-    cosine similarity if FAISS is unavailable.
+    cosine similarity if FAISS is unavailable. Loaded indexes are kept
+    resident in the shared VectorIndexCache between queries.
     """
 
     name = "dense_retriever"
 
-    def __init__(self, kb_base_dir: Optional[str] = None, top_k: int = 5):
+    def __init__(
+        self,
+        kb_base_dir: Optional[str] = None,
+        top_k: int = 5,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ):
         """
         Initialize dense retriever.
 
         Args:
             kb_base_dir: Base directory for knowledge bases
             top_k: Number of results to return
+            nprobe: Inverted lists probed per query on IVF indexes
+                (default: derived from the index's nlist)
+            ef_search: HNSW candidate list size (default: 64)
         """
         super().__init__()
         self.kb_base_dir = kb_base_dir or str(
@@ -41,6 +96,8 @@ class DenseRetriever(BaseComponent):
             / "knowledge_bases"
         )
         self.top_k = top_k
+        self.nprobe = nprobe
+        self.ef_search = ef_search
 
         # Try to import FAISS
         self.use_faiss = False
@@ -52,6 +109,8 @@ class DenseRetriever(BaseComponent):
         except ImportError:
             self.logger.warning("FAISS not available, using simple cosine similarity")
 
+        self._index_cache = get_vector_index_cache()
+
     async def process(self, query: str, kb_name: str, **kwargs) -> Dict[str, Any]:
         """
         Search using dense embeddings with FAISS or cosine similarity.
@@ -59,108 +118,114 @@ class DenseRetriever(BaseComponent):
         Args:
             query: Search query
             kb_name: Knowledge base name
-            **kwargs: Additional arguments (mode, top_k, etc.)
+            **kwargs: Additional arguments (mode, top_k, nprobe, ef_search, etc.)
 
         Returns:
             Search results dictionary with answer and sources
         """
-        top_k = kwargs.get("top_k", self.top_k)
-        self.logger.info(f"Dense search in {kb_name}: {query[:50]}... (top_k={top_k})")
+        return (await self.process_many([query], kb_name, **kwargs))[0]
 
-        from src.services.embedding import get_embedding_client
-
-        # Get query embedding
-        client = get_embedding_client()
-        query_embedding = np.array((await client.embed([query]))[0], dtype=np.float32)
+    async def process_many(
+        self, queries: List[str], kb_name: str, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Search several queries at once.
 
-        # Load index
-        kb_dir = Path(self.kb_base_dir) / kb_name / "vector_store"
-        metadata_file = kb_dir / "metadata.json"
-        info_file = kb_dir / "info.json"
+        All queries are embedded in one embedding call and scored with a
+        single batched FAISS search or matrix product.
 
-        if not metadata_file.exists():
-            self.logger.warning(f"No vector index found at {kb_dir}")
-            return {
-                "query": query,
-                "answer": "No documents indexed. Please upload documents first.",
-                "content": "",
-                "mode": "dense",
-                "provider": "llamaindex",
-                "results": [],
-            }
-
-        # Load metadata and info (info.json is optional)
-        with open(metadata_file, "r", encoding="utf-8") as f:
-            metadata = json.load(f)
+        Args:
+            queries: Search queries
+            kb_name: Knowledge base name
+            **kwargs: Additional arguments (top_k, nprobe, ef_search, etc.)
 
-        if info_file.exists():
-            with open(info_file, "r", encoding="utf-8") as f:
-                info = json.load(f)
-        else:
-            info = {"use_faiss": False}
+        Returns:
+            One search results dictionary per query, in input order
+        """
+        if not queries:
+            return []
 
-        use_faiss = info.get("use_faiss", False)
+        top_k = kwargs.get("top_k", self.top_k)
+        self.logger.info(f"Dense search in {kb_name}: {len(queries)} queries (top_k={top_k})")
 
-        if use_faiss and self.use_faiss:
-            # Use FAISS for fast search
-            index_file = kb_dir / "index.faiss"
-            if not index_file.exists():
-                self.logger.error(f"FAISS index file not found: {index_file}")
-                return self._empty_response(query)
+        from src.services.embedding import get_embedding_client
 
-            # Load FAISS index
-            index = self.faiss.read_index(str(index_file))
+        # Get query embeddings
+        client = get_embedding_client()
+        query_embeddings = np.array(await client.embed(list(queries)), dtype=np.float32)
 
-            # Normalize query vector for cosine similarity without modifying original
-            norm = np.linalg.norm(query_embedding)
-            if norm > 0:
-                query_vec = (query_embedding / norm).reshape(1, -1)
-            else:
-                query_vec = query_embedding.reshape(1, -1)
-
-            # Search
-            distances, indices = index.search(query_vec, min(top_k, len(metadata)))
-
-            # Build results
-            results = []
-            for dist, idx in zip(distances[0], indices[0]):
-                if idx < len(metadata):  # Valid index
-                    score = 1.0 / (1.0 + dist)  # Convert distance to similarity score
-                    results.append((score, metadata[idx]))
-        else:
-            # Fallback: Load embeddings and use cosine similarity
-            embeddings_file = kb_dir / "embeddings.pkl"
-            if not embeddings_file.exists():
-                self.logger.error(f"Embeddings file not found: {embeddings_file}")
-                return self._empty_response(query)
-
-            with open(embeddings_file, "rb") as f:
-                embeddings = pickle.load(f)
-
-            # Normalize for cosine similarity (avoid division by zero)
-            query_norm = np.linalg.norm(query_embedding)
-            if query_norm > 0:
-                query_vec = query_embedding / query_norm
-            else:
-                query_vec = query_embedding  # Keep as is if zero norm
-
-            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-            # Replace zero norms with 1 to avoid division by zero
-            norms = np.where(norms == 0, 1, norms)
-            doc_vecs = embeddings / norms
-
-            # Compute similarities
-            similarities = np.dot(doc_vecs, query_vec)
-
-            # Get top-k results
-            top_indices = np.argsort(similarities)[::-1][:top_k]
-
-            results = []
-            for idx in top_indices:
-                score = float(similarities[idx])
-                results.append((score, metadata[idx]))
-
-        # Build response content
+        kb_dir = Path(self.kb_base_dir) / kb_name / "vector_store"
+        if not VectorStore(kb_dir).exists():
+            self.logger.warning(f"No vector index found at {kb_dir}")
+            return [
+                {
+                    "query": query,
+                    "answer": "No documents indexed. Please upload documents first.",
+                    "content": "",
+                    "mode": "dense",
+                    "provider": "llamaindex",
+                    "results": [],
+                }
+                for query in queries
+            ]
+
+        # Load index (served from the resident cache when the store is unchanged)
+        cached = self._index_cache.get(kb_dir)
+        if cached is None:
+            cached = await asyncio.to_thread(self._load_index, kb_dir)
+            if cached is None:
+                return [self._empty_response(query) for query in queries]
+            self._index_cache.put(kb_dir, cached)
+
+        # Normalize query vectors for cosine similarity (zero rows kept as is)
+        query_vecs = normalize_rows(query_embeddings)
+
+        k = min(top_k, cached.size)
+        hits: List[List[Tuple[float, int]]] = [[] for _ in queries]
+        if k > 0 and cached.faiss_index is not None:
+            configure_search(
+                self.faiss,
+                cached.faiss_index,
+                k,
+                nprobe=kwargs.get("nprobe", self.nprobe),
+                ef_search=kwargs.get("ef_search", self.ef_search),
+            )
+            # Inner product of normalized vectors = cosine similarity
+            scores, labels = cached.faiss_index.search(query_vecs, k)
+            for i in range(len(queries)):
+                hits[i] = [
+                    (float(score), int(label))
+                    for score, label in zip(scores[i], labels[i])
+                    if label >= 0  # FAISS pads with -1
+                ]
+        elif k > 0:
+            # Fallback: cosine similarity against the pre-normalized matrix
+            similarities = scan_scores(cached.doc_vecs, query_vecs.T)
+            keys = cached.chunk_ids
+            for i in range(len(queries)):
+                column = similarities[:, i]
+                hits[i] = [
+                    (float(column[idx]), int(keys[idx]) if keys is not None else int(idx))
+                    for idx in top_k_indices(column, k)
+                ]
+
+        # Resolve all hits with one record lookup (a SQLite query for current-format stores)
+        all_keys = list(dict.fromkeys(key for query_hits in hits for _, key in query_hits))
+        records = {}
+        if all_keys:
+            records = dict(zip(all_keys, await asyncio.to_thread(cached.get_records, all_keys)))
+
+        return [
+            self._build_response(
+                query,
+                [(score, records[key]) for score, key in query_hits if records.get(key)],
+            )
+            for query, query_hits in zip(queries, hits)
+        ]
+
+    @staticmethod
+    def _build_response(query: str, results: List[Tuple[float, Dict[str, Any]]]) -> Dict[str, Any]:
+        """Format scored chunk records as a search response."""
         # Format chunks cleanly for LLM context (without score annotations)
         content_parts = []
         sources = []
@@ -189,6 +254,109 @@ class DenseRetriever(BaseComponent):
             "results": sources,
         }
 
+    def _load_index(self, kb_dir: Path) -> Optional[CachedVectorIndex]:
+        """
+        Load a vector store from disk into a cache entry.
+
+        Resolves the current generation from info.json and loads either its
+        FAISS index or memory-maps its pre-normalized vector matrix. Chunk
+        records stay in the store's SQLite database and are fetched per query.
+
+        Args:
+            kb_dir: Vector store directory
+
+        Returns:
+            Loaded entry, or None if the index files are missing
+        """
+        # Take the signature before reading so a concurrent rewrite is detected next time
+        signature = get_store_signature(kb_dir)
+        store = VectorStore(kb_dir)
+        info = store.read_info()
+
+        if store.is_current_format(info):
+            gen_dir = store.generation_dir(info)
+            index_file = gen_dir / FAISS_FILE if gen_dir is not None else None
+            if (
+                info.get("use_faiss", False)
+                and self.use_faiss
+                and index_file is not None
+                and index_file.exists()
+            ):
+                index = self.faiss.read_index(str(index_file))
+                self.logger.info(f"Loaded FAISS index with {index.ntotal} vectors from {kb_dir}")
+                return CachedVectorIndex(
+                    signature=signature,
+                    info=info,
+                    faiss_index=index,
+                    store=store,
+                    nbytes=index.ntotal * index.d * 4,
+                )
+
+            # Memory-mapped: pages are shared through the OS page cache, so
+            # only the ids count against the resident cache budget
+            chunk_ids, doc_vecs = store.load_vectors(info, mmap=True)
+            self.logger.info(f"Mapped {len(doc_vecs)} embeddings from {kb_dir}")
+            return CachedVectorIndex(
+                signature=signature,
+                info=info,
+                doc_vecs=doc_vecs,
+                chunk_ids=chunk_ids,
+                store=store,
+                nbytes=chunk_ids.nbytes,
+            )
+
+        return self._load_legacy_index(kb_dir, signature, info)
+
+    def _load_legacy_index(
+        self, kb_dir: Path, signature, info: Dict[str, Any]
+    ) -> Optional[CachedVectorIndex]:
+        """Load a single-file store written before generations were introduced."""
+        metadata_file = kb_dir / "metadata.json"
+
+        # Load metadata (info.json is optional)
+        with open(metadata_file, "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+
+        if not info:
+            info = {"use_faiss": False}
+
+        metadata_bytes = metadata_file.stat().st_size
+
+        if info.get("use_faiss", False) and self.use_faiss:
+            index_file = kb_dir / "index.faiss"
+            if not index_file.exists():
+                self.logger.error(f"FAISS index file not found: {index_file}")
+                return None
+
+            index = self.faiss.read_index(str(index_file))
+            self.logger.info(f"Loaded FAISS index with {index.ntotal} vectors from {kb_dir}")
+            return CachedVectorIndex(
+                signature=signature,
+                metadata=metadata,
+                info=info,
+                faiss_index=index,
+                nbytes=metadata_bytes + index.ntotal * index.d * 4,
+            )
+
+        embeddings_file = kb_dir / "embeddings.pkl"
+        if not embeddings_file.exists():
+            self.logger.error(f"Embeddings file not found: {embeddings_file}")
+            return None
+
+        with open(embeddings_file, "rb") as f:
+            embeddings = np.asarray(pickle.load(f), dtype=np.float32)
+
+        doc_vecs = normalize_rows(embeddings)
+
+        self.logger.info(f"Loaded {len(doc_vecs)} embeddings from {kb_dir}")
+        return CachedVectorIndex(
+            signature=signature,
+            metadata=metadata,
+            info=info,
+            doc_vecs=doc_vecs,
+            nbytes=metadata_bytes + doc_vecs.nbytes,
+        )
+
     def _empty_response(self, query: str) -> Dict[str, Any]:
         """Return empty response when no results found."""
         return {
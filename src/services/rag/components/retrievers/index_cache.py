@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Vector Index Cache
+==================
+
+Process-wide resident cache for vector stores written by VectorIndexer.
+
+Keeps the FAISS index (or the pre-normalized embedding matrix), chunk metadata
+and index info in memory so that repeated queries against the same knowledge
+base do not re-read and re-parse the store from disk. Entries are bounded by
+an approximate byte budget, evicted in LRU order, and invalidated whenever the
+files on disk change (mtime/size) or VectorIndexer publishes a new generation.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Files whose stat() makes up the cache signature of a vector store
+# (info.json points at the current generation; the rest are legacy files)
+VECTOR_STORE_FILES = ("info.json", "metadata.json", "index.faiss", "embeddings.pkl")
+
+# Default byte budget for all resident indexes (overridable via env)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+@dataclass
+class CachedVectorIndex:
+    """
+    A vector store loaded into memory.
+
+    Search hits are keys into the store: chunk ids (labels of the FAISS
+    index, or ``chunk_ids[row]`` for the matrix) resolved through ``store``,
+    or row positions into ``metadata`` for legacy single-file stores.
+    """
+
+    signature: Tuple
+    metadata: List[Dict[str, Any]] = field(default_factory=list)
+    info: Dict[str, Any] = field(default_factory=dict)
+    faiss_index: Any = None
+    doc_vecs: Optional[np.ndarray] = None
+    chunk_ids: Optional[np.ndarray] = None
+    store: Any = None
+    nbytes: int = 0
+
+    @property
+    def generation(self) -> int:
+        return int(self.info.get("generation", 0))
+
+    @property
+    def size(self) -> int:
+        """Number of searchable vectors."""
+        if self.faiss_index is not None:
+            return int(self.faiss_index.ntotal)
+        if self.doc_vecs is not None:
+            return len(self.doc_vecs)
+        return len(self.metadata)
+
+    def get_records(self, keys: List[int]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Resolve search hits to chunk records.
+
+        Args:
+            keys: Chunk ids, or metadata rows for legacy stores
+
+        Returns:
+            One record per key (None for keys that no longer exist)
+        """
+        if self.store is not None:
+            records = self.store.get_chunks(keys)
+            return [records.get(int(k)) for k in keys]
+        return [self.metadata[k] if 0 <= k < len(self.metadata) else None for k in keys]
+
+
+def get_store_signature(kb_dir: Path) -> Tuple:
+    """
+    Build a cheap change-detection signature from file stats.
+
+    Args:
+        kb_dir: Vector store directory
+
+    Returns:
+        Tuple of (filename, mtime_ns, size) for every present store file
+    """
+    signature = []
+    for name in VECTOR_STORE_FILES:
+        try:
+            st = os.stat(kb_dir / name)
+        except FileNotFoundError:
+            continue
+        signature.append((name, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+class VectorIndexCache:
+    """
+    LRU cache of loaded vector stores, bounded by bytes.
+
+    Thread-safe: lookups may happen from the event loop while loads run in
+    worker threads.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Approximate memory budget for all cached entries
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CachedVectorIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, kb_dir: Path) -> Optional[CachedVectorIndex]:
+        """
+        Return the cached entry for a store if it is still fresh.
+
+        Args:
+            kb_dir: Vector store directory
+
+        Returns:
+            Cached entry, or None on miss / stale entry
+        """
+        key = str(Path(kb_dir).resolve())
+        signature = get_store_signature(Path(kb_dir))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+            if entry is not None:
+                self._remove(key)
+                self.invalidations += 1
+            self.misses += 1
+            return None
+
+    def put(self, kb_dir: Path, entry: CachedVectorIndex) -> None:
+        """
+        Insert a freshly loaded entry, evicting least recently used ones.
+
+        Entries larger than the whole budget are not cached.
+        """
+        key = str(Path(kb_dir).resolve())
+        if entry.nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._total_bytes += entry.nbytes
+
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, kb_dir: Optional[Path] = None) -> None:
+        """
+        Drop one store (or everything when kb_dir is None).
+        """
+        with self._lock:
+            if kb_dir is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self._total_bytes = 0
+                return
+
+            key = str(Path(kb_dir).resolve())
+            if key in self._entries:
+                self._remove(key)
+                self.invalidations += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.nbytes
+
+
+# Singleton instance
+_cache: Optional[VectorIndexCache] = None
+
+
+def get_vector_index_cache() -> VectorIndexCache:
+    """
+    Get or create the process-wide vector index cache.
+
+    The budget can be set with the RAG_INDEX_CACHE_MAX_BYTES env var.
+    """
+    global _cache
+    if _cache is None:
+        try:
+            max_bytes = int(os.getenv("RAG_INDEX_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+        except ValueError:
+            max_bytes = DEFAULT_MAX_BYTES
+        _cache = VectorIndexCache(max_bytes=max_bytes)
+    return _cache
+
+
+def reset_vector_index_cache():
+    """Reset the singleton cache."""
+    global _cache
+    _cache = None
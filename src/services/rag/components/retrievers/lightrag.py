@@ -6,9 +6,10 @@ LightRAG Retriever
 Pure LightRAG retriever (text-only, no multimodal).
 """
 
+import asyncio
 from pathlib import Path
 import sys
-from typing import Any, ClassVar, Dict, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 from ..base import BaseComponent
 
@@ -128,3 +129,69 @@ class LightRAGRetriever(BaseComponent):
                 "mode": mode,
                 "provider": "lightrag",
             }
+
+    async def process_many(
+        self,
+        queries: List[str],
+        kb_name: str,
+        mode: str = "hybrid",
+        only_need_context: bool = False,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search several queries against one KB.
+
+        Storages are initialized once for the batch and all query embeddings
+        are computed in one EmbeddingClient call up front, so the per-query
+        embedding lookups inside LightRAG are served from the embedding
+        cache. The queries themselves then run concurrently.
+
+        Args:
+            queries: Search queries
+            kb_name: Knowledge base name
+            mode: Search mode (hybrid, local, global, naive)
+            only_need_context: Whether to only return context without answer
+            **kwargs: Additional arguments
+
+        Returns:
+            One search results dictionary per query, in input order
+        """
+        if not queries:
+            return []
+
+        self.logger.info(f"LightRAG search ({mode}) in {kb_name}: {len(queries)} queries")
+
+        from src.logging.adapters import LightRAGLogContext
+
+        with LightRAGLogContext(scene="LightRAG-Search"):
+            rag = self._get_lightrag_instance(kb_name)
+
+            await rag.initialize_storages()
+            from lightrag.kg.shared_storage import initialize_pipeline_status
+
+            await initialize_pipeline_status()
+
+            from lightrag import QueryParam
+
+            from src.services.embedding import get_embedding_client
+
+            embed_client = get_embedding_client()
+            if embed_client.cache is not None:
+                try:
+                    await embed_client.embed(list(dict.fromkeys(queries)))
+                except Exception as e:
+                    self.logger.warning(f"Query embedding prefetch failed: {e}")
+
+            async def run(query: str) -> Dict[str, Any]:
+                query_param = QueryParam(mode=mode, only_need_context=only_need_context)
+                answer = await rag.aquery(query, param=query_param)
+                answer_str = answer if isinstance(answer, str) else str(answer)
+                return {
+                    "query": query,
+                    "answer": answer_str,
+                    "content": answer_str,
+                    "mode": mode,
+                    "provider": "lightrag",
+                }
+
+            return list(await asyncio.gather(*(run(query) for query in queries)))
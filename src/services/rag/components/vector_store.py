@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+"""
+Vector Store
+============
+
+On-disk layout shared by VectorIndexer (writer) and DenseRetriever (reader).
+
+    vector_store/
+        info.json           # Pointer to the current generation (swapped atomically)
+        chunks.sqlite3      # Chunk records keyed by stable chunk id
+        gen-000007/
+            vectors.npy     # L2-normalized float16 vectors, one row per chunk
+            ids.npy         # int64 chunk id of each row
+            index.faiss     # FAISS index labelled by chunk id (only when FAISS is available)
+
+Every write builds a new generation directory next to the current one and
+then replaces info.json, so readers always see either the old or the new
+generation, never a half-written one. Chunk ids are never reused; FAISS
+labels are the chunk ids themselves, which lets documents be added and
+removed without renumbering the rest of the store. The FAISS index type
+(flat, IVF, HNSW, IVF-PQ) is chosen per write, see ann.py.
+
+Stores written by older versions (metadata.json + index.faiss/embeddings.pkl
+at the top level) are still readable and are migrated on the next write.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import pickle
+import shutil
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.logging import get_logger
+
+from ..types import Document
+from .ann import build_index, can_update_in_place, select_index_type
+
+logger = get_logger("VectorStore")
+
+STORE_FORMAT = 2
+INFO_FILE = "info.json"
+CHUNKS_DB = "chunks.sqlite3"
+VECTORS_FILE = "vectors.npy"
+IDS_FILE = "ids.npy"
+FAISS_FILE = "index.faiss"
+LEGACY_FILES = ("metadata.json", "index.faiss", "embeddings.pkl")
+
+# vectors.npy is stored pre-normalized; float16 halves disk and page-cache use
+# at negligible cost to cosine ranking
+VECTOR_DTYPES = ("float16", "float32")
+DEFAULT_VECTOR_DTYPE = "float16"
+
+# Generations kept on disk: the current one plus the previous one, which
+# readers that resolved info.json just before a swap may still be loading
+KEEP_GENERATIONS = 2
+
+# SQLite limits the number of bound parameters per statement
+_SQL_CHUNK = 500
+
+# One writer per store within the process
+_write_locks: Dict[str, threading.Lock] = {}
+_write_locks_guard = threading.Lock()
+
+
+def _write_lock(kb_dir: Path) -> threading.Lock:
+    key = str(Path(kb_dir).resolve())
+    with _write_locks_guard:
+        return _write_locks.setdefault(key, threading.Lock())
+
+
+def document_id(doc: Document) -> str:
+    """
+    Stable identity of a document within a knowledge base.
+
+    Uses the file name so that re-adding the same file replaces its chunks;
+    inline documents fall back to a content hash.
+    """
+    name = doc.metadata.get("filename") if doc.metadata else None
+    if not name and doc.file_path:
+        name = Path(doc.file_path).name
+    if name:
+        return str(name)
+    return "sha256:" + hashlib.sha256(doc.content.encode("utf-8")).hexdigest()[:16]
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Return a float32 copy of vectors scaled to unit L2 norm (zero rows unchanged)."""
+    vectors = np.array(vectors, dtype=np.float32)
+    if vectors.size == 0:
+        return vectors
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _atomic_write_json(path: Path, data: Dict[str, Any]) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class VectorStore:
+    """
+    Handle on one knowledge base's vector store directory.
+
+    Reads are safe from any thread; writes are serialized per directory.
+    """
+
+    def __init__(self, kb_dir: Path):
+        """
+        Initialize the store handle.
+
+        Args:
+            kb_dir: Vector store directory (``<kb>/vector_store``)
+        """
+        self.kb_dir = Path(kb_dir)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def exists(self) -> bool:
+        """Whether the directory holds a store in any supported format."""
+        return (self.kb_dir / INFO_FILE).exists() or (self.kb_dir / "metadata.json").exists()
+
+    def read_info(self) -> Dict[str, Any]:
+        """Return the parsed info.json (empty dict if missing or unreadable)."""
+        try:
+            with open(self.kb_dir / INFO_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def is_current_format(info: Dict[str, Any]) -> bool:
+        return int(info.get("format", 1)) >= STORE_FORMAT
+
+    def generation_dir(self, info: Dict[str, Any]) -> Optional[Path]:
+        """Directory of the generation info.json points to."""
+        path = info.get("path")
+        return self.kb_dir / path if path else None
+
+    def load_vectors(
+        self, info: Dict[str, Any], mmap: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Load chunk ids and normalized vectors of a generation.
+
+        Args:
+            info: Parsed info.json
+            mmap: Map vectors.npy read-only instead of reading it into memory.
+                Mapped pages live in the OS page cache and are shared by every
+                process that maps the same generation.
+
+        Returns:
+            (ids, vectors); empty arrays if the generation has no vectors
+        """
+        gen_dir = self.generation_dir(info)
+        if gen_dir is None or not (gen_dir / VECTORS_FILE).exists():
+            dim = int(info.get("embedding_dim", 0))
+            return np.empty(0, dtype=np.int64), np.empty((0, dim), dtype=np.float32)
+        ids = np.load(gen_dir / IDS_FILE)
+        vectors = np.load(gen_dir / VECTORS_FILE, mmap_mode="r" if mmap else None)
+        return ids, vectors
+
+    def get_chunks(self, chunk_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetch chunk records by id.
+
+        Args:
+            chunk_ids: Chunk ids (e.g. FAISS labels)
+
+        Returns:
+            Mapping of id to record with ``content``, ``type``, ``metadata``
+            and ``doc_id``; ids that no longer exist are absent
+        """
+        ids = [int(i) for i in chunk_ids]
+        records: Dict[int, Dict[str, Any]] = {}
+        if not ids:
+            return records
+
+        with self._conn_lock:
+            conn = self._connect()
+            for start in range(0, len(ids), _SQL_CHUNK):
+                chunk = ids[start : start + _SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT id, doc_id, content, type, metadata FROM chunks "
+                    f"WHERE id IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for chunk_id, doc_id, content, chunk_type, metadata in rows:
+                    records[chunk_id] = {
+                        "id": chunk_id,
+                        "doc_id": doc_id,
+                        "content": content,
+                        "type": chunk_type,
+                        "metadata": json.loads(metadata) if metadata else {},
+                    }
+        return records
+
+    def list_documents(self) -> Dict[str, int]:
+        """Return chunk counts per document id."""
+        with self._conn_lock:
+            conn = self._connect()
+            rows = conn.execute("SELECT doc_id, COUNT(*) FROM chunks GROUP BY doc_id").fetchall()
+        return {doc_id: count for doc_id, count in rows}
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.kb_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.kb_dir / CHUNKS_DB), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " doc_id TEXT NOT NULL,"
+                " content TEXT NOT NULL,"
+                " type TEXT,"
+                " metadata TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_doc_id ON chunks(doc_id)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def apply(
+        self,
+        documents: Sequence[Document] = (),
+        delete_doc_ids: Sequence[str] = (),
+        faiss: Any = None,
+        index_type: str = "flat",
+        vector_dtype: str = DEFAULT_VECTOR_DTYPE,
+    ) -> Dict[str, Any]:
+        """
+        Upsert documents and/or delete documents, publishing a new generation.
+
+        Documents whose id already exists replace their previous chunks.
+        Only chunks with embeddings are stored.
+
+        Args:
+            documents: Documents to add or replace
+            delete_doc_ids: Document ids to remove
+            faiss: FAISS module, or None to skip writing a FAISS index
+            index_type: FAISS index type, or "auto" to choose by corpus size
+            vector_dtype: On-disk dtype of vectors.npy ("float16" or "float32")
+
+        Returns:
+            The info.json of the published generation
+        """
+        with _write_lock(self.kb_dir):
+            return self._apply_locked(documents, delete_doc_ids, faiss, index_type, vector_dtype)
+
+    def _apply_locked(
+        self, documents, delete_doc_ids, faiss, index_type, vector_dtype
+    ) -> Dict[str, Any]:
+        self.kb_dir.mkdir(parents=True, exist_ok=True)
+        info = self.read_info()
+        legacy = not self.is_current_format(info) and (self.kb_dir / "metadata.json").exists()
+
+        if self.is_current_format(info):
+            old_ids, old_vectors = self.load_vectors(info, mmap=True)
+        else:
+            old_ids = np.empty(0, dtype=np.int64)
+            old_vectors = None
+
+        # Records and vectors to insert: migrated legacy chunks first, then new ones
+        replaced = {document_id(doc) for doc in documents} | set(delete_doc_ids)
+        new_records: List[Tuple[str, str, str, str]] = []
+        new_vectors: List[Any] = []
+        if legacy:
+            for record, vector in self._read_legacy(faiss):
+                # Migrated chunks of replaced/deleted documents are dropped right away
+                if record[0] not in replaced:
+                    new_records.append(record)
+                    new_vectors.append(vector)
+
+        for doc in documents:
+            doc_id = document_id(doc)
+            for chunk in doc.chunks:
+                if chunk.embedding is None or len(chunk.embedding) == 0:
+                    continue
+                new_records.append(
+                    (
+                        doc_id,
+                        chunk.content,
+                        chunk.chunk_type,
+                        json.dumps(chunk.metadata or {}, ensure_ascii=False, separators=(",", ":")),
+                    )
+                )
+                new_vectors.append(chunk.embedding)
+
+        with self._conn_lock:
+            conn = self._connect()
+            removed_ids = self._ids_for_documents(conn, replaced)
+
+            # New rows are invisible to readers until info.json points at a
+            # generation containing their ids
+            added_ids: List[int] = []
+            for record in new_records:
+                cursor = conn.execute(
+                    "INSERT INTO chunks (doc_id, content, type, metadata) VALUES (?, ?, ?, ?)",
+                    record,
+                )
+                added_ids.append(int(cursor.lastrowid))
+            conn.commit()
+
+        dim = int(info.get("embedding_dim", 0))
+        ids = np.empty(0, dtype=np.int64)
+        vectors = None
+        if old_vectors is not None and len(old_ids):
+            keep_mask = ~np.isin(old_ids, np.fromiter(removed_ids, dtype=np.int64))
+            ids = old_ids[keep_mask]
+            vectors = np.asarray(old_vectors)[keep_mask]
+
+        added = normalize_rows(new_vectors) if new_vectors else None
+        if added is not None:
+            ids = np.concatenate([ids, np.asarray(added_ids, dtype=np.int64)])
+            vectors = added if vectors is None or not len(vectors) else np.vstack([vectors, added])
+
+        if vectors is not None and vectors.ndim == 2:
+            dim = int(vectors.shape[1])
+        else:
+            vectors = np.empty((0, dim), dtype=np.float32)
+
+        generation = int(info.get("generation", 0)) + 1
+        gen_name = f"gen-{generation:06d}"
+        gen_dir = self.kb_dir / gen_name
+        if gen_dir.exists():
+            shutil.rmtree(gen_dir)
+        gen_dir.mkdir(parents=True)
+
+        if vector_dtype not in VECTOR_DTYPES:
+            logger.warning(f"Unsupported vector dtype '{vector_dtype}', using float32")
+            vector_dtype = "float32"
+        np.save(gen_dir / VECTORS_FILE, vectors.astype(vector_dtype, copy=False))
+        np.save(gen_dir / IDS_FILE, ids.astype(np.int64, copy=False))
+
+        use_faiss = faiss is not None and dim > 0
+        index_params: Dict[str, Any] = {}
+        if use_faiss:
+            index, index_params = self._build_faiss_index(
+                faiss, index_type, info, removed_ids, ids, vectors, added_ids, added
+            )
+            faiss.write_index(index, str(gen_dir / FAISS_FILE))
+
+        with self._conn_lock:
+            conn = self._connect()
+            present = {row[0] for row in conn.execute("SELECT DISTINCT doc_id FROM chunks")}
+        doc_count = len((present - replaced) | {record[0] for record in new_records})
+
+        new_info = {
+            "format": STORE_FORMAT,
+            "generation": generation,
+            "path": gen_name,
+            "num_chunks": int(len(ids)),
+            "num_documents": int(doc_count),
+            "embedding_dim": dim,
+            "use_faiss": use_faiss,
+            "vector_dtype": vector_dtype,
+            **index_params,
+            "updated_at": time.time(),
+        }
+        _atomic_write_json(self.kb_dir / INFO_FILE, new_info)
+
+        # The swap is visible; now drop what only older generations referenced
+        with self._conn_lock:
+            conn = self._connect()
+            self._delete_ids(conn, removed_ids)
+            conn.commit()
+        if legacy:
+            for name in LEGACY_FILES:
+                (self.kb_dir / name).unlink(missing_ok=True)
+        self._prune_generations(generation)
+
+        logger.info(
+            f"Published generation {generation} for {self.kb_dir}: "
+            f"+{len(added_ids)} / -{len(removed_ids)} chunks, {len(ids)} total"
+        )
+        return new_info
+
+    def _build_faiss_index(
+        self, faiss, index_type, info, removed_ids, ids, vectors, added_ids, added
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Update the previous index in place when possible, else build a new one."""
+        index_type = select_index_type(index_type, len(ids))
+        prev_dir = self.generation_dir(info) if self.is_current_format(info) else None
+        prev_file = prev_dir / FAISS_FILE if prev_dir is not None else None
+        if (
+            prev_file is not None
+            and prev_file.exists()
+            and can_update_in_place(index_type, info, len(ids))
+        ):
+            try:
+                index = faiss.read_index(str(prev_file))
+                if removed_ids:
+                    selector = faiss.IDSelectorBatch(np.fromiter(removed_ids, dtype=np.int64))
+                    index.remove_ids(selector)
+                if added is not None:
+                    index.add_with_ids(added, np.asarray(added_ids, dtype=np.int64))
+                if index.ntotal == len(ids):
+                    params = {
+                        key: info[key]
+                        for key in ("index_type", "nlist", "trained_on", "pq_m", "hnsw_m")
+                        if key in info
+                    }
+                    return index, params
+            except Exception as e:
+                logger.warning(f"Rebuilding FAISS index after update failure: {e}")
+
+        return build_index(faiss, index_type, vectors, ids)
+
+    @staticmethod
+    def _ids_for_documents(conn: sqlite3.Connection, doc_ids: Iterable[str]) -> set:
+        doc_ids = list(doc_ids)
+        found = set()
+        for start in range(0, len(doc_ids), _SQL_CHUNK):
+            chunk = doc_ids[start : start + _SQL_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT id FROM chunks WHERE doc_id IN ({placeholders})", chunk
+            ).fetchall()
+            found.update(int(row[0]) for row in rows)
+        return found
+
+    @staticmethod
+    def _delete_ids(conn: sqlite3.Connection, chunk_ids: Iterable[int]) -> None:
+        chunk_ids = list(chunk_ids)
+        for start in range(0, len(chunk_ids), _SQL_CHUNK):
+            chunk = chunk_ids[start : start + _SQL_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            conn.execute(f"DELETE FROM chunks WHERE id IN ({placeholders})", chunk)
+
+    def _prune_generations(self, current: int) -> None:
+        keep = {f"gen-{g:06d}" for g in range(current - KEEP_GENERATIONS + 1, current + 1)}
+        for path in self.kb_dir.glob("gen-*"):
+            if path.is_dir() and path.name not in keep:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _read_legacy(self, faiss: Any) -> List[Tuple[Tuple[str, str, str, str], Any]]:
+        """Read chunks and vectors of a pre-generation store for migration."""
+        try:
+            with open(self.kb_dir / "metadata.json", "r", encoding="utf-8") as f:
+                metadata = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cannot migrate legacy vector store at {self.kb_dir}: {e}")
+            return []
+
+        vectors = None
+        pkl_file = self.kb_dir / "embeddings.pkl"
+        faiss_file = self.kb_dir / "index.faiss"
+        try:
+            if pkl_file.exists():
+                with open(pkl_file, "rb") as f:
+                    vectors = np.asarray(pickle.load(f), dtype=np.float32)
+            elif faiss is not None and faiss_file.exists():
+                index = faiss.read_index(str(faiss_file))
+                vectors = index.reconstruct_n(0, index.ntotal)
+        except Exception as e:
+            logger.warning(f"Cannot read legacy vectors at {self.kb_dir}: {e}")
+
+        if vectors is None or len(vectors) != len(metadata):
+            logger.warning(f"Legacy vector store at {self.kb_dir} not migrated (no vectors)")
+            return []
+
+        migrated = []
+        for item, vector in zip(metadata, vectors):
+            chunk_meta = item.get("metadata") or {}
+            source = chunk_meta.get("source")
+            doc_id = Path(source).name if source else "legacy"
+            record = (
+                doc_id,
+                item.get("content", ""),
+                item.get("type", "text"),
+                json.dumps(chunk_meta, ensure_ascii=False, separators=(",", ":")),
+            )
+            migrated.append((record, vector))
+        logger.info(f"Migrating {len(migrated)} chunks from legacy store at {self.kb_dir}")
+        return migrated
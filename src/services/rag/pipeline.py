@@ -7,8 +7,12 @@ Composable RAG pipeline with fluent API.
 """
 
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+import pickle
 import shutil
+import time
 from typing import Any, Dict, List, Optional
 
 from src.logging import get_logger
@@ -22,6 +26,38 @@ DEFAULT_KB_BASE_DIR = str(
     Path(__file__).resolve().parent.parent.parent.parent / "data" / "knowledge_bases"
 )
 
+# End-of-stream marker passed between initialize() stages
+_END = object()
+
+
+@dataclass
+class StageStats:
+    """Throughput counters for one initialize() stage."""
+
+    name: str
+    unit: str
+    items: int = 0
+    busy_seconds: float = 0.0
+
+    def record(self, items: int, seconds: float) -> None:
+        self.items += items
+        self.busy_seconds += seconds
+
+    @property
+    def throughput(self) -> float:
+        return self.items / self.busy_seconds if self.busy_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Stage {self.name}: {self.items} {self.unit} in {self.busy_seconds:.2f}s "
+            f"({self.throughput:.1f} {self.unit}/s)"
+        )
+
+
+def _run_chunker_in_process(chunker: Component, doc: Document, kwargs: Dict[str, Any]):
+    """Process-pool entry point for CPU-bound chunkers."""
+    return asyncio.run(chunker.process(doc, **kwargs))
+
 
 class RAGPipeline:
     """
@@ -42,16 +78,30 @@ class RAGPipeline:
         result = await pipeline.search("query", "kb_name")
     """
 
-    def __init__(self, name: str = "default", kb_base_dir: Optional[str] = None):
+    def __init__(
+        self,
+        name: str = "default",
+        kb_base_dir: Optional[str] = None,
+        parse_concurrency: int = 4,
+        chunk_workers: int = 0,
+        queue_size: int = 8,
+    ):
         """
         Initialize RAG pipeline.
 
         Args:
             name: Pipeline name for logging
             kb_base_dir: Base directory for knowledge bases
+            parse_concurrency: Files parsed concurrently during initialize()
+            chunk_workers: Process pool size for CPU-bound chunkers (0 = in-process)
+            queue_size: Max items buffered between initialize() stages
         """
         self.name = name
         self.kb_base_dir = kb_base_dir or DEFAULT_KB_BASE_DIR
+        self.parse_concurrency = parse_concurrency
+        self.chunk_workers = chunk_workers
+        self.queue_size = queue_size
+        self.last_run_stats: Dict[str, StageStats] = {}
         self.logger = get_logger(f"Pipeline:{name}")
         self._parser: Optional[Component] = None
         self._chunkers: List[Component] = []
@@ -93,22 +143,35 @@ class RAGPipeline:
         - PDF/complex files -> configured parser (e.g., PDFParser)
         - Text files -> direct text reading (fast path)
 
+        Documents stream through parse -> chunk -> embed -> index stages
+        connected by bounded queues, so a slow stage applies backpressure
+        instead of letting parsed documents pile up in memory:
+        - Parsing runs up to ``parse_concurrency`` files at once
+        - Chunkers marked ``cpu_bound`` run in a process pool when
+          ``chunk_workers`` > 0
+        - Embedding batches span document boundaries to fill the
+          embedder's ``batch_size``
+        - Indexers marked ``incremental`` receive documents batch by batch;
+          other indexers receive all documents once the stream ends
+
         Args:
             kb_name: Knowledge base name
             file_paths: List of file paths to process
-            **kwargs: Additional arguments passed to components
+            **kwargs: Additional arguments passed to components (must be
+                picklable when chunkers run in the process pool)
 
         Returns:
             True if successful
+
+        Raises:
+            ValueError: If no parser is configured, or kwargs cannot be sent
+                to the chunk process pool
         """
         self.logger.info(f"Initializing KB '{kb_name}' with {len(file_paths)} files")
 
         if not self._parser:
             raise ValueError("No parser configured. Use .parser() to set one")
 
-        # Stage 1: Parse documents with file type routing
-        self.logger.info("Stage 1: Parsing documents...")
-
         # Classify files by type
         classification = FileTypeRouter.classify_files(file_paths)
         self.logger.info(
@@ -117,55 +180,219 @@ class RAGPipeline:
             f"{len(classification.unsupported)} unsupported"
         )
 
-        documents = []
-
-        # Process complex files (PDF, etc.) with configured parser
-        for path in classification.needs_mineru:
-            self.logger.info(f"Parsing (parser): {Path(path).name}")
-            doc = await self._parser.process(path, **kwargs)
-            documents.append(doc)
-
-        # Process text files directly (fast path)
-        for path in classification.text_files:
-            self.logger.info(f"Parsing (direct text): {Path(path).name}")
-            content = await FileTypeRouter.read_text_file(path)
-            doc = Document(
-                content=content,
-                file_path=str(path),
-                metadata={
-                    "filename": Path(path).name,
-                    "parser": "direct_text",
-                },
-            )
-            documents.append(doc)
-
         # Log unsupported files
         for path in classification.unsupported:
             self.logger.warning(f"Skipped unsupported file: {Path(path).name}")
 
-        # Stage 2: Chunk (sequential - later chunkers see earlier results)
-        if self._chunkers:
-            self.logger.info("Stage 2: Chunking...")
-            for chunker in self._chunkers:
-                for doc in documents:
-                    new_chunks = await chunker.process(doc, **kwargs)
-                    doc.chunks.extend(new_chunks)
+        jobs = [(path, True) for path in classification.needs_mineru]
+        jobs += [(path, False) for path in classification.text_files]
+
+        stats = {
+            "parse": StageStats("parse", "docs"),
+            "chunk": StageStats("chunk", "chunks"),
+            "embed": StageStats("embed", "chunks"),
+            "index": StageStats("index", "docs"),
+        }
+        self.last_run_stats = stats
+
+        parsed: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        chunked: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        embedded: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        pool = None
+        if self.chunk_workers > 0 and any(getattr(c, "cpu_bound", False) for c in self._chunkers):
+            # Pooled chunkers get the same kwargs as in-process ones, so they must pickle
+            try:
+                pickle.dumps(kwargs)
+            except Exception as e:
+                raise ValueError(
+                    f"initialize() kwargs must be picklable when chunk_workers > 0: {e}"
+                ) from e
+            pool = ProcessPoolExecutor(max_workers=self.chunk_workers)
+
+        file_queue: asyncio.Queue = asyncio.Queue()
+        for job in jobs:
+            file_queue.put_nowait(job)
+
+        parse_workers = max(1, min(self.parse_concurrency, len(jobs)))
+        chunk_workers = max(1, self.chunk_workers) if self._chunkers else 1
+
+        tasks = []
+        try:
+            parse_tasks = [
+                asyncio.create_task(self._parse_worker(file_queue, parsed, stats["parse"], kwargs))
+                for _ in range(parse_workers)
+            ]
+            chunk_tasks = [
+                asyncio.create_task(
+                    self._chunk_worker(parsed, chunked, stats["chunk"], pool, kwargs)
+                )
+                for _ in range(chunk_workers)
+            ]
+            tasks = parse_tasks + chunk_tasks
+            tasks.append(
+                asyncio.create_task(self._close_after(parse_tasks, parsed, len(chunk_tasks)))
+            )
+            tasks.append(asyncio.create_task(self._close_after(chunk_tasks, chunked, 1)))
+            tasks.append(
+                asyncio.create_task(self._embed_stage(chunked, embedded, stats["embed"], kwargs))
+            )
+            tasks.append(
+                asyncio.create_task(self._index_stage(kb_name, embedded, stats["index"], kwargs))
+            )
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        for stage in stats.values():
+            if stage.items:
+                self.logger.info(stage.summary())
 
-        # Stage 3: Embed
-        if self._embedder:
-            self.logger.info("Stage 3: Embedding...")
-            for doc in documents:
-                await self._embedder.process(doc, **kwargs)
+        self.logger.info(f"KB '{kb_name}' initialized successfully")
+        return True
 
-        # Stage 4: Index (can run in parallel)
-        if self._indexers:
-            self.logger.info("Stage 4: Indexing...")
+    async def _parse_worker(
+        self,
+        file_queue: asyncio.Queue,
+        out: asyncio.Queue,
+        stats: "StageStats",
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Parse files until the file queue is drained."""
+        while True:
+            try:
+                path, use_parser = file_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            started = time.perf_counter()
+            if use_parser:
+                self.logger.info(f"Parsing (parser): {Path(path).name}")
+                doc = await self._parser.process(path, **kwargs)
+            else:
+                self.logger.info(f"Parsing (direct text): {Path(path).name}")
+                content = await FileTypeRouter.read_text_file(path)
+                doc = Document(
+                    content=content,
+                    file_path=str(path),
+                    metadata={
+                        "filename": Path(path).name,
+                        "parser": "direct_text",
+                    },
+                )
+            stats.record(1, time.perf_counter() - started)
+            await out.put(doc)
+
+    async def _chunk_worker(
+        self,
+        inp: asyncio.Queue,
+        out: asyncio.Queue,
+        stats: "StageStats",
+        pool: Optional[ProcessPoolExecutor],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Run all chunkers over each document (later chunkers see earlier results)."""
+        loop = asyncio.get_running_loop()
+        while True:
+            doc = await inp.get()
+            if doc is _END:
+                return
+
+            started = time.perf_counter()
+            for chunker in self._chunkers:
+                if pool is not None and getattr(chunker, "cpu_bound", False):
+                    new_chunks = await loop.run_in_executor(
+                        pool, _run_chunker_in_process, chunker, doc, kwargs
+                    )
+                else:
+                    new_chunks = await chunker.process(doc, **kwargs)
+                doc.chunks.extend(new_chunks)
+            if self._chunkers:
+                stats.record(len(doc.chunks), time.perf_counter() - started)
+            await out.put(doc)
+
+    async def _embed_stage(
+        self,
+        inp: asyncio.Queue,
+        out: asyncio.Queue,
+        stats: "StageStats",
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Embed chunks in batches that may span several documents."""
+        batch_size = getattr(self._embedder, "batch_size", None) or 100
+        pending: List[Document] = []
+        pending_chunks = 0
+
+        async def flush():
+            nonlocal pending, pending_chunks
+            if not pending:
+                return
+            if self._embedder and pending_chunks:
+                started = time.perf_counter()
+                batch = Document(content="", chunks=[c for d in pending for c in d.chunks])
+                await self._embedder.process(batch, **kwargs)
+                stats.record(pending_chunks, time.perf_counter() - started)
+            await out.put(pending)
+            pending, pending_chunks = [], 0
+
+        while True:
+            doc = await inp.get()
+            if doc is _END:
+                await flush()
+                await out.put(_END)
+                return
+
+            pending.append(doc)
+            pending_chunks += len(doc.chunks)
+            if not self._embedder or pending_chunks >= batch_size:
+                await flush()
+
+    async def _index_stage(
+        self,
+        kb_name: str,
+        inp: asyncio.Queue,
+        stats: "StageStats",
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Feed incremental indexers per batch; others get every document at the end."""
+        incremental = [i for i in self._indexers if getattr(i, "incremental", False)]
+        deferred = [i for i in self._indexers if not getattr(i, "incremental", False)]
+        documents: List[Document] = []
+
+        while True:
+            batch = await inp.get()
+            if batch is _END:
+                break
+
+            if incremental:
+                started = time.perf_counter()
+                await asyncio.gather(
+                    *[indexer.process(kb_name, batch, **kwargs) for indexer in incremental]
+                )
+                stats.record(len(batch), time.perf_counter() - started)
+            if deferred:
+                documents.extend(batch)
+
+        # Indexers that rebuild the whole store (can run in parallel)
+        if deferred:
+            self.logger.info(f"Indexing {len(documents)} documents...")
+            started = time.perf_counter()
             await asyncio.gather(
-                *[indexer.process(kb_name, documents, **kwargs) for indexer in self._indexers]
+                *[indexer.process(kb_name, documents, **kwargs) for indexer in deferred]
             )
+            if not incremental:
+                stats.record(len(documents), time.perf_counter() - started)
 
-        self.logger.info(f"KB '{kb_name}' initialized successfully")
-        return True
+    @staticmethod
+    async def _close_after(workers: List[asyncio.Task], out: asyncio.Queue, consumers: int):
+        """Signal end-of-stream to each consumer once all producer workers finished."""
+        await asyncio.gather(*workers)
+        for _ in range(consumers):
+            await out.put(_END)
 
     async def search(self, query: str, kb_name: str, **kwargs) -> Dict[str, Any]:
         """
@@ -184,6 +411,33 @@ class RAGPipeline:
 
         return await self._retriever.process(query, kb_name=kb_name, **kwargs)
 
+    async def search_many(self, queries: List[str], kb_name: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Search the knowledge base with several queries.
+
+        Retrievers exposing ``process_many`` handle the whole batch at once;
+        others are queried concurrently.
+
+        Args:
+            queries: Search queries
+            kb_name: Knowledge base name
+            **kwargs: Additional arguments passed to retriever
+
+        Returns:
+            One search results dictionary per query, in input order
+        """
+        if not self._retriever:
+            raise ValueError("No retriever configured. Use .retriever() to set one")
+
+        if hasattr(self._retriever, "process_many"):
+            return await self._retriever.process_many(list(queries), kb_name=kb_name, **kwargs)
+
+        return list(
+            await asyncio.gather(
+                *(self._retriever.process(query, kb_name=kb_name, **kwargs) for query in queries)
+            )
+        )
+
     async def delete(self, kb_name: str) -> bool:
         """
         Delete a knowledge base.
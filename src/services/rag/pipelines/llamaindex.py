@@ -7,8 +7,10 @@ True LlamaIndex integration using official llama-index library.
 """
 
 import asyncio
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from llama_index.core import (
     Document,
@@ -28,6 +30,80 @@ DEFAULT_KB_BASE_DIR = str(
     Path(__file__).resolve().parent.parent.parent.parent.parent / "data" / "knowledge_bases"
 )
 
+# Process-wide cache of loaded indexes: storage_dir -> (signature, index)
+_INDEX_CACHE: Dict[str, Tuple[Tuple, VectorStoreIndex]] = {}
+_INDEX_CACHE_LOCK = threading.Lock()
+_INDEX_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def _storage_signature(storage_dir: Path) -> Tuple:
+    """Change-detection signature of a persisted index (file names, mtimes, sizes)."""
+    signature = []
+    try:
+        with os.scandir(storage_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    st = entry.stat()
+                    signature.append((entry.name, st.st_mtime_ns, st.st_size))
+    except FileNotFoundError:
+        return ()
+    return tuple(sorted(signature))
+
+
+def _get_cached_index(storage_dir: Path) -> VectorStoreIndex:
+    """
+    Return the loaded index for a storage directory, loading it on first use.
+
+    The cached handle is reused until the persisted files change. Blocking;
+    call from a worker thread.
+    """
+    key = str(storage_dir.resolve())
+    signature = _storage_signature(storage_dir)
+
+    with _INDEX_CACHE_LOCK:
+        cached = _INDEX_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            _INDEX_CACHE_STATS["hits"] += 1
+            return cached[1]
+        _INDEX_CACHE_STATS["misses"] += 1
+
+    storage_context = StorageContext.from_defaults(persist_dir=str(storage_dir))
+    index = load_index_from_storage(storage_context)
+
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE[key] = (signature, index)
+    return index
+
+
+def _set_cached_index(storage_dir: Path, index: VectorStoreIndex) -> None:
+    """Publish a freshly persisted index as the cached handle for its directory."""
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE[str(storage_dir.resolve())] = (_storage_signature(storage_dir), index)
+
+
+def invalidate_index_cache(storage_dir: Optional[str] = None) -> None:
+    """
+    Drop cached index handles.
+
+    Args:
+        storage_dir: Storage directory to drop, or None to clear everything
+    """
+    with _INDEX_CACHE_LOCK:
+        if storage_dir is None:
+            _INDEX_CACHE.clear()
+        else:
+            _INDEX_CACHE.pop(str(Path(storage_dir).resolve()), None)
+
+
+def get_index_cache_stats() -> Dict[str, Any]:
+    """Return cached index handle counters."""
+    with _INDEX_CACHE_LOCK:
+        return {
+            "entries": len(_INDEX_CACHE),
+            "hits": _INDEX_CACHE_STATS["hits"],
+            "misses": _INDEX_CACHE_STATS["misses"],
+        }
+
 
 class CustomEmbedding(BaseEmbedding):
     """
@@ -43,6 +119,8 @@ class CustomEmbedding(BaseEmbedding):
     _client: Any = PrivateAttr()
 
     def __init__(self, **kwargs):
+        # LlamaIndex defaults to 10 texts per call; let EmbeddingClient batch instead
+        kwargs.setdefault("embed_batch_size", 256)
         super().__init__(**kwargs)
         self._client = get_embedding_client()
 
@@ -80,6 +158,14 @@ class CustomEmbedding(BaseEmbedding):
         """Get embeddings for multiple texts."""
         return await self._client.embed(texts)
 
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Sync batch version - one EmbeddingClient call instead of one per text."""
+        # Use nest_asyncio to allow nested event loops
+        import nest_asyncio
+
+        nest_asyncio.apply()
+        return asyncio.run(self._aget_text_embeddings(texts))
+
 
 class LlamaIndexPipeline:
     """
@@ -90,6 +176,9 @@ class LlamaIndexPipeline:
     - CustomEmbedding for OpenAI-compatible embeddings
     - SentenceSplitter for chunking
     - StorageContext for persistence
+
+    Loaded indexes are cached process-wide per storage directory, so searches
+    only deserialize the docstore/vector store once per KB version.
     """
 
     def __init__(self, kb_base_dir: Optional[str] = None):
@@ -183,6 +272,7 @@ class LlamaIndexPipeline:
 
             # Persist index
             index.storage_context.persist(persist_dir=str(storage_dir))
+            _set_cached_index(storage_dir, index)
             self.logger.info(f"Index persisted to {storage_dir}")
 
             self.logger.info(f"KB '{kb_name}' initialized successfully with LlamaIndex")
@@ -248,12 +338,11 @@ class LlamaIndexPipeline:
             }
 
         try:
-            # Load index from storage (run in thread pool)
+            # Get cached index, loading from storage on first use (run in thread pool)
             loop = asyncio.get_event_loop()
 
             def load_and_retrieve():
-                storage_context = StorageContext.from_defaults(persist_dir=str(storage_dir))
-                index = load_index_from_storage(storage_context)
+                index = _get_cached_index(storage_dir)
                 top_k = kwargs.get("top_k", 5)
 
                 # Use retriever instead of query_engine to avoid LLM requirement
@@ -292,6 +381,77 @@ class LlamaIndexPipeline:
                 "provider": "llamaindex",
             }
 
+    async def search_many(
+        self,
+        queries: List[str],
+        kb_name: str,
+        mode: str = "hybrid",
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search several queries against one KB.
+
+        Queries are embedded with a single EmbeddingClient call and the
+        precomputed embeddings are handed to the retriever, so each retrieval
+        skips its own embedding round trip.
+
+        Args:
+            queries: Search queries
+            kb_name: Knowledge base name
+            mode: Search mode (ignored, LlamaIndex uses similarity)
+            **kwargs: Additional arguments (top_k, etc.)
+
+        Returns:
+            One search results dictionary per query, in input order
+        """
+        if not queries:
+            return []
+
+        self.logger.info(f"Searching KB '{kb_name}' with {len(queries)} queries")
+
+        storage_dir = Path(self.kb_base_dir) / kb_name / "llamaindex_storage"
+        if not storage_dir.exists():
+            return [await self.search(query, kb_name, mode=mode, **kwargs) for query in queries]
+
+        try:
+            from llama_index.core.schema import QueryBundle
+
+            embeddings = await get_embedding_client().embed(list(queries))
+            top_k = kwargs.get("top_k", 5)
+
+            def load_and_retrieve_all():
+                index = _get_cached_index(storage_dir)
+                retriever = index.as_retriever(similarity_top_k=top_k)
+                return [
+                    retriever.retrieve(QueryBundle(query_str=query, embedding=embedding))
+                    for query, embedding in zip(queries, embeddings)
+                ]
+
+            loop = asyncio.get_event_loop()
+            all_nodes = await loop.run_in_executor(None, load_and_retrieve_all)
+
+            results = []
+            for query, nodes in zip(queries, all_nodes):
+                content = "\n\n".join(node.node.text for node in nodes)
+                results.append(
+                    {
+                        "query": query,
+                        "answer": content,
+                        "content": content,
+                        "mode": mode,
+                        "provider": "llamaindex",
+                    }
+                )
+            return results
+
+        except Exception as e:
+            self.logger.warning(f"Batched search failed ({e}), searching queries one by one")
+            return list(
+                await asyncio.gather(
+                    *(self.search(query, kb_name, mode=mode, **kwargs) for query in queries)
+                )
+            )
+
     async def add_documents(self, kb_name: str, file_paths: List[str], **kwargs) -> bool:
         """
         Incrementally add documents to an existing LlamaIndex KB.
@@ -354,6 +514,7 @@ class LlamaIndexPipeline:
                 self.logger.info(f"Loading existing index from {storage_dir}...")
 
                 def load_and_insert():
+                    # Load a private copy so concurrent searches keep using the cached one
                     storage_context = StorageContext.from_defaults(persist_dir=str(storage_dir))
                     index = load_index_from_storage(storage_context)
 
@@ -361,8 +522,9 @@ class LlamaIndexPipeline:
                     for doc in documents:
                         index.insert(doc)
 
-                    # Persist updated index
+                    # Persist updated index and swap it in for searches
                     index.storage_context.persist(persist_dir=str(storage_dir))
+                    _set_cached_index(storage_dir, index)
                     return len(documents)
 
                 num_added = await loop.run_in_executor(None, load_and_insert)
@@ -375,6 +537,7 @@ class LlamaIndexPipeline:
                 def create_index():
                     index = VectorStoreIndex.from_documents(documents, show_progress=True)
                     index.storage_context.persist(persist_dir=str(storage_dir))
+                    _set_cached_index(storage_dir, index)
                     return len(documents)
 
                 num_added = await loop.run_in_executor(None, create_index)
@@ -390,6 +553,29 @@ class LlamaIndexPipeline:
             self.logger.error(traceback.format_exc())
             return False
 
+    async def warmup(self, kb_name: str) -> bool:
+        """
+        Preload a KB's index into the process-wide cache.
+
+        Args:
+            kb_name: Knowledge base name
+
+        Returns:
+            True if the index was loaded (or already cached)
+        """
+        storage_dir = Path(self.kb_base_dir) / kb_name / "llamaindex_storage"
+        if not storage_dir.exists():
+            self.logger.debug(f"Skip warmup for '{kb_name}': no LlamaIndex storage")
+            return False
+
+        try:
+            await asyncio.get_event_loop().run_in_executor(None, _get_cached_index, storage_dir)
+            self.logger.info(f"Warmed up LlamaIndex index for KB '{kb_name}'")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to warm up KB '{kb_name}': {e}")
+            return False
+
     async def delete(self, kb_name: str) -> bool:
         """
         Delete knowledge base.
@@ -403,6 +589,7 @@ class LlamaIndexPipeline:
         import shutil
 
         kb_dir = Path(self.kb_base_dir) / kb_name
+        invalidate_index_cache(str(kb_dir / "llamaindex_storage"))
 
         if kb_dir.exists():
             shutil.rmtree(kb_dir)
@@ -4,13 +4,21 @@ RAG Service
 ===========
 
 Unified RAG service providing a single entry point for all RAG operations.
+
+Pipelines are long-lived: every RAGService shares one instance per
+(provider, kb_base_dir), so searches reuse configured clients, loaded
+RAG instances and index handles instead of rebuilding them per query. The
+provider recorded in each KB's metadata.json is cached too and re-read only
+when that file changes.
 """
 
+import asyncio
 import json
 import os
 from pathlib import Path
 import shutil
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.logging import get_logger
 
@@ -21,6 +29,87 @@ DEFAULT_KB_BASE_DIR = str(
     Path(__file__).resolve().parent.parent.parent.parent / "data" / "knowledge_bases"
 )
 
+# Shared pipeline instances: (provider, resolved kb_base_dir) -> pipeline
+_PIPELINES: Dict[Tuple[str, str], Any] = {}
+_PIPELINES_LOCK = threading.Lock()
+
+# Provider per KB: metadata.json path -> ((mtime_ns, size), rag_provider or None)
+_KB_PROVIDERS: Dict[str, Tuple[Tuple[int, int], Optional[str]]] = {}
+_KB_PROVIDERS_LOCK = threading.Lock()
+
+
+def _registry_key(provider: str, kb_base_dir: str) -> Tuple[str, str]:
+    return provider, str(Path(kb_base_dir).resolve())
+
+
+def get_shared_pipeline(provider: str, kb_base_dir: Optional[str] = None):
+    """
+    Get the shared pipeline instance for a provider and KB base directory.
+
+    The pipeline is created on first use and kept until evicted.
+
+    Args:
+        provider: Pipeline provider name
+        kb_base_dir: Base directory for knowledge bases (default: data/knowledge_bases)
+
+    Returns:
+        Pipeline instance
+
+    Raises:
+        ValueError: If the provider is unknown or its dependencies are missing
+    """
+    kb_base_dir = kb_base_dir or DEFAULT_KB_BASE_DIR
+    key = _registry_key(provider, kb_base_dir)
+    with _PIPELINES_LOCK:
+        pipeline = _PIPELINES.get(key)
+        if pipeline is None:
+            pipeline = get_pipeline(provider, kb_base_dir=kb_base_dir)
+            _PIPELINES[key] = pipeline
+        return pipeline
+
+
+def evict_pipelines(provider: Optional[str] = None, kb_base_dir: Optional[str] = None) -> int:
+    """
+    Drop shared pipeline instances (and cached KB providers under kb_base_dir).
+
+    The next search recreates the pipeline, e.g. after a KB was deleted or
+    rebuilt outside the pipeline, or after changing LLM/embedding settings.
+
+    Args:
+        provider: Only drop this provider's pipelines (None for all providers)
+        kb_base_dir: Only drop pipelines of this base directory (None for all)
+
+    Returns:
+        Number of pipelines dropped
+    """
+    base = str(Path(kb_base_dir).resolve()) if kb_base_dir else None
+    with _PIPELINES_LOCK:
+        stale = [
+            key
+            for key in _PIPELINES
+            if (provider is None or key[0] == provider) and (base is None or key[1] == base)
+        ]
+        for key in stale:
+            del _PIPELINES[key]
+    with _KB_PROVIDERS_LOCK:
+        if base is None:
+            _KB_PROVIDERS.clear()
+        else:
+            for path in [p for p in _KB_PROVIDERS if Path(p).parent.parent == Path(base)]:
+                del _KB_PROVIDERS[path]
+    return len(stale)
+
+
+def list_shared_pipelines() -> List[Dict[str, str]]:
+    """
+    List the live shared pipeline instances.
+
+    Returns:
+        List of {"provider", "kb_base_dir"} dictionaries
+    """
+    with _PIPELINES_LOCK:
+        return [{"provider": p, "kb_base_dir": d} for p, d in _PIPELINES]
+
 
 class RAGService:
     """
@@ -59,13 +148,10 @@ class RAGService:
         self.logger = get_logger("RAGService")
         self.kb_base_dir = kb_base_dir or DEFAULT_KB_BASE_DIR
         self.provider = provider or os.getenv("RAG_PROVIDER", "raganything")
-        self._pipeline = None
 
-    def _get_pipeline(self):
-        """Get or create pipeline instance."""
-        if self._pipeline is None:
-            self._pipeline = get_pipeline(self.provider, kb_base_dir=self.kb_base_dir)
-        return self._pipeline
+    def _get_pipeline(self, provider: Optional[str] = None):
+        """Get the shared pipeline instance for a provider (default: instance provider)."""
+        return get_shared_pipeline(provider or self.provider, self.kb_base_dir)
 
     async def initialize(self, kb_name: str, file_paths: List[str], **kwargs) -> bool:
         """
@@ -120,11 +206,77 @@ class RAGService:
         )
 
         # Get pipeline for the specific provider
-        pipeline = get_pipeline(provider, kb_base_dir=self.kb_base_dir)
+        pipeline = self._get_pipeline(provider)
 
         result = await pipeline.search(query=query, kb_name=kb_name, mode=mode, **kwargs)
 
-        # Ensure consistent return format
+        return self._normalize_result(result, query, mode, provider)
+
+    async def search_many(
+        self, queries: List[str], kb_name: str, mode: str = "hybrid", **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Search a knowledge base with several queries at once.
+
+        Duplicate queries are searched once. Pipelines exposing ``search_many``
+        embed and score the whole batch together; others are searched
+        concurrently query by query.
+
+        Args:
+            queries: Search queries
+            kb_name: Knowledge base name
+            mode: Search mode (hybrid, local, global, naive)
+            **kwargs: Additional arguments passed to pipeline
+
+        Returns:
+            One search results dictionary per query (same keys as ``search``),
+            in input order
+
+        Example:
+            service = RAGService()
+            results = await service.search_many(["What is ML?", "What is AI?"], "textbook")
+        """
+        if not queries:
+            return []
+
+        provider = self._get_provider_for_kb(kb_name)
+        unique = list(dict.fromkeys(queries))
+
+        self.logger.info(
+            f"Searching KB '{kb_name}' with provider '{provider}': "
+            f"{len(queries)} queries ({len(unique)} unique)"
+        )
+
+        pipeline = self._get_pipeline(provider)
+
+        if hasattr(pipeline, "search_many"):
+            results = await pipeline.search_many(unique, kb_name=kb_name, mode=mode, **kwargs)
+        else:
+            results = await asyncio.gather(
+                *(
+                    pipeline.search(query=query, kb_name=kb_name, mode=mode, **kwargs)
+                    for query in unique
+                )
+            )
+
+        by_query = {
+            query: self._normalize_result(result, query, mode, provider)
+            for query, result in zip(unique, results)
+        }
+        # Duplicates get their own copy so callers can mutate results independently
+        seen = set()
+        ordered = []
+        for query in queries:
+            result = by_query[query]
+            ordered.append(dict(result) if query in seen else result)
+            seen.add(query)
+        return ordered
+
+    @staticmethod
+    def _normalize_result(
+        result: Dict[str, Any], query: str, mode: str, provider: str
+    ) -> Dict[str, Any]:
+        """Ensure a pipeline result has the consistent search return format."""
         if "query" not in result:
             result["query"] = query
         if "answer" not in result and "content" in result:
@@ -138,38 +290,76 @@ class RAGService:
 
         return result
 
+    async def warmup(self, kb_name: str) -> bool:
+        """
+        Preload a knowledge base so the first search does not pay load latency.
+
+        Creates the KB's shared pipeline; pipelines exposing a ``warmup`` method
+        (e.g. LlamaIndex) also load the KB's index.
+
+        Args:
+            kb_name: Knowledge base name
+
+        Returns:
+            True if the pipeline preloaded the KB
+        """
+        provider = self._get_provider_for_kb(kb_name)
+        pipeline = self._get_pipeline(provider)
+
+        if not hasattr(pipeline, "warmup"):
+            self.logger.debug(f"Provider '{provider}' has no warmup, skipping KB '{kb_name}'")
+            return False
+
+        return await pipeline.warmup(kb_name)
+
     def _get_provider_for_kb(self, kb_name: str) -> str:
         """
         Get the RAG provider for a specific knowledge base from its metadata.
         Falls back to instance provider or env var if not found in metadata.
 
+        The metadata is read once and re-read only when metadata.json changes.
+
         Args:
             kb_name: Knowledge base name
 
         Returns:
             Provider name (e.g., 'llamaindex', 'lightrag', 'raganything')
         """
+        metadata_file = Path(self.kb_base_dir) / kb_name / "metadata.json"
+        key = str(metadata_file.resolve())
+
         try:
-            metadata_file = Path(self.kb_base_dir) / kb_name / "metadata.json"
-
-            if metadata_file.exists():
-                with open(metadata_file, encoding="utf-8") as f:
-                    metadata = json.load(f)
-                    provider = metadata.get("rag_provider")
-                    if provider:
-                        self.logger.info(f"Using provider '{provider}' from KB metadata")
-                        return provider
-
-            # Fallback to instance provider
-            self.logger.info(f"No provider in metadata, using instance provider: {self.provider}")
+            stat = metadata_file.stat()
+        except OSError:
+            with _KB_PROVIDERS_LOCK:
+                _KB_PROVIDERS.pop(key, None)
+            self.logger.debug(f"No metadata for KB '{kb_name}', using instance provider")
             return self.provider
+        signature = (stat.st_mtime_ns, stat.st_size)
 
+        with _KB_PROVIDERS_LOCK:
+            cached = _KB_PROVIDERS.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1] or self.provider
+
+        try:
+            with open(metadata_file, encoding="utf-8") as f:
+                provider = json.load(f).get("rag_provider") or None
         except Exception as e:
             self.logger.warning(
                 f"Error reading provider from metadata: {e}, using instance provider"
             )
             return self.provider
 
+        with _KB_PROVIDERS_LOCK:
+            _KB_PROVIDERS[key] = (signature, provider)
+        if provider:
+            self.logger.info(f"Using provider '{provider}' from KB metadata")
+            return provider
+
+        self.logger.info(f"No provider in metadata, using instance provider: {self.provider}")
+        return self.provider
+
     async def delete(self, kb_name: str) -> bool:
         """
         Delete a knowledge base.
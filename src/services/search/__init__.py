@@ -10,6 +10,9 @@ Usage:
     # Simple usage (uses config/main.yaml or SEARCH_PROVIDER env var)
     result = web_search("What is AI?")
 
+    # Inside a coroutine (does not block the event loop)
+    result = await aweb_search("What is AI?")
+
     # Specify provider
     result = web_search("What is AI?", provider="tavily")
 
@@ -35,6 +38,7 @@ Environment Variables:
     - SEARCH_API_KEY: Unified API key for all providers
 """
 
+import asyncio
 from datetime import datetime
 import json
 import os
@@ -45,6 +49,7 @@ from src.logging import get_logger
 from src.services.config import PROJECT_ROOT, load_config_with_main
 
 from .base import SEARCH_API_KEY_ENV, BaseSearchProvider
+from .cache import SearchCache, get_search_cache, reset_search_cache
 from .consolidation import CONSOLIDATION_TYPES, PROVIDER_TEMPLATES, AnswerConsolidator
 from .providers import (
     get_available_providers,
@@ -59,19 +64,37 @@ from .types import Citation, SearchResult, WebSearchResponse
 _logger = get_logger("Search", level="INFO")
 
 
+# (mtime of config/main.yaml, tools.web_search section) of the last load
+_config_cache: tuple[int, dict[str, Any]] | None = None
+
+
 def _get_web_search_config() -> dict[str, Any]:
     """
     Load web search configuration from config/main.yaml using the standard config loader.
 
+    The section is re-read only when main.yaml changes, so searches started on
+    the event loop do not parse YAML each time.
+
     Returns:
         dict with web_search config from tools.web_search section
     """
+    global _config_cache
     try:
-        config = load_config_with_main("main.yaml", PROJECT_ROOT)
-        return config.get("tools", {}).get("web_search", {})
+        mtime = (PROJECT_ROOT / "config" / "main.yaml").stat().st_mtime_ns
+    except OSError:
+        mtime = -1
+    if _config_cache is not None and _config_cache[0] == mtime:
+        return _config_cache[1]
+
+    config: dict[str, Any] = {}
+    try:
+        config = (
+            load_config_with_main("main.yaml", PROJECT_ROOT).get("tools", {}).get("web_search", {})
+        )
     except Exception as e:
         _logger.debug(f"Could not load config: {e}")
-    return {}
+    _config_cache = (mtime, config)
+    return config
 
 
 def _save_results(result: dict[str, Any], output_dir: str, provider: str) -> str:
@@ -89,6 +112,145 @@ def _save_results(result: dict[str, Any], output_dir: str, provider: str) -> str
     return str(file_path)
 
 
+def _resolve_search(
+    query: str,
+    provider: str | None,
+    consolidation: str | None,
+    consolidation_custom_template: str | None,
+    consolidation_llm_model: str | None,
+    baidu_model: str,
+    baidu_enable_deep_search: bool,
+    baidu_search_recency_filter: str,
+    provider_kwargs: dict[str, Any],
+) -> dict[str, Any] | None:
+    """
+    Resolve provider, consolidation and options of a search from args and config.
+
+    Returns:
+        Search plan, or None when web search is disabled
+    """
+    # Load config from main.yaml
+    config = _get_web_search_config()
+
+    # Check if web_search is enabled (default: True)
+    if not config.get("enabled", True):
+        _logger.warning("Web search is disabled in config")
+        return None
+
+    # Determine provider: function arg > env var > config > default
+    provider_name = (
+        provider or os.environ.get("SEARCH_PROVIDER") or config.get("provider") or "perplexity"
+    ).lower()
+
+    # Determine consolidation from config if not provided
+    if consolidation is None:
+        consolidation = config.get("consolidation")
+
+    # Determine custom template from config if not provided
+    if consolidation_custom_template is None:
+        consolidation_custom_template = config.get("consolidation_template") or None
+
+    # Handle legacy Baidu params
+    if provider_name == "baidu":
+        provider_kwargs.setdefault("model", baidu_model)
+        provider_kwargs.setdefault("enable_deep_search", baidu_enable_deep_search)
+        provider_kwargs.setdefault("search_recency_filter", baidu_search_recency_filter)
+
+    # Get provider instance
+    search_provider = get_provider(provider_name)
+
+    # Consolidation only applies to SERP providers without LLM answers
+    if search_provider.supports_answer:
+        consolidation = None
+
+    cache = get_search_cache(config)
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.make_key(
+            provider_name,
+            query,
+            {
+                "provider_kwargs": provider_kwargs,
+                "consolidation": consolidation,
+                "consolidation_template": consolidation_custom_template,
+                "consolidation_llm_model": consolidation_llm_model,
+            },
+        )
+
+    return {
+        "provider_name": provider_name,
+        "search_provider": search_provider,
+        "provider_kwargs": provider_kwargs,
+        "consolidation": consolidation,
+        "consolidation_template": consolidation_custom_template,
+        "consolidation_llm_model": consolidation_llm_model,
+        "cache": cache,
+        "cache_key": cache_key,
+    }
+
+
+def _disabled_result(query: str) -> dict[str, Any]:
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "query": query,
+        "answer": "Web search is disabled.",
+        "citations": [],
+        "search_results": [],
+        "provider": "disabled",
+    }
+
+
+def _cached_result(plan: dict[str, Any], query: str) -> dict[str, Any] | None:
+    if plan["cache"] is None:
+        return None
+    result = plan["cache"].get(plan["cache_key"])
+    if result is not None:
+        _logger.info(f"[{plan['search_provider'].name}] Cache hit: {query[:50]}...")
+    return result
+
+
+def _consolidator(plan: dict[str, Any]) -> AnswerConsolidator | None:
+    if not plan["consolidation"]:
+        return None
+    llm_config = {}
+    if plan["consolidation_llm_model"]:
+        llm_config["model"] = plan["consolidation_llm_model"]
+
+    return AnswerConsolidator(
+        consolidation_type=plan["consolidation"],
+        custom_template=plan["consolidation_template"],
+        llm_config=llm_config if llm_config else None,
+    )
+
+
+def _finish_search(
+    plan: dict[str, Any],
+    query: str,
+    result: dict[str, Any],
+    output_dir: str | None,
+    verbose: bool,
+    cached: bool,
+) -> dict[str, Any]:
+    """Cache, save and log a search result."""
+    if not cached and plan["cache"] is not None:
+        plan["cache"].put(plan["cache_key"], result)
+
+    # Save if output_dir provided
+    if output_dir:
+        output_path = _save_results(result, output_dir, plan["provider_name"])
+        result["result_file"] = output_path
+        _logger.debug(f"Search results saved to: {output_path}")
+
+    if verbose:
+        answer = result.get("answer", "")
+        _logger.info(f"Query: {query}")
+        if answer:
+            _logger.info(f"Answer: {answer[:200]}..." if len(answer) > 200 else f"Answer: {answer}")
+        _logger.info(f"Citations: {len(result.get('citations', []))}")
+
+    return result
+
+
 def web_search(
     query: str,
     output_dir: str | None = None,
@@ -107,6 +269,9 @@ def web_search(
     """
     Perform web search using configured provider.
 
+    Blocks for the whole provider round trip; coroutines should use aweb_search.
+    Results are cached per (provider, normalized query, options), see cache.py.
+
     Args:
         query: Search query.
         output_dir: Output directory for saving results (optional).
@@ -139,83 +304,111 @@ def web_search(
         >>> print(result["citations"])
         [{"id": 1, "url": "https://...", "title": "...", ...}]
     """
-    # Load config from main.yaml
-    config = _get_web_search_config()
-
-    # Check if web_search is enabled (default: True)
-    if not config.get("enabled", True):
-        _logger.warning("Web search is disabled in config")
-        return {
-            "timestamp": datetime.now().isoformat(),
-            "query": query,
-            "answer": "Web search is disabled.",
-            "citations": [],
-            "search_results": [],
-            "provider": "disabled",
-        }
-
-    # Determine provider: function arg > env var > config > default
-    provider_name = (
-        provider or os.environ.get("SEARCH_PROVIDER") or config.get("provider") or "perplexity"
-    ).lower()
-
-    # Determine consolidation from config if not provided
-    if consolidation is None:
-        consolidation = config.get("consolidation")
-
-    # Determine custom template from config if not provided
-    if consolidation_custom_template is None:
-        consolidation_custom_template = config.get("consolidation_template") or None
-
-    # Handle legacy Baidu params
-    if provider_name == "baidu":
-        provider_kwargs.setdefault("model", baidu_model)
-        provider_kwargs.setdefault("enable_deep_search", baidu_enable_deep_search)
-        provider_kwargs.setdefault("search_recency_filter", baidu_search_recency_filter)
+    plan = _resolve_search(
+        query,
+        provider,
+        consolidation,
+        consolidation_custom_template,
+        consolidation_llm_model,
+        baidu_model,
+        baidu_enable_deep_search,
+        baidu_search_recency_filter,
+        provider_kwargs,
+    )
+    if plan is None:
+        return _disabled_result(query)
 
-    # Get provider instance
-    search_provider = get_provider(provider_name)
+    result = _cached_result(plan, query)
+    if result is not None:
+        return _finish_search(plan, query, result, output_dir, verbose, cached=True)
 
+    search_provider = plan["search_provider"]
     _logger.progress(f"[{search_provider.name}] Searching: {query[:50]}...")
 
     # Execute search
     try:
-        response = search_provider.search(query, **provider_kwargs)
+        response = search_provider.search(query, **plan["provider_kwargs"])
         _logger.success(f"[{search_provider.name}] Search completed")
     except Exception as e:
         _logger.error(f"[{search_provider.name}] Search failed: {e}")
         raise Exception(f"{search_provider.name} search failed: {e}") from e
 
     # Apply consolidation for SERP providers without LLM answers
-    if consolidation and not search_provider.supports_answer:
-        llm_config = {}
-        if consolidation_llm_model:
-            llm_config["model"] = consolidation_llm_model
-
-        consolidator = AnswerConsolidator(
-            consolidation_type=consolidation,
-            custom_template=consolidation_custom_template,
-            llm_config=llm_config if llm_config else None,
-        )
+    consolidator = _consolidator(plan)
+    if consolidator is not None:
         response = consolidator.consolidate(response)
 
     # Convert to dict (backward compatible format)
-    result = response.to_dict()
+    return _finish_search(plan, query, response.to_dict(), output_dir, verbose, cached=False)
 
-    # Save if output_dir provided
-    if output_dir:
-        output_path = _save_results(result, output_dir, provider_name)
-        result["result_file"] = output_path
-        _logger.debug(f"Search results saved to: {output_path}")
 
-    if verbose:
-        answer = result.get("answer", "")
-        _logger.info(f"Query: {query}")
-        if answer:
-            _logger.info(f"Answer: {answer[:200]}..." if len(answer) > 200 else f"Answer: {answer}")
-        _logger.info(f"Citations: {len(result.get('citations', []))}")
+async def aweb_search(
+    query: str,
+    output_dir: str | None = None,
+    verbose: bool = False,
+    provider: str | None = None,
+    consolidation: str | None = None,
+    consolidation_custom_template: str | None = None,
+    consolidation_llm_model: str | None = None,
+    baidu_model: str = "ernie-4.5-turbo-32k",
+    baidu_enable_deep_search: bool = False,
+    baidu_search_recency_filter: str = "week",
+    **provider_kwargs: Any,
+) -> dict[str, Any]:
+    """
+    Async variant of web_search for use inside coroutines.
 
-    return result
+    HTTP providers run on the shared pooled aiohttp sessions; SDK-based providers
+    (perplexity) and LLM consolidation run in a worker thread. Arguments, result
+    format and caching are the same as web_search.
+
+    Example:
+        >>> result = await aweb_search("What is machine learning?")
+    """
+    plan = _resolve_search(
+        query,
+        provider,
+        consolidation,
+        consolidation_custom_template,
+        consolidation_llm_model,
+        baidu_model,
+        baidu_enable_deep_search,
+        baidu_search_recency_filter,
+        provider_kwargs,
+    )
+    if plan is None:
+        return _disabled_result(query)
+
+    # A persistent cache reads SQLite, which must not block the event loop
+    if plan["cache"] is not None and plan["cache"].path is not None:
+        result = await asyncio.to_thread(_cached_result, plan, query)
+    else:
+        result = _cached_result(plan, query)
+    if result is not None:
+        return await asyncio.to_thread(
+            _finish_search, plan, query, result, output_dir, verbose, True
+        )
+
+    search_provider = plan["search_provider"]
+    _logger.progress(f"[{search_provider.name}] Searching: {query[:50]}...")
+
+    try:
+        response = await search_provider.asearch(query, **plan["provider_kwargs"])
+        _logger.success(f"[{search_provider.name}] Search completed")
+    except Exception as e:
+        _logger.error(f"[{search_provider.name}] Search failed: {e}")
+        raise Exception(f"{search_provider.name} search failed: {e}") from e
+
+    consolidator = _consolidator(plan)
+    if consolidator is not None:
+        if consolidator.consolidation_type == "llm":
+            response = await asyncio.to_thread(consolidator.consolidate, response)
+        else:
+            response = consolidator.consolidate(response)
+
+    return await asyncio.to_thread(
+        _finish_search, plan, query, response.to_dict(), output_dir, verbose, False
+    )
 
 
 def get_current_config() -> dict[str, Any]:
@@ -263,6 +456,7 @@ SearchProvider = BaseSearchProvider
 __all__ = [
     # Main function
     "web_search",
+    "aweb_search",
     "get_current_config",
     # Provider management
     "get_provider",
@@ -274,6 +468,10 @@ __all__ = [
     "WebSearchResponse",
     "Citation",
     "SearchResult",
+    # Result cache
+    "SearchCache",
+    "get_search_cache",
+    "reset_search_cache",
     # Consolidation
     "AnswerConsolidator",
     "CONSOLIDATION_TYPES",
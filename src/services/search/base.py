@@ -4,12 +4,24 @@ Web Search Base Provider - Abstract base class for all search providers
 
 This module defines the BaseSearchProvider class that all search providers must inherit from.
 All providers use a unified SEARCH_API_KEY environment variable.
+
+Providers that wrap an SDK implement search() and asearch() runs it in a worker
+thread. HTTP providers inherit from HTTPSearchProvider instead: they describe
+their call with build_request() and decode it with parse_response(), and the
+base class runs it either blocking (search) or on the pooled aiohttp sessions
+(asearch).
 """
 
 from abc import ABC, abstractmethod
+import asyncio
+from dataclasses import dataclass, field
+import json
 import os
 from typing import Any
 
+import aiohttp
+import requests
+
 from src.logging import get_logger
 
 from .types import WebSearchResponse
@@ -18,6 +30,30 @@ from .types import WebSearchResponse
 SEARCH_API_KEY_ENV = "SEARCH_API_KEY"
 
 
+@dataclass
+class SearchRequest:
+    """A provider HTTP call, independent of the client that sends it."""
+
+    method: str
+    url: str
+    headers: dict[str, str] = field(default_factory=dict)
+    json: dict[str, Any] | None = None
+    timeout: float = 60
+    # Request options parse_response() needs (mode, model, ...)
+    context: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SearchHTTPResponse:
+    """Status and body of a provider HTTP call."""
+
+    status_code: int
+    text: str
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
 class BaseSearchProvider(ABC):
     """Abstract base class for search providers.
 
@@ -68,6 +104,19 @@ class BaseSearchProvider(ABC):
         """
         pass
 
+    async def asearch(self, query: str, **kwargs: Any) -> WebSearchResponse:
+        """
+        Execute search without blocking the event loop.
+
+        Args:
+            query: The search query.
+            **kwargs: Provider-specific options.
+
+        Returns:
+            WebSearchResponse: Standardized search response.
+        """
+        return await asyncio.to_thread(self.search, query, **kwargs)
+
     def is_available(self) -> bool:
         """
         Check if provider is available (dependencies installed, API key set).
@@ -85,4 +134,96 @@ class BaseSearchProvider(ABC):
             return False
 
 
-__all__ = ["BaseSearchProvider", "SEARCH_API_KEY_ENV"]
+class HTTPSearchProvider(BaseSearchProvider):
+    """Base class for providers that are a single HTTP call.
+
+    Subclasses implement build_request() and parse_response(); search() sends
+    the request with requests and asearch() on the pooled aiohttp sessions.
+    """
+
+    @abstractmethod
+    def build_request(self, query: str, **kwargs: Any) -> SearchRequest:
+        """
+        Describe the HTTP call for a query.
+
+        Args:
+            query: The search query.
+            **kwargs: Provider-specific options.
+
+        Returns:
+            SearchRequest: Method, URL, headers, body and timeout of the call.
+        """
+        pass
+
+    @abstractmethod
+    def parse_response(
+        self, query: str, response: SearchHTTPResponse, request: SearchRequest
+    ) -> WebSearchResponse:
+        """
+        Convert the provider's HTTP response into a standardized response.
+
+        Args:
+            query: The search query.
+            response: Status and body returned by the provider.
+            request: The request that produced the response.
+
+        Returns:
+            WebSearchResponse: Standardized search response.
+        """
+        pass
+
+    def search(self, query: str, **kwargs: Any) -> WebSearchResponse:
+        """
+        Execute search and return standardized response.
+
+        Args:
+            query: The search query.
+            **kwargs: Provider-specific options.
+
+        Returns:
+            WebSearchResponse: Standardized search response.
+        """
+        request = self.build_request(query, **kwargs)
+        raw = requests.request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            json=request.json,
+            timeout=request.timeout,
+        )
+        return self.parse_response(query, SearchHTTPResponse(raw.status_code, raw.text), request)
+
+    async def asearch(self, query: str, **kwargs: Any) -> WebSearchResponse:
+        """
+        Execute search without blocking the event loop.
+
+        Args:
+            query: The search query.
+            **kwargs: Provider-specific options.
+
+        Returns:
+            WebSearchResponse: Standardized search response.
+        """
+        from src.services.llm.http_pool import get_session_pool
+
+        request = self.build_request(query, **kwargs)
+        session = get_session_pool().get_session(request.url)
+        async with session.request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            json=request.json,
+            timeout=aiohttp.ClientTimeout(total=request.timeout),
+        ) as resp:
+            text = await resp.text()
+            status = resp.status
+        return self.parse_response(query, SearchHTTPResponse(status, text), request)
+
+
+__all__ = [
+    "BaseSearchProvider",
+    "HTTPSearchProvider",
+    "SearchRequest",
+    "SearchHTTPResponse",
+    "SEARCH_API_KEY_ENV",
+]
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+Web Search Result Cache
+=======================
+
+TTL'd, size-bounded cache of web search results.
+
+Entries are keyed by sha256(provider, normalized query, options), so the same
+question asked again by research, solve or chat within the TTL is answered
+locally instead of paying for another provider round trip. Results live in an
+in-memory LRU; with persistence enabled they are also written to SQLite and
+survive restarts.
+
+Configuration (config/main.yaml, tools.web_search.cache):
+    enabled: Cache results (default: true)
+    ttl_seconds: Lifetime of a cached result (default: 3600)
+    max_entries: Entries kept in memory and on disk (default: 512)
+    persist: Also store results on disk (default: false)
+    path: SQLite file (default: data/user/cache/web_search.sqlite3)
+
+Usage:
+    from src.services.search.cache import get_search_cache
+
+    cache = get_search_cache(config)
+    key = cache.make_key(provider, query, options)
+    result = cache.get(key)
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from src.logging import get_logger
+from src.services.config import PROJECT_ROOT
+
+logger = get_logger("SearchCache", level="INFO")
+
+DEFAULT_CACHE_PATH = PROJECT_ROOT / "data" / "user" / "cache" / "web_search.sqlite3"
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 512
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace and case so trivially different queries share an entry."""
+    return " ".join(query.split()).casefold()
+
+
+class SearchCache:
+    """
+    LRU + TTL cache of search result dicts with optional SQLite persistence.
+
+    Thread-safe: sync web_search may run in worker threads next to aweb_search.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        path: Path | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of an entry
+            max_entries: Maximum number of entries kept
+            path: SQLite file for persistence (None keeps results in memory only)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, int(max_entries))
+        self.path = Path(path) if path else None
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(provider: str, query: str, options: dict[str, Any] | None = None) -> str:
+        """
+        Build the cache key of one search.
+
+        Args:
+            provider: Provider name
+            query: Search query (normalized before hashing)
+            options: Provider and consolidation options that change the result
+
+        Returns:
+            Hex sha256 digest
+        """
+        h = hashlib.sha256()
+        h.update(f"{provider}\x00{normalize_query(query)}\x00".encode("utf-8"))
+        h.update(json.dumps(options or {}, sort_keys=True, default=str).encode("utf-8"))
+        return h.hexdigest()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self.path is None:
+            return None
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_results ("
+                " key TEXT PRIMARY KEY,"
+                " result TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute("DELETE FROM search_results WHERE expires_at <= ?", (time.time(),))
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            A copy of the cached result, or None when missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._load(key)
+            if entry is not None and entry[0] <= now:
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._trim()
+            self.hits += 1
+            return json.loads(json.dumps(entry[1]))
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """
+        Store a result, evicting least recently used entries beyond max_entries.
+
+        Args:
+            key: Key from make_key()
+            result: JSON-serializable search result
+        """
+        expires_at = time.time() + self.ttl_seconds
+        payload = json.dumps(result, ensure_ascii=False, default=str)
+        with self._lock:
+            self._entries[key] = (expires_at, json.loads(payload))
+            self._entries.move_to_end(key)
+            conn = self._connect()
+            if conn is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_results (key, result, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, payload, expires_at),
+                )
+                conn.commit()
+            self._trim()
+
+    def _load(self, key: str) -> tuple[float, dict[str, Any]] | None:
+        conn = self._connect()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT expires_at, result FROM search_results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return float(row[0]), json.loads(row[1])
+
+    def _drop(self, key: str) -> None:
+        self._entries.pop(key, None)
+        conn = self._connect()
+        if conn is not None:
+            conn.execute("DELETE FROM search_results WHERE key = ?", (key,))
+            conn.commit()
+
+    def _trim(self) -> None:
+        """Evict least recently used entries beyond max_entries."""
+        evicted = []
+        while len(self._entries) > self.max_entries:
+            key, _ = self._entries.popitem(last=False)
+            evicted.append(key)
+        conn = self._connect()
+        if conn is None:
+            return
+        if evicted:
+            conn.executemany("DELETE FROM search_results WHERE key = ?", [(k,) for k in evicted])
+        # The disk table also holds entries never loaded into memory this run
+        (count,) = conn.execute("SELECT COUNT(*) FROM search_results").fetchone()
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM search_results WHERE key IN ("
+                " SELECT key FROM search_results ORDER BY expires_at ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+        conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        with self._lock:
+            self._entries.clear()
+            conn = self._connect()
+            if conn is not None:
+                conn.execute("DELETE FROM search_results")
+                conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "path": str(self.path) if self.path else None,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Singleton instance
+_cache: SearchCache | None = None
+
+
+def get_search_cache(config: dict[str, Any] | None = None) -> SearchCache | None:
+    """
+    Get or create the process-wide search cache.
+
+    Args:
+        config: tools.web_search section of the main config
+
+    Returns:
+        SearchCache, or None when disabled via tools.web_search.cache.enabled
+    """
+    global _cache
+    settings = (config or {}).get("cache") or {}
+    if not settings.get("enabled", True):
+        return None
+    if _cache is None:
+        path = None
+        if settings.get("persist", False):
+            path = Path(settings.get("path") or DEFAULT_CACHE_PATH)
+            if not path.is_absolute():
+                path = PROJECT_ROOT / path
+        _cache = SearchCache(
+            ttl_seconds=float(settings.get("ttl_seconds", DEFAULT_TTL_SECONDS)),
+            max_entries=int(settings.get("max_entries", DEFAULT_MAX_ENTRIES)),
+            path=path,
+        )
+    return _cache
+
+
+def reset_search_cache() -> None:
+    """Close and reset the singleton cache."""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+    _cache = None
+
+
+__all__ = [
+    "SearchCache",
+    "get_search_cache",
+    "normalize_query",
+    "reset_search_cache",
+]
@@ -15,15 +15,13 @@ Features:
 from datetime import datetime
 from typing import Any
 
-import requests
-
-from ..base import BaseSearchProvider
+from ..base import HTTPSearchProvider, SearchHTTPResponse, SearchRequest
 from ..types import Citation, SearchResult, WebSearchResponse
 from . import register_provider
 
 
 @register_provider("baidu")
-class BaiduProvider(BaseSearchProvider):
+class BaiduProvider(HTTPSearchProvider):
     """Baidu AI Search provider"""
 
     display_name = "Baidu AI"
@@ -31,7 +29,7 @@ class BaiduProvider(BaseSearchProvider):
     supports_answer = True
     BASE_URL = "https://qianfan.baidubce.com/v2/ai_search/chat/completions"
 
-    def search(
+    def build_request(
         self,
         query: str,
         model: str = "ernie-4.5-turbo-32k",
@@ -46,9 +44,9 @@ class BaiduProvider(BaseSearchProvider):
         instruction: str = "",
         timeout: int = 120,
         **kwargs: Any,
-    ) -> WebSearchResponse:
+    ) -> SearchRequest:
         """
-        Perform intelligent search using Baidu AI Search API.
+        Build the request for intelligent search using Baidu AI Search API.
 
         Args:
             query: Search query.
@@ -66,7 +64,7 @@ class BaiduProvider(BaseSearchProvider):
             **kwargs: Additional options.
 
         Returns:
-            WebSearchResponse: Standardized search response.
+            SearchRequest: The API call for the query.
         """
         self.logger.debug(f"Calling Baidu API with model={model}, deep_search={enable_deep_search}")
         headers = {
@@ -95,7 +93,20 @@ class BaiduProvider(BaseSearchProvider):
         if instruction:
             payload["instruction"] = instruction
 
-        response = requests.post(self.BASE_URL, headers=headers, json=payload, timeout=timeout)
+        return SearchRequest(
+            method="POST",
+            url=self.BASE_URL,
+            headers=headers,
+            json=payload,
+            timeout=timeout,
+            context={"model": model},
+        )
+
+    def parse_response(
+        self, query: str, response: SearchHTTPResponse, request: SearchRequest
+    ) -> WebSearchResponse:
+        """Convert a Baidu API response into a standardized response."""
+        model = request.context["model"]
 
         if response.status_code != 200:
             try:
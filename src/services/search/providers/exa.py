@@ -23,15 +23,13 @@ Pricing:
 from datetime import datetime
 from typing import Any
 
-import requests
-
-from ..base import BaseSearchProvider
+from ..base import HTTPSearchProvider, SearchHTTPResponse, SearchRequest
 from ..types import Citation, SearchResult, WebSearchResponse
 from . import register_provider
 
 
 @register_provider("exa")
-class ExaProvider(BaseSearchProvider):
+class ExaProvider(HTTPSearchProvider):
     """Exa neural/embeddings-based search provider"""
 
     display_name = "Exa"
@@ -39,7 +37,7 @@ class ExaProvider(BaseSearchProvider):
     supports_answer = True  # Provides summaries and context
     BASE_URL = "https://api.exa.ai/search"
 
-    def search(
+    def build_request(
         self,
         query: str,
         search_type: str = "auto",  # auto, neural, keyword
@@ -55,9 +53,9 @@ class ExaProvider(BaseSearchProvider):
         end_published_date: str | None = None,
         timeout: int = 60,
         **kwargs: Any,
-    ) -> WebSearchResponse:
+    ) -> SearchRequest:
         """
-        Perform neural search using Exa API.
+        Build the request for neural search using Exa API.
 
         Args:
             query: Search query.
@@ -76,7 +74,7 @@ class ExaProvider(BaseSearchProvider):
             **kwargs: Additional options.
 
         Returns:
-            WebSearchResponse: Standardized search response.
+            SearchRequest: The API call for the query.
         """
         self.logger.debug(f"Calling Exa API type={search_type}, num_results={num_results}")
         headers = {
@@ -111,7 +109,20 @@ class ExaProvider(BaseSearchProvider):
         if end_published_date:
             payload["endPublishedDate"] = end_published_date
 
-        response = requests.post(self.BASE_URL, headers=headers, json=payload, timeout=timeout)
+        return SearchRequest(
+            method="POST",
+            url=self.BASE_URL,
+            headers=headers,
+            json=payload,
+            timeout=timeout,
+            context={"search_type": search_type},
+        )
+
+    def parse_response(
+        self, query: str, response: SearchHTTPResponse, request: SearchRequest
+    ) -> WebSearchResponse:
+        """Convert a Exa API response into a standardized response."""
+        search_type = request.context["search_type"]
 
         if response.status_code != 200:
             try:
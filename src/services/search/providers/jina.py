@@ -20,15 +20,13 @@ from datetime import datetime
 from typing import Any
 import urllib.parse
 
-import requests
-
-from ..base import BaseSearchProvider
+from ..base import HTTPSearchProvider, SearchHTTPResponse, SearchRequest
 from ..types import Citation, SearchResult, WebSearchResponse
 from . import register_provider
 
 
 @register_provider("jina")
-class JinaProvider(BaseSearchProvider):
+class JinaProvider(HTTPSearchProvider):
     """Jina Reader search provider"""
 
     display_name = "Jina"
@@ -37,15 +35,15 @@ class JinaProvider(BaseSearchProvider):
     requires_api_key = False  # Has free tier without API key
     BASE_URL = "https://s.jina.ai"
 
-    def search(
+    def build_request(
         self,
         query: str,
         enrich: bool = True,
         timeout: int = 60,
         **kwargs: Any,
-    ) -> WebSearchResponse:
+    ) -> SearchRequest:
         """
-        Perform web search using Jina Reader API.
+        Build the request for web search using Jina Reader API.
 
         Args:
             query: Search query.
@@ -54,7 +52,7 @@ class JinaProvider(BaseSearchProvider):
             **kwargs: Additional options.
 
         Returns:
-            WebSearchResponse: Standardized search response.
+            SearchRequest: The API call for the query.
         """
         headers: dict[str, str] = {
             "Accept": "application/json",
@@ -76,8 +74,12 @@ class JinaProvider(BaseSearchProvider):
         encoded_query = urllib.parse.quote(query)
         url = f"{self.BASE_URL}/{encoded_query}"
 
-        response = requests.get(url, headers=headers, timeout=timeout)
+        return SearchRequest(method="GET", url=url, headers=headers, timeout=timeout)
 
+    def parse_response(
+        self, query: str, response: SearchHTTPResponse, request: SearchRequest
+    ) -> WebSearchResponse:
+        """Convert a Jina API response into a standardized response."""
         if response.status_code != 200:
             self.logger.error(f"Jina API error: {response.status_code}")
             raise Exception(f"Jina API error: {response.status_code} - {response.text}")
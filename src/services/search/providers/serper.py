@@ -18,9 +18,7 @@ from datetime import datetime
 import json
 from typing import Any
 
-import requests
-
-from ..base import BaseSearchProvider
+from ..base import HTTPSearchProvider, SearchHTTPResponse, SearchRequest
 from ..types import Citation, SearchResult, WebSearchResponse
 from . import register_provider
 
@@ -32,7 +30,7 @@ class SerperAPIError(Exception):
 
 
 @register_provider("serper")
-class SerperProvider(BaseSearchProvider):
+class SerperProvider(HTTPSearchProvider):
     """Serper Google SERP provider"""
 
     display_name = "Serper"
@@ -40,7 +38,7 @@ class SerperProvider(BaseSearchProvider):
     supports_answer = False  # Raw SERP results, no LLM answer
     BASE_URL = "https://google.serper.dev"
 
-    def search(
+    def build_request(
         self,
         query: str,
         mode: str = "search",  # search, scholar
@@ -51,9 +49,9 @@ class SerperProvider(BaseSearchProvider):
         autocorrect: bool = True,
         timeout: int = 30,
         **kwargs: Any,
-    ) -> WebSearchResponse:
+    ) -> SearchRequest:
         """
-        Perform Google SERP search using Serper API.
+        Build the request for Google SERP search using Serper API.
 
         Args:
             query: Search query.
@@ -67,7 +65,7 @@ class SerperProvider(BaseSearchProvider):
             **kwargs: Additional options.
 
         Returns:
-            WebSearchResponse: Standardized search response.
+            SearchRequest: The API call for the query.
         """
         self.logger.debug(f"Calling Serper API mode={mode}, num={num}")
         headers = {
@@ -84,8 +82,20 @@ class SerperProvider(BaseSearchProvider):
             "autocorrect": autocorrect,
         }
 
-        url = f"{self.BASE_URL}/{mode}"
-        response = requests.post(url, headers=headers, json=payload, timeout=timeout)
+        return SearchRequest(
+            method="POST",
+            url=f"{self.BASE_URL}/{mode}",
+            headers=headers,
+            json=payload,
+            timeout=timeout,
+            context={"mode": mode},
+        )
+
+    def parse_response(
+        self, query: str, response: SearchHTTPResponse, request: SearchRequest
+    ) -> WebSearchResponse:
+        """Convert a Serper API response into a standardized response."""
+        mode = request.context["mode"]
 
         if response.status_code != 200:
             try:
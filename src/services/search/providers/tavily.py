@@ -17,15 +17,13 @@ from datetime import datetime
 import json
 from typing import Any
 
-import requests
-
-from ..base import BaseSearchProvider
+from ..base import HTTPSearchProvider, SearchHTTPResponse, SearchRequest
 from ..types import Citation, SearchResult, WebSearchResponse
 from . import register_provider
 
 
 @register_provider("tavily")
-class TavilyProvider(BaseSearchProvider):
+class TavilyProvider(HTTPSearchProvider):
     """Tavily research-focused search provider"""
 
     name = "tavily"
@@ -34,7 +32,7 @@ class TavilyProvider(BaseSearchProvider):
     supports_answer = True
     BASE_URL = "https://api.tavily.com/search"
 
-    def search(
+    def build_request(
         self,
         query: str,
         search_depth: str = "basic",  # basic, advanced
@@ -48,9 +46,9 @@ class TavilyProvider(BaseSearchProvider):
         exclude_domains: list[str] | None = None,
         timeout: int = 60,
         **kwargs: Any,
-    ) -> WebSearchResponse:
+    ) -> SearchRequest:
         """
-        Perform research-focused search using Tavily API.
+        Build the request for research-focused search using Tavily API.
 
         Args:
             query: Search query.
@@ -67,7 +65,7 @@ class TavilyProvider(BaseSearchProvider):
             **kwargs: Additional options.
 
         Returns:
-            WebSearchResponse: Standardized search response.
+            SearchRequest: The API call for the query.
         """
         self.logger.debug(f"Calling Tavily API depth={search_depth}, max_results={max_results}")
         payload: dict[str, Any] = {
@@ -88,7 +86,20 @@ class TavilyProvider(BaseSearchProvider):
         if exclude_domains:
             payload["exclude_domains"] = exclude_domains
 
-        response = requests.post(self.BASE_URL, json=payload, timeout=timeout)
+        return SearchRequest(
+            method="POST",
+            url=self.BASE_URL,
+            json=payload,
+            timeout=timeout,
+            context={"search_depth": search_depth, "topic": topic},
+        )
+
+    def parse_response(
+        self, query: str, response: SearchHTTPResponse, request: SearchRequest
+    ) -> WebSearchResponse:
+        """Convert a Tavily API response into a standardized response."""
+        search_depth = request.context["search_depth"]
+        topic = request.context["topic"]
 
         if response.status_code != 200:
             try:
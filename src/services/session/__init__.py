@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+Session Service
+===============
+
+Persistent storage for chat and solver sessions.
+
+Usage:
+    from src.services.session import SessionStore
+"""
+
+from .store import SessionStore
+
+__all__ = ["SessionStore"]
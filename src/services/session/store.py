@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+Session Store
+=============
+
+SQLite storage for chat and solver sessions.
+
+Session fields live in one row per session, messages in one row per message,
+so appending a message is a single insert plus a summary update instead of a
+rewrite of every session, and listing reads only the summary rows. Writes run
+in IMMEDIATE transactions on a WAL database, so concurrent websocket handlers
+(and processes) serialize instead of overwriting each other's changes.
+
+A legacy JSON sessions file ({"version": ..., "sessions": [...]}) found next to
+an empty database is imported once and renamed to ``*.migrated``.
+
+Usage:
+    from src.services.session import SessionStore
+
+    store = SessionStore(db_path, legacy_json=json_path)
+    store.insert(session)
+    store.append_message(session_id, message)
+"""
+
+from contextlib import contextmanager
+import json
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from src.logging import get_logger
+
+logger = get_logger("SessionStore")
+
+# Characters of the last message kept in the summary row
+PREVIEW_LENGTH = 100
+
+
+class SessionStore:
+    """
+    SQLite-backed session storage.
+
+    Sessions are plain dicts; every key except ``messages`` is stored as session
+    data, so chat and solver sessions can carry different fields.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        legacy_json: str | Path | None = None,
+        max_sessions: int = 100,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: SQLite database file (created on first use)
+            legacy_json: Old JSON sessions file to import when the database is empty
+            max_sessions: Most recently updated sessions kept; older ones are dropped
+        """
+        self.db_path = Path(db_path)
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            " session_id TEXT PRIMARY KEY,"
+            " data TEXT NOT NULL,"
+            " message_count INTEGER NOT NULL DEFAULT 0,"
+            " last_message TEXT NOT NULL DEFAULT '',"
+            " created_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions(updated_at);"
+            "CREATE TABLE IF NOT EXISTS messages ("
+            " session_id TEXT NOT NULL,"
+            " seq INTEGER NOT NULL,"
+            " data TEXT NOT NULL,"
+            " PRIMARY KEY (session_id, seq));"
+        )
+        if legacy_json is not None:
+            self._migrate(Path(legacy_json))
+
+    @contextmanager
+    def _transaction(self):
+        """Serialize writers across threads (lock) and processes (BEGIN IMMEDIATE)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _preview(message: dict[str, Any]) -> str:
+        return str(message.get("content", ""))[:PREVIEW_LENGTH]
+
+    @staticmethod
+    def _dump(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False)
+
+    def _write_session(self, conn: sqlite3.Connection, session: dict[str, Any]) -> None:
+        messages = session.get("messages") or []
+        data = {k: v for k, v in session.items() if k != "messages"}
+        conn.execute(
+            "INSERT OR REPLACE INTO sessions "
+            "(session_id, data, message_count, last_message, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                session["session_id"],
+                self._dump(data),
+                len(messages),
+                self._preview(messages[-1]) if messages else "",
+                session.get("created_at", time.time()),
+                session.get("updated_at", time.time()),
+            ),
+        )
+        conn.execute("DELETE FROM messages WHERE session_id = ?", (session["session_id"],))
+        conn.executemany(
+            "INSERT INTO messages (session_id, seq, data) VALUES (?, ?, ?)",
+            [(session["session_id"], i, self._dump(m)) for i, m in enumerate(messages)],
+        )
+
+    def _trim(self, conn: sqlite3.Connection) -> None:
+        """Drop the least recently updated sessions beyond max_sessions."""
+        stale = [
+            row[0]
+            for row in conn.execute(
+                "SELECT session_id FROM sessions ORDER BY updated_at DESC LIMIT -1 OFFSET ?",
+                (self.max_sessions,),
+            )
+        ]
+        for session_id in stale:
+            conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def _migrate(self, legacy_json: Path) -> None:
+        """Import a legacy JSON sessions file into an empty database."""
+        if not legacy_json.exists():
+            return
+        try:
+            with open(legacy_json, encoding="utf-8") as f:
+                sessions = json.load(f).get("sessions", [])
+        except (json.JSONDecodeError, OSError, AttributeError) as e:
+            logger.warning(f"Skipping migration of {legacy_json}: {e}")
+            return
+
+        with self._transaction() as conn:
+            if conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]:
+                return
+            for session in sessions:
+                if isinstance(session, dict) and session.get("session_id"):
+                    self._write_session(conn, session)
+            self._trim(conn)
+
+        legacy_json.replace(legacy_json.with_name(legacy_json.name + ".migrated"))
+        logger.info(f"Migrated {len(sessions)} sessions from {legacy_json.name}")
+
+    def _read_session(self, conn: sqlite3.Connection, session_id: str) -> dict[str, Any] | None:
+        row = conn.execute(
+            "SELECT data FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        session = json.loads(row[0])
+        session["messages"] = [
+            json.loads(data)
+            for (data,) in conn.execute(
+                "SELECT data FROM messages WHERE session_id = ? ORDER BY seq", (session_id,)
+            )
+        ]
+        return session
+
+    @staticmethod
+    def _summary(data: dict[str, Any], count: int, last_message: str) -> dict[str, Any]:
+        return {**data, "message_count": count, "last_message": last_message}
+
+    def insert(self, session: dict[str, Any]) -> None:
+        """
+        Store a new session (or replace one with the same session_id).
+
+        Args:
+            session: Session dict with session_id, created_at, updated_at
+        """
+        with self._transaction() as conn:
+            self._write_session(conn, session)
+            self._trim(conn)
+
+    def get(self, session_id: str) -> dict[str, Any] | None:
+        """
+        Load a session with its messages.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Session dict or None if not found
+        """
+        with self._lock:
+            return self._read_session(self._conn, session_id)
+
+    def update(
+        self,
+        session_id: str,
+        fields: dict[str, Any],
+        messages: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Update session fields and optionally replace its messages.
+
+        Args:
+            session_id: Session identifier
+            fields: Session fields to set (updated_at is refreshed automatically)
+            messages: New messages list (replaces existing)
+
+        Returns:
+            Updated session (with messages if they were replaced, otherwise the
+            summary: session fields, message_count and last_message) or None if not found
+        """
+        with self._transaction() as conn:
+            if messages is not None:
+                session = self._read_session(conn, session_id)
+                if session is None:
+                    return None
+                session.update(fields, messages=messages, updated_at=time.time())
+                self._write_session(conn, session)
+                return session
+
+            # Field-only updates leave the message rows untouched
+            row = conn.execute(
+                "SELECT data, message_count, last_message FROM sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            data = {**json.loads(row[0]), **fields, "updated_at": time.time()}
+            conn.execute(
+                "UPDATE sessions SET data = ?, updated_at = ? WHERE session_id = ?",
+                (self._dump(data), data["updated_at"], session_id),
+            )
+            return self._summary(data, row[1], row[2])
+
+    def append_message(
+        self,
+        session_id: str,
+        message: dict[str, Any],
+        retitle: tuple[str, str] | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Append one message without rewriting the session's history.
+
+        Args:
+            session_id: Session identifier
+            message: Message dict
+            retitle: (default_title, new_title); the title is replaced only while it
+                still equals default_title
+
+        Returns:
+            Session summary (session fields, message_count and last_message; the
+            history is not loaded) or None if not found
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT data, message_count FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            data, count = json.loads(row[0]), row[1]
+            now = time.time()
+            data["updated_at"] = now
+            if retitle is not None and data.get("title") == retitle[0]:
+                data["title"] = retitle[1]
+
+            conn.execute(
+                "INSERT INTO messages (session_id, seq, data) VALUES (?, ?, ?)",
+                (session_id, count, self._dump(message)),
+            )
+            preview = self._preview(message)
+            conn.execute(
+                "UPDATE sessions SET data = ?, message_count = ?, last_message = ?, "
+                "updated_at = ? WHERE session_id = ?",
+                (self._dump(data), count + 1, preview, now, session_id),
+            )
+            return self._summary(data, count + 1, preview)
+
+    def list_summaries(self, limit: int = 20) -> list[dict[str, Any]]:
+        """
+        List recently updated sessions without loading their messages.
+
+        Args:
+            limit: Maximum number of sessions to return
+
+        Returns:
+            Session data dicts (newest first) with message_count and last_message
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data, message_count, last_message FROM sessions "
+                "ORDER BY updated_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [
+            self._summary(json.loads(data), count, last_message)
+            for data, count, last_message in rows
+        ]
+
+    def list_sessions(self, limit: int = 20) -> list[dict[str, Any]]:
+        """
+        List recently updated sessions with their messages.
+
+        Args:
+            limit: Maximum number of sessions to return
+
+        Returns:
+            Session dicts (newest first)
+        """
+        with self._lock:
+            ids = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT session_id FROM sessions ORDER BY updated_at DESC LIMIT ?", (limit,)
+                )
+            ]
+            return [s for s in (self._read_session(self._conn, i) for i in ids) if s]
+
+    def delete(self, session_id: str) -> bool:
+        """
+        Delete a session and its messages.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if deleted, False if not found
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            return (
+                conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,)).rowcount
+                > 0
+            )
+
+    def clear(self) -> int:
+        """
+        Delete all sessions.
+
+        Returns:
+            Number of sessions deleted
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM messages")
+            return conn.execute("DELETE FROM sessions").rowcount
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["SessionStore"]
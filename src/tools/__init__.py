@@ -55,9 +55,9 @@ except Exception as e:
     traceback.print_exc()
 
 from .code_executor import run_code, run_code_sync
-from .query_item_tool import query_numbered_item
+from .query_item_tool import query_numbered_item, query_numbered_items
 from .rag_tool import rag_search
-from .web_search import web_search
+from .web_search import aweb_search, web_search
 
 # Paper research related tools
 try:
@@ -69,7 +69,9 @@ try:
         "PaperSearchTool",
         "TexChunker",
         "TexDownloader",
+        "aweb_search",
         "query_numbered_item",
+        "query_numbered_items",
         "rag_search",
         "read_tex_file",
         "run_code",
@@ -80,7 +82,9 @@ except ImportError as e:
     # If import fails (e.g., missing tiktoken), only export basic tools
     print(f"⚠️  Some paper tools import failed: {e}")
     __all__ = [
+        "aweb_search",
         "query_numbered_item",
+        "query_numbered_items",
         "rag_search",
         "run_code",
         "run_code_sync",
@@ -2,147 +2,213 @@
 # -*- coding: utf-8 -*-
 """
 Query Numbered Item Tool - Query definitions, theorems, formulas, figures, etc.
+
+numbered_items.json is loaded once per knowledge base into a resident index
+(exact dict, case-insensitive dict, sorted keys for prefix queries such as
+"2.1" -> "(2.1.x)") and rebuilt only when the file changes on disk.
 """
 
+from bisect import bisect_left
 import json
 from pathlib import Path
 import sys
+import threading
+from typing import Any
 
 # Add parent directory to path (insert at front to prioritize project modules)
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+DEFAULT_MAX_RESULTS = 5
 
-def query_numbered_item(
-    identifier: str,
-    kb_name: str | None = None,
-    kb_base_dir: str | None = None,
-    max_results: int | None = None,
-) -> dict:
-    """
-    Query numbered item - Supports returning multiple matching results
+# (path) -> ((mtime_ns, size), value); values are rebuilt when the file stat changes
+_file_cache: dict[str, tuple[tuple[int, int], Any]] = {}
+_cache_lock = threading.Lock()
 
-    Args:
-        identifier: Identifier of the numbered item
-            - Definition/Theorem: e.g., "Definition 1.1", "Theorem 2.3"
-            - Formula: e.g., "(1.2.1)", "(2.3.5)"
-            - Figure: e.g., "Figure 1.1", "Figure 2.5"
-            - Example: e.g., "Example 1.1", "Remark 2.1"
-        kb_name: Knowledge base name (optional, defaults to default knowledge base)
-        kb_base_dir: Knowledge base base directory (optional, defaults to knowledge_bases under project root)
-        max_results: Maximum number of items to return (optional, defaults to config value or 5)
 
-    Returns:
-        dict: Dictionary containing query results
-            {
-                "identifier": str,  # Original query identifier
-                "type": str,  # formula/definition/theorem/lemma/figure/example/remark
-                "status": str,  # success/failed
-                "count": int,  # Number of matched items
-                "items": [  # List of all matched items (sorted by priority)
-                    {
-                        "identifier": str,  # Actual matched identifier
-                        "type": str,
-                        "content": str
-                    },
-                    ...
-                ],
-                "content": str,  # Backward compatible: single item content or merged content for multiple items
-                "error": str (only when failed)
-            }
+def _load_cached(path: Path, build):
     """
-    # Load configuration for max_results if not specified
-    if max_results is None:
-        try:
-            from src.services.config import load_config_with_main
+    Return build(path), reusing the previous result while the file is unchanged.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = str(path)
+    with _cache_lock:
+        entry = _file_cache.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+    value = build(path)
+    with _cache_lock:
+        _file_cache[key] = (signature, value)
+    return value
+
+
+def _read_json(path: Path) -> Any:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _load_max_results() -> int:
+    def build(path: Path) -> int:
+        from src.services.config import load_config_with_main
+
+        config = load_config_with_main("main.yaml", path.parent.parent)
+        return config.get("tools", {}).get("query_item", {}).get("max_results", DEFAULT_MAX_RESULTS)
+
+    try:
+        return _load_cached(project_root / "config" / "main.yaml", build)
+    except Exception:
+        return DEFAULT_MAX_RESULTS
+
+
+def _prefix_range(sorted_keys: list[tuple[str, int]], prefix: str) -> list[int]:
+    """Positions of all entries whose key starts with prefix."""
+    positions = []
+    i = bisect_left(sorted_keys, (prefix, -1))
+    while i < len(sorted_keys) and sorted_keys[i][0].startswith(prefix):
+        positions.append(sorted_keys[i][1])
+        i += 1
+    return positions
+
+
+class NumberedItemIndex:
+    """Lookup structures over one knowledge base's numbered_items.json"""
+
+    def __init__(self, raw_items: dict[str, Any]):
+        # Extract text content
+        self.items: dict[str, Any] = {}
+        for key, value in raw_items.items():
+            if isinstance(value, dict):
+                self.items[key] = value.get("text", str(value))
+            else:
+                self.items[key] = value
+
+        # Positions keep results in file order, as the original linear scans did
+        self.keys = list(self.items)
+        self.lower: dict[str, list[int]] = {}
+        for pos, key in enumerate(self.keys):
+            self.lower.setdefault(key.lower(), []).append(pos)
+        # Keys without parentheses, e.g. "(2.1.3)" -> "2.1.3", for numeric prefixes
+        self.clean_sorted = sorted(
+            (key.strip().strip("()"), pos) for pos, key in enumerate(self.keys)
+        )
+        self.lower_sorted = sorted((key.lower(), pos) for pos, key in enumerate(self.keys))
+
+    @classmethod
+    def from_file(cls, path: Path) -> "NumberedItemIndex":
+        return cls(_read_json(path))
+
+    def exact(self, identifier: str) -> str | None:
+        return identifier if identifier in self.items else None
+
+    def case_insensitive(self, identifier_lower: str) -> list[str]:
+        return [self.keys[pos] for pos in self.lower.get(identifier_lower, [])]
+
+    def prefix(self, identifier_clean: str, identifier_lower: str) -> list[str]:
+        """Keys numbered under identifier_clean, equal to it, or starting with the query"""
+        positions = set(_prefix_range(self.clean_sorted, identifier_clean + "."))
+        positions.update(pos for key, pos in self._equal(identifier_clean))
+        positions.update(_prefix_range(self.lower_sorted, identifier_lower))
+        return [self.keys[pos] for pos in sorted(positions)]
+
+    def _equal(self, identifier_clean: str) -> list[tuple[str, int]]:
+        i = bisect_left(self.clean_sorted, (identifier_clean, -1))
+        matches = []
+        while i < len(self.clean_sorted) and self.clean_sorted[i][0] == identifier_clean:
+            matches.append(self.clean_sorted[i])
+            i += 1
+        return matches
+
+    def partial(self, identifier_lower: str) -> list[str]:
+        return [key for key in self.keys if identifier_lower in key.lower()]
+
 
-            project_root = Path(__file__).parent.parent.parent
-            config = load_config_with_main("main.yaml", project_root)
-            max_results = config.get("tools", {}).get("query_item", {}).get("max_results", 5)
-        except Exception:
-            max_results = 5  # Default value
+def clear_numbered_item_cache() -> None:
+    """Drop all loaded indexes (they are also rebuilt automatically on file change)."""
+    with _cache_lock:
+        _file_cache.clear()
 
+
+def _failed(identifier: str, error: str) -> dict:
+    return {
+        "identifier": identifier,
+        "type": "unknown",
+        "content": "",
+        "status": "failed",
+        "error": error,
+    }
+
+
+def _load_index(
+    kb_name: str | None, kb_base_dir: str | None
+) -> tuple[NumberedItemIndex | None, str | None]:
+    """
+    Resolve the knowledge base and return its index
+
+    Returns:
+        (index, None) on success, (None, error message) otherwise
+    """
     # If path not specified, use absolute path relative to this file
     if kb_base_dir is None:
-        # __file__ = DeepTutor/tools/query_item_tool.py
-        # .parent = DeepTutor/tools
-        # .parent = DeepTutor
-        kb_base_dir = Path(__file__).parent.parent.parent / "data/knowledge_bases"
+        base_dir = Path(__file__).parent.parent.parent / "data/knowledge_bases"
     else:
-        kb_base_dir = Path(kb_base_dir)
-
-    base_dir = kb_base_dir
+        base_dir = Path(kb_base_dir)
 
     # Get knowledge base
     if not kb_name:
         config_file = base_dir / "kb_config.json"
         if config_file.exists():
             try:
-                with open(config_file, encoding="utf-8") as f:
-                    config = json.load(f)
-                    kb_name = config.get("default")
+                kb_name = _load_cached(config_file, _read_json).get("default")
             except Exception:
                 pass
 
         if not kb_name:
-            return {
-                "identifier": identifier,
-                "type": "unknown",
-                "content": "",
-                "status": "failed",
-                "error": "Error: Knowledge base not specified and no default knowledge base",
-            }
+            return None, "Error: Knowledge base not specified and no default knowledge base"
 
     # Load items
     kb_dir = base_dir / kb_name
     if not kb_dir.exists():
-        return {
-            "identifier": identifier,
-            "type": "unknown",
-            "content": "",
-            "status": "failed",
-            "error": f"Error: Knowledge base '{kb_name}' does not exist",
-        }
+        return None, f"Error: Knowledge base '{kb_name}' does not exist"
 
     items_file = kb_dir / "numbered_items.json"
     if not items_file.exists():
-        return {
-            "identifier": identifier,
-            "type": "unknown",
-            "content": "",
-            "status": "failed",
-            "error": f"Error: numbered_items.json not found in knowledge base '{kb_name}'",
-        }
+        return None, f"Error: numbered_items.json not found in knowledge base '{kb_name}'"
 
     try:
-        with open(items_file, encoding="utf-8") as f:
-            raw_items = json.load(f)
+        return _load_cached(items_file, NumberedItemIndex.from_file), None
     except Exception as e:
-        return {
-            "identifier": identifier,
-            "type": "unknown",
-            "content": "",
-            "status": "failed",
-            "error": f"Error: Unable to read file - {e}",
-        }
-
-    # Extract text content
-    items = {}
-    for key, value in raw_items.items():
-        if isinstance(value, dict):
-            items[key] = value.get("text", str(value))
-        else:
-            items[key] = value
+        return None, f"Error: Unable to read file - {e}"
 
+
+def _matched_result(
+    identifier: str, item_type: str, index: NumberedItemIndex, keys: list[str]
+) -> dict:
+    matches = [{"identifier": k, "type": item_type, "content": index.items[k]} for k in keys]
+    # Build content (backward compatible)
+    content = (
+        matches[0]["content"]
+        if len(matches) == 1
+        else "\n\n".join([f"[{item['identifier']}]\n{item['content']}" for item in matches])
+    )
+    return {
+        "identifier": identifier,
+        "type": item_type,
+        "status": "success",
+        "count": len(matches),
+        "items": matches,
+        "content": content,
+    }
+
+
+def _lookup(index: NumberedItemIndex, identifier: str, max_results: int) -> dict:
+    """Match one identifier against a loaded index"""
     # Validate identifier parameter
     if not identifier:
-        return {
-            "identifier": identifier or "",
-            "type": "unknown",
-            "content": "",
-            "status": "failed",
-            "error": "Error: identifier parameter is empty or None",
-        }
+        return _failed(identifier or "", "Error: identifier parameter is empty or None")
 
     # Ensure identifier is a string
     if not isinstance(identifier, str):
@@ -167,117 +233,27 @@ def query_numbered_item(
         item_type = "formula"
 
     # 1. Exact match (highest priority)
-    if identifier in items:
-        matched_item = {"identifier": identifier, "type": item_type, "content": items[identifier]}
-        return {
-            "identifier": identifier,
-            "type": item_type,
-            "status": "success",
-            "count": 1,
-            "items": [matched_item],
-            "content": items[identifier],  # Backward compatible
-        }
+    exact = index.exact(identifier)
+    if exact is not None:
+        return _matched_result(identifier, item_type, index, [exact])
 
     # 2. Case-insensitive exact match
-    exact_matches = []
-    for key, value in items.items():
-        if key.lower() == identifier_lower:
-            exact_matches.append({"identifier": key, "type": item_type, "content": value})
-
-    if exact_matches:
-        # Limit results
-        if max_results and len(exact_matches) > max_results:
-            exact_matches = exact_matches[:max_results]
-
-        # Build content (backward compatible)
-        content = (
-            exact_matches[0]["content"]
-            if len(exact_matches) == 1
-            else "\n\n".join(
-                [f"[{item['identifier']}]\n{item['content']}" for item in exact_matches]
-            )
-        )
-
-        return {
-            "identifier": identifier,
-            "type": item_type,
-            "status": "success",
-            "count": len(exact_matches),
-            "items": exact_matches,
-            "content": content,
-        }
-
     # 3. Prefix match (e.g., "2.1" matches "(2.1.1)", "(2.1.2)", etc.)
-    prefix_matches = []
-    identifier_clean = identifier.strip().strip("()")  # Remove parentheses, extract pure numbers
-
-    for key, value in items.items():
-        key_clean = key.strip().strip("()")
-        # Prefix match: key starts with identifier (after removing parentheses)
-        if (
-            key_clean.startswith(identifier_clean + ".")
-            or key_clean == identifier_clean
-            or key.lower().startswith(identifier_lower)
-        ):
-            prefix_matches.append({"identifier": key, "type": item_type, "content": value})
-
-    # Limit results
-    if max_results and len(prefix_matches) > max_results:
-        prefix_matches = prefix_matches[:max_results]
-
-    if prefix_matches:
-        # Build content
-        content = (
-            prefix_matches[0]["content"]
-            if len(prefix_matches) == 1
-            else "\n\n".join(
-                [f"[{item['identifier']}]\n{item['content']}" for item in prefix_matches]
-            )
-        )
-
-        return {
-            "identifier": identifier,
-            "type": item_type,
-            "status": "success",
-            "count": len(prefix_matches),
-            "items": prefix_matches,
-            "content": content,
-        }
-
     # 4. Partial match (contains query string)
-    partial_matches = []
-    for key, value in items.items():
-        if identifier_lower in key.lower():
-            partial_matches.append({"identifier": key, "type": item_type, "content": value})
-
-    # Limit results
-    if max_results and len(partial_matches) > max_results:
-        partial_matches = partial_matches[:max_results]
-
-    if partial_matches:
-        content = (
-            partial_matches[0]["content"]
-            if len(partial_matches) == 1
-            else "\n\n".join(
-                [f"[{item['identifier']}]\n{item['content']}" for item in partial_matches]
-            )
-        )
-
-        return {
-            "identifier": identifier,
-            "type": item_type,
-            "status": "success",
-            "count": len(partial_matches),
-            "items": partial_matches,
-            "content": content,
-        }
-
-    # 5. Not found - provide suggestions
-    suggestions = [k for k in items if identifier_lower in k.lower()][:5]
-    error_msg = f"Numbered item '{identifier}' not found"
-    if suggestions:
-        error_msg += "\n\nSimilar items:\n" + "\n".join(f"  • {s}" for s in suggestions)
-
+    identifier_clean = identifier.strip().strip("()")  # Remove parentheses, extract pure numbers
+    for match in (
+        lambda: index.case_insensitive(identifier_lower),
+        lambda: index.prefix(identifier_clean, identifier_lower),
+        lambda: index.partial(identifier_lower),
+    ):
+        keys = match()
+        if keys:
+            # Limit results
+            if max_results and len(keys) > max_results:
+                keys = keys[:max_results]
+            return _matched_result(identifier, item_type, index, keys)
+
+    # 5. Not found
     return {
         "identifier": identifier,
         "type": item_type,
@@ -285,10 +261,81 @@ def query_numbered_item(
         "count": 0,
         "items": [],
         "content": "",
-        "error": error_msg,
+        "error": f"Numbered item '{identifier}' not found",
     }
 
 
+def query_numbered_item(
+    identifier: str,
+    kb_name: str | None = None,
+    kb_base_dir: str | None = None,
+    max_results: int | None = None,
+) -> dict:
+    """
+    Query numbered item - Supports returning multiple matching results
+
+    Args:
+        identifier: Identifier of the numbered item
+            - Definition/Theorem: e.g., "Definition 1.1", "Theorem 2.3"
+            - Formula: e.g., "(1.2.1)", "(2.3.5)"
+            - Figure: e.g., "Figure 1.1", "Figure 2.5"
+            - Example: e.g., "Example 1.1", "Remark 2.1"
+        kb_name: Knowledge base name (optional, defaults to default knowledge base)
+        kb_base_dir: Knowledge base base directory (optional, defaults to knowledge_bases under project root)
+        max_results: Maximum number of items to return (optional, defaults to config value or 5)
+
+    Returns:
+        dict: Dictionary containing query results
+            {
+                "identifier": str,  # Original query identifier
+                "type": str,  # formula/definition/theorem/lemma/figure/example/remark
+                "status": str,  # success/failed
+                "count": int,  # Number of matched items
+                "items": [  # List of all matched items (sorted by priority)
+                    {
+                        "identifier": str,  # Actual matched identifier
+                        "type": str,
+                        "content": str
+                    },
+                    ...
+                ],
+                "content": str,  # Backward compatible: single item content or merged content for multiple items
+                "error": str (only when failed)
+            }
+    """
+    return query_numbered_items([identifier], kb_name, kb_base_dir, max_results)[0]
+
+
+def query_numbered_items(
+    identifiers: list[str],
+    kb_name: str | None = None,
+    kb_base_dir: str | None = None,
+    max_results: int | None = None,
+) -> list[dict]:
+    """
+    Query several numbered items of one knowledge base at once
+
+    The knowledge base is resolved and its index loaded once for the whole batch.
+
+    Args:
+        identifiers: Identifiers of the numbered items (see query_numbered_item)
+        kb_name: Knowledge base name (optional, defaults to default knowledge base)
+        kb_base_dir: Knowledge base base directory (optional)
+        max_results: Maximum number of items per identifier (optional)
+
+    Returns:
+        list[dict]: One query_numbered_item result per identifier, in input order
+    """
+    # Load configuration for max_results if not specified
+    if max_results is None:
+        max_results = _load_max_results()
+
+    index, error = _load_index(kb_name, kb_base_dir)
+    if index is None:
+        return [_failed(identifier, error) for identifier in identifiers]
+    return [_lookup(index, identifier, max_results) for identifier in identifiers]
+
+
 if __name__ == "__main__":
     import sys
 
@@ -7,8 +7,9 @@ All logic is delegated to RAGService in src/services/rag/service.py.
 """
 
 import asyncio
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from dotenv import load_dotenv
 
@@ -20,6 +21,122 @@ load_dotenv(project_root / ".env", override=False)
 # Import RAGService as the single entry point
 from src.services.rag.service import RAGService
 
+# One RAGService per (kb_base_dir, provider); its pipelines are shared process-wide
+_services: Dict[Tuple[Optional[str], Optional[str]], RAGService] = {}
+
+
+def _get_service(kb_base_dir: Optional[str], provider: Optional[str]) -> RAGService:
+    service = _services.get((kb_base_dir, provider))
+    if service is None:
+        service = _services[(kb_base_dir, provider)] = RAGService(
+            kb_base_dir=kb_base_dir, provider=provider
+        )
+    return service
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class _SearchBatcher:
+    """
+    Coalesces concurrent rag_search calls into RAGService.search_many batches.
+
+    Calls for the same KB, mode, provider and options that arrive within
+    ``window_ms`` of each other are searched together (one embedding call and
+    one index scan for the batch). A batch is flushed when its window ends or
+    when it reaches ``max_size`` queries.
+    """
+
+    def __init__(self, window_ms: int, max_size: int):
+        self.window = max(window_ms, 0) / 1000
+        self.max_size = max(max_size, 1)
+        self._pending: Dict[Tuple, List[Tuple[str, asyncio.Future]]] = {}
+        # The loop only keeps weak references to tasks; hold flushed batches until done
+        self._tasks: Set[asyncio.Future] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0 and self.max_size > 1
+
+    async def search(
+        self,
+        query: str,
+        kb_name: Optional[str],
+        mode: str,
+        provider: Optional[str],
+        kb_base_dir: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> dict:
+        loop = asyncio.get_running_loop()
+        key = (id(loop), kb_name, mode, provider, kb_base_dir, tuple(sorted(kwargs.items())))
+        future = loop.create_future()
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            loop.call_later(self.window, self._flush, key, batch)
+        batch.append((query, future))
+        if len(batch) >= self.max_size:
+            self._flush(key, batch)
+
+        return await future
+
+    def _flush(self, key: Tuple, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        # The window timer may fire after the batch was already flushed as full
+        if self._pending.get(key) is not batch:
+            return
+        del self._pending[key]
+        _, kb_name, mode, provider, kb_base_dir, items = key
+        task = asyncio.ensure_future(
+            self._run(batch, kb_name, mode, provider, kb_base_dir, dict(items))
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _run(batch, kb_name, mode, provider, kb_base_dir, kwargs) -> None:
+        service = _get_service(kb_base_dir, provider)
+        # Callers cancelled before the flush are dropped from the batch
+        live = [(query, future) for query, future in batch if not future.done()]
+        queries = [query for query, _ in live]
+        try:
+            if not queries:
+                return
+            if len(queries) == 1:
+                results = [
+                    await service.search(query=queries[0], kb_name=kb_name, mode=mode, **kwargs)
+                ]
+            else:
+                results = await service.search_many(
+                    queries=queries, kb_name=kb_name, mode=mode, **kwargs
+                )
+        except Exception as e:
+            for _, future in live:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(live, results):
+            if not future.done():
+                future.set_result(result)
+
+
+_batcher: Optional[_SearchBatcher] = None
+
+
+def _get_batcher() -> _SearchBatcher:
+    global _batcher
+    if _batcher is None:
+        _batcher = _SearchBatcher(
+            window_ms=_env_int("RAG_BATCH_WINDOW_MS", 5),
+            max_size=_env_int("RAG_BATCH_MAX_SIZE", 16),
+        )
+    return _batcher
+
 
 async def rag_search(
     query: str,
@@ -32,6 +149,10 @@ async def rag_search(
     """
     Query knowledge base using configurable RAG pipeline.
 
+    Concurrent calls with the same KB and options are coalesced into
+    micro-batches (see RAG_BATCH_WINDOW_MS / RAG_BATCH_MAX_SIZE; a window of
+    0 disables batching).
+
     Args:
         query: Query question
         kb_name: Knowledge base name (optional, defaults to default knowledge base)
@@ -61,14 +182,56 @@ async def rag_search(
         # Override provider
         result = await rag_search("What is ML?", kb_name="textbook", provider="lightrag")
     """
-    service = RAGService(kb_base_dir=kb_base_dir, provider=provider)
+    batcher = _get_batcher()
 
     try:
+        if batcher.enabled:
+            try:
+                hash(tuple(kwargs.values()))
+            except TypeError:
+                pass  # Unhashable options cannot share a batch key
+            else:
+                return await batcher.search(query, kb_name, mode, provider, kb_base_dir, kwargs)
+
+        service = _get_service(kb_base_dir, provider)
         return await service.search(query=query, kb_name=kb_name, mode=mode, **kwargs)
     except Exception as e:
         raise Exception(f"RAG search failed: {e}")
 
 
+async def rag_search_many(
+    queries: List[str],
+    kb_name: Optional[str] = None,
+    mode: str = "hybrid",
+    provider: Optional[str] = None,
+    kb_base_dir: Optional[str] = None,
+    **kwargs,
+) -> List[dict]:
+    """
+    Query knowledge base with several queries in one batch.
+
+    Args:
+        queries: Query questions
+        kb_name: Knowledge base name (optional, defaults to default knowledge base)
+        mode: Query mode (e.g., "hybrid", "local", "global", "naive")
+        provider: RAG pipeline to use (defaults to RAG_PROVIDER env var or "raganything")
+        kb_base_dir: Base directory for knowledge bases (for testing)
+        **kwargs: Additional parameters passed to the RAG pipeline
+
+    Returns:
+        List of result dictionaries (same format as rag_search), in input order
+
+    Example:
+        results = await rag_search_many(["What is ML?", "What is AI?"], kb_name="textbook")
+    """
+    service = _get_service(kb_base_dir, provider)
+
+    try:
+        return await service.search_many(queries=queries, kb_name=kb_name, mode=mode, **kwargs)
+    except Exception as e:
+        raise Exception(f"RAG search failed: {e}")
+
+
 async def initialize_rag(
     kb_name: str,
     documents: List[str],
@@ -93,7 +256,7 @@ async def initialize_rag(
         documents = ["doc1.pdf", "doc2.txt"]
         success = await initialize_rag("my_kb", documents)
     """
-    service = RAGService(kb_base_dir=kb_base_dir, provider=provider)
+    service = _get_service(kb_base_dir, provider)
     return await service.initialize(kb_name=kb_name, file_paths=documents, **kwargs)
 
 
@@ -116,7 +279,7 @@ async def delete_rag(
     Example:
         success = await delete_rag("old_kb")
     """
-    service = RAGService(kb_base_dir=kb_base_dir, provider=provider)
+    service = _get_service(kb_base_dir, provider)
     return await service.delete(kb_name=kb_name)
 
 
@@ -13,6 +13,9 @@ Usage:
     # With provider
     result = web_search("What is AI?", provider="tavily")
 
+    # Inside a coroutine (pooled async HTTP, does not block the event loop)
+    result = await aweb_search("What is AI?")
+
 Environment Variables:
     - SEARCH_PROVIDER: Default search provider (default: perplexity)
     - SEARCH_API_KEY: Unified API key for all providers
@@ -37,6 +40,7 @@ from src.services.search import (
     SearchProvider,
     SearchResult,
     WebSearchResponse,
+    aweb_search,
     get_available_providers,
     get_current_config,
     get_default_provider,
@@ -49,6 +53,7 @@ from src.services.search import (
 __all__ = [
     # Main function
     "web_search",
+    "aweb_search",
     "get_current_config",
     # Provider management
     "get_provider",
@@ -0,0 +1,41 @@
+import asyncio
+
+from src.agents.ideagen.idea_generation_workflow import IdeaGenerationWorkflow
+
+
+def test_points_run_concurrently_and_keep_order(concurrency_probe):
+    workflow = IdeaGenerationWorkflow(api_key="k", model="m", max_concurrency=2)
+
+    async def explore_ideas(point):
+        await concurrency_probe.hold(point["delay"])
+        return [] if point["knowledge_point"] == "empty" else ["idea"]
+
+    async def strict_filter(point, ideas):
+        return ideas
+
+    async def generate_statement(point, ideas):
+        return f"statement {point['knowledge_point']}"
+
+    workflow.explore_ideas = explore_ideas
+    workflow.strict_filter = strict_filter
+    workflow.generate_statement = generate_statement
+
+    points = [
+        {"knowledge_point": "slow", "delay": 0.03},
+        {"knowledge_point": "empty", "delay": 0.0},
+        {"knowledge_point": "fast", "delay": 0.0},
+    ]
+    events = []
+
+    async def emit(stage, data):
+        events.append((stage, data["status"], data["index"], data["total"]))
+
+    results = asyncio.run(workflow.process_points(points, emit=emit))
+
+    assert [r and r["statement"] for r in results] == ["statement slow", None, "statement fast"]
+    assert concurrency_probe.peak == 2
+    done = [
+        index for stage, status, index, _ in events if (stage, status) == ("statement", "complete")
+    ]
+    assert done == [3, 1]
+    assert all(total == 3 for *_, total in events)
@@ -0,0 +1,33 @@
+import json
+from pathlib import Path
+import threading
+
+from src.agents.research.utils.progress_log import ProgressEventLog
+
+
+def test_events_stream_to_jsonl_and_snapshot_on_close(tmp_path: Path):
+    log = ProgressEventLog(
+        tmp_path,
+        lambda stage: {"research_id": "r1", "stage": stage},
+        snapshot_interval=60,
+    )
+
+    def emit(worker):
+        for i in range(50):
+            log.record("researching", {"status": "step", "worker": worker, "i": i})
+
+    threads = [threading.Thread(target=emit, args=(w,)) for w in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    log.record("planning", {"status": "planning_started"})
+    log.close()
+
+    lines = (tmp_path / "researching_progress.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 200
+    snapshot = json.loads((tmp_path / "researching_progress.json").read_text(encoding="utf-8"))
+    assert snapshot["research_id"] == "r1" and snapshot["stage"] == "researching"
+    assert snapshot["events"] == [json.loads(line) for line in lines]
+    planning = json.loads((tmp_path / "planning_progress.json").read_text(encoding="utf-8"))
+    assert planning["events"] == [{"status": "planning_started"}]
@@ -0,0 +1,46 @@
+import asyncio
+
+from src.agents.research.agents.reporting_agent import ReportingAgent
+from src.agents.research.data_structures import TopicBlock
+
+
+def _agent(reporting_config):
+    return ReportingAgent({"reporting": reporting_config}, api_key="k")
+
+
+def test_parallel_drafting_keeps_outline_order(concurrency_probe):
+    agent = _agent({"execution_mode": "parallel", "max_parallel_sections": 3})
+    events = []
+    agent._progress_callback = events.append
+
+    async def fake_write(text, delay):
+        await concurrency_probe.hold(delay)
+        return text
+
+    async def intro(topic, blocks, outline):
+        return await fake_write("intro", 0.03)
+
+    async def body(topic, block, section):
+        return await fake_write(f"## {block.sub_topic}", 0.01 if block.block_id == "b1" else 0.02)
+
+    async def conclusion(topic, blocks, outline):
+        return await fake_write("end", 0.0)
+
+    agent._write_introduction = intro
+    agent._write_section_body = body
+    agent._write_conclusion = conclusion
+
+    blocks = [TopicBlock(block_id=f"b{i}", sub_topic=f"S{i}", overview="") for i in (1, 2)]
+    outline = {
+        "title": "# T",
+        "sections": [{"block_id": "b1"}, {"block_id": "missing"}, {"block_id": "b2"}],
+    }
+
+    report = asyncio.run(agent._write_report("topic", blocks, outline))
+
+    assert report == "# T\n\n## Introduction\n\nintro\n\n## S1\n\n## S2\n\n## Conclusion\n\nend\n\n"
+    assert concurrency_probe.peak == 3
+    completed = [e for e in events if e["status"] == "section_completed"]
+    # Finished parts stream out as soon as they are ready, not in outline order
+    assert [e["current_section"] for e in completed] == ["S1", "Conclusion", "S2", "Introduction"]
+    assert [s["section_index"] for s in agent.section_latencies] == [0, 1, 3, 4]
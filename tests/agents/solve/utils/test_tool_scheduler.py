@@ -0,0 +1,31 @@
+import asyncio
+
+from src.agents.solve.utils.tool_scheduler import ToolScheduler
+
+
+def _run(scheduler, calls, probe):
+    async def worker(call):
+        tool_type, delay = call
+        await probe.hold(delay, key=tool_type)
+        return f"{tool_type}:{delay}"
+
+    return asyncio.run(scheduler.run(calls, lambda call: call[0], worker))
+
+
+def test_parallel_mode_respects_global_and_per_tool_limits(concurrency_probe):
+    scheduler = ToolScheduler(mode="parallel", max_concurrency=3, per_tool_limits={"web": 1})
+    calls = [("rag", 0.03), ("web", 0.01), ("web", 0.01), ("rag", 0.0), ("code_execution", 0.0)]
+
+    results = _run(scheduler, calls, concurrency_probe)
+
+    # Results come back in input order regardless of completion order
+    assert results == [f"{tool}:{delay}" for tool, delay in calls]
+    assert concurrency_probe.peak == 3
+    assert concurrency_probe.peaks["web"] == 1
+    assert concurrency_probe.peaks["code_execution"] == 1
+
+
+def test_series_mode_runs_one_at_a_time(concurrency_probe):
+    scheduler = ToolScheduler.from_config({"solve": {"tool_execution": {"mode": "series"}}})
+    _run(scheduler, [("rag", 0.0), ("rag", 0.0)], concurrency_probe)
+    assert concurrency_probe.peak == 1
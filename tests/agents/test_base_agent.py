@@ -0,0 +1,38 @@
+"""Tests for BaseAgent token accounting."""
+
+import asyncio
+
+from src.agents import base_agent
+from src.agents.base_agent import BaseAgent
+from src.services.llm.usage import capture_usage, report_usage
+
+
+class EchoAgent(BaseAgent):
+    async def process(self, *args, **kwargs):
+        return None
+
+
+def test_stream_usage_excludes_the_consumers_calls(monkeypatch):
+    async def fake_stream(**kwargs):
+        for chunk in ("a", "b"):
+            report_usage({"prompt_tokens": 100, "completion_tokens": 1})
+            yield chunk
+
+    tracked = []
+    monkeypatch.setattr(base_agent, "llm_stream", fake_stream)
+    agent = EchoAgent(module_name="solve", agent_name="echo", api_key="k", model="m")
+    monkeypatch.setattr(agent, "_track_tokens", lambda *a, **kw: tracked.append(kw["usage"]))
+
+    async def consume():
+        chunks = []
+        # The consumer's own call between chunks belongs to the consumer only
+        with capture_usage() as outer:
+            async for chunk in agent.stream_llm("q", "sys"):
+                chunks.append(chunk)
+                report_usage({"prompt_tokens": 7, "completion_tokens": 7})
+        return chunks, outer
+
+    chunks, outer = asyncio.run(consume())
+    assert chunks == ["a", "b"]
+    assert (tracked[0].prompt_tokens, tracked[0].completion_tokens) == (200, 2)
+    assert (outer.prompt_tokens, outer.completion_tokens) == (14, 14)
@@ -0,0 +1,41 @@
+"""Shared fixtures for the test suite."""
+
+import asyncio
+
+import pytest
+
+
+class ConcurrencyProbe:
+    """Stand-in for slow async work that records how much of it overlapped."""
+
+    def __init__(self):
+        self.peak = 0
+        self.peaks: dict[str, int] = {}
+        self._running = 0
+        self._running_by_key: dict[str, int] = {}
+
+    async def hold(self, delay: float, key: str | None = None) -> None:
+        """
+        Occupy a slot for ``delay`` seconds.
+
+        Args:
+            delay: Seconds to hold the slot
+            key: Optional group (e.g. a tool type) whose peak is tracked in ``peaks``
+        """
+        self._running += 1
+        self.peak = max(self.peak, self._running)
+        if key is not None:
+            self._running_by_key[key] = self._running_by_key.get(key, 0) + 1
+            self.peaks[key] = max(self.peaks.get(key, 0), self._running_by_key[key])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._running -= 1
+            if key is not None:
+                self._running_by_key[key] -= 1
+
+
+@pytest.fixture
+def concurrency_probe() -> ConcurrencyProbe:
+    """Fresh ConcurrencyProbe for measuring peak concurrency."""
+    return ConcurrencyProbe()
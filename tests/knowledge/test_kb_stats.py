@@ -0,0 +1,48 @@
+"""Tests for cached knowledge base statistics."""
+
+import json
+from pathlib import Path
+
+from src.knowledge import stats
+from src.knowledge.manager import KnowledgeBaseManager
+
+
+def test_count_json_entries_streams_across_chunks(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(stats, "_READ_CHUNK", 3)
+    data = {'k"1': {"nested": [1, {"a": "}],"}]}, "k\\2": "x\\", "k3": []}
+    path = tmp_path / "store.json"
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    assert stats.count_json_entries(path) == 3
+
+    path.write_text("  [ ]", encoding="utf-8")
+    assert stats.count_json_entries(path) == 0
+
+
+def test_get_info_uses_sidecar_until_sources_change(tmp_path: Path, monkeypatch):
+    manager = KnowledgeBaseManager(base_dir=str(tmp_path))
+    kb_dir = tmp_path / "kb"
+    (kb_dir / "raw").mkdir(parents=True)
+    (kb_dir / "raw" / "a.pdf").write_text("a")
+    (kb_dir / "rag_storage").mkdir()
+    (kb_dir / "rag_storage" / "kv_store_full_entities.json").write_text('{"e1": {}, "e2": {}}')
+
+    statistics = manager.get_info("kb")["statistics"]
+    assert statistics["raw_documents"] == 1
+    assert statistics["rag"] == {"entities": 2}
+    assert (kb_dir / stats.STATS_FILE).exists()
+
+    # Unchanged stores are served from memory or the sidecar without recounting
+    stats.forget_kb_stats(kb_dir)
+    recounts = []
+    real_compute = stats.compute_rag_stats
+    monkeypatch.setattr(stats, "compute_rag_stats", lambda d: recounts.append(d) or real_compute(d))
+    (kb_dir / "raw" / "b.pdf").write_text("b")
+    statistics = manager.get_info("kb")["statistics"]
+    assert statistics["raw_documents"] == 2
+    assert statistics["rag"] == {"entities": 2}
+    assert recounts == []
+
+    (kb_dir / "rag_storage" / "kv_store_full_entities.json").write_text('{"e1": {}}')
+    assert manager.get_info("kb")["statistics"]["rag"] == {"entities": 1}
+    assert len(recounts) == 1
+    stats.forget_kb_stats(kb_dir)
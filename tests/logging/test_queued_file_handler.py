@@ -0,0 +1,112 @@
+"""Tests for the queued (background-writer) log file handlers."""
+
+import json
+import logging
+from pathlib import Path
+import threading
+
+from src.logging.handlers import file as file_module
+from src.logging.handlers.file import BufferedLogSink, JSONFileHandler, QueuedFileHandler
+
+
+def _logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(f"deeptutor.test.{name}")
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+def test_handlers_share_one_writer_per_file(tmp_path: Path):
+    log_file = tmp_path / "app.log"
+    first = QueuedFileHandler(str(log_file))
+    second = QueuedFileHandler(str(log_file))
+    assert first.sink is second.sink
+
+    _logger("a", first).info("from a")
+    _logger("b", second).error("from b")
+    first.flush()
+    assert log_file.read_text(encoding="utf-8").splitlines() == ["from a", "from b"]
+
+    first.close()
+    _logger("b", second).info("still open")
+    second.close()
+    assert log_file.read_text(encoding="utf-8").splitlines()[-1] == "still open"
+
+
+def test_json_handler_writes_jsonl(tmp_path: Path):
+    log_file = tmp_path / "events.jsonl"
+    handler = JSONFileHandler(str(log_file))
+    _logger("json", handler).warning("hello %s", "world", extra={"tool_name": "rag"})
+    handler.close()
+
+    entry = json.loads(log_file.read_text(encoding="utf-8"))
+    assert (entry["level"], entry["message"], entry["tool_name"]) == (
+        "WARNING",
+        "hello world",
+        "rag",
+    )
+
+
+def test_full_queue_drops_and_reports(tmp_path: Path):
+    sink = BufferedLogSink(str(tmp_path / "small.log"), max_queue=2, flush_interval=60)
+    # Fill the queue before the writer starts consuming
+    sink._queue.put_nowait(("one\n", False))
+    sink._queue.put_nowait(("two\n", False))
+    sink._thread = threading.current_thread()  # Pretend the writer runs so put() only enqueues
+    assert sink.put("three\n") is False
+    assert sink.get_stats()["dropped"] == 1
+
+    sink._thread = None
+    sink._queue.get_nowait()
+    sink._queue.get_nowait()
+    sink.put("four\n")
+    sink.close()
+    lines = (tmp_path / "small.log").read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "four"
+    assert lines[1].endswith("Dropped 1 log records")
+
+
+def test_rotation_by_size(tmp_path: Path):
+    log_file = tmp_path / "rot.log"
+    sink = BufferedLogSink(str(log_file), max_bytes=20, backup_count=2)
+    for i in range(4):
+        sink.put(f"line-{i:02d}-xxxxxxxx\n", urgent=True)
+        sink.flush()
+    sink.close()
+
+    assert log_file.read_text(encoding="utf-8") == "line-03-xxxxxxxx\n"
+    assert (tmp_path / "rot.log.1").read_text(encoding="utf-8") == "line-02-xxxxxxxx\n"
+    assert (tmp_path / "rot.log.2").exists()
+    assert not (tmp_path / "rot.log.3").exists()
+
+
+def test_unencodable_line_does_not_kill_the_writer(tmp_path: Path):
+    log_file = tmp_path / "surrogate.log"
+    sink = BufferedLogSink(str(log_file), encoding="ascii")
+    sink.put("lone surrogate \ud83d and caf\u00e9\n", urgent=True)
+    sink.flush(timeout=2)
+    sink.put("after\n", urgent=True)
+    sink.flush(timeout=2)
+    assert sink._thread.is_alive()
+    sink.close()
+
+    lines = log_file.read_text(encoding="ascii").splitlines()
+    assert lines == ["lone surrogate \\ud83d and caf\\xe9", "after"]
+
+
+def test_dead_writer_is_restarted(tmp_path: Path):
+    log_file = tmp_path / "restart.log"
+    sink = BufferedLogSink(str(log_file))
+    sink.put("first\n", urgent=True)
+    sink.flush(timeout=2)
+    # Simulate a writer that exited unexpectedly (the sink itself stays open)
+    sink._queue.put(file_module._STOP)
+    sink._thread.join(2)
+    assert not sink._thread.is_alive()
+
+    sink.put("second\n", urgent=True)
+    sink.flush(timeout=2)
+    sink.close()
+    assert log_file.read_text(encoding="utf-8").splitlines() == ["first", "second"]
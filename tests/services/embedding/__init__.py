@@ -0,0 +1 @@
+# Tests for embedding service
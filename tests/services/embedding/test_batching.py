@@ -0,0 +1,69 @@
+"""Tests for batch splitting and concurrent batch execution in embedding adapters."""
+
+import asyncio
+from typing import Any, Dict
+
+from src.services.embedding.adapters.base import (
+    BaseEmbeddingAdapter,
+    EmbeddingRequest,
+    EmbeddingResponse,
+    split_batches,
+)
+
+
+class RecordingAdapter(BaseEmbeddingAdapter):
+    MAX_BATCH_SIZE = 3
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _embed_batch(self, request: EmbeddingRequest) -> EmbeddingResponse:
+        self.batches.append(list(request.texts))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later batches finish first to check that order is restored
+        await asyncio.sleep(0.01 * (10 - len(self.batches)))
+        self.in_flight -= 1
+        return EmbeddingResponse(
+            embeddings=[[float(t)] for t in request.texts],
+            model="fake",
+            dimensions=1,
+            usage={"total_tokens": len(request.texts)},
+        )
+
+    def get_model_info(self) -> Dict[str, Any]:
+        return {"model": "fake"}
+
+
+def test_split_batches_by_items_and_tokens():
+    texts = ["a" * 30, "b" * 30, "c" * 30, "d" * 300, "e"]
+    assert [len(b) for _, b in split_batches(texts, max_items=2)] == [2, 2, 1]
+
+    batches = split_batches(texts, max_items=10, max_tokens=40)
+    assert [start for start, _ in batches] == [0, 3, 4]
+    # Oversized single text still gets its own batch
+    assert batches[1][1] == ["d" * 300]
+
+
+def test_embed_splits_runs_concurrently_and_preserves_order():
+    adapter = RecordingAdapter({"model": "fake", "max_concurrency": 2})
+    texts = [str(i) for i in range(10)]
+
+    response = asyncio.run(adapter.embed(EmbeddingRequest(texts=texts, model="fake")))
+
+    assert [e[0] for e in response.embeddings] == [float(i) for i in range(10)]
+    assert len(adapter.batches) == 4
+    assert adapter.max_in_flight == 2
+    assert response.usage == {"total_tokens": 10}
+
+
+def test_embed_respects_smaller_caller_batch_size():
+    adapter = RecordingAdapter({"model": "fake"})
+    texts = [str(i) for i in range(4)]
+
+    asyncio.run(adapter.embed(EmbeddingRequest(texts=texts, model="fake"), batch_size=1))
+
+    assert len(adapter.batches) == 4
@@ -0,0 +1,76 @@
+"""Tests for the persistent embedding cache and its use in EmbeddingClient."""
+
+import asyncio
+import logging
+from pathlib import Path
+
+from src.services.embedding.adapters.base import EmbeddingResponse
+from src.services.embedding.cache import EmbeddingCache
+from src.services.embedding.client import EmbeddingClient
+from src.services.embedding.config import EmbeddingConfig
+
+
+def test_roundtrip_persists_and_evicts_lru(tmp_path: Path):
+    path = tmp_path / "emb.sqlite3"
+    # Each 4-dim float32 vector is 16 bytes; budget fits three
+    cache = EmbeddingCache(path=path, max_bytes=48)
+    keys = [cache.make_key("m", 4, None, t) for t in ("a", "b", "c", "d")]
+
+    cache.put_many([(k, [float(i)] * 4) for i, k in enumerate(keys[:3])])
+    assert cache.get_many([keys[0]])[keys[0]] == [0.0] * 4  # refresh "a"
+    cache.put_many([(keys[3], [3.0] * 4)])
+
+    assert cache.get_stats()["evictions"] >= 1
+    cache.close()
+
+    reopened = EmbeddingCache(path=path, max_bytes=48)
+    found = reopened.get_many(keys)
+    assert keys[0] in found and keys[3] in found
+    assert keys[1] not in found
+    assert reopened.get_stats()["bytes"] <= 48
+    reopened.close()
+
+
+def test_keys_depend_on_model_dimensions_and_input_type():
+    base = EmbeddingCache.make_key("m", 4, None, "text")
+    assert base == EmbeddingCache.make_key("m", 4, None, "text")
+    assert base != EmbeddingCache.make_key("m2", 4, None, "text")
+    assert base != EmbeddingCache.make_key("m", 8, None, "text")
+    assert base != EmbeddingCache.make_key("m", 4, "search_query", "text")
+
+
+def test_client_only_embeds_uncached_texts(tmp_path: Path):
+    calls = []
+
+    class FakeAdapter:
+        async def embed(self, request, batch_size=None):
+            calls.append(list(request.texts))
+            return EmbeddingResponse(
+                embeddings=[[float(len(t))] for t in request.texts],
+                model="fake",
+                dimensions=1,
+                usage={},
+            )
+
+    class FakeManager:
+        def get_active_adapter(self):
+            return FakeAdapter()
+
+    client = EmbeddingClient.__new__(EmbeddingClient)
+    client.config = EmbeddingConfig(model="fake", api_key="", dim=1)
+    client.logger = logging.getLogger("test")
+    client.manager = FakeManager()
+    client.cache = EmbeddingCache(path=tmp_path / "emb.sqlite3")
+
+    async def run():
+        first = await client.embed(["a", "bb", "a"])
+        second = await client.embed(["bb", "ccc"])
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == [[1.0], [2.0], [1.0]]
+    assert second == [[2.0], [3.0]]
+    assert calls == [["a", "bb"], ["ccc"]]
+    stats = client.cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 4
+    client.cache.close()
@@ -0,0 +1,117 @@
+"""Tests for the LLM completion cache and its use in factory.complete."""
+
+import asyncio
+from pathlib import Path
+import threading
+
+from src.services.llm import factory
+from src.services.llm.cache import (
+    CompletionCache,
+    reset_completion_cache,
+    set_completion_cache,
+    should_cache,
+)
+
+
+def test_policy_bypasses_sampled_calls_unless_opted_in():
+    assert not should_cache(None, 0.0)
+    assert not should_cache({"enabled": False}, 0.0)
+    assert should_cache({"enabled": True}, 0.0)
+    assert not should_cache({"enabled": True}, 0.7)
+    assert not should_cache({"enabled": True}, None)
+    assert should_cache({"enabled": True, "allow_sampling": True}, 0.7)
+
+
+def test_lru_eviction_and_persistence(tmp_path: Path):
+    path = tmp_path / "llm.sqlite3"
+    cache = CompletionCache(max_entries=2, path=path)
+    keys = [cache.make_key("m", [{"role": "user", "content": str(i)}]) for i in range(3)]
+    for key in keys:
+        cache.put(key, f"r-{key[:4]}", latency=1.5)
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == f"r-{keys[2][:4]}"
+    # Overwriting a stored key does not grow the table
+    cache.put(keys[2], "updated")
+    assert cache._disk_count == 2
+    cache.close()
+
+    reopened = CompletionCache(max_entries=2, path=path)
+    assert reopened.get(keys[1]) == f"r-{keys[1][:4]}"
+    assert reopened.get(keys[2]) == "updated"
+    assert reopened._disk_count == 2
+    stats = reopened.get_stats()
+    assert (stats["hits"], stats["misses"], stats["saved_seconds"]) == (2, 0, 1.5)
+    reopened.close()
+
+
+def test_complete_serves_identical_requests_from_cache(monkeypatch):
+    calls = []
+
+    async def fake_complete(**kwargs):
+        calls.append(kwargs)
+        return f"answer {len(calls)}"
+
+    monkeypatch.setattr(factory.cloud_provider, "complete", fake_complete)
+    cache = CompletionCache()
+    set_completion_cache(cache)
+
+    async def run():
+        common = {"model": "m", "base_url": "https://api.example.com/v1", "api_key": "k"}
+        policy = {"enabled": True}
+        return [
+            await factory.complete("q", temperature=0.0, cache=policy, **common),
+            await factory.complete("q", temperature=0.0, cache=policy, **common),
+            # A different response format is a different request
+            await factory.complete(
+                "q",
+                temperature=0.0,
+                response_format={"type": "json_object"},
+                cache=policy,
+                **common,
+            ),
+            # Sampled calls bypass the cache without allow_sampling
+            await factory.complete("q", temperature=0.7, cache=policy, **common),
+            await factory.complete("q", temperature=0.0, **common),
+        ]
+
+    try:
+        results = asyncio.run(run())
+        assert results == ["answer 1", "answer 1", "answer 2", "answer 3", "answer 4"]
+        assert all("cache" not in call for call in calls)
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["bypassed"]) == (1, 2, 1)
+    finally:
+        reset_completion_cache()
+
+
+def test_persistent_cache_runs_off_the_event_loop(tmp_path: Path, monkeypatch):
+    threads = []
+
+    class RecordingCache(CompletionCache):
+        def get(self, key):
+            threads.append(threading.current_thread())
+            return super().get(key)
+
+        def put(self, key, response, latency=0.0):
+            threads.append(threading.current_thread())
+            super().put(key, response, latency)
+
+    async def fake_complete(**kwargs):
+        return "answer"
+
+    monkeypatch.setattr(factory.cloud_provider, "complete", fake_complete)
+    set_completion_cache(RecordingCache(path=tmp_path / "llm.sqlite3"))
+
+    async def run():
+        common = {"model": "m", "base_url": "https://api.example.com/v1", "api_key": "k"}
+        for _ in range(2):
+            await factory.complete("q", temperature=0.0, cache={"enabled": True}, **common)
+
+    try:
+        asyncio.run(run())
+        # miss + store, then a hit
+        assert len(threads) == 3
+        assert threading.main_thread() not in threads
+    finally:
+        reset_completion_cache()
@@ -0,0 +1,130 @@
+"""Tests for hedged and fallback LLM requests."""
+
+import asyncio
+
+import pytest
+
+from src.services.llm import factory, hedge
+from src.services.llm.config import LLMConfig
+from src.services.llm.hedge import HedgeStats, hedged_call, hedged_stream
+
+
+def _call(result, delay=0.0, error=None, log=None):
+    async def run():
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(f"cancelled {result}")
+            raise
+        if error:
+            raise error
+        return result
+
+    return run
+
+
+def test_slow_primary_is_hedged_and_cancelled():
+    stats = HedgeStats()
+    log = []
+
+    async def run():
+        result = await hedged_call(
+            _call("primary", delay=5, log=log), _call("hedge"), delay=0.05, stats=stats
+        )
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == "hedge"
+    assert log == ["cancelled primary"]
+    complete = stats.get_stats()["complete"]
+    assert (complete["hedged"], complete["hedge_wins"], complete["hedge_rate"]) == (1, 1, 1.0)
+
+
+def test_fast_primary_is_not_hedged():
+    stats = HedgeStats()
+    started = []
+
+    def never():
+        started.append(True)
+        return _call("hedge")()
+
+    assert asyncio.run(hedged_call(_call("primary"), never, delay=1, stats=stats)) == "primary"
+    assert not started
+    assert stats.get_stats()["complete"]["hedge_rate"] == 0.0
+
+
+def test_failed_primary_falls_back_only_when_enabled():
+    stats = HedgeStats()
+    failing = _call("primary", error=RuntimeError("down"))
+
+    result = asyncio.run(hedged_call(failing, _call("hedge"), delay=5, fallback=True, stats=stats))
+    assert result == "hedge"
+    assert stats.get_stats()["complete"]["fallbacks"] == 1
+    with pytest.raises(RuntimeError):
+        asyncio.run(hedged_call(failing, _call("hedge"), delay=5, stats=stats))
+
+
+def test_stream_is_hedged_on_slow_first_token():
+    stats = HedgeStats()
+    closed = []
+
+    def make(name, first_delay):
+        async def gen():
+            try:
+                await asyncio.sleep(first_delay)
+                for i in range(3):
+                    yield f"{name}{i}"
+            finally:
+                closed.append(name)
+
+        return gen
+
+    async def run():
+        chunks = [
+            c async for c in hedged_stream(make("p", 5), make("h", 0), ttft=0.05, stats=stats)
+        ]
+        await asyncio.sleep(0)
+        return chunks
+
+    assert asyncio.run(run()) == ["h0", "h1", "h2"]
+    assert sorted(closed) == ["h", "p"]
+    assert stats.get_stats()["stream"]["hedge_wins"] == 1
+
+
+def test_complete_hedges_to_the_secondary_model(monkeypatch):
+    stats = HedgeStats()
+    monkeypatch.setattr(hedge, "get_hedge_stats", lambda: stats)
+    monkeypatch.setattr(
+        hedge,
+        "get_llm_config_by_id",
+        lambda config_id: LLMConfig(
+            model="backup", api_key="k2", base_url="https://backup.example.com/v1"
+        ),
+    )
+    calls = []
+
+    async def fake_complete(**kwargs):
+        calls.append((kwargs["model"], kwargs["base_url"], kwargs.get("max_tokens")))
+        if kwargs["model"] == "main":
+            await asyncio.sleep(5)
+        return f"from {kwargs['model']}"
+
+    monkeypatch.setattr(factory.cloud_provider, "complete", fake_complete)
+
+    result = asyncio.run(
+        factory.complete(
+            "q",
+            model="main",
+            base_url="https://api.example.com/v1",
+            api_key="k",
+            max_tokens=100,
+            hedge={"enabled": True, "delay": 0.05, "config_id": "backup"},
+        )
+    )
+    assert result == "from backup"
+    assert calls == [
+        ("main", "https://api.example.com/v1", 100),
+        ("backup", "https://backup.example.com/v1", 100),
+    ]
+    assert stats.get_stats()["complete"]["hedge_wins"] == 1
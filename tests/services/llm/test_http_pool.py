@@ -0,0 +1,67 @@
+"""Tests for the pooled LLM HTTP sessions."""
+
+import asyncio
+
+from aiohttp import web
+
+from src.services.llm import local_provider
+from src.services.llm.http_pool import PoolConfig, SessionPool, get_session_pool
+
+
+async def _start_server():
+    async def chat(request):
+        body = await request.json()
+        return web.json_response(
+            {"choices": [{"message": {"content": body["messages"][-1]["content"]}}]}
+        )
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/v1"
+
+
+def test_sessions_are_shared_per_origin_and_loop():
+    pool = SessionPool(PoolConfig(limit=4, limit_per_host=2, keepalive_timeout=5))
+
+    async def run():
+        before = pool.get_stats()["total_requests"]
+        a = pool.get_session("https://api.example.com/v1/chat/completions")
+        b = pool.get_session("https://api.example.com/v1/embeddings")
+        c = pool.get_session("https://other.example.com/v1/chat/completions")
+        assert a is b
+        assert a is not c
+        stats = pool.get_stats()
+        assert stats["sessions"] == 2
+        assert stats["total_requests"] - before == 3
+        assert stats["limit_per_host"] == 2
+        await pool.close()
+        assert a.closed and c.closed
+        return a
+
+    first = asyncio.run(run())
+    # A new event loop gets a new session
+    second = asyncio.run(run())
+    assert first is not second
+
+
+def test_local_provider_reuses_pooled_session():
+    async def run():
+        runner, base_url = await _start_server()
+        try:
+            for text in ("one", "two"):
+                result = await local_provider.complete(text, model="m", base_url=base_url)
+                assert result == text
+            stats = get_session_pool().get_stats()
+            endpoint = [e for e in stats["endpoints"] if e["origin"] in base_url][0]
+            assert endpoint["requests"] == 2
+            assert endpoint["idle_connections"] == 1  # keep-alive connection kept for reuse
+        finally:
+            await get_session_pool().close()
+            await runner.cleanup()
+
+    asyncio.run(run())
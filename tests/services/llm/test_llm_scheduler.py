@@ -0,0 +1,156 @@
+"""Tests for LLM admission control (concurrency, priorities, fair queuing, budgets)."""
+
+import asyncio
+from types import SimpleNamespace
+
+from src.services.llm import factory
+from src.services.llm import scheduler as scheduler_module
+from src.services.llm.scheduler import LLMScheduler, set_llm_session
+
+ENDPOINT = "https://api.example.com/v1"
+
+
+def test_concurrency_cap_and_priority_order():
+    scheduler = LLMScheduler(max_concurrency=1)
+    order = []
+
+    async def call(name, priority, hold):
+        async with scheduler.admit(ENDPOINT, priority=priority):
+            order.append(name)
+            await hold
+
+    async def run():
+        release = asyncio.get_running_loop().create_future()
+        first = asyncio.create_task(call("first", "normal", release))
+        await asyncio.sleep(0)
+        done = asyncio.get_running_loop().create_future()
+        done.set_result(None)
+        rest = [
+            asyncio.create_task(call("batch", "batch", done)),
+            asyncio.create_task(call("normal", "normal", done)),
+            asyncio.create_task(call("interactive", "interactive", done)),
+        ]
+        await asyncio.sleep(0)
+        lane = scheduler.get_stats()["lanes"]["https://api.example.com"]
+        assert lane["active"] == 1
+        assert lane["queued"] == {"interactive": 1, "normal": 1, "batch": 1}
+        release.set_result(None)
+        await asyncio.gather(first, *rest)
+
+    asyncio.run(run())
+    assert order == ["first", "interactive", "normal", "batch"]
+    lane = scheduler.get_stats()["lanes"]["https://api.example.com"]
+    assert lane["active"] == 0
+    assert lane["max_queued"] == 3
+    assert lane["admitted"] == {"interactive": 1, "normal": 2, "batch": 1}
+
+
+def test_sessions_are_served_round_robin():
+    scheduler = LLMScheduler(max_concurrency=1)
+    order = []
+
+    async def call(session, n):
+        set_llm_session(session)
+        async with scheduler.admit(ENDPOINT, priority="batch"):
+            order.append((session, n))
+            await asyncio.sleep(0)
+
+    async def run():
+        release = asyncio.get_running_loop().create_future()
+
+        async def holder():
+            async with scheduler.admit(ENDPOINT, priority="batch", session="x"):
+                await release
+
+        held = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        # Session A queues three calls before B queues any
+        tasks = [asyncio.create_task(call("a", n)) for n in range(3)]
+        tasks += [asyncio.create_task(call("b", n)) for n in range(2)]
+        await asyncio.sleep(0)
+        release.set_result(None)
+        await asyncio.gather(held, *tasks)
+
+    asyncio.run(run())
+    assert order == [("a", 0), ("b", 0), ("a", 1), ("b", 1), ("a", 2)]
+
+
+def test_token_budget_delays_admission(monkeypatch):
+    clock = [1000.0]
+    # Only the scheduler's clock moves; the event loop keeps real time
+    monkeypatch.setattr(scheduler_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    scheduler = LLMScheduler(max_concurrency=4, tokens_per_minute=100)
+    admitted = []
+
+    async def call(name, tokens):
+        async with scheduler.admit(ENDPOINT, tokens=tokens):
+            admitted.append(name)
+
+    async def run():
+        await call("first", 80)
+        second = asyncio.create_task(call("second", 50))
+        await asyncio.sleep(0.01)
+        assert admitted == ["first"]
+        # Once the first request leaves the window the second one fits
+        clock[0] += 61
+        scheduler.set_limits(ENDPOINT)
+        await asyncio.wait_for(second, 1)
+
+    asyncio.run(run())
+    assert admitted == ["first", "second"]
+
+
+def test_cancelled_waiter_frees_its_place():
+    scheduler = LLMScheduler(max_concurrency=1)
+
+    async def run():
+        release = asyncio.get_running_loop().create_future()
+
+        async def holder():
+            async with scheduler.admit(ENDPOINT):
+                await release
+
+        held = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        release.set_result(None)
+        await held
+
+    asyncio.run(run())
+    lane = scheduler.get_stats()["lanes"]["https://api.example.com"]
+    assert lane["active"] == 0
+    assert lane["queued"] == {"interactive": 0, "normal": 0, "batch": 0}
+
+
+def test_factory_calls_pass_through_the_scheduler(monkeypatch):
+    scheduler = LLMScheduler(max_concurrency=2)
+    monkeypatch.setattr(factory, "get_llm_scheduler", lambda: scheduler)
+    running = []
+    peak = []
+
+    async def fake_complete(**kwargs):
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+        return "ok"
+
+    monkeypatch.setattr(factory.cloud_provider, "complete", fake_complete)
+
+    async def run():
+        return await asyncio.gather(
+            *[
+                factory.complete(
+                    "q", model="m", base_url=ENDPOINT, api_key="k", priority="interactive"
+                )
+                for _ in range(5)
+            ]
+        )
+
+    assert asyncio.run(run()) == ["ok"] * 5
+    assert max(peak) == 2
+    lane = scheduler.get_stats()["lanes"]["https://api.example.com"]
+    assert lane["admitted"]["interactive"] == 5
@@ -0,0 +1,128 @@
+"""Tests for prompt-prefix assembly, Anthropic cache breakpoints and cached-token usage."""
+
+import asyncio
+
+from aiohttp import web
+
+from src.logging import LLMStats
+from src.services.llm import cloud_provider
+from src.services.llm.prompt_cache import CACHE_CONTROL, assemble_messages, to_anthropic
+from src.services.llm.usage import capture_usage, parse_usage
+
+CHAT = [
+    {"role": "system", "content": "You are a tutor."},
+    {"role": "user", "content": "q1"},
+    {"role": "assistant", "content": "a1"},
+    {"role": "system", "content": "Reference context: retrieved this turn"},
+    {"role": "user", "content": "q2"},
+]
+
+
+def test_stable_context_follows_the_system_prompt():
+    messages = assemble_messages("sys", "question", context=["outline", "citations"])
+    assert [m["content"] for m in messages] == ["sys", "outline", "citations", "question"]
+    assert [m["role"] for m in messages] == ["system", "system", "system", "user"]
+
+    messages = assemble_messages("ignored", "ignored", context="knowledge chain", messages=CHAT)
+    assert [m["content"] for m in messages[:3]] == ["You are a tutor.", "knowledge chain", "q1"]
+    assert messages[3:] == CHAT[2:]
+
+
+def test_anthropic_breakpoints_end_the_stable_prefix():
+    system, msg_list = to_anthropic(CHAT, "unused", "unused", cache=True)
+    assert system == [{"type": "text", "text": "You are a tutor.", "cache_control": CACHE_CONTROL}]
+    assert msg_list[0] == {"role": "user", "content": "q1"}
+    # The last turn before the volatile suffix closes the cached prefix
+    assert msg_list[1]["content"] == [
+        {"type": "text", "text": "a1", "cache_control": CACHE_CONTROL}
+    ]
+    # Per-turn context is folded into the user turn instead of the system blocks
+    assert msg_list[2] == {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": "Reference context: retrieved this turn"},
+            {"type": "text", "text": "q2"},
+        ],
+    }
+
+    system, msg_list = to_anthropic(
+        assemble_messages("sys", "question", context="outline"), "", "", cache=True
+    )
+    assert [block.get("cache_control") for block in system] == [CACHE_CONTROL, CACHE_CONTROL]
+    assert msg_list == [{"role": "user", "content": "question"}]
+
+    # Without breakpoints the request keeps the plain string system prompt
+    assert to_anthropic(None, "sys", "question", cache=False) == (
+        "sys",
+        [{"role": "user", "content": "question"}],
+    )
+
+
+def test_usage_reports_cached_prompt_tokens():
+    openai = parse_usage(
+        {
+            "prompt_tokens": 1200,
+            "completion_tokens": 50,
+            "prompt_tokens_details": {"cached_tokens": 1024},
+        }
+    )
+    assert (openai.prompt_tokens, openai.cached_tokens) == (1200, 1024)
+    deepseek = parse_usage({"prompt_tokens": 900, "prompt_cache_hit_tokens": 640})
+    assert deepseek.cached_tokens == 640
+    assert parse_usage({"total_tokens": 5}) is None
+
+    stats = LLMStats("Test")
+    stats.add_call(model="m", prompt_tokens=1200, completion_tokens=50, cached_tokens=1024)
+    stats.add_call(model="m", system_prompt="sys", user_prompt="q", response="a")
+    summary = stats.get_summary()
+    assert (summary["prompt_tokens"], summary["cached_tokens"]) == (1200 + 2, 1024)
+
+
+def test_anthropic_request_carries_breakpoints_and_reports_cache_hits():
+    bodies = []
+
+    async def messages(request):
+        bodies.append(await request.json())
+        return web.json_response(
+            {
+                "content": [{"type": "text", "text": "ok"}],
+                "usage": {
+                    "input_tokens": 20,
+                    "cache_read_input_tokens": 2000,
+                    "cache_creation_input_tokens": 0,
+                    "output_tokens": 7,
+                },
+            }
+        )
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/v1/messages", messages)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            with capture_usage() as usage:
+                response = await cloud_provider.complete(
+                    "question",
+                    system_prompt="sys",
+                    model="claude-test",
+                    api_key="k",
+                    base_url=f"http://127.0.0.1:{port}/v1",
+                    binding="anthropic",
+                    messages=assemble_messages("sys", "question", context="outline"),
+                )
+            return response, usage
+        finally:
+            await runner.cleanup()
+
+    response, usage = asyncio.run(run())
+    assert response == "ok"
+    assert bodies[0]["system"][-1] == {
+        "type": "text",
+        "text": "outline",
+        "cache_control": CACHE_CONTROL,
+    }
+    assert (usage.prompt_tokens, usage.cached_tokens, usage.completion_tokens) == (2020, 2000, 7)
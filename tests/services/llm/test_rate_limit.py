@@ -0,0 +1,175 @@
+"""Tests for header-driven rate limiting of LLM calls."""
+
+import asyncio
+from email.utils import formatdate
+import sys
+import time
+from types import ModuleType
+
+from aiohttp import web
+import pytest
+
+from src.services.llm import factory
+from src.services.llm.http_pool import close_session_pool
+from src.services.llm.rate_limit import (
+    RateLimiter,
+    get_rate_limiter,
+    parse_rate_limit_headers,
+    reset_rate_limiter,
+)
+
+
+def test_parse_openai_and_anthropic_headers():
+    info = parse_rate_limit_headers(
+        {
+            "X-RateLimit-Limit-Requests": "500",
+            "x-ratelimit-remaining-requests": "499",
+            "x-ratelimit-reset-requests": "120ms",
+            "x-ratelimit-limit-tokens": "30000",
+            "x-ratelimit-remaining-tokens": "29000",
+            "x-ratelimit-reset-tokens": "1m30s",
+        }
+    )
+    assert (info.limit_requests, info.remaining_requests) == (500, 499)
+    assert info.reset_requests == pytest.approx(0.12)
+    assert (info.limit_tokens, info.remaining_tokens, info.reset_tokens) == (30000, 29000, 90.0)
+    assert info.retry_after is None
+
+    info = parse_rate_limit_headers(
+        {
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "0",
+            "anthropic-ratelimit-requests-reset": "2099-01-01T00:00:00Z",
+            "retry-after": "7",
+        }
+    )
+    assert (info.limit_requests, info.remaining_requests) == (50, 0)
+    assert info.reset_requests > 0
+    assert info.retry_after == 7.0
+
+    assert parse_rate_limit_headers({"retry-after-ms": "250"}).retry_after == 0.25
+    http_date = parse_rate_limit_headers({"retry-after": formatdate(time.time() + 30, usegmt=True)})
+    assert 25 < http_date.retry_after <= 30
+    assert parse_rate_limit_headers({"content-type": "application/json"}).is_empty()
+
+
+def test_requests_are_paced_at_the_reported_rate():
+    limiter = RateLimiter()
+    # 2 of 10 requests left, full again in 0.8s: 10 requests per second
+    limiter.observe(
+        "https://api.example.com/v1",
+        "m",
+        {
+            "x-ratelimit-limit-requests": "10",
+            "x-ratelimit-remaining-requests": "2",
+            "x-ratelimit-reset-requests": "0.8s",
+        },
+    )
+
+    async def run():
+        return await asyncio.gather(
+            *[limiter.acquire("https://api.example.com/v1/chat", "m") for _ in range(5)]
+        )
+
+    delays = asyncio.run(run())
+    assert delays == pytest.approx([0.0, 0.0, 0.1, 0.2, 0.3], abs=0.02)
+    # Other models and endpoints have their own buckets
+    assert asyncio.run(limiter.acquire("https://api.example.com/v1", "other")) == 0.0
+    stats = limiter.get_stats()["providers"]["https://api.example.com|m"]
+    assert (stats["requests_limit"], stats["paced"]) == (10.0, 3)
+
+
+def test_unreported_endpoints_are_not_paced():
+    limiter = RateLimiter()
+    limiter.observe("http://127.0.0.1:1234/v1", "m", {"content-type": "application/json"})
+
+    async def run():
+        return await asyncio.gather(
+            *[limiter.acquire("http://127.0.0.1:1234/v1", "m", tokens=10**6) for _ in range(20)]
+        )
+
+    assert asyncio.run(run()) == [0.0] * 20
+
+
+def test_429_retries_after_the_providers_retry_after():
+    hits = []
+
+    async def chat(request):
+        hits.append(time.monotonic())
+        if len(hits) == 1:
+            return web.json_response(
+                {"error": "slow down"}, status=429, headers={"retry-after-ms": "200"}
+            )
+        return web.json_response(
+            {"choices": [{"message": {"content": "ok"}}]},
+            headers={"x-ratelimit-limit-requests": "60", "x-ratelimit-remaining-requests": "59"},
+        )
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", chat)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            # retry_delay is far above retry-after, so a fast retry proves it was honored
+            return await factory.complete(
+                "q", model="m", base_url=f"http://127.0.0.1:{port}/v1", retry_delay=30
+            )
+        finally:
+            await close_session_pool()
+            await runner.cleanup()
+
+    reset_rate_limiter()
+    try:
+        assert asyncio.run(run()) == "ok"
+        assert 0.15 <= hits[1] - hits[0] < 5
+        (stats,) = get_rate_limiter().get_stats()["providers"].values()
+        assert (stats["throttled"], stats["observed"], stats["requests_limit"]) == (1, 2, 60.0)
+    finally:
+        reset_rate_limiter()
+
+
+def test_completions_observe_headers_even_with_lightrag_installed(monkeypatch):
+    # An importable lightrag must not take the request off the observed path
+    lightrag_openai = ModuleType("lightrag.llm.openai")
+
+    async def openai_complete_if_cache(*args, **kwargs):
+        raise AssertionError("completion bypassed the rate limiter")
+
+    lightrag_openai.openai_complete_if_cache = openai_complete_if_cache
+    monkeypatch.setitem(sys.modules, "lightrag.llm.openai", lightrag_openai)
+
+    async def chat(request):
+        return web.json_response(
+            {"choices": [{"message": {"content": "ok"}}]},
+            headers={
+                "x-ratelimit-limit-tokens": "30000",
+                "x-ratelimit-remaining-tokens": "20000",
+                "x-ratelimit-reset-tokens": "20s",
+            },
+        )
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", chat)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await factory.complete("q", model="m", base_url=f"http://127.0.0.1:{port}/v1")
+        finally:
+            await close_session_pool()
+            await runner.cleanup()
+
+    reset_rate_limiter()
+    try:
+        assert asyncio.run(run()) == "ok"
+        (stats,) = get_rate_limiter().get_stats()["providers"].values()
+        assert (stats["observed"], stats["tokens_limit"]) == (1, 30000.0)
+    finally:
+        reset_rate_limiter()
@@ -0,0 +1,47 @@
+"""Tests for ANN index type selection and numpy top-k retrieval."""
+
+import numpy as np
+
+from src.services.rag.components.ann import (
+    can_update_in_place,
+    ivf_nlist,
+    pq_subquantizers,
+    select_index_type,
+)
+from src.services.rag.components.retrievers.dense import top_k_indices
+
+
+def test_auto_selection_by_corpus_size():
+    assert select_index_type("auto", 1_000) == "flat"
+    assert select_index_type("auto", 100_000) == "ivf_flat"
+    assert select_index_type("auto", 2_000_000) == "ivf_pq"
+    assert select_index_type("hnsw", 10) == "hnsw"
+    # Too small to train the requested type
+    assert select_index_type("ivf_pq", 5_000) == "ivf_flat"
+    assert select_index_type("ivf_flat", 50) == "flat"
+    assert select_index_type("bogus", 10) == "flat"
+
+
+def test_ivf_and_pq_parameters():
+    assert ivf_nlist(10_000) == 256  # 4*sqrt(n) = 400, capped at n // 39
+    assert ivf_nlist(1_000_000) == 4000
+    assert pq_subquantizers(3072) == 64
+    assert pq_subquantizers(768) == 64
+    assert pq_subquantizers(100) == 4  # 25 dims per sub-quantizer
+
+
+def test_in_place_update_rules():
+    assert can_update_in_place("flat", {}, 10)
+    assert not can_update_in_place("hnsw", {"index_type": "hnsw"}, 10)
+    ivf = {"index_type": "ivf_flat", "trained_on": 1000}
+    assert can_update_in_place("ivf_flat", ivf, 3000)
+    assert not can_update_in_place("ivf_flat", ivf, 5000)
+    assert not can_update_in_place("ivf_pq", ivf, 1000)
+
+
+def test_top_k_indices_matches_full_sort():
+    rng = np.random.default_rng(0)
+    scores = rng.random(1000).astype(np.float32)
+    expected = np.argsort(scores)[::-1][:10]
+    assert top_k_indices(scores, 10).tolist() == expected.tolist()
+    assert top_k_indices(scores[:3], 10).tolist() == np.argsort(scores[:3])[::-1].tolist()
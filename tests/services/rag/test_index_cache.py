@@ -0,0 +1,134 @@
+"""Tests for the resident vector index cache used by DenseRetriever."""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+import threading
+
+import numpy as np
+
+from src.services.rag.components.indexers.vector import VectorIndexer
+from src.services.rag.components.retrievers.dense import DenseRetriever
+from src.services.rag.components.retrievers.index_cache import (
+    CachedVectorIndex,
+    VectorIndexCache,
+    get_store_signature,
+    reset_vector_index_cache,
+)
+from src.services.rag.components.vector_store import INFO_FILE, STORE_FORMAT, VectorStore
+from src.services.rag.types import Chunk, Document
+
+
+def _make_store(path: Path, payload: str = "[]") -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "metadata.json").write_text(payload, encoding="utf-8")
+    return path
+
+
+def _entry(path: Path, nbytes: int) -> CachedVectorIndex:
+    return CachedVectorIndex(signature=get_store_signature(path), metadata=[], nbytes=nbytes)
+
+
+def test_hit_miss_and_mtime_invalidation(tmp_path: Path):
+    store = _make_store(tmp_path / "kb" / "vector_store")
+    cache = VectorIndexCache(max_bytes=1000)
+
+    assert cache.get(store) is None
+    cache.put(store, _entry(store, 10))
+    assert cache.get(store) is not None
+
+    # Rewriting a store file changes its signature
+    (store / "metadata.json").write_text("[1]", encoding="utf-8")
+    stat = os.stat(store / "metadata.json")
+    os.utime(store / "metadata.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.get(store) is None
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["invalidations"] == 1
+    assert stats["entries"] == 0
+
+
+def test_lru_eviction_by_bytes(tmp_path: Path):
+    a = _make_store(tmp_path / "a")
+    b = _make_store(tmp_path / "b")
+    c = _make_store(tmp_path / "c")
+    cache = VectorIndexCache(max_bytes=100)
+
+    cache.put(a, _entry(a, 40))
+    cache.put(b, _entry(b, 40))
+    assert cache.get(a) is not None  # a becomes most recently used
+    cache.put(c, _entry(c, 40))
+
+    assert cache.get(b) is None
+    assert cache.get(a) is not None
+    assert cache.get(c) is not None
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_stats()["bytes"] == 80
+
+
+def test_dense_retriever_serves_from_cache_until_reindexed(tmp_path: Path, monkeypatch):
+    reset_vector_index_cache()
+
+    class FakeClient:
+        async def embed(self, texts):
+            return [[1.0, 0.0] for _ in texts]
+
+    import src.services.embedding as embedding
+
+    monkeypatch.setattr(embedding, "get_embedding_client", lambda: FakeClient())
+
+    def make_doc(texts):
+        doc = Document(content="")
+        for i, text in enumerate(texts):
+            doc.add_chunk(Chunk(content=text, embedding=[1.0, float(i)]))
+        return doc
+
+    # Chunk records are read from SQLite in a worker thread, not on the event loop
+    lookup_threads = []
+    get_chunks = VectorStore.get_chunks
+
+    def recording_get_chunks(self, chunk_ids):
+        lookup_threads.append(threading.current_thread())
+        return get_chunks(self, chunk_ids)
+
+    monkeypatch.setattr(VectorStore, "get_chunks", recording_get_chunks)
+
+    indexer = VectorIndexer(kb_base_dir=str(tmp_path))
+    indexer.use_faiss = False
+    retriever = DenseRetriever(kb_base_dir=str(tmp_path), top_k=1)
+    retriever.use_faiss = False
+
+    async def run():
+        assert await indexer.process("kb", [make_doc(["alpha", "beta"])])
+        first = await retriever.process("q", kb_name="kb")
+        second = await retriever.process("q", kb_name="kb")
+        assert first["content"] == second["content"] == "alpha"
+        assert retriever._index_cache.get_stats()["hits"] == 1
+
+        assert await indexer.process("kb", [make_doc(["gamma"])])
+        third = await retriever.process("q", kb_name="kb")
+        assert third["content"] == "gamma"
+
+    asyncio.run(run())
+    assert lookup_threads and threading.main_thread() not in lookup_threads
+
+    info = (tmp_path / "kb" / "vector_store" / "info.json").read_text(encoding="utf-8")
+    assert '"generation": 2' in info
+    reset_vector_index_cache()
+
+
+def test_faiss_info_without_generation_path_falls_back_to_empty_vectors(tmp_path: Path):
+    store_dir = tmp_path / "kb" / "vector_store"
+    store_dir.mkdir(parents=True)
+    info = {"format": STORE_FORMAT, "use_faiss": True, "embedding_dim": 2}
+    (store_dir / INFO_FILE).write_text(json.dumps(info), encoding="utf-8")
+
+    retriever = DenseRetriever(kb_base_dir=str(tmp_path), top_k=1)
+    retriever.use_faiss = True
+    cached = retriever._load_index(store_dir)
+
+    assert cached.faiss_index is None
+    assert cached.size == 0
@@ -0,0 +1,86 @@
+"""Tests for the process-wide loaded-index cache of LlamaIndexPipeline."""
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("llama_index.core")
+
+from llama_index.core import Settings  # noqa: E402
+from llama_index.core.embeddings import MockEmbedding  # noqa: E402
+
+from src.services.rag.pipelines import llamaindex  # noqa: E402
+from src.services.rag.pipelines.llamaindex import (  # noqa: E402
+    LlamaIndexPipeline,
+    _get_cached_index,
+    get_index_cache_stats,
+    invalidate_index_cache,
+)
+
+
+@pytest.fixture
+def pipeline(tmp_path: Path, monkeypatch):
+    # Offline embeddings instead of the configured EmbeddingClient
+    monkeypatch.setattr(
+        LlamaIndexPipeline,
+        "_configure_settings",
+        lambda self: setattr(Settings, "embed_model", MockEmbedding(embed_dim=8)),
+    )
+    invalidate_index_cache()
+    yield LlamaIndexPipeline(kb_base_dir=str(tmp_path / "kbs"))
+    invalidate_index_cache()
+
+
+def _write(tmp_path: Path, name: str, text: str) -> str:
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def _doc_count(index) -> int:
+    return len(index.docstore.docs)
+
+
+def test_index_is_reused_until_persisted_files_change(tmp_path: Path, pipeline):
+    assert asyncio.run(pipeline.initialize("kb", [_write(tmp_path, "a.txt", "alpha")]))
+    storage_dir = Path(pipeline.kb_base_dir) / "kb" / "llamaindex_storage"
+    published = _get_cached_index(storage_dir)
+    assert _get_cached_index(storage_dir) is published
+    hits = get_index_cache_stats()["hits"]
+    assert hits >= 2
+
+    # Rewriting a persisted file changes the signature and forces a reload
+    persisted = next(p for p in storage_dir.iterdir() if p.is_file())
+    stat = persisted.stat()
+    os.utime(persisted, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    reloaded = _get_cached_index(storage_dir)
+    assert reloaded is not published
+    assert _doc_count(reloaded) == _doc_count(published)
+    assert get_index_cache_stats()["hits"] == hits
+
+
+def test_add_documents_swaps_in_a_new_index(tmp_path: Path, pipeline):
+    assert asyncio.run(pipeline.initialize("kb", [_write(tmp_path, "a.txt", "alpha")]))
+    storage_dir = Path(pipeline.kb_base_dir) / "kb" / "llamaindex_storage"
+    before = _get_cached_index(storage_dir)
+    count = _doc_count(before)
+
+    assert asyncio.run(pipeline.add_documents("kb", [_write(tmp_path, "b.txt", "beta")]))
+
+    # Copy-on-write: searches holding the old handle never see a half-inserted index
+    after = _get_cached_index(storage_dir)
+    assert after is not before
+    assert _doc_count(before) == count
+    assert _doc_count(after) > count
+
+
+def test_delete_evicts_the_cached_index(tmp_path: Path, pipeline):
+    assert asyncio.run(pipeline.initialize("kb", [_write(tmp_path, "a.txt", "alpha")]))
+    storage_dir = Path(pipeline.kb_base_dir) / "kb" / "llamaindex_storage"
+    assert str(storage_dir.resolve()) in llamaindex._INDEX_CACHE
+
+    assert asyncio.run(pipeline.delete("kb"))
+    assert str(storage_dir.resolve()) not in llamaindex._INDEX_CACHE
+    assert get_index_cache_stats()["entries"] == 0
@@ -0,0 +1,76 @@
+"""Tests for the shared pipeline registry and cached KB providers of RAGService."""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.services.rag import service
+from src.services.rag.service import RAGService, evict_pipelines, list_shared_pipelines
+
+
+def test_pipelines_are_shared_and_providers_cached(tmp_path: Path, monkeypatch):
+    built = []
+
+    class FakePipeline:
+        def __init__(self, name):
+            self.name = name
+
+        async def search(self, query, kb_name, mode, **kwargs):
+            return {"answer": f"{self.name}:{query}"}
+
+    def fake_get_pipeline(name, kb_base_dir=None, **kwargs):
+        built.append(name)
+        return FakePipeline(name)
+
+    monkeypatch.setattr(service, "get_pipeline", fake_get_pipeline)
+    evict_pipelines()
+
+    metadata = tmp_path / "kb" / "metadata.json"
+    metadata.parent.mkdir()
+    metadata.write_text(json.dumps({"rag_provider": "lightrag"}), encoding="utf-8")
+    reads = []
+    real_open = open
+
+    def counting_open(path, *args, **kwargs):
+        if Path(path) == metadata:
+            reads.append(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+
+    async def run():
+        results = []
+        for _ in range(3):
+            rag = RAGService(kb_base_dir=str(tmp_path), provider="llamaindex")
+            results.append(await rag.search("q", "kb"))
+        return results
+
+    results = asyncio.run(run())
+    assert [r["answer"] for r in results] == ["lightrag:q"] * 3
+    assert built == ["lightrag"]
+    assert len(reads) == 1
+    assert list_shared_pipelines() == [
+        {"provider": "lightrag", "kb_base_dir": str(tmp_path.resolve())}
+    ]
+
+    # Rewriting the metadata switches provider on the next search
+    metadata.write_text(json.dumps({"rag_provider": "llamaindex"}), encoding="utf-8")
+    stat = os.stat(metadata)
+    os.utime(metadata, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    result = asyncio.run(RAGService(kb_base_dir=str(tmp_path)).search("q", "kb"))
+    assert result["answer"] == "llamaindex:q"
+    assert built == ["lightrag", "llamaindex"]
+
+    assert evict_pipelines(provider="lightrag") == 1
+    assert evict_pipelines(kb_base_dir=str(tmp_path)) == 1
+    assert list_shared_pipelines() == []
+
+
+def test_unknown_provider_is_not_registered():
+    evict_pipelines()
+    with pytest.raises(ValueError):
+        service.get_shared_pipeline("nonexistent")
+    assert list_shared_pipelines() == []
@@ -0,0 +1,127 @@
+"""Tests for the streaming, staged RAGPipeline.initialize."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.services.rag.components.base import BaseComponent
+from src.services.rag.components.chunkers.fixed import FixedSizeChunker
+from src.services.rag.pipeline import RAGPipeline
+
+
+class UnusedParser(BaseComponent):
+    name = "unused_parser"
+
+
+class RecordingEmbedder(BaseComponent):
+    name = "recording_embedder"
+
+    def __init__(self, batch_size: int):
+        super().__init__()
+        self.batch_size = batch_size
+        self.calls = []
+
+    async def process(self, doc, **kwargs):
+        self.calls.append(len(doc.chunks))
+        for chunk in doc.chunks:
+            chunk.embedding = [1.0]
+        return doc
+
+
+class RecordingIndexer(BaseComponent):
+    name = "recording_indexer"
+
+    def __init__(self, incremental: bool):
+        super().__init__()
+        self.incremental = incremental
+        self.calls = []
+
+    async def process(self, kb_name, documents, **kwargs):
+        assert all(c.embedding for d in documents for c in d.chunks)
+        self.calls.append(sorted(Path(d.file_path).name for d in documents))
+        return True
+
+
+class TaggingChunker(FixedSizeChunker):
+    """Prefixes chunks with the ``tag`` option, to show it reached the pool."""
+
+    async def process(self, doc, **kwargs):
+        chunks = await super().process(doc, **kwargs)
+        for chunk in chunks:
+            chunk.content = f"{kwargs['tag']}:{chunk.content}"
+        return chunks
+
+
+def _write_files(tmp_path: Path, count: int):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_text("x" * 30, encoding="utf-8")  # three 10-char chunks
+        paths.append(str(path))
+    return paths
+
+
+def test_batches_span_documents_and_stream_to_incremental_indexers(tmp_path: Path):
+    embedder = RecordingEmbedder(batch_size=5)
+    streaming = RecordingIndexer(incremental=True)
+    rebuilding = RecordingIndexer(incremental=False)
+    pipeline = (
+        RAGPipeline("test", kb_base_dir=str(tmp_path), parse_concurrency=2, queue_size=1)
+        .parser(UnusedParser())
+        .chunker(FixedSizeChunker(chunk_size=10, chunk_overlap=0))
+        .embedder(embedder)
+        .indexer(streaming)
+        .indexer(rebuilding)
+    )
+
+    assert asyncio.run(pipeline.initialize("kb", _write_files(tmp_path, 5)))
+
+    # 15 chunks, flushed once at least 5 are pending: 6 + 6 + 3
+    assert embedder.calls == [6, 6, 3]
+    assert [len(batch) for batch in streaming.calls] == [2, 2, 1]
+    assert rebuilding.calls == [[f"doc{i}.txt" for i in range(5)]]
+
+    stats = pipeline.last_run_stats
+    assert stats["parse"].items == 5
+    assert stats["chunk"].items == 15
+    assert stats["embed"].items == 15
+    assert stats["index"].items == 5
+
+
+def test_cpu_bound_chunkers_run_in_process_pool(tmp_path: Path):
+    indexer = RecordingIndexer(incremental=False)
+    pipeline = (
+        RAGPipeline("test", kb_base_dir=str(tmp_path), chunk_workers=2)
+        .parser(UnusedParser())
+        .chunker(FixedSizeChunker(chunk_size=10, chunk_overlap=0))
+        .embedder(RecordingEmbedder(batch_size=100))
+        .indexer(indexer)
+    )
+
+    assert asyncio.run(pipeline.initialize("kb", _write_files(tmp_path, 3)))
+    assert pipeline.last_run_stats["chunk"].items == 9
+    assert len(indexer.calls[0]) == 3
+
+
+def test_pooled_chunkers_receive_initialize_kwargs(tmp_path: Path):
+    contents = []
+
+    class ContentIndexer(RecordingIndexer):
+        async def process(self, kb_name, documents, **kwargs):
+            contents.extend(chunk.content for doc in documents for chunk in doc.chunks)
+            return True
+
+    pipeline = (
+        RAGPipeline("test", kb_base_dir=str(tmp_path), chunk_workers=1)
+        .parser(UnusedParser())
+        .chunker(TaggingChunker(chunk_size=10, chunk_overlap=0))
+        .embedder(RecordingEmbedder(batch_size=100))
+        .indexer(ContentIndexer(incremental=False))
+    )
+
+    assert asyncio.run(pipeline.initialize("kb", _write_files(tmp_path, 1), tag="t"))
+    assert contents == ["t:" + "x" * 10] * 3
+
+    with pytest.raises(ValueError, match="picklable"):
+        asyncio.run(pipeline.initialize("kb", _write_files(tmp_path, 1), tag=lambda: None))
@@ -0,0 +1,83 @@
+"""Tests for batched multi-query search and rag_search micro-batching."""
+
+import asyncio
+from pathlib import Path
+
+from src.services.rag.components.indexers.vector import VectorIndexer
+from src.services.rag.components.retrievers.dense import DenseRetriever
+from src.services.rag.components.retrievers.index_cache import reset_vector_index_cache
+from src.services.rag.types import Chunk, Document
+from src.tools import rag_tool
+
+
+def test_dense_process_many_matches_single_queries(tmp_path: Path, monkeypatch):
+    reset_vector_index_cache()
+    vectors = {"north": [0.0, 1.0], "east": [1.0, 0.0], "diag": [1.0, 1.0]}
+    embed_calls = []
+
+    class FakeClient:
+        async def embed(self, texts):
+            embed_calls.append(list(texts))
+            return [vectors[text] for text in texts]
+
+    import src.services.embedding as embedding
+
+    monkeypatch.setattr(embedding, "get_embedding_client", lambda: FakeClient())
+
+    doc = Document(content="", metadata={"filename": "a.md"})
+    for text, vector in (("up", [0.1, 1.0]), ("right", [1.0, 0.1]), ("both", [0.7, 0.7])):
+        doc.add_chunk(Chunk(content=text, embedding=vector))
+    indexer = VectorIndexer(kb_base_dir=str(tmp_path))
+    indexer.use_faiss = False
+    retriever = DenseRetriever(kb_base_dir=str(tmp_path), top_k=1)
+    retriever.use_faiss = False
+
+    async def run():
+        assert await indexer.process("kb", [doc])
+        batch = await retriever.process_many(["north", "east", "diag"], kb_name="kb")
+        single = [await retriever.process(q, kb_name="kb") for q in ("north", "east", "diag")]
+        return batch, single
+
+    batch, single = asyncio.run(run())
+    assert [r["content"] for r in batch] == ["up", "right", "both"]
+    assert [r["content"] for r in batch] == [r["content"] for r in single]
+    assert embed_calls[0] == ["north", "east", "diag"]
+    reset_vector_index_cache()
+
+
+def test_concurrent_rag_search_calls_are_coalesced(monkeypatch):
+    calls = []
+
+    class FakeService:
+        def __init__(self, kb_base_dir=None, provider=None):
+            pass
+
+        async def search(self, query, kb_name, mode, **kwargs):
+            calls.append([query])
+            return {"query": query, "answer": query.upper()}
+
+        async def search_many(self, queries, kb_name, mode, **kwargs):
+            calls.append(list(queries))
+            return [{"query": q, "answer": q.upper()} for q in queries]
+
+    monkeypatch.setattr(rag_tool, "RAGService", FakeService)
+    monkeypatch.setattr(rag_tool, "_services", {})
+    batcher = rag_tool._SearchBatcher(window_ms=20, max_size=3)
+    monkeypatch.setattr(rag_tool, "_batcher", batcher)
+    held = []
+
+    async def run():
+        same_kb = [rag_tool.rag_search(q, kb_name="kb") for q in ("a", "b", "c", "d")]
+        other_kb = rag_tool.rag_search("e", kb_name="other")
+        gathered = asyncio.gather(*same_kb, other_kb)
+        await asyncio.sleep(0)
+        # The full batch was flushed; its task is referenced until it finishes
+        held.append(len(batcher._tasks))
+        return await gathered
+
+    results = asyncio.run(run())
+    assert held == [1]
+    assert not batcher._tasks
+    assert [r["answer"] for r in results] == ["A", "B", "C", "D", "E"]
+    # The first batch flushes when full, the rest when the window ends
+    assert sorted(calls) == [["a", "b", "c"], ["d"], ["e"]]
@@ -0,0 +1,99 @@
+"""Tests for the generational, append/delete-capable vector store."""
+
+import asyncio
+import json
+from pathlib import Path
+import pickle
+
+import numpy as np
+
+from src.services.rag.components.indexers.vector import VectorIndexer
+from src.services.rag.components.retrievers import dense
+from src.services.rag.components.vector_store import VectorStore
+from src.services.rag.types import Chunk, Document
+
+
+def _doc(name: str, vectors):
+    doc = Document(content="", file_path=f"/tmp/{name}", metadata={"filename": name})
+    for i, vector in enumerate(vectors):
+        doc.add_chunk(Chunk(content=f"{name}-{i}", embedding=list(vector)))
+    return doc
+
+
+def _indexer(tmp_path: Path) -> VectorIndexer:
+    indexer = VectorIndexer(kb_base_dir=str(tmp_path))
+    indexer.use_faiss = False
+    return indexer
+
+
+def test_append_replace_and_delete_keep_stable_ids(tmp_path: Path):
+    indexer = _indexer(tmp_path)
+    store = VectorStore(tmp_path / "kb" / "vector_store")
+
+    async def run():
+        await indexer.process("kb", [_doc("a.md", [[1, 0], [0, 1]]), _doc("b.md", [[1, 1]])])
+        first_ids = sorted(store.load_vectors(store.read_info())[0].tolist())
+
+        # Adding a document keeps existing ids
+        await indexer.process("kb", [_doc("c.md", [[2, 0]])])
+        info = store.read_info()
+        ids = store.load_vectors(info)[0].tolist()
+        assert set(first_ids) <= set(ids)
+        assert info["num_chunks"] == 4 and info["num_documents"] == 3
+
+        # Re-indexing a document replaces its chunks only
+        await indexer.process("kb", [_doc("a.md", [[0, 3]])])
+        assert store.list_documents() == {"a.md": 1, "b.md": 1, "c.md": 1}
+
+        # Deleting a document drops its vectors and records
+        assert await indexer.delete_documents("kb", ["b.md"])
+        info = store.read_info()
+        ids, vectors = store.load_vectors(info)
+        records = store.get_chunks(ids)
+        assert sorted(r["content"] for r in records.values()) == ["a.md-0", "c.md-0"]
+        assert np.allclose(np.linalg.norm(vectors.astype(np.float32), axis=1), 1.0, atol=1e-2)
+        assert info["generation"] == 4
+
+    asyncio.run(run())
+    store.close()
+
+    # Only the current and previous generation directories remain
+    gens = sorted(p.name for p in (tmp_path / "kb" / "vector_store").glob("gen-*"))
+    assert gens == ["gen-000003", "gen-000004"]
+
+
+def test_legacy_store_is_migrated_on_write(tmp_path: Path):
+    kb_dir = tmp_path / "kb" / "vector_store"
+    kb_dir.mkdir(parents=True)
+    legacy = [
+        {"id": 0, "content": "old", "type": "text", "metadata": {"source": "/x/old.md"}},
+    ]
+    (kb_dir / "metadata.json").write_text(json.dumps(legacy), encoding="utf-8")
+    with open(kb_dir / "embeddings.pkl", "wb") as f:
+        pickle.dump(np.array([[0.0, 2.0]], dtype=np.float32), f)
+    (kb_dir / "info.json").write_text(json.dumps({"use_faiss": False}), encoding="utf-8")
+
+    asyncio.run(_indexer(tmp_path).process("kb", [_doc("new.md", [[1, 0]])]))
+
+    store = VectorStore(kb_dir)
+    assert store.list_documents() == {"old.md": 1, "new.md": 1}
+    assert not (kb_dir / "metadata.json").exists()
+    assert not (kb_dir / "embeddings.pkl").exists()
+    store.close()
+
+
+def test_vectors_are_memory_mapped_float16(tmp_path: Path, monkeypatch):
+    asyncio.run(_indexer(tmp_path).process("kb", [_doc("a.md", [[3, 4], [1, 0], [0, 2]])]))
+
+    store = VectorStore(tmp_path / "kb" / "vector_store")
+    info = store.read_info()
+    ids, vectors = store.load_vectors(info, mmap=True)
+    assert info["vector_dtype"] == "float16"
+    assert isinstance(vectors, np.memmap) and vectors.dtype == np.float16
+
+    # Block-wise scoring matches a full float32 product
+    monkeypatch.setattr(dense, "SCAN_BLOCK_ROWS", 2)
+    query = np.array([0.6, 0.8], dtype=np.float32)
+    expected = vectors.astype(np.float32) @ query
+    assert np.allclose(dense.scan_scores(vectors, query), expected)
+    store.close()
@@ -0,0 +1 @@
+# Tests for web search service
@@ -0,0 +1,146 @@
+"""Tests for the web search result cache and async web search."""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+import threading
+
+import src.services.search as search
+from src.services.search.base import BaseSearchProvider, SearchHTTPResponse
+from src.services.search.cache import SearchCache, reset_search_cache
+from src.services.search.providers.serper import SerperProvider
+from src.services.search.types import WebSearchResponse
+
+
+def test_cache_expires_evicts_and_persists(tmp_path: Path, monkeypatch):
+    now = {"t": 1000.0}
+    monkeypatch.setattr("src.services.search.cache.time.time", lambda: now["t"])
+    path = tmp_path / "search.sqlite3"
+    cache = SearchCache(ttl_seconds=10, max_entries=2, path=path)
+    keys = [cache.make_key("jina", q, {"num": 5}) for q in ("a", "b", "c")]
+
+    # Whitespace and case do not change the key; options do
+    assert keys[0] == cache.make_key("jina", "  A ", {"num": 5})
+    assert keys[0] != cache.make_key("jina", "a", {"num": 6})
+
+    cache.put(keys[0], {"answer": "a"})
+    cache.put(keys[1], {"answer": "b"})
+    assert cache.get(keys[0]) == {"answer": "a"}  # refresh "a"
+    cache.put(keys[2], {"answer": "c"})
+    assert cache.get(keys[1]) is None
+    cache.close()
+
+    reopened = SearchCache(ttl_seconds=10, max_entries=2, path=path)
+    assert reopened.get(keys[0]) == {"answer": "a"}
+    now["t"] += 11
+    assert reopened.get(keys[2]) is None
+    reopened.close()
+
+
+def test_serper_request_and_response_are_split():
+    provider = SerperProvider(api_key="key")
+    request = provider.build_request("attention", mode="scholar", num=3)
+    assert request.url.endswith("/scholar") and request.json["num"] == 3
+
+    body = {"organic": [{"title": "T", "link": "https://x", "year": 2017}]}
+    response = provider.parse_response(
+        "attention", SearchHTTPResponse(200, json.dumps(body)), request
+    )
+    assert response.provider == "serper_scholar"
+    assert response.search_results[0].attributes["year"] == 2017
+
+
+def test_aweb_search_caches_results(tmp_path: Path, monkeypatch):
+    calls = []
+
+    class FakeProvider(BaseSearchProvider):
+        name = "fake"
+        requires_api_key = False
+        supports_answer = True
+
+        def search(self, query, **kwargs):
+            calls.append(query)
+            return WebSearchResponse(query=query, answer=f"answer {len(calls)}", provider="fake")
+
+    reset_search_cache()
+    monkeypatch.setattr(search, "_get_web_search_config", lambda: {"provider": "fake"})
+    monkeypatch.setattr(search, "get_provider", lambda name: FakeProvider())
+
+    async def run():
+        first = await search.aweb_search("What is AI?", output_dir=str(tmp_path))
+        second = await search.aweb_search("what is  ai?", output_dir=str(tmp_path))
+        return first, second
+
+    first, second = asyncio.run(run())
+    third = search.web_search("What is AI?")
+    other = search.web_search("What is AI?", max_results=3)
+
+    assert calls == ["What is AI?", "What is AI?"]
+    assert first["answer"] == second["answer"] == third["answer"] == "answer 1"
+    assert other["answer"] == "answer 2"
+    assert Path(second["result_file"]).exists()
+    reset_search_cache()
+
+
+def test_web_search_config_is_reloaded_only_when_main_yaml_changes(tmp_path: Path, monkeypatch):
+    (tmp_path / "config").mkdir()
+    main_yaml = tmp_path / "config" / "main.yaml"
+    main_yaml.write_text("tools: {}\n")
+    loads = []
+
+    def load(name, root):
+        loads.append(name)
+        return {"tools": {"web_search": {"provider": f"p{len(loads)}"}}}
+
+    monkeypatch.setattr(search, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(search, "load_config_with_main", load)
+    monkeypatch.setattr(search, "_config_cache", None)
+
+    assert search._get_web_search_config()["provider"] == "p1"
+    assert search._get_web_search_config()["provider"] == "p1"
+    stat = main_yaml.stat()
+    os.utime(main_yaml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert search._get_web_search_config()["provider"] == "p2"
+    assert len(loads) == 2
+
+
+def test_persistent_cache_lookup_runs_off_the_event_loop(tmp_path: Path, monkeypatch):
+    lookup_threads = []
+    cache = SearchCache(path=tmp_path / "search.sqlite3")
+    real_get = cache.get
+
+    def get(key):
+        lookup_threads.append(threading.current_thread())
+        return real_get(key)
+
+    monkeypatch.setattr(cache, "get", get)
+    monkeypatch.setattr(search, "_get_web_search_config", lambda: {"provider": "fake"})
+    monkeypatch.setattr(search, "get_search_cache", lambda config: cache)
+    key = cache.make_key(
+        "fake",
+        "q",
+        {
+            "provider_kwargs": {},
+            "consolidation": None,
+            "consolidation_template": None,
+            "consolidation_llm_model": None,
+        },
+    )
+    cache.put(key, {"answer": "cached"})
+
+    class FakeProvider(BaseSearchProvider):
+        name = "fake"
+        requires_api_key = False
+        supports_answer = True
+
+        def search(self, query, **kwargs):
+            raise AssertionError("cache miss")
+
+    monkeypatch.setattr(search, "get_provider", lambda name: FakeProvider())
+    try:
+        result = asyncio.run(search.aweb_search("q"))
+    finally:
+        cache.close()
+    assert result["answer"] == "cached"
+    assert lookup_threads and lookup_threads[0] is not threading.main_thread()
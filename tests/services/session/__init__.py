@@ -0,0 +1 @@
+# Tests for session storage
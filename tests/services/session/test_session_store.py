@@ -0,0 +1,79 @@
+"""Tests for SQLite session storage and the session managers built on it."""
+
+import json
+from pathlib import Path
+import threading
+
+from src.agents.chat.session_manager import SessionManager
+from src.agents.solve.session_manager import SolverSessionManager
+
+
+def test_legacy_json_is_migrated_once(tmp_path: Path):
+    legacy = {
+        "version": "1.0",
+        "sessions": [
+            {
+                "session_id": "chat_new",
+                "title": "Newer",
+                "messages": [{"role": "user", "content": "hi", "timestamp": 2.0}],
+                "settings": {"kb_name": "kb"},
+                "created_at": 2.0,
+                "updated_at": 2.0,
+            },
+            {
+                "session_id": "chat_old",
+                "title": "Older",
+                "messages": [],
+                "settings": {},
+                "created_at": 1.0,
+                "updated_at": 1.0,
+            },
+        ],
+    }
+    (tmp_path / "chat_sessions.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    manager = SessionManager(base_dir=str(tmp_path))
+    summaries = manager.list_sessions()
+    assert [s["session_id"] for s in summaries] == ["chat_new", "chat_old"]
+    assert summaries[0]["message_count"] == 1 and summaries[0]["last_message"] == "hi"
+    assert manager.get_session("chat_new")["settings"] == {"kb_name": "kb"}
+    assert not (tmp_path / "chat_sessions.json").exists()
+    assert (tmp_path / "chat_sessions.json.migrated").exists()
+
+
+def test_concurrent_appends_are_not_lost(tmp_path: Path):
+    manager = SolverSessionManager(base_dir=str(tmp_path))
+    session_id = manager.create_session()["session_id"]
+    # A second manager on the same file stands in for another worker
+    other = SolverSessionManager(base_dir=str(tmp_path))
+
+    def append(mgr, prefix):
+        for i in range(20):
+            mgr.add_message(session_id, "user", f"{prefix}{i}")
+
+    threads = [
+        threading.Thread(target=append, args=(m, p)) for m, p in ((manager, "a"), (other, "b"))
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    session = manager.get_session(session_id)
+    assert len(session["messages"]) == 40
+    assert session["title"] in ("a0", "b0")
+    manager.update_token_stats(session_id, {"calls": 3})
+    summary = manager.list_sessions()[0]
+    assert summary["token_stats"] == {"calls": 3} and summary["message_count"] == 40
+    assert manager.delete_session(session_id) and manager.get_session(session_id) is None
+
+
+def test_append_returns_summary_without_history(tmp_path: Path):
+    manager = SessionManager(base_dir=str(tmp_path))
+    session_id = manager.create_session()["session_id"]
+    manager.add_message(session_id, "user", "first question")
+    summary = manager.add_message(session_id, "assistant", "an answer")
+    assert "messages" not in summary
+    assert summary["title"] == "first question"
+    assert (summary["message_count"], summary["last_message"]) == (2, "an answer")
+    assert manager.add_message("chat_missing", "user", "x") is None
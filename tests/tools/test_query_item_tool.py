@@ -0,0 +1,51 @@
+"""Tests for the resident numbered item index."""
+
+import json
+import os
+from pathlib import Path
+
+from src.tools.query_item_tool import (
+    clear_numbered_item_cache,
+    query_numbered_item,
+    query_numbered_items,
+)
+
+
+def _write_items(kb_dir: Path, items: dict, mtime: int) -> None:
+    path = kb_dir / "numbered_items.json"
+    path.write_text(json.dumps(items), encoding="utf-8")
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_batch_lookup_and_reload_on_change(tmp_path: Path):
+    clear_numbered_item_cache()
+    kb_dir = tmp_path / "kb"
+    kb_dir.mkdir()
+    _write_items(
+        kb_dir,
+        {
+            "(2.1.1)": "first",
+            "Definition 2.1": {"text": "def"},
+            "(2.10.1)": "other section",
+            "(2.1.2)": "second",
+        },
+        mtime=1_000_000_000,
+    )
+
+    exact, folded, prefix, missing = query_numbered_items(
+        ["(2.1.1)", "definition 2.1", "2.1", "9.9"], kb_name="kb", kb_base_dir=str(tmp_path)
+    )
+    assert exact["content"] == "first"
+    assert folded["items"][0]["identifier"] == "Definition 2.1"
+    # Numeric prefixes match whole components and keep file order
+    assert [i["identifier"] for i in prefix["items"]] == ["(2.1.1)", "(2.1.2)"]
+    assert missing["status"] == "failed"
+
+    _write_items(kb_dir, {"(2.1.1)": "updated"}, mtime=2_000_000_000)
+    result = query_numbered_item("(2.1.1)", kb_name="kb", kb_base_dir=str(tmp_path))
+    assert result["content"] == "updated"
+
+    failed = query_numbered_items(["a", "b"], kb_name="nope", kb_base_dir=str(tmp_path))
+    assert [r["identifier"] for r in failed] == ["a", "b"]
+    assert all("does not exist" in r["error"] for r in failed)
+    clear_numbered_item_cache()
@@ -493,6 +493,17 @@ export const researchReducer = (
         },
       };
 
+    case "section_completed":
+      return {
+        ...state,
+        logs: [
+          ...logs,
+          createLog(
+            `Section written: ${event.current_section} (${event.latency_s}s)`,
+          ),
+        ],
+      };
+
     case "writing_completed":
       return {
         ...state,
@@ -143,6 +143,7 @@ export type ResearchEventType =
   | "deduplicate_completed"
   | "outline_completed"
   | "writing_section"
+  | "section_completed"
   | "writing_completed"
   | "reporting_completed"
 